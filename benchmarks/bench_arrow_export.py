@@ -0,0 +1,70 @@
+"""Throughput and peak memory of the Parquet export of CDRs by export size.
+
+Run with ``python -m benchmarks.bench_arrow_export``. Synthetic CDRs (see
+``benchmarks.samples``) are served page by page through an
+``httpx.MockTransport`` and exported with ``export_arrow`` into a temporary
+Parquet file. Python's peak allocation (``tracemalloc``) should stay flat as
+the number of CDRs grows, since only one record batch and the prefetched pages
+are held at a time.
+"""
+
+import argparse
+import json
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import httpx
+
+from benchmarks.samples import cdr
+from longship.arrow_export import export_arrow
+from longship_api_client import Client
+from longship_api_client.api.cdrs import get_all_cdrs
+from longship_api_client.models.cdr_dto import CdrDto
+
+
+def make_client(total: int) -> Client:
+    def handler(request: httpx.Request) -> httpx.Response:
+        skip = int(request.url.params["skip"])
+        take = int(request.url.params["take"])
+        items = [cdr(index) for index in range(skip, min(skip + take, total))]
+        return httpx.Response(200, content=json.dumps(items).encode())
+
+    return Client(
+        base_url="https://api.example.com",
+        httpx_args={"transport": httpx.MockTransport(handler)},
+    )
+
+
+def main(args: argparse.Namespace) -> None:
+    print(f"{'cdrs':>8}{'seconds':>10}{'cdrs/s':>10}{'peak MiB':>10}{'file MiB':>10}")
+    with tempfile.TemporaryDirectory() as directory:
+        for total in args.cdrs:
+            path = Path(directory) / f"cdrs-{total}.parquet"
+            client = make_client(total)
+            tracemalloc.start()
+            started = time.perf_counter()
+            export_arrow(
+                get_all_cdrs,
+                CdrDto,
+                client,
+                str(path),
+                batch_size=args.batch_size,
+                page_size=args.page_size,
+            )
+            elapsed = time.perf_counter() - started
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(
+                f"{total:>8}{elapsed:>10.2f}{total / elapsed:>10.0f}"
+                f"{peak / 2**20:>10.1f}{path.stat().st_size / 2**20:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cdrs", type=int, nargs="+", default=[2500, 10000, 40000])
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    parser.add_argument("--page-size", type=int, default=500)
+    main(parser.parse_args())
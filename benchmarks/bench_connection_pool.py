@@ -0,0 +1,92 @@
+"""Requests/sec of Longship against a local mock server, default vs tuned pool.
+
+Run with ``python -m benchmarks.bench_connection_pool``. The mock server counts
+accepted connections and delays the first response on every new connection by
+``--handshake`` seconds to stand in for the TLS handshake of the real API.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from longship.client import Longship
+
+BODY = json.dumps({"id": "CP1", "chargeBoxSerialNumber": "SN1"}).encode()
+RESPONSE = (
+    b"HTTP/1.1 200 OK\r\n"
+    b"Content-Type: application/json\r\n"
+    b"Content-Length: " + str(len(BODY)).encode() + b"\r\n"
+    b"\r\n" + BODY
+)
+
+
+class MockServer:
+    def __init__(self, latency: float, handshake: float) -> None:
+        self.latency = latency
+        self.handshake = handshake
+        self.connections = 0
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connections += 1
+        try:
+            await asyncio.sleep(self.handshake)
+            while True:
+                await reader.readuntil(b"\r\n\r\n")
+                await asyncio.sleep(self.latency)
+                writer.write(RESPONSE)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+async def run(longship: Longship, requests: int, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def call(i: int) -> None:
+        async with semaphore:
+            await longship.get_chargepoint(f"CP{i % 10}")
+
+    started = time.perf_counter()
+    await asyncio.gather(*(call(i) for i in range(requests)))
+    return requests / (time.perf_counter() - started)
+
+
+async def main(args: argparse.Namespace) -> None:
+    server = MockServer(args.latency, args.handshake)
+    listener = await asyncio.start_server(server.handle, "127.0.0.1", 0)
+    url = "http://127.0.0.1:%d" % listener.sockets[0].getsockname()[1]
+
+    configurations = {
+        # httpx defaults, as used before the pool became configurable
+        "default": dict(max_keepalive_connections=20, keepalive_expiry=5.0),
+        "tuned": dict(
+            max_connections=args.concurrency,
+            max_keepalive_connections=args.concurrency,
+            keepalive_expiry=30.0,
+        ),
+    }
+    print(f"{'pool':<10}{'requests/s':>12}{'connections':>14}")
+    for name, limits in configurations.items():
+        server.connections = 0
+        async with Longship(url, "apiKey", "ocpKey", **limits) as longship:
+            # Bursts separated by idle gaps, like a webhook-driven worker
+            rates = []
+            for _ in range(args.bursts):
+                rates.append(await run(longship, args.requests, args.concurrency))
+                await asyncio.sleep(0.01)
+        print(f"{name:<10}{sum(rates) / len(rates):>12.0f}{server.connections:>14}")
+    listener.close()
+    await listener.wait_closed()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=40)
+    parser.add_argument("--bursts", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.1)
+    parser.add_argument("--handshake", type=float, default=0.1)
+    asyncio.run(main(parser.parse_args()))
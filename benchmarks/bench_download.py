@@ -0,0 +1,94 @@
+"""Peak memory of downloading a CDR file export, generated endpoint vs streaming.
+
+Run with ``python -m benchmarks.bench_download``. A ``FileContentResult`` with
+``--megabytes`` of base64 encoded CSV is served through an
+``httpx.MockTransport``. ``endpoint`` reads the whole response like the
+generated ``get_file_full_download_cdrs`` does and decodes the contents,
+``download_file`` streams them to a temporary file.
+Memory is traced with ``tracemalloc``, the served body itself excluded.
+"""
+
+import argparse
+import base64
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Iterator
+
+import httpx
+
+from longship.download import download_file
+from longship_api_client import Client
+from longship_api_client.api.cdrs import get_file_full_download_cdrs
+
+
+def make_body(megabytes: int) -> bytes:
+    line = b"cdr-000000;2024-01-01T00:00:00Z;2024-01-01T01:00:00Z;10.500;3.48\n"
+    contents = line * (megabytes * 2**20 // len(line))
+    return (
+        b'{"fileContents":"'
+        + base64.b64encode(contents)
+        + b'","contentType":"text/csv","fileDownloadName":"cdrs.csv"}'
+    )
+
+
+class ChunkedBody(httpx.SyncByteStream):
+    """The body in 64 KiB chunks, as a network transport yields it"""
+
+    def __init__(self, body: bytes) -> None:
+        self.body = body
+
+    def __iter__(self) -> Iterator[bytes]:
+        for start in range(0, len(self.body), 2**16):
+            yield self.body[start : start + 2**16]
+
+
+def measure(func: Callable[[], object]) -> "tuple[float, float]":
+    tracemalloc.start()
+    started = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 2**20
+
+
+def main(args: argparse.Namespace) -> None:
+    body = make_body(args.megabytes)
+    client = Client(
+        base_url="https://api.example.com",
+        httpx_args={
+            "transport": httpx.MockTransport(
+                lambda request: httpx.Response(
+                    200,
+                    headers={"Content-Type": "application/json", "ETag": '"v1"'},
+                    stream=ChunkedBody(body),
+                )
+            )
+        },
+    )
+
+    def endpoint() -> None:
+        response = client.get_httpx_client().request(
+            **get_file_full_download_cdrs._get_kwargs()
+        )
+        base64.b64decode(client.json_codec.loads(response.content)["fileContents"])
+
+    print(f"{len(body) / 2**20:.0f} MiB response body")
+    print(f"{'run':<16}{'seconds':>10}{'peak MiB':>10}")
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "cdrs.csv"
+
+        def stream() -> None:
+            download_file(get_file_full_download_cdrs, client, path)
+
+        for name, run in (("endpoint", endpoint), ("download_file", stream)):
+            elapsed, peak = measure(run)
+            print(f"{name:<16}{elapsed:>10.2f}{peak:>10.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--megabytes", type=int, default=100)
+    main(parser.parse_args())
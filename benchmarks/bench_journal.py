@@ -0,0 +1,65 @@
+"""Append and replay throughput of the webhook journal.
+
+Run with ``python -m benchmarks.bench_journal``. The webhook samples in
+``fixtures/`` are appended round robin to a ``WebhookJournal`` in a temporary
+directory, then replayed in full, filtered on one type (which only reads the
+index for the other webhooks) and in full again decoding every payload.
+Samples that don't decode into a ``WebhookPayload`` are skipped.
+"""
+
+import argparse
+import itertools
+import tempfile
+import time
+
+from benchmarks.bench_webhook_receiver import load_samples
+from longship.journal import WebhookJournal
+from longship.types import WebhookPayload
+
+
+def main(args: argparse.Namespace) -> None:
+    samples = load_samples()
+    payloads = [WebhookPayload.from_json(body) for body in samples]
+    one_type = payloads[0].type
+    with tempfile.TemporaryDirectory() as directory, WebhookJournal(
+        directory, segment_size=args.segment_mb << 20, sync=args.sync
+    ) as journal:
+        started = time.perf_counter()
+        for body, payload in itertools.islice(
+            itertools.cycle(zip(samples, payloads)), args.webhooks
+        ):
+            journal.append(body, payload if args.decoded else None)
+        appended = time.perf_counter() - started
+
+        started = time.perf_counter()
+        replayed = sum(1 for _ in journal.replay())
+        raw = time.perf_counter() - started
+
+        started = time.perf_counter()
+        filtered = sum(1 for _ in journal.replay(types=[one_type]))
+        by_type = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for entry in journal.replay():
+            entry.payload
+        decoded = time.perf_counter() - started
+
+        print(f"webhooks      {args.webhooks:>10}")
+        print(f"MB on disk    {journal.size / (1 << 20):>10.1f}")
+        print(f"appends/s     {args.webhooks / appended:>10.0f}")
+        print(f"replay/s      {replayed / raw:>10.0f}")
+        print(f"by type ms    {by_type * 1000:>10.1f}  ({filtered} of {one_type})")
+        print(f"decoded/s     {replayed / decoded:>10.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--webhooks", type=int, default=200_000)
+    parser.add_argument("--segment-mb", type=int, default=64)
+    parser.add_argument("--sync", action="store_true")
+    parser.add_argument(
+        "--decoded",
+        action="store_true",
+        help="pass the decoded payload to append, as the receiver does",
+    )
+    main(parser.parse_args())
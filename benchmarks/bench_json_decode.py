@@ -0,0 +1,73 @@
+"""Decode throughput of the JSON codecs on the largest list endpoints.
+
+Run with ``python -m benchmarks.bench_json_decode``. A page of synthetic
+sessions and one of CDRs (see ``benchmarks.samples``) are served through an
+``httpx.MockTransport``. For every installed codec the page is decoded with
+``json_codec.loads`` alone (``decode``) and through ``get_all_*.sync_detailed``
+including the model parsing (``endpoint``).
+"""
+
+import argparse
+import json
+import time
+from typing import Callable
+
+import httpx
+
+from benchmarks.samples import cdr, session
+from longship_api_client import Client
+from longship_api_client.api.cdrs import get_all_cdrs
+from longship_api_client.api.sessions import get_all_sessions
+from longship_api_client.json_codec import JsonCodec, MsgspecCodec, OrjsonCodec
+
+
+def best_of(repeat: int, func: Callable[[], object]) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main(args: argparse.Namespace) -> None:
+    pages = {
+        "sessions": (
+            get_all_sessions,
+            json.dumps([session(i) for i in range(args.page_size)]).encode(),
+        ),
+        "cdrs": (
+            get_all_cdrs,
+            json.dumps([cdr(i) for i in range(args.page_size)]).encode(),
+        ),
+    }
+    codecs = {}
+    for codec in (JsonCodec, OrjsonCodec, MsgspecCodec):
+        try:
+            codecs[codec.name] = codec()
+        except ImportError:
+            print(f"{codec.name} is not installed, skipping it")
+
+    print(f"{'page':<10}{'codec':<9}{'MB':>6}{'decode MB/s':>13}{'endpoint ms':>13}")
+    for name, (endpoint, body) in pages.items():
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body))
+        for codec_name, codec in codecs.items():
+            client = Client(
+                base_url="https://api.example.com",
+                json_codec=codec,
+                httpx_args={"transport": transport},
+            )
+            decode = best_of(args.repeat, lambda: codec.loads(body))
+            parse = best_of(args.repeat, lambda: endpoint.sync_detailed(client=client))
+            megabytes = len(body) / 1e6
+            print(
+                f"{name:<10}{codec_name:<9}{megabytes:>6.1f}"
+                f"{megabytes / decode:>13.0f}{parse * 1e3:>13.1f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    main(parser.parse_args())
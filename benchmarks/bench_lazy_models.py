@@ -0,0 +1,67 @@
+"""Time to list sessions and CDRs with eager and lazy model decoding.
+
+Run with ``python -m benchmarks.bench_lazy_models``. A page of synthetic
+sessions and one of CDRs (see ``benchmarks.samples``) are decoded into models
+like ``get_all_*`` does, then a dashboard reads a few scalar fields of every
+item (``scalars``) or additionally walks the nested lists (``nested``).
+"""
+
+import argparse
+import time
+from typing import Any, Callable, Dict, List
+
+from benchmarks.samples import cdr, session
+from longship_api_client.lazy_models import lazy_model
+from longship_api_client.models.cdr_dto import CdrDto
+from longship_api_client.models.session_dto import SessionDto
+
+
+def best_of(repeat: int, func: Callable[[], object]) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def read_session(item: SessionDto, nested: bool) -> None:
+    item.id, item.total_energy_in_kwh, item.session_start
+    if nested:
+        len(item.charging_meter_values), len(item.charging_periods)
+
+
+def read_cdr(item: CdrDto, nested: bool) -> None:
+    item.id, item.total_energy_in_kwh, item.total_price
+    if nested:
+        len(item.charging_periods)
+
+
+def main(args: argparse.Namespace) -> None:
+    pages: Dict[str, Any] = {
+        "sessions": (
+            SessionDto,
+            read_session,
+            [session(i) for i in range(args.page_size)],
+        ),
+        "cdrs": (CdrDto, read_cdr, [cdr(i) for i in range(args.page_size)]),
+    }
+    print(f"{'page':<10}{'read':<9}{'eager ms':>10}{'lazy ms':>10}")
+    for name, (model, read, page) in pages.items():
+        for nested in (False, True):
+
+            def run(model_class: Any, page: List[Dict[str, Any]] = page) -> None:
+                for item in page:
+                    read(model_class.from_dict(item), nested)
+
+            eager = best_of(args.repeat, lambda: run(model))
+            lazy = best_of(args.repeat, lambda: run(lazy_model(model)))
+            read_name = "nested" if nested else "scalars"
+            print(f"{name:<10}{read_name:<9}{eager * 1e3:>10.1f}{lazy * 1e3:>10.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--page-size", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    main(parser.parse_args())
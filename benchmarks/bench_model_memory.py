@@ -0,0 +1,75 @@
+"""Memory held by parsed session pages, compact models vs the previous layout.
+
+Run with ``python -m benchmarks.bench_model_memory``. The same synthetic session
+pages (see ``benchmarks.samples``) are parsed with ``SessionDto.from_dict`` and
+the retained memory is measured with ``tracemalloc``.
+
+Models used to keep the emptied copy of their source dict as
+``additional_properties``. The ``previous`` run re-creates that by attaching an
+emptied dict of the same size to every parsed model; ``compact`` is what
+``from_dict`` keeps now.
+"""
+
+import argparse
+import gc
+import tracemalloc
+from typing import Any, Callable, List
+
+import attr
+
+from benchmarks.samples import session_pages
+from longship_api_client.models.session_dto import SessionDto
+
+
+def emptied_copy(src_dict: dict) -> dict:
+    """What the previous ``from_dict`` kept: a copy with every known key popped"""
+    d = src_dict.copy()
+    for key in src_dict:
+        d.pop(key)
+    return d
+
+
+def restore_previous_layout(model: Any) -> None:
+    """Attach an emptied copy of the source dict to ``model`` and its children"""
+    if isinstance(model, list):
+        for item in model:
+            restore_previous_layout(item)
+        return
+    if not attr.has(type(model)):
+        return
+    for field in attr.fields(type(model)):
+        if field.name != "_additional_properties":
+            restore_previous_layout(getattr(model, field.name))
+    model.additional_properties = emptied_copy({key: None for key in model.to_dict()})
+
+
+def measure(pages: List[List[dict]], after_parse: Callable[[Any], None]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    parsed = [[SessionDto.from_dict(item) for item in page] for page in pages]
+    after_parse(parsed)
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del parsed
+    return retained
+
+
+def main(args: argparse.Namespace) -> None:
+    pages = session_pages(args.pages, meter_values=args.meter_values)
+    sessions = args.pages * 100
+    print(f"{sessions} sessions with {args.meter_values} meter values each")
+    print(f"{'layout':<10}{'MiB':>10}{'bytes/session':>16}")
+    for name, after_parse in (
+        ("previous", restore_previous_layout),
+        ("compact", lambda parsed: None),
+    ):
+        retained = measure(pages, after_parse)
+        print(f"{name:<10}{retained / 2**20:>10.1f}{retained // sessions:>16}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--meter-values", type=int, default=60)
+    main(parser.parse_args())
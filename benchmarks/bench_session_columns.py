@@ -0,0 +1,88 @@
+"""Energy per session from meter values, object loops vs NumPy columns.
+
+Run with ``python -m benchmarks.bench_session_columns``. Synthetic sessions
+(see ``benchmarks.samples``) are decoded into ``SessionDto`` models once. The
+``objects`` run computes the energy delivered per session (last minus first
+energy register reading) by looping over the meter value models. The columnar
+runs first fill a ``SessionColumnsBuilder`` from the models (``add``) or from
+the raw JSON (``add_dict``) and then compute the same with NumPy; ``build`` and
+``compute`` are timed separately.
+"""
+
+import argparse
+import time
+from typing import Any, Callable, List, Tuple
+
+import numpy
+
+from benchmarks.samples import session
+from longship.session_columns import SessionColumns, SessionColumnsBuilder
+from longship_api_client.models.session_dto import SessionDto
+
+ENERGY_REGISTER = "Energy.Active.Import.Register"
+
+
+def timed(repeat: int, func: Callable[[], Any]) -> Tuple[Any, float]:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - started)
+    return result, best
+
+
+def energy_from_objects(sessions: List[SessionDto]) -> List[float]:
+    energy = []
+    for item in sessions:
+        readings = [
+            float(meter_value.value)
+            for meter_value in item.charging_meter_values
+            if meter_value.measurand == ENERGY_REGISTER
+        ]
+        energy.append(readings[-1] - readings[0] if readings else 0.0)
+    return energy
+
+
+def energy_from_columns(columns: SessionColumns) -> Any:
+    register = columns.meter_measurands == columns.measurands.index(ENERGY_REGISTER)
+    values = columns.meter_values[register]
+    sessions = columns.meter_value_sessions()[register]
+    first = numpy.full(len(columns), numpy.nan)
+    last = numpy.full(len(columns), numpy.nan)
+    # Fancy assignment keeps the last write per index
+    last[sessions] = values
+    first[sessions[::-1]] = values[::-1]
+    return numpy.nan_to_num(last - first)
+
+
+def main(args: argparse.Namespace) -> None:
+    raw = [session(i, meter_values=args.meter_values) for i in range(args.sessions)]
+    models = [SessionDto.from_dict(item) for item in raw]
+    print(f"{args.sessions} sessions with {args.meter_values} meter values each")
+
+    expected, objects = timed(args.repeat, lambda: energy_from_objects(models))
+    print(f"{'run':<12}{'build ms':>10}{'compute ms':>12}")
+    print(f"{'objects':<12}{'':>10}{objects * 1e3:>12.1f}")
+    for name, add, items in (
+        ("add", SessionColumnsBuilder.add, models),
+        ("add_dict", SessionColumnsBuilder.add_dict, raw),
+    ):
+
+        def build(add: Callable = add, items: List = items) -> SessionColumns:
+            builder = SessionColumnsBuilder()
+            for item in items:
+                add(builder, item)
+            return builder.build()
+
+        columns, built = timed(args.repeat, build)
+        energy, computed = timed(args.repeat, lambda: energy_from_columns(columns))
+        assert numpy.allclose(energy, expected)
+        print(f"{name:<12}{built * 1e3:>10.1f}{computed * 1e3:>12.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=5000)
+    parser.add_argument("--meter-values", type=int, default=60)
+    parser.add_argument("--repeat", type=int, default=3)
+    main(parser.parse_args())
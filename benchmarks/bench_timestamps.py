@@ -0,0 +1,58 @@
+"""Time to parse a large synthetic session page with each timestamp parser.
+
+Run with ``python -m benchmarks.bench_timestamps``. Every run parses the same
+page of sessions (see ``benchmarks.samples``) with ``SessionDto.from_dict``
+after switching parsers with ``set_timestamp_parser``. ``cold`` starts with an
+empty timestamp cache, ``warm`` parses the page again right after, like a sync
+that polls the same sessions (``--sessions`` 100 fits into the cache).
+"""
+
+import argparse
+import time
+from typing import Any, Dict, List
+
+from dateutil.parser import isoparse
+
+from benchmarks.samples import session_pages
+from longship_api_client.models.session_dto import SessionDto
+from longship_api_client import timestamps
+from longship_api_client.timestamps import parse_isoformat, set_timestamp_parser
+
+PARSERS = {
+    "isoparse": isoparse,
+    "default": parse_isoformat,
+    # The default before Python 3.11
+    "memoized": timestamps._parse_cached,
+}
+
+
+def parse_page(page: List[Dict[str, Any]]) -> float:
+    started = time.perf_counter()
+    for item in page:
+        SessionDto.from_dict(item)
+    return time.perf_counter() - started
+
+
+def main(args: argparse.Namespace) -> None:
+    (page,) = session_pages(1, page_size=args.sessions, meter_values=args.meter_values)
+    print(f"{args.sessions} sessions with {args.meter_values} meter values each")
+    print(f"{'parser':<12}{'cold ms':>10}{'warm ms':>10}")
+    try:
+        for name, parser in PARSERS.items():
+            set_timestamp_parser(parser)
+            cold = warm = float("inf")
+            for _ in range(args.repeat):
+                timestamps._parse_cached.cache_clear()
+                cold = min(cold, parse_page(page))
+                warm = min(warm, parse_page(page))
+            print(f"{name:<12}{cold * 1e3:>10.1f}{warm * 1e3:>10.1f}")
+    finally:
+        set_timestamp_parser(None)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=500)
+    parser.add_argument("--meter-values", type=int, default=60)
+    parser.add_argument("--repeat", type=int, default=5)
+    main(parser.parse_args())
@@ -0,0 +1,50 @@
+"""Decoding time of the webhook samples in ``fixtures/``.
+
+Run with ``python -m benchmarks.bench_webhook_decode``. Every sample is decoded
+``--repeat`` times from its raw request body, once through
+``WebhookPayload(**json.loads(body))`` and once through
+``WebhookPayload.from_json(body)``. Samples that don't decode into a
+``WebhookPayload`` are listed with the error instead.
+"""
+
+import argparse
+import json
+import timeit
+from pathlib import Path
+
+from longship.types import WebhookPayload
+
+FIXTURES = Path(__file__).resolve().parent.parent / "fixtures"
+
+
+def load_samples():
+    samples = {}
+    for path in sorted(FIXTURES.glob("*.json")):
+        body = path.read_bytes()
+        if "specversion" in json.loads(body):
+            samples[path.stem] = body
+    return samples
+
+
+def main(args: argparse.Namespace) -> None:
+    print(f"{'sample':<26} {'kwargs us':>10} {'from_json us':>13}")
+    for name, body in load_samples().items():
+        try:
+            WebhookPayload.from_json(body)
+        except (KeyError, TypeError, ValueError) as e:
+            print(f"{name:<26} skipped: {type(e).__name__} {e}")
+            continue
+        kwargs = timeit.timeit(
+            lambda: WebhookPayload(**json.loads(body)), number=args.repeat
+        )
+        fast = timeit.timeit(lambda: WebhookPayload.from_json(body), number=args.repeat)
+        print(
+            f"{name:<26} {kwargs / args.repeat * 1e6:>10.2f} "
+            f"{fast / args.repeat * 1e6:>13.2f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20000)
+    main(parser.parse_args())
@@ -0,0 +1,99 @@
+"""Load test of the ASGI webhook receiver with the webhook samples in ``fixtures/``.
+
+Run with ``python -m benchmarks.bench_webhook_receiver``. The samples are
+posted round robin to a ``WebhookReceiver`` through ``httpx.ASGITransport``, so
+the numbers cover decoding, queueing and the ASGI round trip but no sockets.
+The transport handles a request without yielding to the event loop, so the
+requests are sent one after the other, giving the handlers a turn in between.
+Every batch handler takes ``--handler-ms`` milliseconds, like a database write
+per batch; once the handlers fall behind the queues fill up and webhooks are
+answered with 503.
+Samples that don't decode into a ``WebhookPayload`` are skipped.
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import statistics
+import time
+from collections import Counter
+from pathlib import Path
+from typing import List
+
+import httpx
+
+from longship.types import WebhookPayload
+from longship.webhook_receiver import WebhookReceiver
+
+FIXTURES = Path(__file__).resolve().parent.parent / "fixtures"
+
+
+def load_samples() -> List[bytes]:
+    samples = []
+    for path in sorted(FIXTURES.glob("*.json")):
+        body = path.read_bytes()
+        if "specversion" not in json.loads(body):
+            continue
+        try:
+            WebhookPayload.from_json(body)
+        except (KeyError, TypeError, ValueError) as e:
+            print(f"skipped {path.stem}: {type(e).__name__} {e}")
+            continue
+        samples.append(body)
+    return samples
+
+
+async def run(args: argparse.Namespace, samples: List[bytes]) -> None:
+    receiver = WebhookReceiver(
+        max_queue=args.max_queue,
+        batch_size=args.batch_size,
+        concurrency=args.concurrency,
+    )
+    batches = 0
+
+    @receiver.handler()
+    async def handle(payloads: List[WebhookPayload]) -> None:
+        nonlocal batches
+        batches += 1
+        await asyncio.sleep(args.handler_ms / 1000)
+
+    statuses: Counter = Counter()
+    latencies: List[float] = []
+    transport = httpx.ASGITransport(app=receiver)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        started = time.perf_counter()
+        for body in itertools.islice(itertools.cycle(samples), args.requests):
+            sent = time.perf_counter()
+            response = await client.post("/", content=body)
+            latencies.append(time.perf_counter() - sent)
+            statuses[response.status_code] += 1
+            await asyncio.sleep(0)
+        acknowledged = time.perf_counter() - started
+        await receiver.stop()
+        handled = time.perf_counter() - started
+
+    latencies.sort()
+    print(f"requests      {args.requests:>10}")
+    for status, count in sorted(statuses.items()):
+        print(f"HTTP {status}      {count:>10}")
+    print(f"requests/s    {args.requests / acknowledged:>10.0f}")
+    print(f"ack p50 ms    {statistics.median(latencies) * 1000:>10.3f}")
+    print(f"ack p99 ms    {latencies[int(len(latencies) * 0.99)] * 1000:>10.3f}")
+    print(f"batches       {batches:>10}")
+    print(f"handled/s     {sum(receiver.handled.values()) / handled:>10.0f}")
+
+
+def main(args: argparse.Namespace) -> None:
+    samples = load_samples()
+    asyncio.run(run(args, samples))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=50_000)
+    parser.add_argument("--handler-ms", type=float, default=5.0)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=2)
+    parser.add_argument("--max-queue", type=int, default=10_000)
+    main(parser.parse_args())
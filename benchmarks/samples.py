@@ -0,0 +1,132 @@
+"""Synthetic API responses shared by the benchmarks"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def timestamp(moment: datetime) -> str:
+    """Format like the API: 7 fractional digits and a Z suffix"""
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.%f") + "0Z"
+
+
+def session(index: int, meter_values: int = 60, charging_periods: int = 4) -> Dict[str, Any]:
+    """A completed session as returned by ``GET /v1/sessions``"""
+    start = START + timedelta(seconds=37 * index, microseconds=4321 * index)
+    return {
+        "id": f"session-{index}",
+        "tenantId": "tenant",
+        "chargePointId": f"CP{index % 500}",
+        "transactionId": str(index),
+        "ocppTransactionId": str(index),
+        "connectorId": 1,
+        "sessionLocation": {
+            "id": f"location-{index % 100}",
+            "evseId": f"NL*GAI*E{index % 500}",
+            "powerType": "AC_3_PHASE",
+            "name": "Parking",
+            "street": "Main street",
+            "houseNumber": "1",
+            "city": "Amsterdam",
+            "country": "NLD",
+        },
+        "idTag": "04A2B3C4D5",
+        "startedByInfo": {
+            "tokenInfo": {"uid": "04A2B3C4D5", "tokenType": "RFID"},
+            "authorizationState": "ApprovedByAuthRequest",
+            "isGuestUsage": False,
+        },
+        "meterStartInWh": 1000.0,
+        "sessionStart": timestamp(start),
+        "chargingPeriods": [
+            {
+                "timestamp": timestamp(start + timedelta(minutes=15 * period)),
+                "deltaKwh": 2.5,
+                "absoluteKwh": 2.5 * (period + 1),
+                "price": 0.87,
+                "parkingTimeMinutes": 0,
+            }
+            for period in range(charging_periods)
+        ],
+        "chargingMeterValues": [
+            {
+                "timestamp": timestamp(start + timedelta(minutes=value)),
+                "value": str(1000 + 150 * value),
+                "measurand": "Energy.Active.Import.Register",
+                "unit": "Wh",
+            }
+            for value in range(meter_values)
+        ],
+        "meterStopInWh": 1000.0 + 150 * meter_values,
+        "sessionStop": timestamp(start + timedelta(minutes=meter_values)),
+        "status": "COMPLETED",
+        "totalEnergyInKwh": 0.15 * meter_values,
+        "totalPrice": 3.48,
+        "created": timestamp(start),
+        "lastUpdated": timestamp(start + timedelta(minutes=meter_values)),
+        "ou": "0000",
+        "ouId": "ou-1",
+        "ouName": "Gaia",
+        "tariffId": "tariff-1",
+        "tariffName": "Default",
+        "startTariff": 0.0,
+        "tariffPrice": 0.35,
+        "parkingTariff": 0.0,
+    }
+
+
+def cdr(index: int, charging_periods: int = 4) -> Dict[str, Any]:
+    """A CDR as returned by ``GET /v1/cdrs``"""
+    start = START + timedelta(seconds=37 * index, microseconds=4321 * index)
+    end = start + timedelta(hours=1)
+    return {
+        "id": f"cdr-{index}",
+        "tenantId": "tenant",
+        "chargePointId": f"CP{index % 500}",
+        "connectorId": 1,
+        "cdrLocation": {
+            "id": f"location-{index % 100}",
+            "evseId": f"NL*GAI*E{index % 500}",
+            "powerType": "AC_3_PHASE",
+            "name": "Parking",
+            "street": "Main street",
+            "houseNumber": "1",
+            "city": "Amsterdam",
+            "country": "NLD",
+        },
+        "startDatetime": timestamp(start),
+        "endDateTime": timestamp(end),
+        "sessionId": f"session-{index}",
+        "token": "04A2B3C4D5",
+        "totalEnergyInKwh": 10.0,
+        "totalTimeInHours": 1.0,
+        "chargingPeriods": [
+            {
+                "timestamp": timestamp(start + timedelta(minutes=15 * period)),
+                "deltaKwh": 2.5,
+                "absoluteKwh": 2.5 * (period + 1),
+                "price": 0.87,
+                "parkingTimeMinutes": 0,
+            }
+            for period in range(charging_periods)
+        ],
+        "totalPrice": 3.48,
+        "created": timestamp(end),
+        "lastUpdated": timestamp(end),
+        "ou": "0000",
+        "ouId": "ou-1",
+        "ouName": "Gaia",
+        "tariffId": "tariff-1",
+        "tariffName": "Default",
+        "startTariff": 0.0,
+        "tariffPrice": 0.35,
+    }
+
+
+def session_pages(pages: int, page_size: int = 100, **kwargs: Any) -> List[List[Dict[str, Any]]]:
+    """``pages`` pages of consecutive sessions"""
+    return [
+        [session(page * page_size + index, **kwargs) for index in range(page_size)]
+        for page in range(pages)
+    ]
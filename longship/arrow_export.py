@@ -0,0 +1,279 @@
+"""Streaming export of list endpoints to Arrow IPC or Parquet files.
+
+``pyarrow`` is an optional dependency (the ``arrow`` extra), it is imported on
+first use. The schema of a file is derived from the model of the endpoint:
+scalar fields become nullable Arrow columns, nested models structs and lists
+Arrow lists, so CDRs land in the warehouse with the same shape no matter which
+fields a page holds.
+
+Example:
+    rows = export_arrow(
+        get_all_interchangeformat, InterchangeFormatCdr, client, "cdrs.parquet",
+        from_=from_, to=to,
+    )
+"""
+
+import datetime
+import os
+import shutil
+import tempfile
+import typing
+from enum import Enum
+from types import ModuleType
+from typing import IO, Any, BinaryIO, Callable, List, Optional, Tuple, Type, Union
+
+import attr
+
+from longship.pagination import Paginator
+from longship_api_client import AuthenticatedClient, Client
+from longship_api_client.types import Unset
+
+FORMATS = ("parquet", "ipc")
+
+_Sink = Union[str, "os.PathLike[str]", BinaryIO]
+
+
+class _Models(dict):
+    # Resolves the forward references of the models to nested models without
+    # importing all of them up front
+    def __missing__(self, name: str) -> Any:
+        from longship_api_client import models
+
+        return getattr(models, name)
+
+
+def _field_hints(model: type) -> List[Tuple[str, Any]]:
+    hints = typing.get_type_hints(model, localns=_Models())
+    return [
+        (field.name, hints[field.name])
+        for field in attr.fields(model)
+        if field.name != "_additional_properties"
+    ]
+
+
+def _unwrap(hint: Any) -> Any:
+    """``X`` of ``Union[Unset, X]`` and ``Optional[X]``"""
+    if typing.get_origin(hint) is Union:
+        args = [arg for arg in typing.get_args(hint) if arg not in (Unset, type(None))]
+        if len(args) == 1:
+            return args[0]
+    return hint
+
+
+def _arrow_type(hint: Any) -> Any:
+    import pyarrow
+
+    hint = _unwrap(hint)
+    if typing.get_origin(hint) in (list, List):
+        (item,) = typing.get_args(hint)
+        return pyarrow.list_(_arrow_type(item))
+    if attr.has(hint):
+        return pyarrow.struct(
+            [(name, _arrow_type(field)) for name, field in _field_hints(hint)]
+        )
+    if hint is bool:
+        return pyarrow.bool_()
+    if hint is int:
+        return pyarrow.int64()
+    if hint is float:
+        return pyarrow.float64()
+    if hint is datetime.datetime:
+        return pyarrow.timestamp("us", tz="UTC")
+    if hint is datetime.date:
+        return pyarrow.date32()
+    if hint is str or (isinstance(hint, type) and issubclass(hint, Enum)):
+        return pyarrow.string()
+    raise TypeError(f"No Arrow type for {hint}")
+
+
+def arrow_schema(model: type) -> Any:
+    """The ``pyarrow.Schema`` of the files ``model`` items are exported to"""
+    import pyarrow
+
+    return pyarrow.schema(
+        [(name, _arrow_type(hint)) for name, hint in _field_hints(model)]
+    )
+
+
+def _converter(hint: Any) -> Callable[[Any], Any]:
+    """Turns a model field into the Python value pyarrow builds its column from"""
+    hint = _unwrap(hint)
+    if typing.get_origin(hint) in (list, List):
+        (item,) = typing.get_args(hint)
+        convert_item = _converter(item)
+        return lambda value: (
+            None if isinstance(value, Unset) or value is None
+            else [convert_item(item) for item in value]
+        )
+    if attr.has(hint):
+        fields = [(name, _converter(field)) for name, field in _field_hints(hint)]
+        return lambda value: (
+            None if isinstance(value, Unset) or value is None
+            else {name: convert(getattr(value, name)) for name, convert in fields}
+        )
+    if isinstance(hint, type) and issubclass(hint, Enum):
+        return lambda value: None if isinstance(value, Unset) else value.value
+    return lambda value: None if isinstance(value, Unset) else value
+
+
+class RecordBatchBuilder:
+    """Converts pages of ``model`` items into ``pyarrow.RecordBatch`` es"""
+
+    def __init__(self, model: type) -> None:
+        import pyarrow
+
+        self._pyarrow = pyarrow
+        self.schema = arrow_schema(model)
+        self._columns = [
+            (name, _converter(hint), self.schema.field(name).type)
+            for name, hint in _field_hints(model)
+        ]
+
+    def build(self, items: List[Any]) -> Any:
+        pyarrow = self._pyarrow
+        return pyarrow.record_batch(
+            [
+                pyarrow.array(
+                    [convert(getattr(item, name)) for item in items], type=arrow_type
+                )
+                for name, convert, arrow_type in self._columns
+            ],
+            schema=self.schema,
+        )
+
+
+def _open_writer(sink: IO[bytes], schema: Any, format: str) -> Any:
+    if format == "parquet":
+        import pyarrow.parquet
+
+        return pyarrow.parquet.ParquetWriter(sink, schema)
+    import pyarrow
+
+    return pyarrow.ipc.new_file(sink, schema)
+
+
+class _Export:
+    """Buffers items until ``batch_size`` of them can be written as one batch.
+
+    The file is written to a temporary file first and only replaces a ``sink``
+    path, or is copied to a ``sink`` file object, once it is complete, so a
+    failed export leaves no truncated file behind.
+    """
+
+    def __init__(self, model: type, sink: _Sink, format: str, batch_size: int) -> None:
+        if format not in FORMATS:
+            raise ValueError(
+                f"format must be one of {', '.join(FORMATS)}, not {format!r}"
+            )
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.builder = RecordBatchBuilder(model)
+        self.sink = sink
+        self.batch_size = batch_size
+        self.buffer: List[Any] = []
+        self.rows = 0
+        self._partial: Optional[str] = None
+        if isinstance(sink, (str, os.PathLike)):
+            # Next to the sink, so that it can be renamed over it
+            self._partial = os.fspath(sink) + ".partial"
+            self._file: IO[bytes] = open(self._partial, "wb")
+        else:
+            self._file = tempfile.TemporaryFile()
+        try:
+            self.writer = _open_writer(self._file, self.builder.schema, format)
+        except BaseException:
+            self._discard()
+            raise
+
+    def add(self, page: List[Any]) -> None:
+        self.buffer.extend(page)
+        while len(self.buffer) >= self.batch_size:
+            self._write(self.buffer[: self.batch_size])
+            del self.buffer[: self.batch_size]
+
+    def _write(self, items: List[Any]) -> None:
+        self.writer.write_batch(self.builder.build(items))
+        self.rows += len(items)
+
+    def _discard(self) -> None:
+        self._file.close()
+        if self._partial is not None:
+            os.unlink(self._partial)
+
+    def abort(self) -> None:
+        """Drop the file written so far, the sink is left untouched"""
+        try:
+            self.writer.close()
+        except Exception:
+            # The error that led to the abort is the one worth raising
+            pass
+        self._discard()
+
+    def close(self) -> int:
+        """Complete the file and move it to the sink"""
+        try:
+            if self.buffer:
+                self._write(self.buffer)
+                self.buffer = []
+            self.writer.close()
+            if self._partial is None:
+                self._file.seek(0)
+                shutil.copyfileobj(self._file, self.sink)  # type: ignore
+                self._file.close()
+            else:
+                self._file.close()
+                os.replace(self._partial, self.sink)  # type: ignore
+        except BaseException:
+            self.abort()
+            raise
+        return self.rows
+
+
+def export_arrow(
+    endpoint: ModuleType,
+    model: Type[Any],
+    client: Union[AuthenticatedClient, Client],
+    sink: _Sink,
+    format: str = "parquet",
+    batch_size: int = 10_000,
+    page_size: int = 100,
+    **kwargs: Any,
+) -> int:
+    """Page through a ``get_all_*`` endpoint and write its items to ``sink``.
+
+    Items are written in record batches of ``batch_size`` rows (Parquet row
+    groups), so memory use is bounded by one batch plus the prefetched pages,
+    however many items the endpoint holds. ``format`` is ``"parquet"`` or
+    ``"ipc"`` for the Arrow IPC file format. Returns the number of rows written.
+    ``sink`` is only written once all pages were read.
+    """
+    export = _Export(model, sink, format, batch_size)
+    try:
+        for page in Paginator(endpoint, client, page_size=page_size, **kwargs).pages():
+            export.add(page)
+    except BaseException:
+        export.abort()
+        raise
+    return export.close()
+
+
+async def aexport_arrow(
+    endpoint: ModuleType,
+    model: Type[Any],
+    client: Union[AuthenticatedClient, Client],
+    sink: _Sink,
+    format: str = "parquet",
+    batch_size: int = 10_000,
+    page_size: int = 100,
+    **kwargs: Any,
+) -> int:
+    """Async version of ``export_arrow``"""
+    export = _Export(model, sink, format, batch_size)
+    paginator = Paginator(endpoint, client, page_size=page_size, **kwargs)
+    try:
+        async for page in paginator.pages_async():
+            export.add(page)
+    except BaseException:
+        export.abort()
+        raise
+    return export.close()
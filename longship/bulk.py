@@ -0,0 +1,114 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+import attr
+
+T = TypeVar("T")
+
+
+class RateLimitedScheduler:
+    """Runs coroutines with at most ``concurrency`` in flight and, if ``rate`` is
+    set, starts no more than ``rate`` of them per second.
+    """
+
+    def __init__(self, concurrency: int = 10, rate: Optional[float] = None) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be positive")
+        self.concurrency = concurrency
+        self.rate = rate
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._next_start = 0.0
+
+    async def _wait_for_slot(self) -> None:
+        if self.rate is None:
+            return
+        now = time.monotonic()
+        start = max(now, self._next_start)
+        self._next_start = start + 1 / self.rate
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    async def run(self, func: Callable[[], Awaitable[T]]) -> T:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        async with self._semaphore:
+            await self._wait_for_slot()
+            return await func()
+
+
+@attr.s(auto_attribs=True)
+class BulkResult:
+    key: str
+    response: Any = attr.ib(default=None)
+    error: Optional[BaseException] = attr.ib(default=None)
+    # Seconds spent waiting for a concurrency/rate slot and in the call itself
+    queued: float = attr.ib(default=0.0)
+    duration: float = attr.ib(default=0.0)
+
+    @property
+    def ok(self) -> bool:
+        if self.error is not None:
+            return False
+        status_code = getattr(self.response, "status_code", None)
+        return status_code is None or 200 <= status_code < 300
+
+
+@attr.s(auto_attribs=True)
+class BulkReport:
+    results: Dict[str, BulkResult]
+    total: float
+
+    @property
+    def failed(self) -> Dict[str, BulkResult]:
+        return {key: result for key, result in self.results.items() if not result.ok}
+
+    @property
+    def max_queued(self) -> float:
+        return max((result.queued for result in self.results.values()), default=0.0)
+
+    @property
+    def mean_duration(self) -> float:
+        if not self.results:
+            return 0.0
+        return sum(result.duration for result in self.results.values()) / len(
+            self.results
+        )
+
+
+async def run_bulk(
+    calls: Dict[str, Callable[[], Awaitable[Any]]],
+    scheduler: RateLimitedScheduler,
+) -> BulkReport:
+    """Run one call per key through ``scheduler`` and time each of them.
+
+    A failing call does not stop the others; its exception is kept in the
+    ``BulkResult`` of its key.
+    """
+    started = time.monotonic()
+
+    async def timed(key: str, func: Callable[[], Awaitable[Any]]) -> BulkResult:
+        submitted = time.monotonic()
+        result = BulkResult(key=key)
+
+        async def call() -> None:
+            call_started = time.monotonic()
+            result.queued = call_started - submitted
+            try:
+                result.response = await func()
+            finally:
+                result.duration = time.monotonic() - call_started
+
+        try:
+            await scheduler.run(call)
+        except Exception as e:
+            result.error = e
+        return result
+
+    results = await asyncio.gather(*(timed(key, func) for key, func in calls.items()))
+    return BulkReport(
+        results={result.key: result for result in results},
+        total=time.monotonic() - started,
+    )
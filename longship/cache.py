@@ -0,0 +1,269 @@
+"""Caching of slow-changing entities, invalidated by webhooks.
+
+Locations, tariffs, tariff distributions, organization units and chargepoints
+change rarely but are looked up for nearly every session event. ``EntityCache``
+keeps the responses of their ``*_get`` endpoints for ``ttl`` seconds and drops
+them early when a webhook announces a change, e.g. ``LocationUpdated`` for the
+location in its ``subject``.
+
+The storage is pluggable: ``TTLCache``, an in-memory LRU, is the default, and
+any object with the same ``get``/``set``/``delete`` methods can take its place.
+One backend can be shared between the caches of several clients, so that every
+client sees an invalidation. Caches of different tenants sharing a backend need a
+``namespace`` of their own, e.g. ``tenant_namespace(url, api_key)``, or they serve
+each other's entities.
+
+Example:
+    cache = EntityCache(TTLCache(maxsize=10_000, ttl=600))
+    response = await cache.acall(location_get, client, id=location_id)
+    ...
+    cache.handle_webhook(WebhookPayload.from_json(body))
+"""
+
+import hashlib
+import threading
+import time
+from collections import Counter, OrderedDict
+from types import ModuleType
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, Union
+
+from longship.single_flight import SingleFlight
+from longship.types import WebhookPayload, WebhookPayloadType
+from longship_api_client import AuthenticatedClient, Client
+from longship_api_client.api.chargepoints import chargepoint_get
+from longship_api_client.api.locations import location_get
+from longship_api_client.api.organizationunits import organization_unit_get
+from longship_api_client.api.tariffdistributions import tariffdistribution_get
+from longship_api_client.api.tariffs import tariff_get
+from longship_api_client.types import Response
+
+CACHED_ENDPOINTS = (
+    location_get,
+    tariff_get,
+    tariffdistribution_get,
+    organization_unit_get,
+    chargepoint_get,
+)
+
+# The entity in the ``subject`` of these webhooks changed. Chargepoints carry
+# their connectivity status, the operational status of their connectors and
+# the metadata a boot notification updates.
+INVALIDATED_BY: Dict[WebhookPayloadType, Tuple[ModuleType, ...]] = {
+    WebhookPayloadType.LocationCreated: (location_get,),
+    WebhookPayloadType.LocationUpdated: (location_get,),
+    WebhookPayloadType.ChargePointBooted: (chargepoint_get,),
+    WebhookPayloadType.ConnectivityStatusChanged: (chargepoint_get,),
+    WebhookPayloadType.OperationalStatusChanged: (chargepoint_get,),
+}
+
+_MISSING = object()
+
+
+class TTLCache:
+    """An in-memory LRU cache whose entries expire ``ttl`` seconds after being set.
+
+    Thread-safe, so that it can be shared between clients in different threads.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.evictions = 0
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            if entry[0] <= self._clock():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        expires = self._clock() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: Hashable) -> bool:
+        """Remove ``key``, returns whether it was cached"""
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def tenant_namespace(url: str, api_key: str) -> str:
+    """A cache namespace of the tenant of ``api_key`` on the API at ``url``,
+    which doesn't reveal the key to external backends
+    """
+    fingerprint = hashlib.sha256(api_key.encode()).hexdigest()[:16]
+    return f"{url.rstrip('/')}#{fingerprint}"
+
+
+def _name(endpoint: ModuleType) -> str:
+    return endpoint.__name__.rpartition(".")[2]
+
+
+class EntityCache:
+    """Serves the ``CACHED_ENDPOINTS`` from ``backend``, other endpoints uncached.
+
+    Only successful responses are cached. ``hits``, ``misses`` and
+    ``invalidations`` are counted per endpoint. Calls missing the cache go
+    through ``single_flight`` if one is given, so a burst of lookups of the
+    same entity costs one request. Keys are prefixed with ``namespace``.
+
+    Writes through the API (``location_put`` etc.) aren't seen by the cache,
+    ``invalidate`` the entity after changing it. A response fetched while its
+    entity was invalidated isn't cached, it may predate the change.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[Any] = None,
+        ttl: Optional[float] = None,
+        single_flight: Optional[SingleFlight] = None,
+        namespace: str = "",
+    ) -> None:
+        self.backend = TTLCache() if backend is None else backend
+        self.namespace = namespace
+        # Passed to ``backend.set``, None for the default of the backend
+        self.ttl = ttl
+        self.single_flight = single_flight
+        self.hits: Counter = Counter()
+        self.misses: Counter = Counter()
+        self.invalidations: Counter = Counter()
+        self._names = {_name(endpoint) for endpoint in CACHED_ENDPOINTS}
+        # Fetches in flight per key, and how often their key was invalidated
+        # since the first of them started
+        self._fetching: Counter = Counter()
+        self._generations: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def caches(self, endpoint: ModuleType) -> bool:
+        return _name(endpoint) in self._names
+
+    @property
+    def hit_ratio(self) -> float:
+        hits = sum(self.hits.values())
+        total = hits + sum(self.misses.values())
+        return hits / total if total else 0.0
+
+    def _key(self, endpoint: ModuleType, kwargs: Dict[str, Any]) -> str:
+        # The path identifies the entity of a tenant, also as a key of external
+        # backends
+        return self.namespace + endpoint._get_kwargs(**kwargs)["url"]
+
+    def _lookup(self, endpoint: ModuleType, key: str) -> Any:
+        response = self.backend.get(key, _MISSING)
+        if response is _MISSING:
+            self.misses[_name(endpoint)] += 1
+        else:
+            self.hits[_name(endpoint)] += 1
+        return response
+
+    def _fetch_started(self, key: str) -> int:
+        with self._lock:
+            self._fetching[key] += 1
+            return self._generations[key]
+
+    def _fetch_done(
+        self, key: str, generation: int, response: Optional[Response[Any]]
+    ) -> None:
+        with self._lock:
+            if (
+                response is not None
+                and response.status_code == 200
+                and self._generations[key] == generation
+            ):
+                self.backend.set(key, response, self.ttl)
+            self._fetching[key] -= 1
+            if not self._fetching[key]:
+                del self._fetching[key]
+                self._generations.pop(key, None)
+
+    async def acall(
+        self,
+        endpoint: ModuleType,
+        client: Union[AuthenticatedClient, Client],
+        **kwargs: Any,
+    ) -> Response[Any]:
+        """``endpoint.asyncio_detailed(client=client, **kwargs)``, cached"""
+        if not self.caches(endpoint):
+            return await endpoint.asyncio_detailed(client=client, **kwargs)
+        key = self._key(endpoint, kwargs)
+        response = self._lookup(endpoint, key)
+        if response is _MISSING:
+            generation = self._fetch_started(key)
+            response = None
+            try:
+                if self.single_flight is None:
+                    response = await endpoint.asyncio_detailed(client=client, **kwargs)
+                else:
+                    response = await self.single_flight.acall(
+                        endpoint, client, **kwargs
+                    )
+            finally:
+                self._fetch_done(key, generation, response)
+        return response
+
+    def call(
+        self,
+        endpoint: ModuleType,
+        client: Union[AuthenticatedClient, Client],
+        **kwargs: Any,
+    ) -> Response[Any]:
+        """``endpoint.sync_detailed(client=client, **kwargs)``, cached"""
+        if not self.caches(endpoint):
+            return endpoint.sync_detailed(client=client, **kwargs)
+        key = self._key(endpoint, kwargs)
+        response = self._lookup(endpoint, key)
+        if response is _MISSING:
+            generation = self._fetch_started(key)
+            response = None
+            try:
+                if self.single_flight is None:
+                    response = endpoint.sync_detailed(client=client, **kwargs)
+                else:
+                    response = self.single_flight.call(endpoint, client, **kwargs)
+            finally:
+                self._fetch_done(key, generation, response)
+        return response
+
+    def invalidate(self, endpoint: ModuleType, id: str) -> bool:
+        """Drop the cached response of ``endpoint`` for entity ``id``"""
+        key = self._key(endpoint, {"id": id})
+        with self._lock:
+            if key in self._fetching:
+                self._generations[key] += 1
+            deleted = bool(self.backend.delete(key))
+        if deleted:
+            self.invalidations[_name(endpoint)] += 1
+        return deleted
+
+    def handle_webhook(self, payload: WebhookPayload) -> int:
+        """Invalidate the entities changed according to ``payload``, returns how
+        many cached responses were dropped
+        """
+        endpoints = INVALIDATED_BY.get(payload.type, ())
+        return sum(self.invalidate(endpoint, payload.subject) for endpoint in endpoints)
@@ -0,0 +1,187 @@
+import asyncio
+import heapq
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Dict, List, Set, Tuple, Union
+
+from longship.errors import PageLoadError
+from longship_api_client import AuthenticatedClient, Client
+from longship_api_client.api.cdrs import get_all_cdrs
+from longship_api_client.models.cdr_dto import CdrDto
+from longship_api_client.models.get_all_cdrs_order_by import GetAllCdrsOrderBy
+from longship_api_client.types import Unset
+
+_ORDER_ATTRIBUTES = {
+    GetAllCdrsOrderBy.STARTDATETIME: "start_datetime",
+    GetAllCdrsOrderBy.ENDDATETIME: "end_date_time",
+}
+
+_DONE = object()
+
+
+def split_windows(
+    from_: datetime, to: datetime, window: timedelta
+) -> List[Tuple[datetime, datetime]]:
+    """Split the ``from_``/``to`` range into consecutive sub-windows of ``window``"""
+    if window <= timedelta(0):
+        raise ValueError("window must be positive")
+    if to <= from_:
+        return []
+    windows = []
+    start = from_
+    while start < to:
+        end = min(start + window, to)
+        windows.append((start, end))
+        start = end
+    return windows
+
+
+class _Descending:
+    """Inverts the ordering of a sort key so the heap yields the largest first"""
+
+    __slots__ = ("key",)
+
+    def __init__(self, key) -> None:
+        self.key = key
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Descending) and self.key == other.key
+
+    def __lt__(self, other: "_Descending") -> bool:
+        return other.key < self.key
+
+
+class CdrExporter:
+    """Exports CDRs of a time range by fetching sub-windows concurrently.
+
+    The ``from_``/``to`` range is split into windows of ``window`` length. Every
+    window is paged through ``get_all_cdrs`` on the shared async client, with at
+    most ``concurrency`` page requests in flight across all windows. The windows
+    are merged back into a single stream ordered by ``order_by``, and CDRs seen
+    on both sides of a window boundary are only yielded once. Duplicates share
+    their sort key, so only the ids of the current key have to be remembered.
+
+    Example:
+        async for cdr in CdrExporter(client, from_, to, window=timedelta(days=1)):
+            ...
+    """
+
+    def __init__(
+        self,
+        client: Union[AuthenticatedClient, Client],
+        from_: datetime,
+        to: datetime,
+        window: timedelta = timedelta(days=1),
+        concurrency: int = 4,
+        page_size: int = 100,
+        order_by: GetAllCdrsOrderBy = GetAllCdrsOrderBy.STARTDATETIME,
+        descending: bool = False,
+        **filters: Any,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        self.client = client
+        self.windows = split_windows(from_, to, window)
+        self.concurrency = concurrency
+        self.page_size = page_size
+        self.order_by = order_by
+        self.descending = descending
+        self.filters: Dict[str, Any] = filters
+
+    def _sort_key(self, cdr: CdrDto):
+        value = getattr(cdr, _ORDER_ATTRIBUTES[self.order_by])
+        # CDRs without the ordering field sort after all others
+        if isinstance(value, Unset) or value is None:
+            return (1,)
+        return (0, _Descending(value) if self.descending else value)
+
+    async def _fetch_window(
+        self,
+        from_: datetime,
+        to: datetime,
+        queue: asyncio.Queue,
+        semaphore: asyncio.Semaphore,
+    ) -> None:
+        skip = 0
+        try:
+            while True:
+                async with semaphore:
+                    response = await get_all_cdrs.asyncio_detailed(
+                        client=self.client,
+                        skip=skip,
+                        take=self.page_size,
+                        from_=from_,
+                        to=to,
+                        order_by=self.order_by,
+                        descending=self.descending,
+                        **self.filters,
+                    )
+                if not isinstance(response.parsed, list):
+                    raise PageLoadError(
+                        f"Failed to load CDRs between {from_} and {to} "
+                        f"at skip={skip}: HTTP {response.status_code}"
+                    )
+                page = response.parsed
+                if page:
+                    await queue.put(page)
+                if len(page) < self.page_size:
+                    break
+                skip += self.page_size
+        except Exception as e:
+            await queue.put(e)
+            return
+        await queue.put(_DONE)
+
+    async def _window_items(self, queue: asyncio.Queue) -> AsyncIterator[CdrDto]:
+        while True:
+            page = await queue.get()
+            if page is _DONE:
+                return
+            if isinstance(page, Exception):
+                raise page
+            for cdr in page:
+                yield cdr
+
+    async def __aiter__(self) -> AsyncIterator[CdrDto]:
+        semaphore = asyncio.Semaphore(self.concurrency)
+        streams = []
+        tasks = []
+        for from_, to in self.windows:
+            # Two buffered pages per window keep memory bounded while the
+            # slowest window catches up with the merge
+            queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+            tasks.append(
+                asyncio.ensure_future(self._fetch_window(from_, to, queue, semaphore))
+            )
+            streams.append(self._window_items(queue))
+
+        seen: Set[str] = set()
+        seen_key = None
+        heap: List[Tuple[Any, int, CdrDto]] = []
+        try:
+            for index, stream in enumerate(streams):
+                await self._push_next(heap, index, stream)
+            while heap:
+                key, index, cdr = heapq.heappop(heap)
+                await self._push_next(heap, index, streams[index])
+                if key != seen_key:
+                    seen.clear()
+                    seen_key = key
+                if not isinstance(cdr.id, Unset):
+                    if cdr.id in seen:
+                        continue
+                    seen.add(cdr.id)
+                yield cdr
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _push_next(
+        self, heap: List, index: int, stream: AsyncIterator[CdrDto]
+    ) -> None:
+        try:
+            cdr = await stream.__anext__()
+        except StopAsyncIteration:
+            return
+        heapq.heappush(heap, (self._sort_key(cdr), index, cdr))
@@ -1,11 +1,24 @@
-import asyncio
-import json
-from datetime import datetime
-from typing import List
-from urllib.parse import parse_qs, urlsplit
+from collections import defaultdict
+from datetime import datetime, timedelta
+from types import ModuleType
+from typing import Any, AsyncIterator, Dict, List, Optional
 
-from longship.errors import ChargepointNotFoundError, CompositeScheduleNotFoundError
+import httpx
+
+from longship.bulk import BulkReport, RateLimitedScheduler, run_bulk
+from longship.cache import EntityCache, tenant_namespace
+from longship.cdr_export import CdrExporter
+from longship.correlator import CommandCorrelator
+from longship.errors import CompositeScheduleNotFoundError
+from longship.pagination import Paginator
+from longship.polling import LatencyHistogram
+from longship.session_tracker import SessionTracker
+from longship.single_flight import SingleFlight
+from longship.status_mirror import StatusMirror
+from longship.streaming import aiter_list
+from longship.types import WebhookPayload
 from longship_api_client import Client
+from longship_api_client.api.cdrs import get_all_cdrs
 from longship_api_client.api.chargepoint_status import (
     chargepoint_status_get,
     get_all_chargepointstatus,
@@ -18,11 +31,16 @@ from longship_api_client.api.commands import (
     send_get_composite_schedule_request,
     send_set_charging_profile_request,
 )
+from longship_api_client.api.locations import location_get
+from longship_api_client.api.organizationunits import organization_unit_get
 from longship_api_client.api.sessions import get_all_sessions
+from longship_api_client.api.tariffdistributions import tariffdistribution_get
+from longship_api_client.api.tariffs import tariff_get
 from longship_api_client.models import (
     GetCompositeScheduleRequest,
     SetChargingProfileRequest,
 )
+from longship_api_client.models.cdr_dto import CdrDto
 from longship_api_client.models.chargepoint_dto import ChargepointDto
 from longship_api_client.models.chargepoint_status_dto import ChargepointStatusDto
 from longship_api_client.models.charging_schedule import ChargingSchedule
@@ -37,25 +55,140 @@ from longship_api_client.models.cs_charging_profiles_charging_profile_kind impor
 from longship_api_client.models.cs_charging_profiles_charging_profile_purpose import (
     CsChargingProfilesChargingProfilePurpose,
 )
+from longship_api_client.models.get_all_cdrs_order_by import GetAllCdrsOrderBy
 from longship_api_client.models.get_composite_schedule_request_charging_rate_unit import (
     GetCompositeScheduleRequestChargingRateUnit,
 )
+from longship_api_client.models.location_dto import LocationDto
 from longship_api_client.models.message_log_dto import MessageLogDto
+from longship_api_client.models.organization_unit_get_dto import OrganizationUnitGetDto
 from longship_api_client.models.session_dto import SessionDto
+from longship_api_client.models.tariff_distribution_get_dto import (
+    TariffDistributionGetDto,
+)
+from longship_api_client.models.tariff_dto import TariffDto
+from longship_api_client.rate_limit import RateLimiter
 
 
 class Longship:
-    instance = None
+    def __init__(
+        self,
+        url: str,
+        apiKey: str,
+        ocpKey: str,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 50,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+        rate_limiter: Optional[RateLimiter] = None,
+        lazy_models: bool = False,
+        single_flight: bool = False,
+        cache: Optional[Any] = None,
+    ) -> None:
+        """
+        Args:
+            max_connections: Upper bound of concurrent connections to the API.
+            max_keepalive_connections: How many idle connections are kept open for
+                reuse. Keeping this close to ``max_connections`` avoids new TLS
+                handshakes after every burst of concurrent calls.
+            keepalive_expiry: Seconds an idle connection is kept in the pool.
+            http2: Multiplex requests over HTTP/2, requires ``httpx[http2]``.
+            rate_limiter: Throttles requests and retries them on 429. Share one
+                limiter between the ``Longship`` clients of the same API key.
+            lazy_models: Decode the nested objects and lists of listed sessions,
+                CDRs and other items only when they are first accessed.
+            single_flight: Let concurrent identical ``get_*`` calls share one
+                request and its decoded result, see ``SingleFlight``. The
+                counters are kept in ``single_flight``.
+            cache: A ``TTLCache`` (or compatible backend) for the responses of
+                the locations, tariffs, tariff distributions, organization units
+                and chargepoints looked up. Can be shared between ``Longship``
+                clients, also of different API keys, whose entries are kept
+                apart. Pass webhooks to ``handle_webhook`` to drop changed
+                entities early.
+        """
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._client = Client(
+            base_url=url,
+            httpx_args={"limits": limits, "http2": http2},
+            rate_limiter=rate_limiter,
+            lazy_models=lazy_models,
+        ).with_headers({"x-api-key": apiKey, "Ocp-Apim-Subscription-Key": ocpKey})
+        # Time between sending a command and its reply showing up in the message
+        # log, per OCPP action
+        self.response_latency: Dict[str, LatencyHistogram] = defaultdict(
+            LatencyHistogram
+        )
+        self._correlator = CommandCorrelator(
+            self._client, latency=self.response_latency
+        )
+        self.single_flight: Optional[SingleFlight] = (
+            SingleFlight() if single_flight else None
+        )
+        self.cache: Optional[EntityCache] = (
+            None
+            if cache is None
+            else EntityCache(
+                cache,
+                single_flight=self.single_flight,
+                namespace=tenant_namespace(url, apiKey),
+            )
+        )
+        self._status_mirror: Optional[StatusMirror] = None
+        self._session_tracker: Optional[SessionTracker] = None
 
-    def __new__(cls, *args, **kwargs):
-        if not isinstance(cls.instance, cls):
-            cls.instance = object.__new__(cls)
-        return cls.instance
+    async def _get(self, endpoint: ModuleType, **kwargs: Any) -> Any:
+        if self.cache is not None and self.cache.caches(endpoint):
+            return await self.cache.acall(endpoint, self._client, **kwargs)
+        if self.single_flight is None:
+            return await endpoint.asyncio_detailed(client=self._client, **kwargs)
+        return await self.single_flight.acall(endpoint, self._client, **kwargs)
 
-    def __init__(self, url: str, apiKey: str, ocpKey: str) -> None:
-        self._client = Client(base_url=url).with_headers(
-            {"x-api-key": apiKey, "Ocp-Apim-Subscription-Key": ocpKey}
-        )
+    async def aclose(self) -> None:
+        """Close the pooled connections of the underlying HTTP clients that were
+        created, the async one and the sync one opened by iterating ``paginate``
+        """
+        if self._client._async_client is not None:
+            await self._client._async_client.aclose()
+        if self._client._client is not None:
+            self._client._client.close()
+
+    async def __aenter__(self) -> "Longship":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+    def handle_webhook(self, payload: WebhookPayload) -> None:
+        """Update the client's view of the API with a received webhook"""
+        if self.cache is not None:
+            self.cache.handle_webhook(payload)
+        if self._status_mirror is not None:
+            self._status_mirror.apply(payload)
+        if self._session_tracker is not None:
+            self._session_tracker.apply(payload)
+
+    def status_mirror(self, reconcile_interval: float = 300.0) -> StatusMirror:
+        """The ``StatusMirror`` of all chargepoints, kept up to date with the
+        webhooks passed to ``handle_webhook``. Start it with ``run``.
+        """
+        if self._status_mirror is None:
+            self._status_mirror = StatusMirror(
+                self._client, reconcile_interval=reconcile_interval
+            )
+        return self._status_mirror
+
+    def session_tracker(self) -> SessionTracker:
+        """The ``SessionTracker`` of all running sessions, kept up to date with
+        the webhooks passed to ``handle_webhook``. Start it with ``run``.
+        """
+        if self._session_tracker is None:
+            self._session_tracker = SessionTracker(self._client)
+        return self._session_tracker
 
     async def get_composite_schedule(
         self,
@@ -63,38 +196,44 @@ class Longship:
         connector_id=0,
         duration=3600,
         unit=GetCompositeScheduleRequestChargingRateUnit.W,
+        timeout: float = 30.0,
     ) -> ChargingSchedule:
+        """Request the composite schedule and wait up to ``timeout`` seconds for
+        the charger to answer it.
+        """
         request = GetCompositeScheduleRequest(
             connector_id=connector_id, duration=duration, charging_rate_unit=unit
         )
-        response = await send_get_composite_schedule_request.asyncio_detailed(
-            id=chargepoint_id, json_body=request, client=self._client
-        )
-        if response.status_code == 404:
-            raise ChargepointNotFoundError
-
-        query = urlsplit(response.headers["location"]).query
-        params = parse_qs(query)
-        message_id = params["messageId"]
-        await asyncio.sleep(1)
-
-        response = await self.get_messages(
-            chargepoint_id, response_only=True, message_id=message_id
+        payload = await self.send_command(
+            send_get_composite_schedule_request,
+            chargepoint_id,
+            request,
+            timeout=timeout,
         )
-        if response.status_code != 200:
-            raise Exception("Failed to load the messages")
-        content = json.loads(response.content)
-        if len(content) == 0:
-            # TODO: Retry
-            raise Exception("No response from the charger yet")
-        payload = json.loads(content[0]["payload"])
 
         try:
-            schedule = ChargingSchedule.from_dict(payload[2]["chargingSchedule"])
+            schedule = ChargingSchedule.from_dict(payload["chargingSchedule"])
             return schedule
         except KeyError:
             raise CompositeScheduleNotFoundError
 
+    async def send_command(
+        self,
+        command: ModuleType,
+        chargepoint_id: str,
+        body: Any,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """Send one of the ``api.commands`` requests and return the OCPP payload
+        the charger answered with.
+
+        Replies are polled from the message log by a ``CommandCorrelator``, which
+        shares one lookup per chargepoint between all commands in flight.
+        """
+        return await self._correlator.send(
+            command, chargepoint_id, body, timeout=timeout
+        )
+
     def _create_charging_schedule(
         self, max_power: int, min_power: int = 1000, number_of_phases: int = 3
     ):
@@ -130,7 +269,37 @@ class Longship:
             connector_id=0, cs_charging_profiles=profiles
         )
         return await send_set_charging_profile_request.asyncio_detailed(
-            id=chargepoint_id, json_body=request, client=self._client
+            id=chargepoint_id, body=request, client=self._client
+        )
+
+    async def set_charge_points_max_power(
+        self,
+        limits: Dict[str, int],
+        min_power: int = 1000,
+        number_of_phases: int = 3,
+        concurrency: int = 10,
+        rate: Optional[float] = 5.0,
+    ) -> BulkReport:
+        """Set the maximum power of many chargepoints at once.
+
+        ``limits`` maps chargepoint ids to their maximum power in W. At most
+        ``concurrency`` requests are in flight and no more than ``rate`` are
+        started per second, so a fleet-wide update doesn't trip the API's rate
+        limits. Returns the response (or exception) and timings per chargepoint.
+        """
+        scheduler = RateLimitedScheduler(concurrency=concurrency, rate=rate)
+
+        def limit(chargepoint_id: str, max_power: int):
+            return lambda: self.set_charge_point_max_power(
+                chargepoint_id, max_power, min_power, number_of_phases
+            )
+
+        return await run_bulk(
+            {
+                chargepoint_id: limit(chargepoint_id, max_power)
+                for chargepoint_id, max_power in limits.items()
+            },
+            scheduler,
         )
 
     async def set_transaction_max_power(
@@ -157,7 +326,7 @@ class Longship:
             connector_id=connector_id, cs_charging_profiles=profiles
         )
         return await send_set_charging_profile_request.asyncio_detailed(
-            id=chargepoint_id, json_body=request, client=self._client
+            id=chargepoint_id, body=request, client=self._client
         )
 
     async def get_messages(
@@ -165,43 +334,109 @@ class Longship:
         chargepoint_id: str,
         response_only=False,
         message_id=None,
-        message_types=None,
     ) -> List[MessageLogDto]:
-        return await get_all_chargepointmessages.asyncio_detailed(
+        return await self._get(
+            get_all_chargepointmessages,
             id=chargepoint_id,
             response_only=response_only,
             message_id=message_id,
-            message_types=message_types,
-            client=self._client,
         )
 
     async def get_chargepoint(self, chargepoint_id: str) -> ChargepointDto:
-        response = await chargepoint_get.asyncio_detailed(
-            id=chargepoint_id, client=self._client
-        )
+        response = await self._get(chargepoint_get, id=chargepoint_id)
+        return response.parsed
+
+    async def get_location(self, location_id: str) -> LocationDto:
+        response = await self._get(location_get, id=location_id)
+        return response.parsed
+
+    async def get_tariff(self, tariff_id: str) -> TariffDto:
+        response = await self._get(tariff_get, id=tariff_id)
+        return response.parsed
+
+    async def get_tariff_distribution(
+        self, tariff_distribution_id: str
+    ) -> TariffDistributionGetDto:
+        response = await self._get(tariffdistribution_get, id=tariff_distribution_id)
+        return response.parsed
+
+    async def get_organization_unit(
+        self, organization_unit_id: str
+    ) -> OrganizationUnitGetDto:
+        response = await self._get(organization_unit_get, id=organization_unit_id)
         return response.parsed
 
     async def list_chargepoint_statuses(
         self, skip: int = None, take: int = None
     ) -> ChargepointStatusDto:
-        response = await get_all_chargepointstatus.asyncio_detailed(
-            skip=skip, take=take, client=self._client
-        )
+        response = await self._get(get_all_chargepointstatus, skip=skip, take=take)
         return response.parsed
 
     async def get_chargepoint_status(self, chargepoint_id: str) -> ChargepointStatusDto:
-        response = await chargepoint_status_get.asyncio_detailed(
-            id=chargepoint_id, client=self._client
-        )
+        response = await self._get(chargepoint_status_get, id=chargepoint_id)
         return response.parsed
 
     async def get_sessions(
         self, chargepoint_id=None, connector_number=None, running_only=True
     ) -> List[SessionDto]:
-        response = await get_all_sessions.asyncio_detailed(
+        response = await self._get(
+            get_all_sessions,
             chargepoint_id=chargepoint_id,
             connector_number=connector_number,
             running_only=running_only,
-            client=self._client,
         )
         return response.parsed
+
+    def paginate(
+        self,
+        endpoint: ModuleType,
+        page_size: int = 100,
+        max_in_flight: int = 2,
+        **kwargs: Any,
+    ) -> Paginator:
+        """Iterate over every item of a ``get_all_*`` endpoint, page by page.
+
+        ``kwargs`` are passed to the endpoint as filters, e.g.
+        ``longship.paginate(get_all_sessions, chargepoint_id="CP1")``.
+        """
+        return Paginator(
+            endpoint,
+            self._client,
+            page_size=page_size,
+            max_in_flight=max_in_flight,
+            **kwargs,
+        )
+
+    def export_cdrs(
+        self,
+        from_: datetime,
+        to: datetime,
+        window: timedelta = timedelta(days=1),
+        concurrency: int = 4,
+        page_size: int = 100,
+        order_by: GetAllCdrsOrderBy = GetAllCdrsOrderBy.STARTDATETIME,
+        descending: bool = False,
+        **filters: Any,
+    ) -> CdrExporter:
+        """Stream all CDRs between ``from_`` and ``to``, fetching time windows
+        concurrently and merging them back in ``order_by`` order.
+        """
+        return CdrExporter(
+            self._client,
+            from_,
+            to,
+            window=window,
+            concurrency=concurrency,
+            page_size=page_size,
+            order_by=order_by,
+            descending=descending,
+            **filters,
+        )
+
+    def stream_sessions(self, **filters: Any) -> AsyncIterator[SessionDto]:
+        """Stream a (large) page of sessions without holding it in memory at once"""
+        return aiter_list(get_all_sessions, SessionDto, self._client, **filters)
+
+    def stream_cdrs(self, **filters: Any) -> AsyncIterator[CdrDto]:
+        """Stream a (large) page of CDRs without holding it in memory at once"""
+        return aiter_list(get_all_cdrs, CdrDto, self._client, **filters)
@@ -0,0 +1,255 @@
+import asyncio
+import json
+import logging
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from types import ModuleType
+from typing import Any, Dict, Optional, Union
+from urllib.parse import parse_qs, urlsplit
+
+from longship.errors import (
+    ChargepointNotFoundError,
+    ChargerResponseTimeoutError,
+    CommandFailedError,
+)
+from longship.pagination import Paginator
+from longship.polling import Backoff, LatencyHistogram
+from longship_api_client import AuthenticatedClient, Client
+from longship_api_client.api.chargepoints import get_all_chargepointmessages
+from longship_api_client.models.message_log_dto import MessageLogDto
+from longship_api_client.types import Unset
+
+OCPP_CALLRESULT = 3
+OCPP_CALLERROR = 4
+
+logger = logging.getLogger(__name__)
+
+
+class _PendingCommand:
+    __slots__ = ("action", "future", "sent_at", "sent", "deadline")
+
+    def __init__(
+        self, action: str, future: asyncio.Future, sent_at: datetime, timeout: float
+    ) -> None:
+        self.action = action
+        self.future = future
+        self.sent_at = sent_at
+        self.sent = time.monotonic()
+        self.deadline = self.sent + timeout
+
+
+class CommandCorrelator:
+    """Resolves OCPP commands with the reply the charger logs for them.
+
+    Every ``send_*_request`` command answers with a ``location`` header that holds
+    the ``messageId`` of the call. Outstanding message ids are grouped per
+    chargepoint and a single poller per chargepoint pages the message log for
+    replies, so many concurrent commands to one charger cost one message log
+    lookup per poll instead of one per command. Polling backs off exponentially
+    while nothing arrives and resets once a reply is matched. A failed lookup is
+    retried at the next poll, until the deadline of each command.
+
+    Example:
+        correlator = CommandCorrelator(client)
+        payload = await correlator.send(
+            send_get_configuration_request, "CP1", GetConfigurationRequest()
+        )
+    """
+
+    def __init__(
+        self,
+        client: Union[AuthenticatedClient, Client],
+        timeout: float = 30.0,
+        initial_delay: float = 0.1,
+        max_delay: float = 2.0,
+        multiplier: float = 2.0,
+        jitter: float = 0.2,
+        page_size: int = 100,
+        latency: Optional[Dict[str, LatencyHistogram]] = None,
+    ) -> None:
+        self.client = client
+        self.timeout = timeout
+        self.backoff_options = dict(
+            initial_delay=initial_delay,
+            max_delay=max_delay,
+            multiplier=multiplier,
+            jitter=jitter,
+        )
+        self.page_size = page_size
+        self.latency: Dict[str, LatencyHistogram] = (
+            latency if latency is not None else defaultdict(LatencyHistogram)
+        )
+        self.message_log_calls = 0
+        self.message_log_errors = 0
+        self._pending: Dict[str, Dict[str, _PendingCommand]] = {}
+        self._pollers: Dict[str, asyncio.Task] = {}
+
+    async def send(
+        self,
+        command: ModuleType,
+        chargepoint_id: str,
+        body: Any,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """Send a command and return the payload of the charger's CALLRESULT.
+
+        Raises:
+            ChargepointNotFoundError: If the chargepoint doesn't exist.
+            CommandFailedError: If the API rejects the command or the charger
+                answers with a CALLERROR.
+            ChargerResponseTimeoutError: If no reply arrives within ``timeout``.
+        """
+        action = type(body).__name__
+        if action.endswith("Request"):
+            action = action[: -len("Request")]
+        sent_at = datetime.now(timezone.utc)
+        response = await command.asyncio_detailed(
+            id=chargepoint_id, body=body, client=self.client
+        )
+        if response.status_code == 404:
+            raise ChargepointNotFoundError
+        if response.status_code >= 300 or "location" not in response.headers:
+            raise CommandFailedError(
+                f"{action} to {chargepoint_id} was rejected: "
+                f"HTTP {response.status_code}"
+            )
+        message_ids = parse_qs(urlsplit(response.headers["location"]).query).get(
+            "messageId"
+        )
+        if not message_ids:
+            raise CommandFailedError(
+                f"{action} to {chargepoint_id} was accepted without a messageId: "
+                f"{response.headers['location']}"
+            )
+        message_id = message_ids[0]
+
+        pending = _PendingCommand(
+            action,
+            asyncio.get_running_loop().create_future(),
+            sent_at,
+            self.timeout if timeout is None else timeout,
+        )
+        commands = self._pending.setdefault(chargepoint_id, {})
+        commands[message_id] = pending
+        if chargepoint_id not in self._pollers:
+            self._pollers[chargepoint_id] = asyncio.ensure_future(
+                self._poll(chargepoint_id)
+            )
+        try:
+            return await pending.future
+        finally:
+            commands.pop(message_id, None)
+
+    async def _poll(self, chargepoint_id: str) -> None:
+        commands = self._pending[chargepoint_id]
+        backoff = Backoff(**self.backoff_options)
+        try:
+            while commands:
+                # Not beyond the first deadline, so a command times out on time
+                deadline = min(pending.deadline for pending in commands.values())
+                delay = min(backoff.next_delay(), deadline - time.monotonic())
+                await asyncio.sleep(max(delay, 0.0))
+                if not commands:
+                    break
+                try:
+                    matched = await self._match_replies(chargepoint_id, commands)
+                except Exception:
+                    self.message_log_errors += 1
+                    logger.warning(
+                        "Looking up replies of %s failed, retrying",
+                        chargepoint_id,
+                        exc_info=True,
+                    )
+                    matched = 0
+                self._expire(commands)
+                if matched:
+                    backoff.reset()
+        finally:
+            del self._pollers[chargepoint_id]
+            if not commands:
+                del self._pending[chargepoint_id]
+
+    async def _match_replies(
+        self, chargepoint_id: str, commands: Dict[str, _PendingCommand]
+    ) -> int:
+        self.message_log_calls += 1
+        matched = 0
+        # Look up replies from slightly before the oldest pending command to
+        # allow for clock skew between us and the API
+        since = min(pending.sent_at for pending in commands.values())
+        pages = Paginator(
+            get_all_chargepointmessages,
+            self.client,
+            page_size=self.page_size,
+            max_in_flight=1,
+            id=chargepoint_id,
+            response_only=True,
+            from_=since - timedelta(seconds=30),
+        ).pages_async()
+        try:
+            async for page in pages:
+                for message in page:
+                    if self._resolve(chargepoint_id, commands, message):
+                        matched += 1
+                if not commands:
+                    break
+        finally:
+            await pages.aclose()
+        return matched
+
+    def _resolve(
+        self,
+        chargepoint_id: str,
+        commands: Dict[str, _PendingCommand],
+        message: MessageLogDto,
+    ) -> bool:
+        frame = self._parse_frame(message)
+        if frame is None:
+            return False
+        pending = commands.pop(frame[1], None)
+        if pending is None or pending.future.done():
+            return False
+        self.latency[pending.action].observe(time.monotonic() - pending.sent)
+        if frame[0] == OCPP_CALLERROR:
+            pending.future.set_exception(
+                CommandFailedError(
+                    f"{pending.action} to {chargepoint_id} failed: "
+                    + " ".join(str(part) for part in frame[2:4])
+                )
+            )
+        else:
+            pending.future.set_result(frame[2])
+        return True
+
+    @staticmethod
+    def _parse_frame(message: MessageLogDto) -> Optional[list]:
+        """Return the OCPP ``[type, messageId, ...]`` frame of a logged reply"""
+        if isinstance(message.payload, Unset) or not message.payload:
+            return None
+        try:
+            frame = json.loads(message.payload)
+        except ValueError:
+            return None
+        if (
+            not isinstance(frame, list)
+            or len(frame) < 3
+            or frame[0] not in (OCPP_CALLRESULT, OCPP_CALLERROR)
+        ):
+            return None
+        if not isinstance(message.message_id, Unset) and message.message_id:
+            frame[1] = message.message_id
+        return frame
+
+    def _expire(self, commands: Dict[str, _PendingCommand]) -> None:
+        now = time.monotonic()
+        for message_id, pending in list(commands.items()):
+            if now >= pending.deadline:
+                del commands[message_id]
+                if not pending.future.done():
+                    pending.future.set_exception(
+                        ChargerResponseTimeoutError(
+                            f"No response to {pending.action} ({message_id}) "
+                            f"within {pending.deadline - pending.sent:.1f} seconds"
+                        )
+                    )
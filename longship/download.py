@@ -0,0 +1,302 @@
+"""Resumable, streaming downloads of the CDR file endpoints.
+
+``get_file_full_download_cdrs`` and ``get_file_intercharge_cdrs`` answer with a
+JSON ``FileContentResult`` holding the whole export base64 encoded in
+``fileContents``. The generated endpoints read that into memory at once;
+``download_file`` streams the response body to ``<path>.part`` instead and then
+decodes ``fileContents`` chunk by chunk into ``path``.
+
+An interrupted transfer is resumed with a ``Range`` request for the missing
+bytes. ``If-Range`` carries the ``ETag`` (or ``Last-Modified``) of the first
+response, so that the server sends the whole body again if the export changed
+in between. The validator is kept next to the partial body in
+``<path>.part.json``, which also lets a later call resume after a crash.
+
+Example:
+    download = download_file(
+        get_file_full_download_cdrs, client, "cdrs-2024-01.csv", from_=from_, to=to
+    )
+"""
+
+import binascii
+import json
+import os
+import re
+from pathlib import Path
+from types import ModuleType
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Union
+
+import attr
+import httpx
+
+from longship.errors import DownloadError
+from longship_api_client import AuthenticatedClient, Client
+from longship_api_client.models.file_content_result import FileContentResult
+
+_FILE_CONTENTS = re.compile(rb'"fileContents"\s*:\s*"')
+_ESCAPE = re.compile(rb"\\(u[0-9a-fA-F]{4}|[^u])")
+_CONTENT_RANGE = re.compile(r"bytes (?:(\d+)-\d+|\*)/(\d+|\*)")
+_ESCAPES = {
+    b"b": b"\b",
+    b"f": b"\f",
+    b"n": b"\n",
+    b"r": b"\r",
+    b"t": b"\t",
+}
+_WHITESPACE = b"\b\f\n\r\t "
+
+
+def _unescape(match: "re.Match[bytes]") -> bytes:
+    escape = match.group(1)
+    if escape.startswith(b"u"):
+        return chr(int(escape[1:], 16)).encode()
+    return _ESCAPES.get(escape, escape)
+
+
+class FileContentsDecoder:
+    """Incrementally decodes a JSON ``FileContentResult``.
+
+    ``feed`` returns the file bytes decoded from the base64 ``fileContents`` of
+    a chunk of the body, never holding more than a few bytes of it. The other
+    members are small and are kept until ``close`` parses them.
+    """
+
+    def __init__(self, loads: Callable[[bytes], Any] = json.loads) -> None:
+        self._loads = loads
+        self._envelope = bytearray()
+        self._in_contents = False
+        self._contents_done = False
+        # Base64 characters short of a group of 4 and a split escape sequence
+        self._pending = b""
+        self._escape = b""
+
+    def _decode(self, text: bytes) -> bytes:
+        if b"\\" in text:
+            # An escape cut off by the end of the chunk is completed by the next
+            cut = text.rfind(b"\\")
+            if len(text) - cut < (6 if text[cut + 1 : cut + 2] == b"u" else 2):
+                text, self._escape = text[:cut], text[cut:]
+            text = _ESCAPE.sub(_unescape, text)
+        # The line breaks of wrapped base64 would throw off the groups of 4
+        data = self._pending + text.translate(None, _WHITESPACE)
+        usable = len(data) - len(data) % 4
+        self._pending = data[usable:]
+        return binascii.a2b_base64(data[:usable])
+
+    def feed(self, chunk: bytes) -> bytes:
+        decoded: List[bytes] = []
+        while chunk:
+            if not self._in_contents:
+                start = len(self._envelope)
+                self._envelope += chunk
+                if self._contents_done:
+                    break
+                # The key may straddle two chunks
+                match = _FILE_CONTENTS.search(self._envelope, max(0, start - 32))
+                if match is None:
+                    break
+                chunk = bytes(self._envelope[match.end() :])
+                del self._envelope[match.end() - 1 :]
+                self._envelope += b"null"
+                self._in_contents = True
+                continue
+            chunk, self._escape = self._escape + chunk, b""
+            end = chunk.find(b'"')
+            if end < 0:
+                decoded.append(self._decode(chunk))
+                break
+            decoded.append(self._decode(chunk[:end]))
+            if self._escape or self._pending:
+                raise ValueError("fileContents is not valid base64")
+            self._in_contents = False
+            self._contents_done = True
+            chunk = chunk[end + 1 :]
+        return b"".join(decoded)
+
+    def close(self) -> Dict[str, Any]:
+        """Verify that the whole body has been received and return its other members"""
+        if self._in_contents:
+            raise ValueError("Incomplete fileContents")
+        return self._loads(bytes(self._envelope))
+
+
+@attr.s(auto_attribs=True)
+class Download:
+    path: Path
+    size: int
+    # How often an interrupted transfer was picked up again
+    resumes: int
+    content_type: Optional[str] = None
+    # Everything but the file contents, for JSON ``FileContentResult`` bodies
+    result: Optional[FileContentResult] = None
+
+
+class _PartialDownload:
+    """The body received so far and the validator of the response it came from"""
+
+    def __init__(self, path: Union[str, Path], chunk_size: int) -> None:
+        self.path = Path(path)
+        self.part = self.path.with_name(self.path.name + ".part")
+        self.meta = self.path.with_name(self.path.name + ".part.json")
+        self.chunk_size = chunk_size
+        self.complete = False
+        self.headers: Dict[str, str] = {}
+        if self.part.exists() and self.meta.exists():
+            self.headers = json.loads(self.meta.read_text())
+        else:
+            self._discard()
+
+    @property
+    def offset(self) -> int:
+        return self.part.stat().st_size if self.part.exists() else 0
+
+    def _validator(self) -> Optional[str]:
+        etag = self.headers.get("etag")
+        # Weak ETags can't be used in If-Range
+        if etag and not etag.startswith("W/"):
+            return etag
+        return self.headers.get("last-modified")
+
+    def _discard(self) -> None:
+        for path in (self.part, self.meta):
+            if path.exists():
+                path.unlink()
+        self.headers = {}
+
+    def request(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        # Ranges refer to the encoded body, keep it identical to the file
+        headers = {**kwargs.get("headers", {}), "Accept-Encoding": "identity"}
+        offset = self.offset
+        validator = self._validator()
+        if offset and validator is not None:
+            headers.update({"Range": f"bytes={offset}-", "If-Range": validator})
+        return {**kwargs, "headers": headers}
+
+    def start(self, response: httpx.Response) -> Optional[BinaryIO]:
+        """Open ``part`` for the body of ``response``, None if there's none to write"""
+        content_range = response.headers.get("content-range", "")
+        match = _CONTENT_RANGE.fullmatch(content_range)
+        if response.status_code == 206:
+            start = None if match is None else match.group(1)
+            if start is None or int(start) != self.offset:
+                raise DownloadError(f"Unexpected Content-Range {content_range!r}")
+            return open(self.part, "ab")
+        if response.status_code == 416:
+            # Nothing left to send if the part already holds the whole body,
+            # start over otherwise
+            if match is not None and match.group(2) == str(self.offset):
+                self.complete = True
+            else:
+                self._discard()
+            return None
+        if response.status_code != 200:
+            raise DownloadError(f"Failed to download file: HTTP {response.status_code}")
+        # The whole body, either the first request or the file changed
+        self.headers = {
+            name: response.headers[name]
+            for name in ("etag", "last-modified", "content-type", "content-length")
+            if name in response.headers
+        }
+        self.meta.write_text(json.dumps(self.headers))
+        return open(self.part, "wb")
+
+    def check_complete(self) -> None:
+        # A connection can also drop without an error, so compare with the
+        # Content-Length of the whole body
+        expected = self.headers.get("content-length")
+        self.complete = expected is None or int(expected) == self.offset
+
+    def finish(self, resumes: int, loads: Callable[[bytes], Any]) -> Download:
+        content_type = self.headers.get("content-type")
+        result = None
+        if content_type is not None and "json" in content_type:
+            decoder = FileContentsDecoder(loads)
+            with open(self.part, "rb") as body, open(self.path, "wb") as file:
+                for chunk in iter(lambda: body.read(self.chunk_size), b""):
+                    file.write(decoder.feed(chunk))
+            result = FileContentResult.from_dict(decoder.close())
+            self.part.unlink()
+        else:
+            os.replace(self.part, self.path)
+        self.meta.unlink()
+        return Download(
+            path=self.path,
+            size=self.path.stat().st_size,
+            resumes=resumes,
+            content_type=content_type,
+            result=result,
+        )
+
+
+def download_file(
+    endpoint: ModuleType,
+    client: Union[AuthenticatedClient, Client],
+    path: Union[str, Path],
+    chunk_size: int = 1 << 20,
+    max_resumes: int = 5,
+    **kwargs: Any,
+) -> Download:
+    """Download the file of ``endpoint`` to ``path``, resuming interrupted transfers.
+
+    ``endpoint`` is ``get_file_full_download_cdrs`` or
+    ``get_file_intercharge_cdrs`` and ``kwargs`` its filters. The body is written
+    as it arrives and decoded ``chunk_size`` bytes at a time. Network errors are
+    retried with a ``Range`` request up to ``max_resumes`` times; after that, or
+    on any other error, the partial body is kept for the next call to resume.
+    """
+    partial = _PartialDownload(path, chunk_size)
+    request = endpoint._get_kwargs(**kwargs)
+    resumes = 0
+    while True:
+        try:
+            httpx_client = client.get_httpx_client()
+            with httpx_client.stream(**partial.request(request)) as response:
+                file = partial.start(response)
+                if file is not None:
+                    with file:
+                        for chunk in response.iter_raw():
+                            file.write(chunk)
+                    partial.check_complete()
+        except httpx.TransportError:
+            if resumes >= max_resumes:
+                raise
+        else:
+            if partial.complete:
+                return partial.finish(resumes, client.json_codec.loads)
+            if resumes >= max_resumes:
+                raise DownloadError(f"Download incomplete after {resumes} resumes")
+        resumes += 1
+
+
+async def adownload_file(
+    endpoint: ModuleType,
+    client: Union[AuthenticatedClient, Client],
+    path: Union[str, Path],
+    chunk_size: int = 1 << 20,
+    max_resumes: int = 5,
+    **kwargs: Any,
+) -> Download:
+    """Async version of ``download_file``"""
+    partial = _PartialDownload(path, chunk_size)
+    request = endpoint._get_kwargs(**kwargs)
+    resumes = 0
+    while True:
+        try:
+            async with client.get_async_httpx_client().stream(
+                **partial.request(request)
+            ) as response:
+                file = partial.start(response)
+                if file is not None:
+                    with file:
+                        async for chunk in response.aiter_raw():
+                            file.write(chunk)
+                    partial.check_complete()
+        except httpx.TransportError:
+            if resumes >= max_resumes:
+                raise
+        else:
+            if partial.complete:
+                return partial.finish(resumes, client.json_codec.loads)
+            if resumes >= max_resumes:
+                raise DownloadError(f"Download incomplete after {resumes} resumes")
+        resumes += 1
@@ -4,3 +4,19 @@ class CompositeScheduleNotFoundError(Exception):
 
 class ChargepointNotFoundError(Exception):
     pass
+
+
+class PageLoadError(Exception):
+    pass
+
+
+class ChargerResponseTimeoutError(Exception):
+    pass
+
+
+class CommandFailedError(Exception):
+    pass
+
+
+class DownloadError(Exception):
+    pass
@@ -0,0 +1,359 @@
+"""A durable, append-only journal of received webhooks.
+
+``WebhookJournal`` appends the raw body of every webhook to a segment file and
+a small index entry (type, subject, time, id and where the body is) to the
+index file next to it, so that webhooks received while a consumer was down can
+be replayed instead of asking Longship to send them again. Segments are
+rotated at ``segment_size`` bytes and dropped as a whole once the journal
+exceeds ``max_bytes`` or their newest webhook is older than ``max_age``, which
+is checked when the journal is opened and on every append.
+
+Replays read segments and indexes through ``mmap``, filter on the index and
+only copy out the bodies of the matching webhooks, which are decoded into a
+``WebhookPayload`` when first accessed.
+
+Example:
+    journal = WebhookJournal("/var/lib/webhooks", max_age=timedelta(days=7))
+    journal.append(body)
+    ...
+    for entry in journal.replay(types=[WebhookPayloadType.SessionStop], since=since):
+        handle(entry.payload)
+"""
+
+import datetime
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Any, Callable, Collection, Iterator, List, Optional, Tuple, Union
+
+from longship.types import WebhookPayload
+from longship_api_client.json_codec import default_json_codec
+from longship_api_client.timestamps import parse_timestamp
+
+# Body offset and length, time in microseconds since the epoch and the lengths
+# of the type, id and subject that follow
+_ENTRY = struct.Struct("<QIqHHH")
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+_LOG_SUFFIX = ".log"
+_INDEX_SUFFIX = ".idx"
+
+
+def _microseconds(moment: datetime.datetime) -> int:
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=datetime.timezone.utc)
+    return (moment - _EPOCH) // datetime.timedelta(microseconds=1)
+
+
+class JournalEntry:
+    """A journaled webhook, its body is decoded on first access of ``payload``"""
+
+    __slots__ = ("seq", "type", "subject", "id", "time", "body", "_payload")
+
+    def __init__(
+        self,
+        seq: int,
+        type: str,
+        subject: str,
+        id: str,
+        time: datetime.datetime,
+        body: bytes,
+    ) -> None:
+        self.seq = seq
+        self.type = type
+        self.subject = subject
+        self.id = id
+        self.time = time
+        self.body = body
+        self._payload: Optional[WebhookPayload] = None
+
+    @property
+    def payload(self) -> WebhookPayload:
+        if self._payload is None:
+            self._payload = WebhookPayload.from_json(self.body)
+        return self._payload
+
+    def __repr__(self) -> str:
+        return f"JournalEntry(seq={self.seq}, type={self.type!r}, id={self.id!r})"
+
+
+class _Segment:
+    """A log file of bodies and the index file of their entries"""
+
+    def __init__(self, directory: Path, base_seq: int) -> None:
+        self.base_seq = base_seq
+        name = f"{base_seq:020d}"
+        self.log_path = directory / (name + _LOG_SUFFIX)
+        self.index_path = directory / (name + _INDEX_SUFFIX)
+        self.count = 0
+        self.log_size = 0
+        self.index_size = 0
+        self.min_time: Optional[int] = None
+        self.max_time: Optional[int] = None
+
+    @property
+    def size(self) -> int:
+        return self.log_size + self.index_size
+
+    def _add(self, time: int) -> None:
+        self.count += 1
+        self.min_time = time if self.min_time is None else min(self.min_time, time)
+        self.max_time = time if self.max_time is None else max(self.max_time, time)
+
+    def _entries(
+        self, index: Any, log_size: int
+    ) -> Iterator[Tuple[int, int, int, int]]:
+        """``(offset, length, time, end)`` of the complete entries of ``index``,
+        ``end`` being where the entry ends in the index
+        """
+        position = 0
+        index_size = len(index)
+        while position + _ENTRY.size <= index_size:
+            offset, length, time, *lengths = _ENTRY.unpack_from(index, position)
+            end = position + _ENTRY.size + sum(lengths)
+            if end > index_size or offset + length > log_size:
+                return
+            yield offset, length, time, end
+            position = end
+
+    def recover(self) -> None:
+        """Load the entries and cut off what a crash left incomplete"""
+        self.log_size = self.log_path.stat().st_size
+        self.index_size = 0
+        log_end = 0
+        if self.index_path.stat().st_size:
+            with open(self.index_path, "rb") as file, mmap.mmap(
+                file.fileno(), 0, access=mmap.ACCESS_READ
+            ) as index:
+                for offset, length, time, end in self._entries(index, self.log_size):
+                    self._add(time)
+                    log_end = offset + length
+                    self.index_size = end
+        sizes = ((self.index_path, self.index_size), (self.log_path, log_end))
+        for path, size in sizes:
+            if path.stat().st_size != size:
+                os.truncate(path, size)
+        self.log_size = log_end
+
+    def may_match(self, seq: int, since: Optional[int], until: Optional[int]) -> bool:
+        if self.base_seq + self.count <= seq or self.min_time is None:
+            return False
+        if since is not None and self.max_time < since:
+            return False
+        return until is None or self.min_time < until
+
+    def read(
+        self,
+        seq: int,
+        types: Optional[Collection[bytes]],
+        subject: Optional[bytes],
+        since: Optional[int],
+        until: Optional[int],
+    ) -> Iterator[JournalEntry]:
+        """The entries from ``seq`` on that match the filters. Only the index
+        is read for the others and only the bodies of matches are copied.
+        """
+        with open(self.index_path, "rb") as index_file, open(
+            self.log_path, "rb"
+        ) as log_file, mmap.mmap(
+            index_file.fileno(), self.index_size, access=mmap.ACCESS_READ
+        ) as index, mmap.mmap(
+            log_file.fileno(), self.log_size, access=mmap.ACCESS_READ
+        ) as log:
+            position = 0
+            for number in range(self.base_seq, self.base_seq + self.count):
+                offset, length, time, type_length, id_length, subject_length = (
+                    _ENTRY.unpack_from(index, position)
+                )
+                type_start = position + _ENTRY.size
+                id_start = type_start + type_length
+                subject_start = id_start + id_length
+                position = subject_start + subject_length
+                if (
+                    number < seq
+                    or (since is not None and time < since)
+                    or (until is not None and time >= until)
+                ):
+                    continue
+                type = index[type_start:id_start]
+                entry_subject = index[subject_start:position]
+                if (types is None or type in types) and (
+                    subject is None or entry_subject == subject
+                ):
+                    yield JournalEntry(
+                        number,
+                        type.decode(),
+                        entry_subject.decode(),
+                        index[id_start:subject_start].decode(),
+                        _EPOCH + datetime.timedelta(microseconds=time),
+                        log[offset : offset + length],
+                    )
+
+
+class WebhookJournal:
+    """Appends webhooks to segment files in ``directory`` and replays them.
+
+    Every webhook gets a sequence number, consumers can remember the last one
+    they handled and ``replay(start=seq + 1)`` after a restart. With ``sync``
+    every append is flushed to disk with ``fsync``, otherwise it survives a
+    crash of the process but not necessarily one of the machine.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        segment_size: int = 64 << 20,
+        max_bytes: Optional[int] = None,
+        max_age: Optional[datetime.timedelta] = None,
+        sync: bool = False,
+        loads: Optional[Callable[[bytes], Any]] = None,
+        clock: Callable[[], datetime.datetime] = lambda: datetime.datetime.now(
+            datetime.timezone.utc
+        ),
+    ) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_size = segment_size
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.sync = sync
+        self.loads = default_json_codec().loads if loads is None else loads
+        self._clock = clock
+        self._segments: List[_Segment] = []
+        for path in sorted(self.directory.glob("*" + _LOG_SUFFIX)):
+            segment = _Segment(self.directory, int(path.stem))
+            if not segment.index_path.exists():
+                segment.index_path.touch()
+            segment.recover()
+            self._segments.append(segment)
+        if not self._segments:
+            self._segments.append(self._create(0))
+        self._open_active()
+        self.apply_retention()
+
+    def _create(self, base_seq: int) -> _Segment:
+        segment = _Segment(self.directory, base_seq)
+        segment.log_path.touch()
+        segment.index_path.touch()
+        return segment
+
+    def _open_active(self) -> None:
+        active = self._segments[-1]
+        self._log = open(active.log_path, "ab")
+        self._index = open(active.index_path, "ab")
+
+    def close(self) -> None:
+        self._log.close()
+        self._index.close()
+
+    def __enter__(self) -> "WebhookJournal":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return sum(segment.count for segment in self._segments)
+
+    @property
+    def next_seq(self) -> int:
+        """The sequence number of the next webhook appended"""
+        active = self._segments[-1]
+        return active.base_seq + active.count
+
+    @property
+    def size(self) -> int:
+        """Bytes on disk, bodies and indexes"""
+        return sum(segment.size for segment in self._segments)
+
+    def append(self, body: bytes, payload: Optional[WebhookPayload] = None) -> int:
+        """Journal the raw ``body`` of a webhook, returns its sequence number.
+
+        ``payload`` saves decoding ``body`` again if it was decoded already.
+        """
+        if payload is None:
+            header = self.loads(body)
+            fields = (header["type"], header["id"], header["subject"], header["time"])
+        else:
+            fields = (payload.type, payload.id, payload.subject, payload.time)
+        type, id, subject = (str(field).encode() for field in fields[:3])
+        time = _microseconds(parse_timestamp(fields[3]))
+        active = self._segments[-1]
+        if active.count and active.size >= self.segment_size:
+            active = self._rotate()
+        seq = active.base_seq + active.count
+        self._log.write(body)
+        entry = _ENTRY.pack(
+            active.log_size, len(body), time, len(type), len(id), len(subject)
+        )
+        self._index.write(entry + type + id + subject)
+        # The body first, an index entry must never point beyond the log
+        self._log.flush()
+        if self.sync:
+            os.fsync(self._log.fileno())
+        self._index.flush()
+        if self.sync:
+            os.fsync(self._index.fileno())
+        active.log_size += len(body)
+        active.index_size += len(entry) + len(type) + len(id) + len(subject)
+        active._add(time)
+        # Segments also expire while no new one is started
+        if len(self._segments) > 1:
+            self.apply_retention()
+        return seq
+
+    def _rotate(self) -> _Segment:
+        self.close()
+        active = self._create(self.next_seq)
+        self._segments.append(active)
+        self._open_active()
+        self.apply_retention()
+        return active
+
+    def apply_retention(self) -> int:
+        """Delete the oldest segments beyond ``max_bytes`` or ``max_age``,
+        returns how many were deleted. The segment appended to is kept.
+        """
+        oldest = None
+        if self.max_age is not None:
+            oldest = _microseconds(self._clock() - self.max_age)
+        deleted = 0
+        while len(self._segments) > 1:
+            segment = self._segments[0]
+            too_big = self.max_bytes is not None and self.size > self.max_bytes
+            too_old = (
+                oldest is not None
+                and segment.max_time is not None
+                and segment.max_time < oldest
+            )
+            if not (too_big or too_old):
+                break
+            segment.log_path.unlink()
+            segment.index_path.unlink()
+            del self._segments[0]
+            deleted += 1
+        return deleted
+
+    def replay(
+        self,
+        start: int = 0,
+        types: Optional[Collection[Any]] = None,
+        subject: Optional[str] = None,
+        since: Optional[datetime.datetime] = None,
+        until: Optional[datetime.datetime] = None,
+    ) -> Iterator[JournalEntry]:
+        """The journaled webhooks from sequence number ``start`` on, in the
+        order they were appended.
+
+        Only webhooks of ``types``, of ``subject`` and with a ``time`` from
+        ``since`` up to (excluding) ``until`` are returned if given.
+        """
+        type_names = None if types is None else {str(type).encode() for type in types}
+        subject_name = None if subject is None else subject.encode()
+        since_time = None if since is None else _microseconds(since)
+        until_time = None if until is None else _microseconds(until)
+        for segment in list(self._segments):
+            if segment.may_match(start, since_time, until_time):
+                yield from segment.read(
+                    start, type_names, subject_name, since_time, until_time
+                )
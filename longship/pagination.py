@@ -0,0 +1,128 @@
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from types import ModuleType
+from typing import (
+    Any,
+    AsyncIterator,
+    Deque,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    TypeVar,
+    Union,
+)
+
+from longship.errors import PageLoadError
+from longship_api_client import AuthenticatedClient, Client
+
+T = TypeVar("T")
+
+
+class Paginator(Generic[T]):
+    """Walks the skip/take pages of a ``get_all_*`` endpoint module.
+
+    Supports both ``async for`` (over ``asyncio_detailed``) and plain ``for``
+    (over ``sync_detailed``). While the caller is handling one page, up to
+    ``max_in_flight`` following pages are already being fetched. Iteration stops
+    at the first page that holds fewer than ``page_size`` items.
+
+    Example:
+        async for session in Paginator(get_all_sessions, client, running_only=True):
+            ...
+    """
+
+    def __init__(
+        self,
+        endpoint: ModuleType,
+        client: Union[AuthenticatedClient, Client],
+        page_size: int = 100,
+        max_in_flight: int = 2,
+        **kwargs: Any,
+    ) -> None:
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        self.endpoint = endpoint
+        self.client = client
+        self.page_size = page_size
+        self.max_in_flight = max_in_flight
+        self.kwargs: Dict[str, Any] = kwargs
+
+    def _check_page(self, skip: int, response) -> List[T]:
+        if not isinstance(response.parsed, list):
+            raise PageLoadError(
+                f"Failed to load page at skip={skip} "
+                f"from {self.endpoint.__name__}: HTTP {response.status_code}"
+            )
+        return response.parsed
+
+    async def _fetch_page_async(self, skip: int) -> List[T]:
+        response = await self.endpoint.asyncio_detailed(
+            client=self.client, skip=skip, take=self.page_size, **self.kwargs
+        )
+        return self._check_page(skip, response)
+
+    def _fetch_page(self, skip: int) -> List[T]:
+        response = self.endpoint.sync_detailed(
+            client=self.client, skip=skip, take=self.page_size, **self.kwargs
+        )
+        return self._check_page(skip, response)
+
+    async def pages_async(self) -> AsyncIterator[List[T]]:
+        """Yield whole pages, prefetching the following ones in the background"""
+        next_skip = 0
+        pending: Deque[asyncio.Task] = deque()
+        try:
+            for _ in range(self.max_in_flight):
+                pending.append(
+                    asyncio.ensure_future(self._fetch_page_async(next_skip))
+                )
+                next_skip += self.page_size
+            while pending:
+                page = await pending.popleft()
+                if len(page) < self.page_size:
+                    if page:
+                        yield page
+                    return
+                pending.append(
+                    asyncio.ensure_future(self._fetch_page_async(next_skip))
+                )
+                next_skip += self.page_size
+                yield page
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def pages(self) -> Iterator[List[T]]:
+        """Yield whole pages, prefetching the following ones on worker threads"""
+        next_skip = 0
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as executor:
+            pending = deque()
+            try:
+                for _ in range(self.max_in_flight):
+                    pending.append(executor.submit(self._fetch_page, next_skip))
+                    next_skip += self.page_size
+                while pending:
+                    page = pending.popleft().result()
+                    if len(page) < self.page_size:
+                        if page:
+                            yield page
+                        return
+                    pending.append(executor.submit(self._fetch_page, next_skip))
+                    next_skip += self.page_size
+                    yield page
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    async def __aiter__(self) -> AsyncIterator[T]:
+        async for page in self.pages_async():
+            for item in page:
+                yield item
+
+    def __iter__(self) -> Iterator[T]:
+        for page in self.pages():
+            yield from page
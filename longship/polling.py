@@ -0,0 +1,76 @@
+import bisect
+import random
+from typing import Dict, Optional, Sequence
+
+DEFAULT_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0)
+
+
+class LatencyHistogram:
+    """Counts observed latencies (in seconds) into cumulative upper-bound buckets.
+
+    Observations above the largest bucket are only counted in ``count``, like
+    the ``+Inf`` bucket of a Prometheus histogram.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        index = bisect.bisect_left(self.buckets, seconds)
+        if index < len(self._counts):
+            self._counts[index] += 1
+        self.count += 1
+        self.sum += seconds
+
+    def snapshot(self) -> Dict[float, int]:
+        """Return the cumulative count of observations per bucket upper bound"""
+        cumulative = {}
+        total = 0
+        for bound, count in zip(self.buckets, self._counts):
+            total += count
+            cumulative[bound] = total
+        return cumulative
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Return the upper bound of the bucket holding the ``q`` quantile"""
+        if self.count == 0:
+            return None
+        rank = q * self.count
+        for bound, count in self.snapshot().items():
+            if count >= rank:
+                return bound
+        return float("inf")
+
+
+class Backoff:
+    """Exponentially growing, jittered delays between polls.
+
+    Starts at ``initial_delay`` and grows by ``multiplier`` up to ``max_delay``
+    with every ``next_delay()``. Every delay is randomised by +/- ``jitter`` so
+    that many pollers don't hit the API in step.
+    """
+
+    def __init__(
+        self,
+        initial_delay: float = 0.1,
+        max_delay: float = 2.0,
+        multiplier: float = 2.0,
+        jitter: float = 0.2,
+    ) -> None:
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self._delay = initial_delay
+
+    def next_delay(self) -> float:
+        delay = self._delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+        self._delay = min(self._delay * self.multiplier, self.max_delay)
+        return delay
+
+    def reset(self) -> None:
+        self._delay = self.initial_delay
+
@@ -0,0 +1,109 @@
+import asyncio
+from collections import Counter, OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, List, Set, Tuple
+
+from longship.client import Longship
+
+
+class LongshipRegistry:
+    """Keeps one pooled ``Longship`` client per (url, apiKey) tenant.
+
+    Clients are created on first use and kept in least-recently-used order. Once
+    more than ``max_size`` tenants are registered the least recently used client
+    is evicted and its connection pool closed. ``client_options`` (pool sizing,
+    ``http2``, ...) are passed to every client that is created.
+
+    A client returned by ``get`` may be closed as soon as it is evicted, use
+    ``lease`` to hold on to it across awaits: an evicted client is only closed
+    once its last lease is released. Clients evicted outside of a running event
+    loop are closed by ``aclose``.
+
+    Example:
+        async with LongshipRegistry(max_size=16) as registry:
+            async with registry.lease(url, api_key, ocp_key) as longship:
+                await longship.get_chargepoint("CP1")
+    """
+
+    def __init__(self, max_size: int = 32, **client_options: Any) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self.client_options = client_options
+        self._clients: "OrderedDict[Tuple[str, str], Longship]" = OrderedDict()
+        self._leases: Counter = Counter()
+        # Evicted clients waiting for their leases to be released or for aclose
+        self._retired: List[Longship] = []
+        self._closing: Set[asyncio.Task] = set()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def __contains__(self, key: Tuple[str, str]) -> bool:
+        return key in self._clients
+
+    def get(self, url: str, apiKey: str, ocpKey: str) -> Longship:
+        """Return the client of a tenant, creating it if needed"""
+        key = (url, apiKey)
+        longship = self._clients.get(key)
+        if longship is not None:
+            self._clients.move_to_end(key)
+            return longship
+        longship = Longship(url, apiKey, ocpKey, **self.client_options)
+        self._clients[key] = longship
+        while len(self._clients) > self.max_size:
+            _, evicted = self._clients.popitem(last=False)
+            self._retire(evicted)
+        return longship
+
+    @asynccontextmanager
+    async def lease(
+        self, url: str, apiKey: str, ocpKey: str
+    ) -> AsyncIterator[Longship]:
+        """The client of a tenant, kept open until the block is left"""
+        longship = self.get(url, apiKey, ocpKey)
+        self._leases[longship] += 1
+        try:
+            yield longship
+        finally:
+            self._leases[longship] -= 1
+            if not self._leases[longship]:
+                del self._leases[longship]
+                if longship in self._retired:
+                    self._retired.remove(longship)
+                    await longship.aclose()
+
+    def evict(self, url: str, apiKey: str) -> None:
+        """Drop the client of a tenant and close its connection pool"""
+        longship = self._clients.pop((url, apiKey), None)
+        if longship is not None:
+            self._retire(longship)
+
+    def _retire(self, longship: Longship) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if self._leases[longship] or loop is None:
+            self._retired.append(longship)
+            return
+        task = loop.create_task(longship.aclose())
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def aclose(self) -> None:
+        """Close every registered and evicted client and wait for pending
+        evictions
+        """
+        clients = list(self._clients.values()) + self._retired
+        self._clients.clear()
+        self._retired = []
+        await asyncio.gather(
+            *(longship.aclose() for longship in clients), *self._closing
+        )
+
+    async def __aenter__(self) -> "LongshipRegistry":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
@@ -0,0 +1,257 @@
+"""Columnar export of session meter values and charging periods to NumPy arrays.
+
+NumPy is an optional dependency (the ``numpy`` extra), it is imported when a
+``SessionColumnsBuilder`` is created.
+"""
+
+from array import array
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterable, Dict, Iterable, List, Tuple
+
+import attr
+
+from longship_api_client.models.session_dto import SessionDto
+from longship_api_client.timestamps import parse_timestamp
+from longship_api_client.types import Unset
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MILLISECOND = timedelta(milliseconds=1)
+# Missing timestamps, NaT once viewed as datetime64[ms]
+MISSING_TIMESTAMP = -(2**63)
+MISSING_CODE = -1
+
+
+def _epoch_ms(moment: Any) -> int:
+    # UNSET, None and empty strings are falsy, datetimes never are
+    if not moment:
+        return MISSING_TIMESTAMP
+    if type(moment) is str:
+        moment = parse_timestamp(moment)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return (moment - _EPOCH) // _MILLISECOND
+
+
+def _number(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        # UNSET, None or not a number
+        return float("nan")
+
+
+@attr.s(auto_attribs=True)
+class SessionColumns:
+    """Meter values and charging periods of many sessions as NumPy arrays.
+
+    Session ``i`` owns the meter values
+    ``meter_value_offsets[i]:meter_value_offsets[i + 1]`` and likewise the
+    charging periods of ``charging_period_offsets``. Timestamps are int64
+    milliseconds since the epoch, ``MISSING_TIMESTAMP`` if absent, so that
+    ``view("datetime64[ms]")`` shows them as NaT. Measurands and units are int8
+    codes into ``measurands`` and ``units``, ``MISSING_CODE`` if absent. Values
+    that are absent or not numbers are NaN.
+
+    Example:
+        columns = SessionColumnsBuilder().extend(sessions).build()
+        energy = columns.meter_values[
+            columns.meter_measurands == columns.measurands.index(
+                "Energy.Active.Import.Register"
+            )
+        ]
+    """
+
+    session_ids: Any
+    meter_value_offsets: Any
+    meter_timestamps: Any
+    meter_values: Any
+    meter_measurands: Any
+    meter_units: Any
+    measurands: List[str]
+    units: List[str]
+    charging_period_offsets: Any
+    period_timestamps: Any
+    period_delta_kwh: Any
+    period_absolute_kwh: Any
+    period_price: Any
+
+    def __len__(self) -> int:
+        return len(self.session_ids)
+
+    def meter_value_sessions(self) -> Any:
+        """The session index of every meter value"""
+        import numpy
+
+        return numpy.repeat(
+            numpy.arange(len(self), dtype=numpy.int64),
+            numpy.diff(self.meter_value_offsets),
+        )
+
+    def charging_period_sessions(self) -> Any:
+        """The session index of every charging period"""
+        import numpy
+
+        return numpy.repeat(
+            numpy.arange(len(self), dtype=numpy.int64),
+            numpy.diff(self.charging_period_offsets),
+        )
+
+
+class SessionColumnsBuilder:
+    """Streams sessions into the growing columns of a ``SessionColumns``.
+
+    Rows are appended to typed ``array.array`` buffers, which ``build`` turns
+    into NumPy arrays without copying them item by item. Sessions can be added
+    as models (``add``, ``extend``, ``aextend``) or as the JSON objects of the
+    API (``add_dict``), which skips decoding their meter values into models.
+    """
+
+    def __init__(self) -> None:
+        import numpy
+
+        self._numpy = numpy
+        self._session_ids: List[Any] = []
+        self._meter_value_offsets = array("q", [0])
+        self._meter_timestamps = array("q")
+        self._meter_values = array("d")
+        self._meter_measurands = array("b")
+        self._meter_units = array("b")
+        self._measurand_codes: Dict[Any, int] = {}
+        self._unit_codes: Dict[Any, int] = {}
+        self._measurands: List[str] = []
+        self._units: List[str] = []
+        self._charging_period_offsets = array("q", [0])
+        self._period_timestamps = array("q")
+        self._period_delta_kwh = array("d")
+        self._period_absolute_kwh = array("d")
+        self._period_price = array("d")
+
+    @staticmethod
+    def _code(codes: Dict[Any, int], categories: List[str], value: Any) -> int:
+        # Keyed by both the enum members of the models and the strings of the
+        # API, members hash by their name and don't find their value
+        if isinstance(value, Unset) or value is None:
+            return MISSING_CODE
+        name = getattr(value, "value", value)
+        code = codes.get(name)
+        if code is None:
+            code = len(categories)
+            if code > 127:
+                raise ValueError(f"More than 128 categories, cannot encode {name}")
+            categories.append(name)
+            codes[name] = code
+        codes[value] = code
+        return code
+
+    def _add_meter_values(self, rows: Iterable[Tuple[Any, Any, Any, Any]]) -> None:
+        timestamps = self._meter_timestamps.append
+        values = self._meter_values.append
+        measurands = self._meter_measurands.append
+        units = self._meter_units.append
+        measurand_codes = self._measurand_codes
+        unit_codes = self._unit_codes
+        code = self._code
+        for timestamp, value, measurand, unit in rows:
+            timestamps(_epoch_ms(timestamp))
+            values(_number(value))
+            try:
+                measurands(measurand_codes[measurand])
+            except KeyError:
+                measurands(code(measurand_codes, self._measurands, measurand))
+            try:
+                units(unit_codes[unit])
+            except KeyError:
+                units(code(unit_codes, self._units, unit))
+
+    def _add_charging_periods(self, rows: Iterable[Tuple[Any, Any, Any, Any]]) -> None:
+        timestamps = self._period_timestamps.append
+        delta_kwh = self._period_delta_kwh.append
+        absolute_kwh = self._period_absolute_kwh.append
+        price = self._period_price.append
+        for timestamp, delta, absolute, period_price in rows:
+            timestamps(_epoch_ms(timestamp))
+            delta_kwh(_number(delta))
+            absolute_kwh(_number(absolute))
+            price(_number(period_price))
+
+    def _end_session(self, session_id: Any) -> None:
+        self._session_ids.append(None if isinstance(session_id, Unset) else session_id)
+        self._meter_value_offsets.append(len(self._meter_timestamps))
+        self._charging_period_offsets.append(len(self._period_timestamps))
+
+    def add(self, session: SessionDto) -> None:
+        self._add_meter_values(
+            (
+                meter_value.timestamp,
+                meter_value.value,
+                meter_value.measurand,
+                meter_value.unit,
+            )
+            for meter_value in session.charging_meter_values or ()
+        )
+        self._add_charging_periods(
+            (period.timestamp, period.delta_kwh, period.absolute_kwh, period.price)
+            for period in session.charging_periods or ()
+        )
+        self._end_session(session.id)
+
+    def add_dict(self, session: Dict[str, Any]) -> None:
+        """Add a session as returned by the API, before it's decoded into a model"""
+        get = dict.get
+        self._add_meter_values(
+            (
+                get(meter_value, "timestamp"),
+                get(meter_value, "value"),
+                get(meter_value, "measurand"),
+                get(meter_value, "unit"),
+            )
+            for meter_value in session.get("chargingMeterValues") or ()
+        )
+        self._add_charging_periods(
+            (
+                get(period, "timestamp"),
+                get(period, "deltaKwh"),
+                get(period, "absoluteKwh"),
+                get(period, "price"),
+            )
+            for period in session.get("chargingPeriods") or ()
+        )
+        self._end_session(session.get("id"))
+
+    def extend(self, sessions: Iterable[SessionDto]) -> "SessionColumnsBuilder":
+        for session in sessions:
+            self.add(session)
+        return self
+
+    async def aextend(
+        self, sessions: AsyncIterable[SessionDto]
+    ) -> "SessionColumnsBuilder":
+        async for session in sessions:
+            self.add(session)
+        return self
+
+    def build(self) -> SessionColumns:
+        """The columns of every session added so far"""
+        numpy = self._numpy
+
+        def column(values: array, dtype: Any) -> Any:
+            # Copy, so that adding more sessions doesn't resize the buffer under
+            # the returned array
+            return numpy.frombuffer(values, dtype=dtype).copy()
+
+        return SessionColumns(
+            session_ids=numpy.array(self._session_ids, dtype=object),
+            meter_value_offsets=column(self._meter_value_offsets, numpy.int64),
+            meter_timestamps=column(self._meter_timestamps, numpy.int64),
+            meter_values=column(self._meter_values, numpy.float64),
+            meter_measurands=column(self._meter_measurands, numpy.int8),
+            meter_units=column(self._meter_units, numpy.int8),
+            measurands=list(self._measurands),
+            units=list(self._units),
+            charging_period_offsets=column(self._charging_period_offsets, numpy.int64),
+            period_timestamps=column(self._period_timestamps, numpy.int64),
+            period_delta_kwh=column(self._period_delta_kwh, numpy.float64),
+            period_absolute_kwh=column(self._period_absolute_kwh, numpy.float64),
+            period_price=column(self._period_price, numpy.float64),
+        )
+
@@ -0,0 +1,347 @@
+"""An in-memory table of running sessions, kept up to date by webhooks.
+
+``SessionTracker`` applies ``SessionStart``, ``SessionUpdate`` and
+``SessionStop`` webhooks to a table of running sessions indexed by session id,
+chargepoint connector and transaction id, so that nothing has to poll
+``get_all_sessions`` to learn what is charging. Listeners registered with
+``subscribe`` are told about every session that starts, changes or stops, and
+about sessions ``Displaced`` by a new session on their connector: their stop was
+missed, so they may still be running until the next backfill tells.
+
+``get_all_sessions`` is only paged to fill the table on startup and after a
+gap: an update of a session that never started, or a start on a connector
+still occupied by another session, means webhooks were missed.
+
+Example:
+    tracker = longship.session_tracker()
+    tracker.subscribe(lambda change, session: print(change, session.session_id))
+    asyncio.create_task(tracker.run())
+"""
+
+import asyncio
+import datetime
+import logging
+import time
+from collections import OrderedDict
+from enum import Enum
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+import attr
+
+from longship.pagination import Paginator
+from longship.types import (
+    BaseSessionData,
+    SessionStartData,
+    SessionStopData,
+    SessionUpdateData,
+    WebhookPayload,
+)
+from longship_api_client import AuthenticatedClient, Client
+from longship_api_client.api.sessions import get_all_sessions
+from longship_api_client.models.session_dto import SessionDto
+from longship_api_client.timestamps import parse_timestamp
+from longship_api_client.types import Unset
+
+logger = logging.getLogger(__name__)
+
+
+class SessionChange(str, Enum):
+    Started = "Started"
+    Updated = "Updated"
+    Stopped = "Stopped"
+    # Replaced by a new session on the same connector, not necessarily stopped
+    Displaced = "Displaced"
+
+    def __str__(self) -> str:
+        return str(self.value)
+
+
+@attr.s(auto_attribs=True)
+class RunningSession:
+    session_id: str
+    chargepoint_id: str
+    connector_number: int
+    transaction_id: Optional[str] = None
+    # When the session started and when it was last reported on
+    started: Optional[datetime.datetime] = None
+    updated: Optional[datetime.datetime] = None
+    total_energy_in_kwh: Optional[float] = None
+    total_duration: Optional[str] = None
+    total_costs: Optional[float] = None
+    location_id: Optional[str] = None
+    evse_id: Optional[str] = None
+    state_of_charge: Optional[float] = None
+
+
+Listener = Callable[[SessionChange, RunningSession], None]
+
+
+def _optional(value: Any) -> Any:
+    return None if isinstance(value, Unset) else value
+
+
+def _from_dto(dto: SessionDto) -> RunningSession:
+    transaction_id = _optional(dto.ocpp_transaction_id)
+    if transaction_id is None and not isinstance(dto.transaction_id, Unset):
+        transaction_id = str(dto.transaction_id)
+    location = _optional(dto.session_location)
+    return RunningSession(
+        session_id=dto.id,
+        chargepoint_id=dto.charge_point_id,
+        connector_number=dto.connector_id,
+        transaction_id=transaction_id,
+        started=_optional(dto.session_start),
+        updated=_optional(dto.last_updated),
+        total_energy_in_kwh=_optional(dto.total_energy_in_kwh),
+        total_costs=_optional(dto.total_price),
+        location_id=None if location is None else _optional(location.id),
+    )
+
+
+class SessionTracker:
+    """Running sessions by session id, ``(chargepoint_id, connector_number)``
+    and transaction id.
+
+    Feed every received webhook to ``apply``. ``run`` backfills the table on
+    startup and whenever ``apply`` detected a gap. Events of the last
+    ``remember_stopped`` stopped sessions are ignored, so that a redelivered or
+    late ``SessionUpdate`` doesn't bring a stopped session back. A failed
+    backfill is counted in ``failures`` and retried after ``retry_interval``
+    seconds.
+    """
+
+    def __init__(
+        self,
+        client: Union[AuthenticatedClient, Client],
+        page_size: int = 100,
+        backfill_delay: float = 1.0,
+        remember_stopped: int = 10_000,
+        retry_interval: float = 30.0,
+    ) -> None:
+        self.client = client
+        self.page_size = page_size
+        # Waited after a gap before backfilling, so that one backfill covers a
+        # burst of gaps
+        self.backfill_delay = backfill_delay
+        self.remember_stopped = remember_stopped
+        self.retry_interval = retry_interval
+        self.gaps = 0
+        self.backfills = 0
+        self.failures = 0
+        self._sessions: Dict[str, RunningSession] = {}
+        self._by_connector: Dict[Tuple[str, int], str] = {}
+        self._by_transaction: Dict[str, str] = {}
+        self._stopped: "OrderedDict[str, None]" = OrderedDict()
+        # Monotonic time each session was last changed at
+        self._touched: Dict[str, float] = {}
+        self._listeners: List[Listener] = []
+        # Created on first use, so that they belong to the running loop
+        self._ready: Optional[asyncio.Event] = None
+        self._gap_event: Optional[asyncio.Event] = None
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    @property
+    def ready(self) -> asyncio.Event:
+        """Set after the first backfill"""
+        if self._ready is None:
+            self._ready = asyncio.Event()
+        return self._ready
+
+    @property
+    def _gap(self) -> asyncio.Event:
+        if self._gap_event is None:
+            self._gap_event = asyncio.Event()
+        return self._gap_event
+
+    def __iter__(self) -> Iterator[RunningSession]:
+        return iter(list(self._sessions.values()))
+
+    def get(self, session_id: str) -> Optional[RunningSession]:
+        return self._sessions.get(session_id)
+
+    def by_connector(
+        self, chargepoint_id: str, connector_number: int
+    ) -> Optional[RunningSession]:
+        session_id = self._by_connector.get((chargepoint_id, connector_number))
+        return None if session_id is None else self._sessions[session_id]
+
+    def by_transaction(self, transaction_id: str) -> Optional[RunningSession]:
+        session_id = self._by_transaction.get(transaction_id)
+        return None if session_id is None else self._sessions[session_id]
+
+    def by_chargepoint(self, chargepoint_id: str) -> List[RunningSession]:
+        return [
+            session
+            for session in self._sessions.values()
+            if session.chargepoint_id == chargepoint_id
+        ]
+
+    def subscribe(self, listener: Listener) -> Callable[[], None]:
+        """Call ``listener(change, session)`` on every change, returns a
+        function that unsubscribes it again
+        """
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    def _notify(self, change: SessionChange, session: RunningSession) -> None:
+        for listener in list(self._listeners):
+            listener(change, session)
+
+    def _detected_gap(self) -> None:
+        self.gaps += 1
+        self._gap.set()
+
+    def _add(self, session: RunningSession) -> None:
+        connector = (session.chargepoint_id, session.connector_number)
+        previous = self._by_connector.get(connector)
+        if previous is not None and previous != session.session_id:
+            # Not necessarily stopped, the backfill after the gap decides
+            self._remove(previous, stopped=False)
+        self._sessions[session.session_id] = session
+        self._by_connector[connector] = session.session_id
+        if session.transaction_id is not None:
+            self._by_transaction[session.transaction_id] = session.session_id
+        self._touched[session.session_id] = time.monotonic()
+        self._notify(SessionChange.Started, session)
+
+    def _remember_stopped(self, session_id: str) -> None:
+        self._stopped[session_id] = None
+        while len(self._stopped) > self.remember_stopped:
+            self._stopped.popitem(last=False)
+
+    def _remove(self, session_id: str, stopped: bool = True) -> RunningSession:
+        session = self._sessions.pop(session_id)
+        del self._touched[session_id]
+        connector = (session.chargepoint_id, session.connector_number)
+        if self._by_connector.get(connector) == session_id:
+            del self._by_connector[connector]
+        if self._by_transaction.get(session.transaction_id) == session_id:
+            del self._by_transaction[session.transaction_id]
+        if stopped:
+            self._remember_stopped(session_id)
+        self._notify(
+            SessionChange.Stopped if stopped else SessionChange.Displaced, session
+        )
+        return session
+
+    def apply(self, payload: WebhookPayload) -> Optional[RunningSession]:
+        """Apply a session webhook, returns the session it changed.
+
+        Other webhooks, events of stopped sessions and events older than the
+        last one applied to their session are ignored. Only a start adds a
+        session, an update of an unknown session is left to the backfill.
+        """
+        data = payload.data
+        if not isinstance(data, BaseSessionData):
+            return None
+        session_id = payload.subject
+        if session_id in self._stopped:
+            return None
+        reported = parse_timestamp(payload.time)
+        session = self._sessions.get(session_id)
+        is_new = session is None
+        if session is None:
+            if isinstance(data, SessionStopData):
+                # Stopped before its start arrived, there's nothing to track
+                self._remember_stopped(session_id)
+                return None
+            if not isinstance(data, SessionStartData):
+                # Updated without having started
+                self._detected_gap()
+                return None
+            if (data.chargepointid, data.connectornumber) in self._by_connector:
+                # The stop of the session before was missed
+                self._detected_gap()
+            session = RunningSession(
+                session_id=session_id,
+                chargepoint_id=data.chargepointid,
+                connector_number=data.connectornumber,
+                started=reported,
+            )
+        elif session.updated is not None and reported < session.updated:
+            return None
+        session.updated = reported
+        if session.transaction_id is None and data.transactionid is not None:
+            session.transaction_id = data.transactionid
+            if not is_new:
+                self._by_transaction[data.transactionid] = session_id
+        if isinstance(data, SessionUpdateData):
+            session.total_energy_in_kwh = data.totalenergyinkwh
+            session.total_duration = data.totalduration
+            session.total_costs = data.totalcosts
+        if isinstance(data, (SessionStartData, SessionUpdateData)):
+            session.location_id = data.locationid or session.location_id
+            session.evse_id = data.evseid or session.evse_id
+            if data.stateofcharge is not None:
+                session.state_of_charge = data.stateofcharge
+        if is_new:
+            self._add(session)
+        if isinstance(data, SessionStopData):
+            return self._remove(session_id)
+        if not is_new:
+            self._touched[session_id] = time.monotonic()
+            self._notify(SessionChange.Updated, session)
+        return session
+
+    async def backfill(self) -> None:
+        """Page the running sessions from the API into the table and drop the
+        tracked sessions that aren't running anymore
+        """
+        started = time.monotonic()
+        running: Set[str] = set()
+        paginator = Paginator(
+            get_all_sessions,
+            self.client,
+            page_size=self.page_size,
+            running_only=True,
+        )
+        async for page in paginator.pages_async():
+            for dto in page:
+                if (
+                    isinstance(dto.id, Unset)
+                    or isinstance(dto.charge_point_id, Unset)
+                    or isinstance(dto.connector_id, Unset)
+                    or dto.id in self._stopped
+                ):
+                    continue
+                running.add(dto.id)
+                if dto.id not in self._sessions:
+                    self._add(_from_dto(dto))
+        # Stopped since, unless a webhook reported on it during the backfill
+        for session_id in [
+            session_id
+            for session_id, touched in self._touched.items()
+            if session_id not in running and touched < started
+        ]:
+            self._remove(session_id)
+        self.backfills += 1
+        self.ready.set()
+
+    async def run(self) -> None:
+        """Backfill on startup and after every detected gap until cancelled"""
+        while True:
+            self._gap.clear()
+            try:
+                await self.backfill()
+            except Exception:
+                self.failures += 1
+                logger.exception(
+                    "Backfilling running sessions failed, retrying in %ss",
+                    self.retry_interval,
+                )
+                await asyncio.sleep(self.retry_interval)
+                continue
+            await self._gap.wait()
+            await asyncio.sleep(self.backfill_delay)
@@ -0,0 +1,128 @@
+"""Coalescing of identical concurrent GET requests.
+
+A burst of webhooks about one chargepoint, e.g. ``OperationalStatusChanged``
+for each of its connectors, easily makes a handler per event fetch the same
+chargepoint at the same moment. ``SingleFlight`` lets the first of these calls
+go out and hands its decoded response to every identical call made while it is
+still in flight. Once it has completed, the next call goes out again, so
+nothing is cached beyond the lifetime of one request.
+
+Calls are identical if they request the same path and query of the same
+client. Only GET requests are coalesced, everything else is always sent.
+
+Example:
+    single_flight = SingleFlight()
+    response = await single_flight.acall(chargepoint_get, client, id="CP1")
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+from collections import Counter
+from types import ModuleType
+from typing import Any, Dict, Hashable, Optional, Tuple, Union
+
+import httpx
+
+from longship_api_client import AuthenticatedClient, Client
+from longship_api_client.types import Response
+
+_Client = Union[AuthenticatedClient, Client]
+
+
+class SingleFlight:
+    """Shares one in-flight call of an endpoint between identical callers.
+
+    ``calls`` counts all calls, ``flights`` those sent to the API and
+    ``coalesced`` those answered by a call already in flight, also per endpoint
+    in ``coalesced_by_endpoint``. The shared ``Response`` and its parsed model
+    are the same object for all callers of a flight, don't modify them.
+    """
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.flights = 0
+        self.coalesced = 0
+        self.coalesced_by_endpoint: Counter = Counter()
+        self._tasks: Dict[Hashable, "asyncio.Task[Response[Any]]"] = {}
+        self._futures: Dict[Hashable, "concurrent.futures.Future[Response[Any]]"] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def in_flight(self) -> int:
+        """The number of calls currently sent and awaited"""
+        return len(self._tasks) + len(self._futures)
+
+    def _key(
+        self, endpoint: ModuleType, client: _Client, kwargs: Dict[str, Any]
+    ) -> Optional[Tuple[int, str]]:
+        request = endpoint._get_kwargs(**kwargs)
+        if request["method"].lower() != "get":
+            return None
+        url = httpx.URL(request["url"], params=request.get("params"))
+        return id(client), str(url)
+
+    def _count(self, endpoint: ModuleType, coalesced: bool) -> None:
+        self.calls += 1
+        if coalesced:
+            self.coalesced += 1
+            self.coalesced_by_endpoint[endpoint.__name__.rpartition(".")[2]] += 1
+        else:
+            self.flights += 1
+
+    async def acall(
+        self, endpoint: ModuleType, client: _Client, **kwargs: Any
+    ) -> Response[Any]:
+        """``endpoint.asyncio_detailed(client=client, **kwargs)``, coalesced"""
+        key = self._key(endpoint, client, kwargs)
+        if key is None:
+            self._count(endpoint, coalesced=False)
+            return await endpoint.asyncio_detailed(client=client, **kwargs)
+        task = self._tasks.get(key)
+        self._count(endpoint, coalesced=task is not None)
+        if task is None:
+            task = asyncio.ensure_future(
+                endpoint.asyncio_detailed(client=client, **kwargs)
+            )
+            self._tasks[key] = task
+            task.add_done_callback(lambda task: self._done(key, task))
+        # A caller that is cancelled must not cancel the call of the others
+        return await asyncio.shield(task)
+
+    def _done(self, key: Hashable, task: "asyncio.Task[Response[Any]]") -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if not task.cancelled():
+            # Retrieved, so an error isn't logged if every caller was cancelled
+            task.exception()
+
+    def call(self, endpoint: ModuleType, client: _Client, **kwargs: Any) -> Response[Any]:
+        """``endpoint.sync_detailed(client=client, **kwargs)``, coalesced between
+        threads
+        """
+        key = self._key(endpoint, client, kwargs)
+        if key is None:
+            with self._lock:
+                self._count(endpoint, coalesced=False)
+            return endpoint.sync_detailed(client=client, **kwargs)
+        with self._lock:
+            future = self._futures.get(key)
+            self._count(endpoint, coalesced=future is not None)
+            if future is not None:
+                leader = False
+            else:
+                future = self._futures[key] = concurrent.futures.Future()
+                leader = True
+        if not leader:
+            return future.result()
+        try:
+            response = endpoint.sync_detailed(client=client, **kwargs)
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        else:
+            future.set_result(response)
+            return response
+        finally:
+            with self._lock:
+                del self._futures[key]
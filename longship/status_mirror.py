@@ -0,0 +1,315 @@
+"""An in-process mirror of the status of all chargepoints and their connectors.
+
+``StatusMirror`` pages ``get_all_chargepointstatus`` once and from then on
+applies ``ConnectivityStatusChanged`` and ``OperationalStatusChanged`` webhooks
+to its copy, so status queries are answered from memory instead of the API. The
+mirror is indexed by organization unit and by connector status.
+
+Webhooks can be lost or arrive out of order. Every status remembers the time
+it was reported at, older updates are ignored, and a periodic reconciliation
+sweep pages the API again to repair whatever the webhooks missed.
+
+Example:
+    mirror = longship.status_mirror()
+    asyncio.create_task(mirror.run())
+    await mirror.ready.wait()
+    free = mirror.connectors_with_status(
+        ConnectorOperationalStatusDtoOperationalStatus.AVAILABLE, ou_id=ou_id
+    )
+"""
+
+import asyncio
+import datetime
+import logging
+import time
+from collections import defaultdict
+from typing import (
+    AbstractSet,
+    Any,
+    DefaultDict,
+    Dict,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import attr
+
+from longship.pagination import Paginator
+from longship.types import (
+    ConnectivityStatusChangedData,
+    OperationalStatusChangedData,
+    WebhookPayload,
+)
+from longship_api_client import AuthenticatedClient, Client
+from longship_api_client.api.chargepoint_status import get_all_chargepointstatus
+from longship_api_client.models.chargepoint_status_dto import ChargepointStatusDto
+from longship_api_client.models.chargepoint_status_dto_connectivity_status import (
+    ChargepointStatusDtoConnectivityStatus,
+)
+from longship_api_client.models.connector_operational_status_dto_operational_status import (
+    ConnectorOperationalStatusDtoOperationalStatus,
+)
+from longship_api_client.timestamps import parse_timestamp
+from longship_api_client.types import Unset
+
+ConnectorKey = Tuple[str, int]
+
+logger = logging.getLogger(__name__)
+
+
+def _value(value: Any) -> Any:
+    return None if isinstance(value, Unset) else value
+
+
+def _is_older(
+    reported: Optional[datetime.datetime], known: Optional[datetime.datetime]
+) -> bool:
+    # Updates without a time can't be ordered and are always applied
+    return reported is not None and known is not None and reported < known
+
+
+@attr.s(auto_attribs=True)
+class ConnectorStatus:
+    chargepoint_id: str
+    connector_number: int
+    status: Optional[ConnectorOperationalStatusDtoOperationalStatus] = None
+    # When the status was reported
+    timestamp: Optional[datetime.datetime] = None
+    error_code: Optional[str] = None
+
+
+@attr.s(auto_attribs=True)
+class ChargepointStatus:
+    chargepoint_id: str
+    ou_id: Optional[str] = None
+    connectivity_status: Optional[ChargepointStatusDtoConnectivityStatus] = None
+    timestamp: Optional[datetime.datetime] = None
+    connectors: Dict[int, ConnectorStatus] = attr.ib(factory=dict)
+
+
+class StatusMirror:
+    """Chargepoint and connector statuses, kept up to date by webhooks.
+
+    Feed every received webhook to ``apply``. ``run`` seeds the mirror and
+    reconciles it with the API every ``reconcile_interval`` seconds; ``repairs``
+    counts the statuses a sweep had to correct, i.e. the missed webhooks, and
+    ``failures`` the sweeps that failed and were retried at the next interval.
+    """
+
+    def __init__(
+        self,
+        client: Union[AuthenticatedClient, Client],
+        reconcile_interval: float = 300.0,
+        page_size: int = 100,
+    ) -> None:
+        self.client = client
+        self.reconcile_interval = reconcile_interval
+        self.page_size = page_size
+        self.repairs = 0
+        self.sweeps = 0
+        self.failures = 0
+        # Created on first use, so that it belongs to the running loop
+        self._ready: Optional[asyncio.Event] = None
+        self._chargepoints: Dict[str, ChargepointStatus] = {}
+        # Monotonic time of the last change per chargepoint, so that a sweep
+        # doesn't drop chargepoints first heard of while it was running
+        self._touched: Dict[str, float] = {}
+        # Dicts without values, whose keys() are read-only views of the index
+        self._by_ou: DefaultDict[Optional[str], Dict[str, None]] = defaultdict(dict)
+        self._by_status: DefaultDict[
+            Optional[ConnectorOperationalStatusDtoOperationalStatus],
+            Dict[ConnectorKey, None],
+        ] = defaultdict(dict)
+
+    def __len__(self) -> int:
+        return len(self._chargepoints)
+
+    @property
+    def ready(self) -> asyncio.Event:
+        """Set once the mirror was seeded"""
+        if self._ready is None:
+            self._ready = asyncio.Event()
+        return self._ready
+
+    def chargepoint(self, chargepoint_id: str) -> Optional[ChargepointStatus]:
+        return self._chargepoints.get(chargepoint_id)
+
+    def connector(
+        self, chargepoint_id: str, connector_number: int
+    ) -> Optional[ConnectorStatus]:
+        chargepoint = self._chargepoints.get(chargepoint_id)
+        if chargepoint is None:
+            return None
+        return chargepoint.connectors.get(connector_number)
+
+    def chargepoints_in_ou(self, ou_id: Optional[str]) -> AbstractSet[str]:
+        """A live, read-only view of the chargepoints of organization unit
+        ``ou_id``, copy it to keep it across awaits
+        """
+        return self._by_ou[ou_id].keys()
+
+    def connectors_with_status(
+        self,
+        status: Optional[ConnectorOperationalStatusDtoOperationalStatus],
+        ou_id: Optional[str] = None,
+    ) -> AbstractSet[ConnectorKey]:
+        """The ``(chargepoint_id, connector_number)`` of all connectors in
+        ``status``, only those of organization unit ``ou_id`` if given.
+
+        Without ``ou_id`` this is a live, read-only view of the index, copy it to
+        keep it across awaits.
+        """
+        connectors = self._by_status[status].keys()
+        if ou_id is None:
+            return connectors
+        in_ou = self._by_ou.get(ou_id, {})
+        return frozenset(key for key in connectors if key[0] in in_ou)
+
+    def _chargepoint(self, chargepoint_id: str) -> ChargepointStatus:
+        chargepoint = self._chargepoints.get(chargepoint_id)
+        if chargepoint is None:
+            chargepoint = self._chargepoints[chargepoint_id] = ChargepointStatus(
+                chargepoint_id
+            )
+            self._by_ou[None][chargepoint_id] = None
+        self._touched[chargepoint_id] = time.monotonic()
+        return chargepoint
+
+    def _set_ou(self, chargepoint: ChargepointStatus, ou_id: Optional[str]) -> None:
+        if chargepoint.ou_id != ou_id:
+            self._by_ou[chargepoint.ou_id].pop(chargepoint.chargepoint_id, None)
+            self._by_ou[ou_id][chargepoint.chargepoint_id] = None
+            chargepoint.ou_id = ou_id
+
+    def _set_connector(
+        self,
+        chargepoint: ChargepointStatus,
+        connector_number: int,
+        status: Optional[ConnectorOperationalStatusDtoOperationalStatus],
+        timestamp: Optional[datetime.datetime],
+        error_code: Optional[str] = None,
+    ) -> bool:
+        """Returns whether the status changed"""
+        key = (chargepoint.chargepoint_id, connector_number)
+        connector = chargepoint.connectors.get(connector_number)
+        if connector is None:
+            connector = chargepoint.connectors[connector_number] = ConnectorStatus(
+                *key
+            )
+            self._by_status[None][key] = None
+        elif _is_older(timestamp, connector.timestamp):
+            return False
+        changed = connector.status != status
+        if changed:
+            self._by_status[connector.status].pop(key, None)
+            self._by_status[status][key] = None
+            connector.status = status
+        connector.timestamp = timestamp
+        # The API lists statuses without error code, that of the webhook
+        # stays until the status changes
+        if error_code is not None or changed:
+            connector.error_code = error_code
+        return changed
+
+    def _remove(self, chargepoint_id: str) -> None:
+        chargepoint = self._chargepoints.pop(chargepoint_id)
+        del self._touched[chargepoint_id]
+        self._by_ou[chargepoint.ou_id].pop(chargepoint_id, None)
+        for connector in chargepoint.connectors.values():
+            self._by_status[connector.status].pop(
+                (chargepoint_id, connector.connector_number), None
+            )
+
+    def apply(self, payload: WebhookPayload) -> bool:
+        """Apply a status webhook, returns whether it changed a status.
+
+        Other webhooks and updates older than the known status are ignored.
+        """
+        data = payload.data
+        if isinstance(data, OperationalStatusChangedData):
+            return self._set_connector(
+                self._chargepoint(payload.subject),
+                data.connectornumber,
+                ConnectorOperationalStatusDtoOperationalStatus(data.status),
+                parse_timestamp(payload.time),
+                data.errorcode,
+            )
+        if isinstance(data, ConnectivityStatusChangedData):
+            chargepoint = self._chargepoint(payload.subject)
+            timestamp = parse_timestamp(payload.time)
+            if _is_older(timestamp, chargepoint.timestamp):
+                return False
+            status = ChargepointStatusDtoConnectivityStatus(str(data.status))
+            changed = chargepoint.connectivity_status != status
+            chargepoint.connectivity_status = status
+            chargepoint.timestamp = timestamp
+            return changed
+        return False
+
+    def _apply_snapshot(self, dto: ChargepointStatusDto) -> int:
+        """Apply a status listed by the API, returns the number of changes"""
+        chargepoint = self._chargepoint(dto.id)
+        self._set_ou(chargepoint, _value(dto.ou_id))
+        changes = 0
+        timestamp = _value(dto.timestamp)
+        if not _is_older(timestamp, chargepoint.timestamp):
+            status = _value(dto.connectivity_status)
+            changes += chargepoint.connectivity_status != status
+            chargepoint.connectivity_status = status
+            chargepoint.timestamp = timestamp
+        for connector in _value(dto.connectors) or ():
+            if isinstance(connector.connector_number, Unset):
+                continue
+            changes += self._set_connector(
+                chargepoint,
+                connector.connector_number,
+                _value(connector.operational_status),
+                _value(connector.timestamp),
+            )
+        return changes
+
+    async def reconcile(self) -> int:
+        """Page all statuses from the API and repair the mirror, returns the
+        number of statuses that had to be corrected
+        """
+        started = time.monotonic()
+        seeding = not self.ready.is_set()
+        changes = 0
+        listed = set()
+        paginator = Paginator(
+            get_all_chargepointstatus, self.client, page_size=self.page_size
+        )
+        async for page in paginator.pages_async():
+            for dto in page:
+                if isinstance(dto.id, Unset):
+                    continue
+                listed.add(dto.id)
+                changes += self._apply_snapshot(dto)
+        # Deleted since, unless a webhook reported it during the sweep
+        for chargepoint_id in [
+            chargepoint_id
+            for chargepoint_id, touched in self._touched.items()
+            if chargepoint_id not in listed and touched < started
+        ]:
+            self._remove(chargepoint_id)
+            changes += 1
+        self.sweeps += 1
+        if seeding:
+            self.ready.set()
+            return 0
+        self.repairs += changes
+        return changes
+
+    async def run(self) -> None:
+        """Seed the mirror and reconcile it periodically until cancelled"""
+        while True:
+            try:
+                await self.reconcile()
+            except Exception:
+                self.failures += 1
+                logger.exception(
+                    "Reconciling chargepoint statuses failed, retrying in %ss",
+                    self.reconcile_interval,
+                )
+            await asyncio.sleep(self.reconcile_interval)
@@ -0,0 +1,151 @@
+import json
+import re
+from types import ModuleType
+from typing import Any, AsyncIterator, Callable, Iterator, List, Type, TypeVar, Union
+
+from longship.errors import PageLoadError
+from longship_api_client import AuthenticatedClient, Client
+
+T = TypeVar("T")
+
+_STRUCTURAL = re.compile(rb'[\[\]{}",]')
+_STRING_SPECIAL = re.compile(rb'["\\]')
+_WHITESPACE = b" \t\r\n"
+
+
+class JsonArrayDecoder:
+    """Incrementally decodes the items of a top-level JSON array.
+
+    Bytes are fed in arbitrary chunks and every item is decoded as soon as its
+    closing delimiter arrives, so only the item currently being received is held
+    in memory, no matter how long the array is. Items are decoded with ``loads``,
+    pass the ``json_codec.loads`` of the client to use its JSON backend.
+    """
+
+    def __init__(self, loads: Callable[[bytes], Any] = json.loads) -> None:
+        self._loads = loads
+        self._buffer = bytearray()
+        self._started = False
+        self._finished = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+    def _flush(self, items: List[Any]) -> None:
+        element = bytes(self._buffer).strip(_WHITESPACE)
+        self._buffer.clear()
+        if element:
+            items.append(self._loads(element))
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Consume a chunk of bytes and return the items completed by it"""
+        items: List[Any] = []
+        position = 0
+        length = len(chunk)
+        while position < length:
+            if self._finished:
+                if chunk[position:].strip(_WHITESPACE):
+                    raise ValueError("Unexpected data after the end of the JSON array")
+                break
+            if not self._started:
+                rest = chunk[position:].lstrip(_WHITESPACE)
+                if not rest:
+                    break
+                if rest[:1] != b"[":
+                    raise ValueError("Response body is not a JSON array")
+                self._started = True
+                position = length - len(rest) + 1
+                continue
+            if self._in_string:
+                if self._escape:
+                    self._buffer += chunk[position : position + 1]
+                    self._escape = False
+                    position += 1
+                    continue
+                match = _STRING_SPECIAL.search(chunk, position)
+                if match is None:
+                    self._buffer += chunk[position:]
+                    break
+                end = match.end()
+                self._buffer += chunk[position:end]
+                if match.group() == b"\\":
+                    self._escape = True
+                else:
+                    self._in_string = False
+                position = end
+                continue
+            match = _STRUCTURAL.search(chunk, position)
+            if match is None:
+                self._buffer += chunk[position:]
+                break
+            start = match.start()
+            self._buffer += chunk[position:start]
+            token = match.group()
+            position = match.end()
+            if token == b'"':
+                self._in_string = True
+                self._buffer += token
+            elif token in (b"[", b"{"):
+                self._depth += 1
+                self._buffer += token
+            elif self._depth == 0 and token == b"]":
+                self._flush(items)
+                self._finished = True
+            elif self._depth == 0 and token == b",":
+                self._flush(items)
+            elif token == b",":
+                self._buffer += token
+            else:
+                self._depth -= 1
+                self._buffer += token
+        return items
+
+    def close(self) -> None:
+        """Verify that the whole array has been received"""
+        if not self._finished:
+            raise ValueError("Incomplete JSON array")
+
+
+def _check_status(endpoint: ModuleType, response) -> None:
+    if response.status_code != 200:
+        raise PageLoadError(
+            f"Failed to stream {endpoint.__name__}: HTTP {response.status_code}"
+        )
+
+
+async def aiter_list(
+    endpoint: ModuleType,
+    model: Type[T],
+    client: Union[AuthenticatedClient, Client],
+    **kwargs: Any,
+) -> AsyncIterator[T]:
+    """Stream the items of a list endpoint, decoding them one at a time.
+
+    ``endpoint`` is a generated ``get_all_*`` module and ``model`` the DTO its
+    list holds, e.g. ``aiter_list(get_all_sessions, SessionDto, client, take=5000)``.
+    """
+    request = endpoint._get_kwargs(**kwargs)
+    async with client.get_async_httpx_client().stream(**request) as response:
+        _check_status(endpoint, response)
+        decoder = JsonArrayDecoder(client.json_codec.loads)
+        async for chunk in response.aiter_bytes():
+            for item in decoder.feed(chunk):
+                yield model.from_dict(item)
+        decoder.close()
+
+
+def iter_list(
+    endpoint: ModuleType,
+    model: Type[T],
+    client: Union[AuthenticatedClient, Client],
+    **kwargs: Any,
+) -> Iterator[T]:
+    """Blocking version of ``aiter_list``"""
+    request = endpoint._get_kwargs(**kwargs)
+    with client.get_httpx_client().stream(**request) as response:
+        _check_status(endpoint, response)
+        decoder = JsonArrayDecoder(client.json_codec.loads)
+        for chunk in response.iter_bytes():
+            for item in decoder.feed(chunk):
+                yield model.from_dict(item)
+        decoder.close()
@@ -1,8 +1,9 @@
 from enum import Enum
-from typing import Optional, Union
+from typing import Any, Dict, FrozenSet, Optional, Union
 
 import attr
 
+from longship_api_client.json_codec import default_json_codec
 from longship_api_client.models.chargepoint_dto_connectivity_status import (
     ChargepointDtoConnectivityStatus,
 )
@@ -63,7 +64,9 @@ class ConnectivityStatusChangedData:
 class BaseSessionData:
     chargepointid: str
     connectornumber: int
-    transactionid: str
+    # Only sent once the chargepoint started a transaction for the session, None
+    # before. Kept without a default, so it stays the third positional argument.
+    transactionid: Optional[str]
 
 @attr.s(auto_attribs=True)
 class SessionStartData(BaseSessionData):
@@ -121,6 +124,33 @@ class PingData:
     pass
 
 
+# Keyed by both the enum members and their values so that payloads built with
+# a plain string type (like the parsed JSON) dispatch the same way
+_DATA_CLASSES: Dict[Any, type] = {}
+for _type, _data_class in (
+    (WebhookPayloadType.ChargePointBooted, ChargePointBootedData),
+    (WebhookPayloadType.OperationalStatusChanged, OperationalStatusChangedData),
+    (WebhookPayloadType.ConnectivityStatusChanged, ConnectivityStatusChangedData),
+    (WebhookPayloadType.SessionStart, SessionStartData),
+    (WebhookPayloadType.SessionUpdate, SessionUpdateData),
+    (WebhookPayloadType.SessionStop, SessionStopData),
+    (WebhookPayloadType.CDRCreated, CDRCreatedData),
+    (WebhookPayloadType.LocationCreated, LocationCreatedData),
+    (WebhookPayloadType.LocationUpdated, LocationUpdatedData),
+    (WebhookPayloadType.MSPInvoiceProposalStatus, MSPInvoiceProposalStatusData),
+    (WebhookPayloadType.Ping, PingData),
+):
+    _DATA_CLASSES[_type] = _data_class
+    _DATA_CLASSES[_type.value] = _data_class
+
+_FIELD_NAMES: Dict[type, FrozenSet[str]] = {
+    data_class: frozenset(field.name for field in attr.fields(data_class))
+    for data_class in set(_DATA_CLASSES.values())
+}
+
+_PAYLOAD_TYPES = {payload_type.value: payload_type for payload_type in WebhookPayloadType}
+
+
 @attr.s(auto_attribs=True)
 class WebhookPayload:
     specversion: str
@@ -144,11 +174,34 @@ class WebhookPayload:
         PingData,
     ]
 
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "WebhookPayload":
+        """Create a payload from a parsed webhook body, ignoring unknown keys."""
+        payload_type = d["type"]
+        return cls(
+            specversion=d["specversion"],
+            id=d["id"],
+            type=_PAYLOAD_TYPES.get(payload_type, payload_type),
+            subject=d["subject"],
+            time=d["time"],
+            source=d["source"],
+            # Location webhooks come without datacontenttype and data
+            datacontenttype=d.get("datacontenttype", "application/json"),
+            data=d.get("data", {}),
+        )
+
+    @classmethod
+    def from_json(cls, content: Union[bytes, str]) -> "WebhookPayload":
+        """Create a payload from a raw webhook request body."""
+        return cls.from_dict(default_json_codec().loads(content))
+
     def _filter_and_create_data(self, data_class):
         """Helper method to filter data and create the appropriate data class instance."""
         if isinstance(self.data, dict):
-            field_names = {field.name for field in attr.fields(data_class)}
+            field_names = _FIELD_NAMES[data_class]
             filtered_data = {k: v for k, v in self.data.items() if k in field_names}
+            if issubclass(data_class, BaseSessionData):
+                filtered_data.setdefault("transactionid", None)
             return data_class(**filtered_data)
         else:
             # If data is already an instance of the correct class, return it as is
@@ -158,27 +211,9 @@ class WebhookPayload:
             return data_class(**self.data)
 
     def __attrs_post_init__(self):
-        if self.type == WebhookPayloadType.ChargePointBooted:
-            self.data = self._filter_and_create_data(ChargePointBootedData)
-        elif self.type == WebhookPayloadType.OperationalStatusChanged:
-            self.data = self._filter_and_create_data(OperationalStatusChangedData)
-        elif self.type == WebhookPayloadType.ConnectivityStatusChanged:
-            if isinstance(self.data, dict):
-                self.data["status"] = self.data["status"].upper()
-            self.data = self._filter_and_create_data(ConnectivityStatusChangedData)
-        elif self.type == WebhookPayloadType.SessionStart:
-            self.data = self._filter_and_create_data(SessionStartData)
-        elif self.type == WebhookPayloadType.SessionUpdate:
-            self.data = self._filter_and_create_data(SessionUpdateData)
-        elif self.type == WebhookPayloadType.SessionStop:
-            self.data = self._filter_and_create_data(SessionStopData)
-        elif self.type == WebhookPayloadType.CDRCreated:
-            self.data = self._filter_and_create_data(CDRCreatedData)
-        elif self.type == WebhookPayloadType.LocationCreated:
-            self.data = self._filter_and_create_data(LocationCreatedData)
-        elif self.type == WebhookPayloadType.LocationUpdated:
-            self.data = self._filter_and_create_data(LocationUpdatedData)
-        elif self.type == WebhookPayloadType.MSPInvoiceProposalStatus:
-            self.data = self._filter_and_create_data(MSPInvoiceProposalStatusData)
-        elif self.type == WebhookPayloadType.Ping:
-            self.data = self._filter_and_create_data(PingData)
+        data_class = _DATA_CLASSES.get(self.type)
+        if data_class is None:
+            return
+        if data_class is ConnectivityStatusChangedData and isinstance(self.data, dict):
+            self.data["status"] = self.data["status"].upper()
+        self.data = self._filter_and_create_data(data_class)
@@ -0,0 +1,214 @@
+"""In-memory deduplication and reordering of webhooks.
+
+Longship delivers webhooks at least once and not necessarily in order, a
+``SessionUpdate`` can arrive after the ``SessionStop`` of its session. Instead
+of every consumer checking a database per event, a ``WebhookBuffer`` in front
+of them
+
+- drops redeliveries by the CloudEvents ``id``, remembering the ids of a time
+  window in an LRU of bounded size (``WebhookDeduplicator``), and
+- holds every event back for a short while, so that the events of one
+  ``subject`` are released in the order of their ``time``
+  (``WebhookReorderBuffer``).
+
+Example:
+    buffer = WebhookBuffer(hold_back=2.0)
+    buffer.push(WebhookPayload.from_json(body))
+    ...
+    for payload in buffer.pop_ready():
+        longship.handle_webhook(payload)
+"""
+
+import datetime
+import heapq
+import itertools
+import time
+from collections import OrderedDict, deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+from longship.types import WebhookPayload
+from longship_api_client.timestamps import parse_timestamp
+
+
+class WebhookDeduplicator:
+    """Remembers the ids of the webhooks of the last ``window`` seconds, at
+    most ``maxsize`` of them
+    """
+
+    def __init__(
+        self,
+        window: float = 3600.0,
+        maxsize: int = 100_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.window = window
+        self.maxsize = maxsize
+        self.duplicates = 0
+        self._clock = clock
+        # Ids by the time they were first seen, oldest first
+        self._seen: "OrderedDict[str, float]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def is_duplicate(self, payload: WebhookPayload) -> bool:
+        """Whether ``payload`` was seen before, remembering it if it wasn't"""
+        now = self._clock()
+        seen = self._seen
+        expired = now - self.window
+        while seen and next(iter(seen.values())) <= expired:
+            seen.popitem(last=False)
+        if payload.id in seen:
+            self.duplicates += 1
+            return True
+        seen[payload.id] = now
+        if len(seen) > self.maxsize:
+            seen.popitem(last=False)
+        return False
+
+
+class _Held:
+    __slots__ = ("payload", "subject", "time", "seq", "deadline", "released")
+
+    def __init__(
+        self,
+        payload: WebhookPayload,
+        time: datetime.datetime,
+        seq: int,
+        deadline: float,
+    ) -> None:
+        self.payload = payload
+        self.subject = payload.subject
+        self.time = time
+        self.seq = seq
+        self.deadline = deadline
+        self.released = False
+
+
+class WebhookReorderBuffer:
+    """Holds webhooks back for ``hold_back`` seconds and releases the events of
+    every subject in the order of their ``time``.
+
+    An event is released once it has been held for ``hold_back`` seconds,
+    together with the earlier events of its subject that arrived after it.
+    Events of a subject older than one already released are too late to be put
+    in order; they are counted in ``late`` and dropped unless ``drop_late`` is
+    False. At most ``max_held`` events are held, beyond that the longest held
+    ones are released early. The time of the last released event is kept for
+    the ``max_subjects`` most recent subjects.
+    """
+
+    def __init__(
+        self,
+        hold_back: float = 2.0,
+        max_held: int = 10_000,
+        max_subjects: int = 100_000,
+        drop_late: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.hold_back = hold_back
+        self.max_held = max_held
+        self.max_subjects = max_subjects
+        self.drop_late = drop_late
+        self.late = 0
+        self._clock = clock
+        self._seq = itertools.count()
+        # Held events by arrival, so also by deadline
+        self._arrivals: Deque[_Held] = deque()
+        self._subjects: Dict[str, List[Tuple[datetime.datetime, int, _Held]]] = {}
+        self._released: "OrderedDict[str, datetime.datetime]" = OrderedDict()
+        self._held = 0
+
+    def __len__(self) -> int:
+        return self._held
+
+    def next_deadline(self) -> Optional[float]:
+        """The clock time the next event is due at, None if none is held"""
+        while self._arrivals and self._arrivals[0].released:
+            self._arrivals.popleft()
+        return self._arrivals[0].deadline if self._arrivals else None
+
+    def push(self, payload: WebhookPayload) -> bool:
+        """Hold ``payload`` back, returns False if it is dropped as too late"""
+        reported = parse_timestamp(payload.time)
+        released = self._released.get(payload.subject)
+        if released is not None and reported < released:
+            self.late += 1
+            if self.drop_late:
+                return False
+        held = _Held(
+            payload, reported, next(self._seq), self._clock() + self.hold_back
+        )
+        self._arrivals.append(held)
+        heapq.heappush(
+            self._subjects.setdefault(held.subject, []), (held.time, held.seq, held)
+        )
+        self._held += 1
+        return True
+
+    def _release(self, due: _Held, ready: List[WebhookPayload]) -> None:
+        subject = due.subject
+        events = self._subjects[subject]
+        while events and events[0][:2] <= (due.time, due.seq):
+            _, _, held = heapq.heappop(events)
+            held.released = True
+            ready.append(held.payload)
+            self._held -= 1
+            if self._released.get(subject, held.time) <= held.time:
+                self._released[subject] = held.time
+        if not events:
+            del self._subjects[subject]
+        self._released.move_to_end(subject)
+        while len(self._released) > self.max_subjects:
+            self._released.popitem(last=False)
+
+    def pop_ready(self, now: Optional[float] = None) -> List[WebhookPayload]:
+        """Release the events that have been held long enough, in order"""
+        if now is None:
+            now = self._clock()
+        ready: List[WebhookPayload] = []
+        arrivals = self._arrivals
+        while arrivals and (arrivals[0].deadline <= now or self._held > self.max_held):
+            due = arrivals.popleft()
+            if not due.released:
+                self._release(due, ready)
+        return ready
+
+    def flush(self) -> List[WebhookPayload]:
+        """Release all held events"""
+        return self.pop_ready(now=float("inf"))
+
+
+class WebhookBuffer:
+    """A ``WebhookDeduplicator`` followed by a ``WebhookReorderBuffer``"""
+
+    def __init__(
+        self,
+        hold_back: float = 2.0,
+        dedupe_window: float = 3600.0,
+        max_ids: int = 100_000,
+        max_held: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.deduplicator = WebhookDeduplicator(dedupe_window, max_ids, clock=clock)
+        self.reorder = WebhookReorderBuffer(hold_back, max_held, clock=clock)
+
+    def __len__(self) -> int:
+        return len(self.reorder)
+
+    def push(self, payload: WebhookPayload) -> bool:
+        """Hold ``payload`` back, returns False if it is a duplicate or too late"""
+        if self.deduplicator.is_duplicate(payload):
+            return False
+        return self.reorder.push(payload)
+
+    def next_deadline(self) -> Optional[float]:
+        return self.reorder.next_deadline()
+
+    def pop_ready(self, now: Optional[float] = None) -> List[WebhookPayload]:
+        return self.reorder.pop_ready(now)
+
+    def flush(self) -> List[WebhookPayload]:
+        return self.reorder.flush()
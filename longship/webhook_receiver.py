@@ -0,0 +1,294 @@
+"""An ASGI app receiving Longship webhooks.
+
+``WebhookReceiver`` acknowledges a webhook as soon as it has been decoded and
+queued, handlers run afterwards in batches. Every webhook type has its own
+bounded queue, so that e.g. a slow CDR handler doesn't hold up status changes.
+When the queue of a type is full the webhook is answered with
+``503 Service Unavailable`` and a ``Retry-After`` header, and Longship delivers
+it again later.
+
+The app has no dependencies besides an ASGI server. Its workers are started by
+the lifespan protocol if the server supports it, otherwise by the first request.
+
+Example:
+    receiver = WebhookReceiver(batch_size=50, concurrency=4)
+
+    @receiver.handler(WebhookPayloadType.SessionStart, WebhookPayloadType.SessionStop)
+    async def sessions(payloads):
+        ...
+
+    # uvicorn module:receiver
+"""
+
+import asyncio
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from longship.journal import WebhookJournal
+from longship.types import WebhookPayload, WebhookPayloadType
+from longship_api_client.json_codec import default_json_codec
+
+BatchHandler = Callable[[List[WebhookPayload]], Awaitable[Any]]
+
+_Send = Callable[[Dict[str, Any]], Awaitable[None]]
+_Receive = Callable[[], Awaitable[Dict[str, Any]]]
+
+
+class _Dispatch:
+    """The queue of one webhook type and the handlers of its batches"""
+
+    def __init__(self, max_queue: int) -> None:
+        self.max_queue = max_queue
+        # Created by start, so that it belongs to the running loop
+        self.queue: "Optional[asyncio.Queue[WebhookPayload]]" = None
+        # Places taken by webhooks being journaled
+        self.reserved = 0
+        self.handlers: List[BatchHandler] = []
+
+    def full(self) -> bool:
+        assert self.queue is not None
+        return self.queue.qsize() + self.reserved >= self.max_queue
+
+
+class WebhookReceiver:
+    """Accepts webhooks on ``path`` and hands them to handlers in batches.
+
+    Up to ``batch_size`` queued webhooks of a type are handed to its handlers
+    at once; a batch is started ``batch_timeout`` seconds after its first
+    webhook at the latest. ``concurrency`` batches of every type are handled at
+    a time, so handlers of one type must not rely on the order of batches.
+    ``max_queue`` webhooks are queued per type before new ones are answered
+    with 503 and ``Retry-After: retry_after``.
+
+    ``received``, ``rejected``, ``handled`` and ``failed`` (batches whose
+    handler raised) count per webhook type, ``invalid`` counts undecodable
+    bodies. Every accepted webhook is appended to ``journal`` if given, before
+    it is acknowledged. Appends run on a thread of their own, so that a
+    journal with ``sync`` doesn't block the event loop.
+    """
+
+    def __init__(
+        self,
+        path: str = "/",
+        max_queue: int = 1000,
+        batch_size: int = 100,
+        batch_timeout: float = 0.05,
+        concurrency: int = 1,
+        retry_after: int = 5,
+        max_body_size: int = 1 << 20,
+        loads: Optional[Callable[[bytes], Any]] = None,
+        journal: Optional[WebhookJournal] = None,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.path = path
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.batch_timeout = batch_timeout
+        self.concurrency = concurrency
+        self.retry_after = retry_after
+        self.max_body_size = max_body_size
+        self.loads = default_json_codec().loads if loads is None else loads
+        self.journal = journal
+        self.received: Counter = Counter()
+        self.rejected: Counter = Counter()
+        self.handled: Counter = Counter()
+        self.failed: Counter = Counter()
+        self.invalid = 0
+        self._dispatches: Dict[str, _Dispatch] = {}
+        self._workers: List["asyncio.Task[None]"] = []
+        self._journal_writer: Optional[ThreadPoolExecutor] = None
+        self._started = False
+
+    def add_handler(self, handler: BatchHandler, *types: WebhookPayloadType) -> None:
+        """Call ``handler`` with batches of the webhooks of ``types``, of all
+        types if none are given
+        """
+        if self._started:
+            raise RuntimeError("Handlers must be added before the receiver starts")
+        for payload_type in types or tuple(WebhookPayloadType):
+            dispatch = self._dispatches.get(str(payload_type))
+            if dispatch is None:
+                dispatch = self._dispatches[str(payload_type)] = _Dispatch(
+                    self.max_queue
+                )
+            dispatch.handlers.append(handler)
+
+    def handler(
+        self, *types: WebhookPayloadType
+    ) -> Callable[[BatchHandler], BatchHandler]:
+        """Decorator version of ``add_handler``"""
+
+        def register(handler: BatchHandler) -> BatchHandler:
+            self.add_handler(handler, *types)
+            return handler
+
+        return register
+
+    @property
+    def queued(self) -> int:
+        return sum(
+            dispatch.queue.qsize()
+            for dispatch in self._dispatches.values()
+            if dispatch.queue is not None
+        )
+
+    async def start(self) -> None:
+        if self._started:
+            return
+        self._started = True
+        if self.journal is not None:
+            self._journal_writer = ThreadPoolExecutor(
+                1, thread_name_prefix="webhook-journal"
+            )
+        for payload_type, dispatch in self._dispatches.items():
+            dispatch.queue = asyncio.Queue(self.max_queue)
+            self._workers.extend(
+                asyncio.create_task(self._work(payload_type, dispatch))
+                for _ in range(self.concurrency)
+            )
+
+    async def stop(self) -> None:
+        """Handle the queued webhooks and stop the workers"""
+        if not self._started:
+            return
+        for dispatch in self._dispatches.values():
+            assert dispatch.queue is not None
+            await dispatch.queue.join()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        if self._journal_writer is not None:
+            self._journal_writer.shutdown()
+            self._journal_writer = None
+        self._started = False
+
+    async def _next_batch(
+        self, queue: "asyncio.Queue[WebhookPayload]"
+    ) -> List[WebhookPayload]:
+        batch = [await queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.batch_timeout
+        while len(batch) < self.batch_size:
+            if queue.empty():
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            else:
+                batch.append(queue.get_nowait())
+        return batch
+
+    async def _work(self, payload_type: str, dispatch: _Dispatch) -> None:
+        assert dispatch.queue is not None
+        while True:
+            batch = await self._next_batch(dispatch.queue)
+            try:
+                for handler in dispatch.handlers:
+                    try:
+                        await handler(batch)
+                    except Exception:
+                        self.failed[payload_type] += 1
+                self.handled[payload_type] += len(batch)
+            finally:
+                for _ in batch:
+                    dispatch.queue.task_done()
+
+    async def _journal(self, body: bytes, payload: WebhookPayload) -> None:
+        assert self.journal is not None
+        await asyncio.get_running_loop().run_in_executor(
+            self._journal_writer, self.journal.append, body, payload
+        )
+
+    async def _accept(self, body: bytes) -> Tuple[int, List[Tuple[bytes, bytes]]]:
+        try:
+            payload = WebhookPayload.from_dict(self.loads(body))
+        except (KeyError, TypeError, ValueError, AttributeError):
+            self.invalid += 1
+            return 400, []
+        payload_type = str(payload.type)
+        dispatch = self._dispatches.get(payload_type)
+        # Without a handler nobody is interested, but there's no need for
+        # Longship to deliver it again either
+        if dispatch is None:
+            if self.journal is not None:
+                await self._journal(body, payload)
+            return 202, []
+        if dispatch.full():
+            self.rejected[payload_type] += 1
+            return 503, [(b"retry-after", str(self.retry_after).encode())]
+        assert dispatch.queue is not None
+        if self.journal is not None:
+            # Hold a place in the queue while the append runs
+            dispatch.reserved += 1
+            try:
+                await self._journal(body, payload)
+            finally:
+                dispatch.reserved -= 1
+        dispatch.queue.put_nowait(payload)
+        self.received[payload_type] += 1
+        return 202, []
+
+    async def _read_body(self, receive: _Receive) -> Optional[bytearray]:
+        """The request body, up to just beyond ``max_body_size``. None if the
+        client disconnected.
+        """
+        body = bytearray()
+        more_body = True
+        while more_body and len(body) <= self.max_body_size:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return None
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+        return body
+
+    async def _lifespan(self, receive: _Receive, send: _Send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await self.start()
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.stop()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def __call__(
+        self, scope: Dict[str, Any], receive: _Receive, send: _Send
+    ) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+        headers: List[Tuple[bytes, bytes]] = []
+        if scope["path"] != self.path:
+            status = 404
+        elif scope["method"] != "POST":
+            status = 405
+            headers.append((b"allow", b"POST"))
+        else:
+            await self.start()
+            body = await self._read_body(receive)
+            if body is None:
+                return
+            if len(body) > self.max_body_size:
+                status = 413
+            else:
+                status, headers = await self._accept(bytes(body))
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": headers + [(b"content-length", b"0")],
+            }
+        )
+        await send({"type": "http.response.body", "body": b""})
@@ -0,0 +1,37 @@
+"""Lazy attribute loading for packages with many submodules (PEP 562)"""
+
+import importlib
+import sys
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+def lazy_module(
+    package: str,
+    attributes: Optional[Dict[str, str]] = None,
+    submodules: Iterable[str] = (),
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Return the ``__getattr__`` and ``__dir__`` of a package whose contents are
+    imported on first access.
+
+    ``attributes`` maps names to the submodule defining them, ``submodules`` are
+    names that are submodules themselves. Resolved names are stored on the
+    package so that ``__getattr__`` only runs once per name.
+    """
+    attributes = attributes or {}
+    submodules = frozenset(submodules)
+
+    def __getattr__(name: str) -> Any:
+        if name in attributes:
+            module = importlib.import_module(f".{attributes[name]}", package)
+            value = getattr(module, name)
+        elif name in submodules:
+            value = importlib.import_module(f".{name}", package)
+        else:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(attributes) | submodules)
+
+    return __getattr__, __dir__
@@ -1 +1,25 @@
 """Contains methods for accessing the API"""
+
+from .._lazy import lazy_module
+
+__getattr__, __dir__ = lazy_module(
+    __name__,
+    submodules=(
+        "cdrs",
+        "chargepoint_status",
+        "chargepoints",
+        "commands",
+        "configurationitems",
+        "localtokengroups",
+        "localtokengroupstoken",
+        "location",
+        "locations",
+        "mspreimbursement",
+        "organizationunits",
+        "reimbursement",
+        "sessions",
+        "tariffdistributions",
+        "tariffs",
+        "webhooks",
+    ),
+)
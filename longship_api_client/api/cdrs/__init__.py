@@ -0,0 +1,15 @@
+"""Contains endpoint functions for accessing the API"""
+
+from ..._lazy import lazy_module
+
+__getattr__, __dir__ = lazy_module(
+    __name__,
+    submodules=(
+        "cdr_get",
+        "cdr_patch",
+        "get_all_cdrs",
+        "get_all_interchangeformat",
+        "get_file_full_download_cdrs",
+        "get_file_intercharge_cdrs",
+    ),
+)
@@ -28,23 +28,33 @@ def _parse_response(
     *, client: Union[AuthenticatedClient, Client], response: httpx.Response
 ) -> Optional[Union[ChargepointStatusDto, LongshipError]]:
     if response.status_code == HTTPStatus.OK:
-        response_200 = ChargepointStatusDto.from_dict(response.json())
+        response_200 = ChargepointStatusDto.from_dict(
+            client.json_codec.loads(response.content)
+        )
 
         return response_200
     if response.status_code == HTTPStatus.UNAUTHORIZED:
-        response_401 = LongshipError.from_dict(response.json())
+        response_401 = LongshipError.from_dict(
+            client.json_codec.loads(response.content)
+        )
 
         return response_401
     if response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR:
-        response_500 = LongshipError.from_dict(response.json())
+        response_500 = LongshipError.from_dict(
+            client.json_codec.loads(response.content)
+        )
 
         return response_500
     if response.status_code == HTTPStatus.NOT_FOUND:
-        response_404 = LongshipError.from_dict(response.json())
+        response_404 = LongshipError.from_dict(
+            client.json_codec.loads(response.content)
+        )
 
         return response_404
     if response.status_code == HTTPStatus.FORBIDDEN:
-        response_403 = LongshipError.from_dict(response.json())
+        response_403 = LongshipError.from_dict(
+            client.json_codec.loads(response.content)
+        )
 
         return response_403
     if client.raise_on_unexpected_status:
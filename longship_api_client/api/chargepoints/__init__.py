@@ -0,0 +1,16 @@
+"""Contains endpoint functions for accessing the API"""
+
+from ..._lazy import lazy_module
+
+__getattr__, __dir__ = lazy_module(
+    __name__,
+    submodules=(
+        "chargepoint_get",
+        "chargepoint_put",
+        "chargepointauthorization_get",
+        "chargepointauthorization_post",
+        "get_all_chargepointauthorizations",
+        "get_all_chargepointmessages",
+        "get_all_chargepoints",
+    ),
+)
@@ -38,23 +38,33 @@ def _parse_response(
     *, client: Union[AuthenticatedClient, Client], response: httpx.Response
 ) -> Optional[Union[Any, LongshipError]]:
     if response.status_code == HTTPStatus.UNAUTHORIZED:
-        response_401 = LongshipError.from_dict(response.json())
+        response_401 = LongshipError.from_dict(
+            client.json_codec.loads(response.content)
+        )
 
         return response_401
     if response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY:
-        response_422 = LongshipError.from_dict(response.json())
+        response_422 = LongshipError.from_dict(
+            client.json_codec.loads(response.content)
+        )
 
         return response_422
     if response.status_code == HTTPStatus.NOT_FOUND:
-        response_404 = LongshipError.from_dict(response.json())
+        response_404 = LongshipError.from_dict(
+            client.json_codec.loads(response.content)
+        )
 
         return response_404
     if response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR:
-        response_500 = LongshipError.from_dict(response.json())
+        response_500 = LongshipError.from_dict(
+            client.json_codec.loads(response.content)
+        )
 
         return response_500
     if response.status_code == HTTPStatus.FORBIDDEN:
-        response_403 = LongshipError.from_dict(response.json())
+        response_403 = LongshipError.from_dict(
+            client.json_codec.loads(response.content)
+        )
 
         return response_403
     if response.status_code == HTTPStatus.ACCEPTED:
@@ -104,6 +114,8 @@ def sync_detailed(
         body=body,
     )
 
+    client.json_codec.encode_body(kwargs)
+
     response = client.get_httpx_client().request(
         **kwargs,
     )
@@ -167,6 +179,8 @@ async def asyncio_detailed(
         body=body,
     )
 
+    client.json_codec.encode_body(kwargs)
+
     response = await client.get_async_httpx_client().request(**kwargs)
 
     return _build_response(client=client, response=response)
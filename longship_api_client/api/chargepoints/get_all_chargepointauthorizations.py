@@ -67,12 +67,13 @@ def _parse_response(
 ) -> Optional[Union[List["ChargePointAuthorizeGetDto"], LongshipError]]:
     if response.status_code == HTTPStatus.OK:
         response_200 = []
-        _response_200 = response.json()
+        _response_200 = client.json_codec.loads(response.content)
+        item_class = client.model_class(ChargePointAuthorizeGetDto)
         for (
             componentsschemascharge_point_authorize_get_dto_array_item_data
         ) in _response_200:
             componentsschemascharge_point_authorize_get_dto_array_item = (
-                ChargePointAuthorizeGetDto.from_dict(
+                item_class.from_dict(
                     componentsschemascharge_point_authorize_get_dto_array_item_data
                 )
             )
@@ -83,19 +84,27 @@ def _parse_response(
 
         return response_200
     if response.status_code == HTTPStatus.UNAUTHORIZED:
-        response_401 = LongshipError.from_dict(response.json())
+        response_401 = LongshipError.from_dict(
+            client.json_codec.loads(response.content)
+        )
 
         return response_401
     if response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR:
-        response_500 = LongshipError.from_dict(response.json())
+        response_500 = LongshipError.from_dict(
+            client.json_codec.loads(response.content)
+        )
 
         return response_500
     if response.status_code == HTTPStatus.NOT_FOUND:
-        response_404 = LongshipError.from_dict(response.json())
+        response_404 = LongshipError.from_dict(
+            client.json_codec.loads(response.content)
+        )
 
         return response_404
     if response.status_code == HTTPStatus.FORBIDDEN:
-        response_403 = LongshipError.from_dict(response.json())
+        response_403 = LongshipError.from_dict(
+            client.json_codec.loads(response.content)
+        )
 
         return response_403
     if client.raise_on_unexpected_status:
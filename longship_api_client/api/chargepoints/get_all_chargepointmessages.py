@@ -76,9 +76,10 @@ def _parse_response(
 ) -> Optional[Union[List["MessageLogDto"], LongshipError]]:
     if response.status_code == HTTPStatus.OK:
         response_200 = []
-        _response_200 = response.json()
+        _response_200 = client.json_codec.loads(response.content)
+        item_class = client.model_class(MessageLogDto)
         for componentsschemasmessage_log_dto_array_item_data in _response_200:
-            componentsschemasmessage_log_dto_array_item = MessageLogDto.from_dict(
+            componentsschemasmessage_log_dto_array_item = item_class.from_dict(
                 componentsschemasmessage_log_dto_array_item_data
             )
 
@@ -86,15 +87,21 @@ def _parse_response(
 
         return response_200
     if response.status_code == HTTPStatus.UNAUTHORIZED:
-        response_401 = LongshipError.from_dict(response.json())
+        response_401 = LongshipError.from_dict(
+            client.json_codec.loads(response.content)
+        )
 
         return response_401
     if response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR:
-        response_500 = LongshipError.from_dict(response.json())
+        response_500 = LongshipError.from_dict(
+            client.json_codec.loads(response.content)
+        )
 
         return response_500
     if response.status_code == HTTPStatus.FORBIDDEN:
-        response_403 = LongshipError.from_dict(response.json())
+        response_403 = LongshipError.from_dict(
+            client.json_codec.loads(response.content)
+        )
 
         return response_403
     if client.raise_on_unexpected_status:
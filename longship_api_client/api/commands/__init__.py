@@ -0,0 +1,28 @@
+"""Contains endpoint functions for accessing the API"""
+
+from ..._lazy import lazy_module
+
+__getattr__, __dir__ = lazy_module(
+    __name__,
+    submodules=(
+        "send_cancel_reservation_request",
+        "send_change_availability_request",
+        "send_change_configuration_request",
+        "send_clear_cache_request",
+        "send_clear_charging_profile_request",
+        "send_data_transfer_request",
+        "send_get_composite_schedule_request",
+        "send_get_configuration_request",
+        "send_get_diagnostics_request",
+        "send_get_local_list_version_request",
+        "send_remote_start_transaction_request",
+        "send_remote_stop_transaction_request",
+        "send_reserve_now_request",
+        "send_reset_request",
+        "send_send_local_list_request",
+        "send_set_charging_profile_request",
+        "send_trigger_message_request",
+        "send_unlock_connector_request",
+        "send_update_firmware_request",
+    ),
+)
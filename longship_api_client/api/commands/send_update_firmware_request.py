@@ -38,15 +38,21 @@ def _parse_response(
     *, client: Union[AuthenticatedClient, Client], response: httpx.Response
 ) -> Optional[Union[Any, LongshipError]]:
     if response.status_code == HTTPStatus.UNAUTHORIZED:
-        response_401 = LongshipError.from_dict(response.json())
+        response_401 = LongshipError.from_dict(
+            client.json_codec.loads(response.content)
+        )
 
         return response_401
     if response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR:
-        response_500 = LongshipError.from_dict(response.json())
+        response_500 = LongshipError.from_dict(
+            client.json_codec.loads(response.content)
+        )
 
         return response_500
     if response.status_code == HTTPStatus.FORBIDDEN:
-        response_403 = LongshipError.from_dict(response.json())
+        response_403 = LongshipError.from_dict(
+            client.json_codec.loads(response.content)
+        )
 
         return response_403
     if response.status_code == HTTPStatus.ACCEPTED:
@@ -96,6 +102,8 @@ def sync_detailed(
         body=body,
     )
 
+    client.json_codec.encode_body(kwargs)
+
     response = client.get_httpx_client().request(
         **kwargs,
     )
@@ -159,6 +167,8 @@ async def asyncio_detailed(
         body=body,
     )
 
+    client.json_codec.encode_body(kwargs)
+
     response = await client.get_async_httpx_client().request(**kwargs)
 
     return _build_response(client=client, response=response)
@@ -0,0 +1,10 @@
+"""Contains endpoint functions for accessing the API"""
+
+from ..._lazy import lazy_module
+
+__getattr__, __dir__ = lazy_module(
+    __name__,
+    submodules=(
+        "configurationitem_get",
+    ),
+)
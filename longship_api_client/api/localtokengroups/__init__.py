@@ -0,0 +1,14 @@
+"""Contains endpoint functions for accessing the API"""
+
+from ..._lazy import lazy_module
+
+__getattr__, __dir__ = lazy_module(
+    __name__,
+    submodules=(
+        "get_all_localtokengroups",
+        "local_token_group_delete",
+        "local_token_group_post",
+        "local_token_group_put",
+        "localtokengroup_get",
+    ),
+)
@@ -0,0 +1,12 @@
+"""Contains endpoint functions for accessing the API"""
+
+from ..._lazy import lazy_module
+
+__getattr__, __dir__ = lazy_module(
+    __name__,
+    submodules=(
+        "local_token_group_token_delete",
+        "local_token_group_token_post",
+        "local_token_group_token_put",
+    ),
+)
@@ -0,0 +1,15 @@
+"""Contains endpoint functions for accessing the API"""
+
+from ..._lazy import lazy_module
+
+__getattr__, __dir__ = lazy_module(
+    __name__,
+    submodules=(
+        "get_all_locations",
+        "location_get",
+        "location_post",
+        "location_put",
+        "relation_between_location_and_charge_point_delete",
+        "relation_between_location_and_charge_point_post",
+    ),
+)
@@ -0,0 +1,13 @@
+"""Contains endpoint functions for accessing the API"""
+
+from ..._lazy import lazy_module
+
+__getattr__, __dir__ = lazy_module(
+    __name__,
+    submodules=(
+        "get_all_organizationunits",
+        "organization_unit_get",
+        "organization_unit_post",
+        "organization_unit_put",
+    ),
+)
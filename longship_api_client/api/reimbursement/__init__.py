@@ -0,0 +1,12 @@
+"""Contains endpoint functions for accessing the API"""
+
+from ..._lazy import lazy_module
+
+__getattr__, __dir__ = lazy_module(
+    __name__,
+    submodules=(
+        "get_all_reimbursementcdrs",
+        "recalculate_reimbursement_cdr_post",
+        "reimbursement_cdr_get",
+    ),
+)
@@ -0,0 +1,11 @@
+"""Contains endpoint functions for accessing the API"""
+
+from ..._lazy import lazy_module
+
+__getattr__, __dir__ = lazy_module(
+    __name__,
+    submodules=(
+        "get_all_sessions",
+        "session_get",
+    ),
+)
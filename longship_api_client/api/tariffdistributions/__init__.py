@@ -0,0 +1,15 @@
+"""Contains endpoint functions for accessing the API"""
+
+from ..._lazy import lazy_module
+
+__getattr__, __dir__ = lazy_module(
+    __name__,
+    submodules=(
+        "get_all_tariffdistributions",
+        "tariffdistribution_delete",
+        "tariffdistribution_get",
+        "tariffdistribution_patch",
+        "tariffdistribution_post",
+        "tariffdistribution_put",
+    ),
+)
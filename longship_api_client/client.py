@@ -1,9 +1,16 @@
 import ssl
-from typing import Any, Dict, Union, Optional
+import threading
+from typing import Any, Dict, Type, TypeVar, Union, Optional
 
 from attrs import define, field, evolve
 import httpx
 
+from .json_codec import JsonCodec, default_json_codec
+from .lazy_models import lazy_model
+from .rate_limit import RateLimiter, rate_limited_httpx_args
+
+T = TypeVar("T")
+
 
 @define
 class Client:
@@ -27,14 +34,25 @@ class Client:
 
         ``httpx_args``: A dictionary of additional arguments to be passed to the ``httpx.Client`` and ``httpx.AsyncClient`` constructor.
 
+        ``rate_limiter``: A ``RateLimiter`` throttling and retrying the requests of both the sync and async httpx
+        Clients. It can be shared with other clients to stay within an API-wide limit.
+
 
     Attributes:
         raise_on_unexpected_status: Whether or not to raise an errors.UnexpectedStatus if the API returns a
             status code that was not documented in the source OpenAPI document. Can also be provided as a keyword
             argument to the constructor.
+        json_codec: Encodes request bodies and decodes response bodies. Defaults to orjson or msgspec when one of
+            them is installed, the standard library otherwise. Can also be provided as a keyword argument to the
+            constructor.
+        lazy_models: Whether list endpoints decode nested objects and lists of their items only when they are
+            first accessed, see ``lazy_models.lazy_model``. Can also be provided as a keyword argument to the
+            constructor.
     """
 
     raise_on_unexpected_status: bool = field(default=False, kw_only=True)
+    json_codec: JsonCodec = field(factory=default_json_codec, kw_only=True)
+    lazy_models: bool = field(default=False, kw_only=True)
     _base_url: str
     _cookies: Dict[str, str] = field(factory=dict, kw_only=True)
     _headers: Dict[str, str] = field(factory=dict, kw_only=True)
@@ -42,8 +60,14 @@ class Client:
     _verify_ssl: Union[str, bool, ssl.SSLContext] = field(default=True, kw_only=True)
     _follow_redirects: bool = field(default=False, kw_only=True)
     _httpx_args: Dict[str, Any] = field(factory=dict, kw_only=True)
+    _rate_limiter: Optional[RateLimiter] = field(default=None, kw_only=True)
     _client: Optional[httpx.Client] = field(default=None, init=False)
     _async_client: Optional[httpx.AsyncClient] = field(default=None, init=False)
+    _client_lock: threading.Lock = field(factory=threading.Lock, init=False, repr=False, eq=False)
+
+    def model_class(self, model: Type[T]) -> Type[T]:
+        """The class list endpoints decode their items into"""
+        return lazy_model(model) if self.lazy_models else model
 
     def with_headers(self, headers: Dict[str, str]) -> "Client":
         """Get a new client matching this one with additional headers"""
@@ -80,15 +104,20 @@ class Client:
     def get_httpx_client(self) -> httpx.Client:
         """Get the underlying httpx.Client, constructing a new one if not previously set"""
         if self._client is None:
-            self._client = httpx.Client(
-                base_url=self._base_url,
-                cookies=self._cookies,
-                headers=self._headers,
-                timeout=self._timeout,
-                verify=self._verify_ssl,
-                follow_redirects=self._follow_redirects,
-                **self._httpx_args,
-            )
+            # Paginator.pages fetches on worker threads, only one of them may create it
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.Client(
+                        base_url=self._base_url,
+                        cookies=self._cookies,
+                        headers=self._headers,
+                        timeout=self._timeout,
+                        verify=self._verify_ssl,
+                        follow_redirects=self._follow_redirects,
+                        **rate_limited_httpx_args(
+                            self._httpx_args, self._verify_ssl, self._rate_limiter, False
+                        ),
+                    )
         return self._client
 
     def __enter__(self) -> "Client":
@@ -118,7 +147,9 @@ class Client:
                 timeout=self._timeout,
                 verify=self._verify_ssl,
                 follow_redirects=self._follow_redirects,
-                **self._httpx_args,
+                **rate_limited_httpx_args(
+                    self._httpx_args, self._verify_ssl, self._rate_limiter, True
+                ),
             )
         return self._async_client
 
@@ -154,17 +185,28 @@ class AuthenticatedClient:
 
         ``httpx_args``: A dictionary of additional arguments to be passed to the ``httpx.Client`` and ``httpx.AsyncClient`` constructor.
 
+        ``rate_limiter``: A ``RateLimiter`` throttling and retrying the requests of both the sync and async httpx
+        Clients. It can be shared with other clients to stay within an API-wide limit.
+
 
     Attributes:
         raise_on_unexpected_status: Whether or not to raise an errors.UnexpectedStatus if the API returns a
             status code that was not documented in the source OpenAPI document. Can also be provided as a keyword
             argument to the constructor.
+        json_codec: Encodes request bodies and decodes response bodies. Defaults to orjson or msgspec when one of
+            them is installed, the standard library otherwise. Can also be provided as a keyword argument to the
+            constructor.
+        lazy_models: Whether list endpoints decode nested objects and lists of their items only when they are
+            first accessed, see ``lazy_models.lazy_model``. Can also be provided as a keyword argument to the
+            constructor.
         token: The token to use for authentication
         prefix: The prefix to use for the Authorization header
         auth_header_name: The name of the Authorization header
     """
 
     raise_on_unexpected_status: bool = field(default=False, kw_only=True)
+    json_codec: JsonCodec = field(factory=default_json_codec, kw_only=True)
+    lazy_models: bool = field(default=False, kw_only=True)
     _base_url: str
     _cookies: Dict[str, str] = field(factory=dict, kw_only=True)
     _headers: Dict[str, str] = field(factory=dict, kw_only=True)
@@ -172,13 +214,19 @@ class AuthenticatedClient:
     _verify_ssl: Union[str, bool, ssl.SSLContext] = field(default=True, kw_only=True)
     _follow_redirects: bool = field(default=False, kw_only=True)
     _httpx_args: Dict[str, Any] = field(factory=dict, kw_only=True)
+    _rate_limiter: Optional[RateLimiter] = field(default=None, kw_only=True)
     _client: Optional[httpx.Client] = field(default=None, init=False)
     _async_client: Optional[httpx.AsyncClient] = field(default=None, init=False)
+    _client_lock: threading.Lock = field(factory=threading.Lock, init=False, repr=False, eq=False)
 
     token: str
     prefix: str = "Bearer"
     auth_header_name: str = "Authorization"
 
+    def model_class(self, model: Type[T]) -> Type[T]:
+        """The class list endpoints decode their items into"""
+        return lazy_model(model) if self.lazy_models else model
+
     def with_headers(self, headers: Dict[str, str]) -> "AuthenticatedClient":
         """Get a new client matching this one with additional headers"""
         if self._client is not None:
@@ -214,18 +262,23 @@ class AuthenticatedClient:
     def get_httpx_client(self) -> httpx.Client:
         """Get the underlying httpx.Client, constructing a new one if not previously set"""
         if self._client is None:
-            self._headers[self.auth_header_name] = (
-                f"{self.prefix} {self.token}" if self.prefix else self.token
-            )
-            self._client = httpx.Client(
-                base_url=self._base_url,
-                cookies=self._cookies,
-                headers=self._headers,
-                timeout=self._timeout,
-                verify=self._verify_ssl,
-                follow_redirects=self._follow_redirects,
-                **self._httpx_args,
-            )
+            # Paginator.pages fetches on worker threads, only one of them may create it
+            with self._client_lock:
+                if self._client is None:
+                    self._headers[self.auth_header_name] = (
+                        f"{self.prefix} {self.token}" if self.prefix else self.token
+                    )
+                    self._client = httpx.Client(
+                        base_url=self._base_url,
+                        cookies=self._cookies,
+                        headers=self._headers,
+                        timeout=self._timeout,
+                        verify=self._verify_ssl,
+                        follow_redirects=self._follow_redirects,
+                        **rate_limited_httpx_args(
+                            self._httpx_args, self._verify_ssl, self._rate_limiter, False
+                        ),
+                    )
         return self._client
 
     def __enter__(self) -> "AuthenticatedClient":
@@ -260,7 +313,9 @@ class AuthenticatedClient:
                 timeout=self._timeout,
                 verify=self._verify_ssl,
                 follow_redirects=self._follow_redirects,
-                **self._httpx_args,
+                **rate_limited_httpx_args(
+                    self._httpx_args, self._verify_ssl, self._rate_limiter, True
+                ),
             )
         return self._async_client
 
@@ -0,0 +1,72 @@
+"""JSON encoding of request bodies and decoding of response bodies"""
+
+import json
+from functools import lru_cache
+from typing import Any, Dict, Union
+
+
+class JsonCodec:
+    """Encodes and decodes JSON with the standard library ``json`` module"""
+
+    name = "json"
+
+    def loads(self, content: Union[bytes, str]) -> Any:
+        return json.loads(content)
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+    def encode_body(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Replace the ``json`` argument of a request by its encoded ``content``"""
+        if "json" in kwargs:
+            kwargs["content"] = self.dumps(kwargs.pop("json"))
+        return kwargs
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class OrjsonCodec(JsonCodec):
+    """Encodes and decodes JSON with ``orjson``, if it is installed (the ``orjson`` extra)"""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self.loads = orjson.loads  # type: ignore
+        self.dumps = orjson.dumps  # type: ignore
+
+
+class MsgspecCodec(JsonCodec):
+    """Encodes and decodes JSON with ``msgspec``, if it is installed"""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._decode = msgspec.json.Decoder().decode
+        self._decode_error = msgspec.DecodeError
+        self.dumps = msgspec.json.Encoder().encode  # type: ignore
+
+    def loads(self, content: Union[bytes, str]) -> Any:
+        # A msgspec.DecodeError is no ValueError, unlike the errors of json and orjson
+        try:
+            return self._decode(content)
+        except self._decode_error as error:
+            raise ValueError(str(error)) from error
+
+
+@lru_cache(maxsize=None)
+def default_json_codec() -> JsonCodec:
+    """The fastest installed codec: orjson, then msgspec, then the standard library"""
+    for codec in (OrjsonCodec, MsgspecCodec):
+        try:
+            return codec()
+        except ImportError:
+            pass
+    return JsonCodec()
+
+
+__all__ = ["JsonCodec", "MsgspecCodec", "OrjsonCodec", "default_json_codec"]
@@ -0,0 +1,1254 @@
+"""The JSON key of every field of the generated models, by model and field name
+
+``lazy_models`` reads the keys of nested fields from this table instead of the
+source of the models, which isn't available in every installation. Regenerate it
+with ``python -m longship_api_client.json_keys`` after updating the client.
+"""
+
+from typing import Dict
+
+JSON_KEYS: Dict[str, Dict[str, str]] = {
+    "AdditionalGeoLocationDto": {
+        "latitude": "latitude",
+        "longitude": "longitude",
+        "name": "name",
+    },
+    "AuthorizationAssertionDto": {
+        "auth_scenario_type": "authScenarioType",
+        "auth_result": "authResult",
+        "status": "status",
+    },
+    "AuthorizationChargerContextDto": {
+        "allow_any_token": "allowAnyToken",
+        "is_roaming": "isRoaming",
+        "charge_point_ou_code": "chargePointOUCode",
+        "reimburse_uid": "reimburseUid",
+        "reimburse_ou": "reimburseOu",
+        "has_reimbursement": "hasReimbursement",
+    },
+    "AuthorizationContextDetailsDto": {
+        "charger": "charger",
+        "tenant": "tenant",
+    },
+    "AuthorizationData": {
+        "id_tag_info": "idTagInfo",
+        "id_tag": "idTag",
+    },
+    "AuthorizationResultDto": {
+        "assertion": "assertion",
+        "status": "status",
+        "reason": "reason",
+        "description": "description",
+    },
+    "AuthorizationTenantContextDto": {
+        "hubject_priority": "hubjectPriority",
+        "hubject_enabled": "hubjectEnabled",
+        "hubject_fast_approval": "hubjectFastApproval",
+    },
+    "BusinessDetailsDto": {
+        "name": "name",
+        "website": "website",
+        "image": "image",
+    },
+    "CancelReservationRequest": {
+        "reservation_id": "reservationId",
+    },
+    "CdrDto": {
+        "id": "id",
+        "tenant_id": "tenantId",
+        "charge_point_id": "chargePointId",
+        "connector_id": "connectorId",
+        "cdr_location": "cdrLocation",
+        "start_datetime": "startDatetime",
+        "end_date_time": "endDateTime",
+        "session_id": "sessionId",
+        "token": "token",
+        "started_by_info": "startedByInfo",
+        "total_energy_in_kwh": "totalEnergyInKwh",
+        "total_time_in_hours": "totalTimeInHours",
+        "charging_periods": "chargingPeriods",
+        "total_price": "totalPrice",
+        "created": "created",
+        "last_updated": "lastUpdated",
+        "ou": "ou",
+        "ou_id": "ouId",
+        "ou_name": "ouName",
+        "tariff_id": "tariffId",
+        "tariff_name": "tariffName",
+        "start_tariff": "startTariff",
+        "tariff_price": "tariffPrice",
+        "charging_time_tariff": "chargingTimeTariff",
+        "parking_time_tariff": "parkingTimeTariff",
+        "price_info": "priceInfo",
+        "local_start_date_time": "localStartDateTime",
+        "local_end_date_time": "localEndDateTime",
+        "approval_status": "approvalStatus",
+        "financial_type": "financialType",
+        "debit_cdr_id": "debitCdrId",
+    },
+    "CdrGeoLocationDto": {
+        "latitude": "latitude",
+        "longitude": "longitude",
+    },
+    "CdrLocationDto": {
+        "id": "id",
+        "evse_id": "evseId",
+        "power_type": "powerType",
+        "country_code": "country_code",
+        "party_id": "party_id",
+        "name": "name",
+        "house_number": "houseNumber",
+        "street": "street",
+        "city": "city",
+        "postal_code": "postal_code",
+        "state": "state",
+        "country": "country",
+        "hotline_phonenumber": "hotline_phonenumber",
+        "coordinates": "coordinates",
+        "time_zone": "time_zone",
+        "has_reimbursement": "hasReimbursement",
+    },
+    "CdrPatchDto": {
+        "approval_status": "approvalStatus",
+    },
+    "CdrStartedByInfoDto": {
+        "token_info": "tokenInfo",
+        "roaming_platform_type": "roamingPlatformType",
+        "authorization_state": "authorizationState",
+        "roaming_platform_connection_id": "roamingPlatformConnectionId",
+        "is_guest_usage": "isGuestUsage",
+    },
+    "CdrStartedByTokenDto": {
+        "uid": "uid",
+        "auth_reference": "authReference",
+        "token_type": "tokenType",
+        "contract_id": "contractId",
+        "auth_method": "authMethod",
+        "provider_country_code": "providerCountryCode",
+        "provider_party_id": "providerPartyId",
+        "token_ou_id": "tokenOUId",
+        "token_ou_name": "tokenOUName",
+        "token_ou": "tokenOU",
+    },
+    "ChangeAvailabilityRequest": {
+        "connector_id": "connectorId",
+        "type": "type",
+    },
+    "ChangeConfigurationRequest": {
+        "key": "key",
+        "value": "value",
+    },
+    "ChargePointAuthorizeGetDto": {
+        "id": "id",
+        "message_id": "messageId",
+        "created": "created",
+        "token_info": "tokenInfo",
+        "authorization_request_type": "authorizationRequestType",
+        "authorization_result": "authorizationResult",
+        "context": "context",
+    },
+    "ChargePointAuthorizePostDto": {
+        "contract_id": "contractId",
+        "id_tag": "idTag",
+    },
+    "ChargepointConfigurationItemsDto": {
+        "id": "id",
+        "read_only": "readOnly",
+        "value": "value",
+        "created": "created",
+        "modified": "modified",
+        "deleted": "deleted",
+    },
+    "ChargepointConnectorDto": {
+        "id": "id",
+        "operational_status": "operationalStatus",
+        "standard": "standard",
+        "format_": "format",
+        "power_type": "powerType",
+        "max_voltage": "maxVoltage",
+        "max_amperage": "maxAmperage",
+        "max_electric_power": "maxElectricPower",
+        "tariff_id": "tariffId",
+    },
+    "ChargepointDto": {
+        "id": "id",
+        "charge_point_id": "chargePointId",
+        "date_deleted": "dateDeleted",
+        "display_name": "displayName",
+        "roaming_name": "roamingName",
+        "charge_box_serial_number": "chargeBoxSerialNumber",
+        "charge_point_model": "chargePointModel",
+        "charge_point_serial_number": "chargePointSerialNumber",
+        "charge_point_vendor": "chargePointVendor",
+        "firmware_version": "firmwareVersion",
+        "connectivity_status": "connectivityStatus",
+        "iccid": "iccid",
+        "imsi": "imsi",
+        "meter_serial_number": "meterSerialNumber",
+        "meter_type": "meterType",
+        "tenant_id": "tenantId",
+        "evses": "evses",
+        "is_roaming": "isRoaming",
+        "has_guest_usage": "hasGuestUsage",
+        "location_id": "locationId",
+        "allow_any_token": "allowAnyToken",
+        "date_created": "dateCreated",
+        "updated": "updated",
+        "ou": "ou",
+        "ou_id": "ouId",
+        "ou_name": "ouName",
+        "tariff_id": "tariffId",
+        "tariff_name": "tariffName",
+        "start_tariff": "startTariff",
+        "tariff_price": "tariffPrice",
+        "sim_card_number": "simCardNumber",
+        "token_groups": "tokenGroups",
+        "is_new": "isNew",
+        "has_reimbursement": "hasReimbursement",
+        "reimburse_tariff_id": "reimburseTariffId",
+        "reimburse_tariff_name": "reimburseTariffName",
+        "reimburse_tariff_price": "reimburseTariffPrice",
+        "reimburse_uid": "reimburseUID",
+        "reimburse_token_id": "reimburseTokenId",
+        "reimburse_ou": "reimburseOU",
+        "use_tenant_fee": "useTenantFee",
+        "max_capacity_in_kw": "maxCapacityInKw",
+    },
+    "ChargepointEVSEDto": {
+        "evse_id": "evse_id",
+        "connectors": "connectors",
+    },
+    "ChargepointPutDto": {
+        "display_name": "displayName",
+        "roaming_name": "roamingName",
+        "allow_any_token": "allowAnyToken",
+        "ou_code": "ouCode",
+        "tariff_id": "tariffId",
+        "sim_card_number": "simCardNumber",
+        "is_new": "isNew",
+        "max_capacity_in_kw": "maxCapacityInKw",
+    },
+    "ChargepointStatusDto": {
+        "id": "id",
+        "display_name": "displayName",
+        "tenant_id": "tenantId",
+        "ou": "ou",
+        "ou_id": "ouId",
+        "ou_name": "ouName",
+        "timestamp": "timestamp",
+        "connectivity_status": "connectivityStatus",
+        "connectors": "connectors",
+        "websocket_connected": "websocketConnected",
+        "websocket_disconnected": "websocketDisconnected",
+    },
+    "ChargingMeterValueDto": {
+        "timestamp": "timestamp",
+        "value": "value",
+        "measurand": "measurand",
+        "unit": "unit",
+    },
+    "ChargingPeriodDto": {
+        "timestamp": "timestamp",
+        "delta_kwh": "deltaKwh",
+        "absolute_kwh": "absoluteKwh",
+        "price": "price",
+        "parking_time_minutes": "parkingTimeMinutes",
+    },
+    "ChargingProfile": {
+        "transaction_id": "transactionId",
+        "recurrency_kind": "recurrencyKind",
+        "valid_from": "validFrom",
+        "valid_to": "validTo",
+        "charging_profile_id": "chargingProfileId",
+        "stack_level": "stackLevel",
+        "charging_profile_purpose": "chargingProfilePurpose",
+        "charging_profile_kind": "chargingProfileKind",
+        "charging_schedule": "chargingSchedule",
+    },
+    "ChargingSchedule": {
+        "duration": "duration",
+        "start_schedule": "startSchedule",
+        "min_charging_rate": "minChargingRate",
+        "charging_rate_unit": "chargingRateUnit",
+        "charging_schedule_period": "chargingSchedulePeriod",
+    },
+    "ChargingSchedulePeriod": {
+        "number_phases": "numberPhases",
+        "start_period": "startPeriod",
+        "limit": "limit",
+    },
+    "ClearCacheRequest": {
+    },
+    "ClearChargingProfileRequest": {
+        "id": "id",
+        "connector_id": "connectorId",
+        "charging_profile_purpose": "chargingProfilePurpose",
+        "stack_level": "stackLevel",
+    },
+    "ConnectorDto": {
+        "id": "id",
+        "standard": "standard",
+        "format_": "format",
+        "power_type": "power_type",
+        "max_voltage": "max_voltage",
+        "max_amperage": "max_amperage",
+        "max_electric_power": "max_electric_power",
+        "calc_max_electric_power": "calc_max_electric_power",
+        "last_updated": "last_updated",
+    },
+    "ConnectorOperationalStatusDto": {
+        "connector_number": "connectorNumber",
+        "operational_status": "operationalStatus",
+        "timestamp": "timestamp",
+    },
+    "CsChargingProfiles": {
+        "transaction_id": "transactionId",
+        "recurrency_kind": "recurrencyKind",
+        "valid_from": "validFrom",
+        "valid_to": "validTo",
+        "charging_profile_id": "chargingProfileId",
+        "stack_level": "stackLevel",
+        "charging_profile_purpose": "chargingProfilePurpose",
+        "charging_profile_kind": "chargingProfileKind",
+        "charging_schedule": "chargingSchedule",
+    },
+    "DataTransferRequest": {
+        "message_id": "messageId",
+        "data": "data",
+        "vendor_id": "vendorId",
+    },
+    "DisplayTextDto": {
+        "language": "language",
+        "text": "text",
+    },
+    "EnergyMixDto": {
+        "is_green_energy": "is_green_energy",
+        "energy_sources": "energy_sources",
+        "environ_impact": "environ_impact",
+    },
+    "EnergySourceDto": {
+        "source": "source",
+        "percentage": "percentage",
+    },
+    "EntityTagHeaderValue": {
+        "tag": "tag",
+        "is_weak": "isWeak",
+    },
+    "EnvironmentalImpactDto": {
+        "category": "category",
+        "amount": "amount",
+    },
+    "ExceptionalPeriodDto": {
+        "period_begin": "period_begin",
+        "period_end": "period_end",
+    },
+    "FileContentResult": {
+        "file_contents": "fileContents",
+        "content_type": "contentType",
+        "file_download_name": "fileDownloadName",
+        "last_modified": "lastModified",
+        "entity_tag": "entityTag",
+        "enable_range_processing": "enableRangeProcessing",
+    },
+    "GeoLocationDto": {
+        "latitude": "latitude",
+        "longitude": "longitude",
+    },
+    "GetCompositeScheduleRequest": {
+        "charging_rate_unit": "chargingRateUnit",
+        "connector_id": "connectorId",
+        "duration": "duration",
+    },
+    "GetConfigurationRequest": {
+        "key": "key",
+    },
+    "GetDiagnosticsRequest": {
+        "retries": "retries",
+        "retry_interval": "retryInterval",
+        "start_time": "startTime",
+        "stop_time": "stopTime",
+        "location": "location",
+    },
+    "GetLocalListVersionRequest": {
+    },
+    "HoursDto": {
+        "twentyfourseven": "twentyfourseven",
+        "regular_hours": "regular_hours",
+        "exceptional_openings": "exceptional_openings",
+        "exceptional_closings": "exceptional_closings",
+    },
+    "IdTagInfo": {
+        "expiry_date": "expiryDate",
+        "parent_id_tag": "parentIdTag",
+        "status": "status",
+    },
+    "ImageDto": {
+        "url": "url",
+        "thumbnail": "thumbnail",
+        "category": "category",
+        "type": "type",
+        "width": "width",
+        "height": "height",
+    },
+    "InterchangeFormatCdr": {
+        "cdr_id": "cdrId",
+        "start_date_time": "startDateTime",
+        "end_date_time": "endDateTime",
+        "duration": "duration",
+        "volume": "volume",
+        "charge_point_address": "chargePointAddress",
+        "charge_point_zip": "chargePointZip",
+        "charge_point_city": "chargePointCity",
+        "charge_point_country": "chargePointCountry",
+        "charge_point_type": "chargePointType",
+        "product_type": "productType",
+        "tariff_type": "tariffType",
+        "authentication_id": "authenticationId",
+        "contract_id": "contractId",
+        "meter_id": "meterId",
+        "obis_code": "obisCode",
+        "charge_point_id": "chargePointId",
+        "service_provider_id": "serviceProviderId",
+        "infra_provider_id": "infraProviderId",
+        "calculated_cost": "calculatedCost",
+    },
+    "LocalTokenGroupGetDto": {
+        "id": "id",
+        "oucode": "oucode",
+        "token_group_name": "tokenGroupName",
+        "target_ou_codes": "targetOUCodes",
+        "tokens": "tokens",
+        "target_chargepoint_ids": "targetChargepointIds",
+        "override_tariff_id": "overrideTariffId",
+        "created": "created",
+        "updated": "updated",
+    },
+    "LocalTokenGroupPostDto": {
+        "oucode": "oucode",
+        "token_group_name": "tokenGroupName",
+        "target_ou_codes": "targetOUCodes",
+        "override_tariff_id": "overrideTariffId",
+        "tokens": "tokens",
+        "target_chargepoint_ids": "targetChargepointIds",
+    },
+    "LocalTokenGroupPutDto": {
+        "oucode": "oucode",
+        "token_group_name": "tokenGroupName",
+        "target_ou_codes": "targetOUCodes",
+        "override_tariff_id": "overrideTariffId",
+        "tokens": "tokens",
+        "target_chargepoint_ids": "targetChargepointIds",
+    },
+    "LocalTokenGroupTokenGetDto": {
+        "is_valid": "isValid",
+        "name": "name",
+        "uid": "uid",
+        "contract_id": "contractId",
+        "normalized_contract_id": "normalizedContractId",
+    },
+    "LocalTokenGroupTokenPostDto": {
+        "is_valid": "isValid",
+        "name": "name",
+        "uid": "uid",
+        "contract_id": "contractId",
+    },
+    "LocalTokenGroupTokenPutDto": {
+        "is_valid": "isValid",
+        "name": "name",
+        "uid": "uid",
+        "contract_id": "contractId",
+    },
+    "LocationChargePointDto": {
+        "charge_point_id": "chargePointId",
+    },
+    "LocationDto": {
+        "publish_allowed_to": "publish_allowed_to",
+        "name": "name",
+        "house_number": "houseNumber",
+        "postal_code": "postal_code",
+        "state": "state",
+        "hotline_phonenumber": "hotline_phonenumber",
+        "related_locations": "related_locations",
+        "parking_type": "parking_type",
+        "evses": "evses",
+        "directions": "directions",
+        "operator": "operator",
+        "suboperator": "suboperator",
+        "owner": "owner",
+        "facilities": "facilities",
+        "opening_times": "opening_times",
+        "charging_when_closed": "charging_when_closed",
+        "images": "images",
+        "energy_mix": "energy_mix",
+        "deleted_on": "deletedOn",
+        "has_reimbursement": "hasReimbursement",
+        "reimburse_info": "reimburseInfo",
+        "operator_id": "operatorId",
+        "ou": "ou",
+        "ou_id": "ouId",
+        "ou_name": "ouName",
+        "external_reference_1": "externalReference1",
+        "external_reference_2": "externalReference2",
+        "external_reference_3": "externalReference3",
+        "id": "id",
+        "country_code": "country_code",
+        "party_id": "party_id",
+        "publish": "publish",
+        "street": "street",
+        "city": "city",
+        "country": "country",
+        "coordinates": "coordinates",
+        "time_zone": "time_zone",
+        "last_updated": "last_updated",
+    },
+    "LocationEVSEDto": {
+        "id": "id",
+        "chargepointid": "chargepointid",
+        "latitude": "latitude",
+        "longitude": "longitude",
+        "uid": "uid",
+        "evse_id": "evse_id",
+        "status": "status",
+        "status_schedule": "status_schedule",
+        "capabilities": "capabilities",
+        "connectors": "connectors",
+        "floor_level": "floor_level",
+        "coordinates": "coordinates",
+        "physical_reference": "physical_reference",
+        "directions": "directions",
+        "parking_restrictions": "parking_restrictions",
+        "images": "images",
+        "last_updated": "last_updated",
+    },
+    "LocationPostDto": {
+        "publish": "publish",
+        "publish_allowed_to": "publishAllowedTo",
+        "name": "name",
+        "house_number": "houseNumber",
+        "postal_code": "postalCode",
+        "state": "state",
+        "hotline_phonenumber": "hotlinePhonenumber",
+        "related_locations": "relatedLocations",
+        "parking_type": "parkingType",
+        "evses": "evses",
+        "directions": "directions",
+        "operator": "operator",
+        "suboperator": "suboperator",
+        "owner": "owner",
+        "facilities": "facilities",
+        "opening_times": "openingTimes",
+        "charging_when_closed": "chargingWhenClosed",
+        "images": "images",
+        "energy_mix": "energyMix",
+        "has_reimbursement": "hasReimbursement",
+        "reimburse_info": "reimburseInfo",
+        "operator_id": "operatorId",
+        "ou": "ou",
+        "ou_id": "ouId",
+        "ou_name": "ouName",
+        "external_reference_1": "externalReference1",
+        "external_reference_2": "externalReference2",
+        "external_reference_3": "externalReference3",
+        "id": "id",
+        "street": "street",
+        "city": "city",
+        "country": "country",
+        "coordinates": "coordinates",
+        "timezone": "timezone",
+    },
+    "LocationPutDto": {
+        "publish_allowed_to": "publish_allowed_to",
+        "name": "name",
+        "house_number": "houseNumber",
+        "postal_code": "postal_code",
+        "state": "state",
+        "hotline_phonenumber": "hotline_phonenumber",
+        "related_locations": "related_locations",
+        "parking_type": "parking_type",
+        "evses": "evses",
+        "directions": "directions",
+        "operator": "operator",
+        "suboperator": "suboperator",
+        "owner": "owner",
+        "facilities": "facilities",
+        "opening_times": "opening_times",
+        "charging_when_closed": "charging_when_closed",
+        "images": "images",
+        "energy_mix": "energy_mix",
+        "deleted_on": "deletedOn",
+        "has_reimbursement": "hasReimbursement",
+        "reimburse_info": "reimburseInfo",
+        "ou": "ou",
+        "ou_id": "ouId",
+        "ou_name": "ouName",
+        "external_reference_1": "externalReference1",
+        "external_reference_2": "externalReference2",
+        "external_reference_3": "externalReference3",
+        "id": "id",
+        "country_code": "country_code",
+        "party_id": "party_id",
+        "publish": "publish",
+        "street": "street",
+        "city": "city",
+        "country": "country",
+        "coordinates": "coordinates",
+        "time_zone": "time_zone",
+        "last_updated": "last_updated",
+    },
+    "LocationTariffDistributionDto": {
+        "id": "id",
+        "valid_from": "validFrom",
+    },
+    "LongshipError": {
+        "code": "code",
+        "error_details": "errorDetails",
+    },
+    "LongshipErrorDetail": {
+        "message": "message",
+        "reference_id": "referenceId",
+    },
+    "MessageLogDto": {
+        "id": "id",
+        "charge_point_id": "chargePointId",
+        "message_id": "messageId",
+        "wamp_message_type": "wampMessageType",
+        "ocpp_message_type": "ocppMessageType",
+        "direction": "direction",
+        "tenant_id": "tenantId",
+        "payload": "payload",
+        "timestamp": "timestamp",
+    },
+    "OrganizationUnitFinancialDetailsDto": {
+        "beneficiary_name": "beneficiaryName",
+        "iban": "iban",
+        "bic": "bic",
+    },
+    "OrganizationUnitGetDto": {
+        "parent_id": "parentId",
+        "name": "name",
+        "external_reference": "externalReference",
+        "grid_owner_reference": "gridOwnerReference",
+        "tenant_reference": "tenantReference",
+        "customer_reference": "customerReference",
+        "address": "address",
+        "state": "state",
+        "country": "country",
+        "city": "city",
+        "house_number": "houseNumber",
+        "postal_code": "postalCode",
+        "hotline_phone_number": "hotlinePhoneNumber",
+        "company_email": "companyEmail",
+        "primary_contactperson": "primaryContactperson",
+        "primary_contactperson_email": "primaryContactpersonEmail",
+        "direct_payment_profile_id": "directPaymentProfileId",
+        "msp_ou_id": "mspOuId",
+        "msp_ou_name": "mspOuName",
+        "msp_ou_code": "mspOuCode",
+        "msp_external_id": "mspExternalId",
+        "financial_details": "financialDetails",
+        "id": "id",
+        "code": "code",
+    },
+    "OrganizationUnitPostDto": {
+        "name": "name",
+        "external_reference": "externalReference",
+        "grid_owner_reference": "gridOwnerReference",
+        "tenant_reference": "tenantReference",
+        "customer_reference": "customerReference",
+        "address": "address",
+        "state": "state",
+        "country": "country",
+        "city": "city",
+        "house_number": "houseNumber",
+        "postal_code": "postalCode",
+        "hotline_phone_number": "hotlinePhoneNumber",
+        "company_email": "companyEmail",
+        "primary_contactperson": "primaryContactperson",
+        "primary_contactperson_email": "primaryContactpersonEmail",
+        "msp_ou_id": "mspOuId",
+        "msp_ou_name": "mspOuName",
+        "msp_ou_code": "mspOuCode",
+        "msp_external_id": "mspExternalId",
+        "financial_details": "financialDetails",
+        "parent_id": "parentId",
+    },
+    "OrganizationUnitPutDto": {
+        "name": "name",
+        "external_reference": "externalReference",
+        "grid_owner_reference": "gridOwnerReference",
+        "tenant_reference": "tenantReference",
+        "customer_reference": "customerReference",
+        "address": "address",
+        "state": "state",
+        "country": "country",
+        "city": "city",
+        "house_number": "houseNumber",
+        "postal_code": "postalCode",
+        "hotline_phone_number": "hotlinePhoneNumber",
+        "company_email": "companyEmail",
+        "primary_contactperson": "primaryContactperson",
+        "primary_contactperson_email": "primaryContactpersonEmail",
+        "msp_ou_id": "mspOuId",
+        "msp_ou_name": "mspOuName",
+        "msp_ou_code": "mspOuCode",
+        "msp_external_id": "mspExternalId",
+        "financial_details": "financialDetails",
+    },
+    "PriceInfoDto": {
+        "start_price": "startPrice",
+        "energy_price": "energyPrice",
+        "total_parking_time_in_minutes": "totalParkingTimeInMinutes",
+        "total_parking_time_steps": "totalParkingTimeSteps",
+        "parking_time_price": "parkingTimePrice",
+        "total_charging_time_in_minutes": "totalChargingTimeInMinutes",
+        "total_charging_time_steps": "totalChargingTimeSteps",
+        "charging_time_price": "chargingTimePrice",
+        "total_price": "totalPrice",
+    },
+    "PrivateEmpTariffDto": {
+        "country_code": "country_code",
+        "party_id": "party_id",
+        "power_type": "powerType",
+        "use_public_tariff_when_kwh_is_cheaper": "usePublicTariffWhenKwhIsCheaper",
+    },
+    "PublishTokenTypeDto": {
+        "uid": "uid",
+        "type": "type",
+        "visual_number": "visual_number",
+        "issuer": "issuer",
+        "group_id": "group_id",
+    },
+    "RegularHoursDto": {
+        "weekday": "weekday",
+        "period_begin": "period_begin",
+        "period_end": "period_end",
+    },
+    "ReimburseInfoDto": {
+        "type": "type",
+        "has_guest_usage": "hasGuestUsage",
+        "has_guest_charging_reimbursement_fee": "hasGuestChargingReimbursementFee",
+        "country_code": "countryCode",
+        "party_id": "partyId",
+        "external_organization_unit_id": "externalOrganizationUnitId",
+        "external_organization_unit_name": "externalOrganizationUnitName",
+        "external_organization_unit_reference": "externalOrganizationUnitReference",
+        "external_organization_unit_code": "externalOrganizationUnitCode",
+        "charge_card_emaid": "chargeCardEMAID",
+        "charge_card_uid": "chargeCardUID",
+        "charge_card_issuer": "chargeCardIssuer",
+        "tariffs": "tariffs",
+        "bank_details": "bankDetails",
+        "tariff_distribution_id": "tariffDistributionId",
+        "tariff_distribution_history": "tariffDistributionHistory",
+        "ou": "ou",
+        "ou_id": "ouId",
+        "ou_name": "ouName",
+    },
+    "ReimburseStartedByInfoDto": {
+        "id_tag": "idTag",
+        "token_info": "tokenInfo",
+        "authorization_state": "authorizationState",
+        "is_guest_usage": "isGuestUsage",
+    },
+    "ReimburseStartedByTokenDto": {
+        "uid": "uid",
+        "auth_reference": "authReference",
+        "token_type": "tokenType",
+        "contract_id": "contractId",
+        "auth_method": "authMethod",
+        "provider_country_code": "providerCountryCode",
+        "provider_party_id": "providerPartyId",
+        "token_ou_id": "tokenOUId",
+        "token_ou_name": "tokenOUName",
+        "token_ou": "tokenOU",
+    },
+    "ReimbursementBankDetailsDto": {
+        "bankaccount": "bankaccount",
+        "date_created": "dateCreated",
+        "valid_from": "validFrom",
+    },
+    "ReimbursementCdrDto": {
+        "id": "id",
+        "tenant_id": "tenantId",
+        "charge_point_id": "chargePointId",
+        "connector_id": "connectorId",
+        "location_id": "locationId",
+        "evse_id": "evseId",
+        "location": "location",
+        "start_datetime": "startDatetime",
+        "end_date_time": "endDateTime",
+        "session_id": "sessionId",
+        "started_by_info": "startedByInfo",
+        "meter_start_in_wh": "meterStartInWh",
+        "meter_stop_in_wh": "meterStopInWh",
+        "total_energy_in_kwh": "totalEnergyInKwh",
+        "total_time_in_hours": "totalTimeInHours",
+        "total_price": "totalPrice",
+        "created": "created",
+        "last_updated": "lastUpdated",
+        "ou": "ou",
+        "ou_id": "ouId",
+        "ou_name": "ouName",
+        "reimburse_tariff_id": "reimburseTariffId",
+        "reimburse_tariff_name": "reimburseTariffName",
+        "reimburse_tariff_price": "reimburseTariffPrice",
+        "reimburse_tariff_calculated": "reimburseTariffCalculated",
+        "reimburse_price_calculated_on": "reimbursePriceCalculatedOn",
+        "bank_account": "bankAccount",
+        "bank_account_created_on": "bankAccountCreatedOn",
+        "bank_account_valid_from": "bankAccountValidFrom",
+        "reimburse_tariff_original_price": "reimburseTariffOriginalPrice",
+        "has_guest_charging_reimbursement_fee": "hasGuestChargingReimbursementFee",
+        "reimburse_tenant_fee": "reimburseTenantFee",
+        "tenant_fee_calculated": "tenantFeeCalculated",
+        "tariff_distribution_id": "tariffDistributionId",
+        "price_info": "priceInfo",
+        "customer_share": "customerShare",
+        "energy_compensation": "energyCompensation",
+        "reimbursement_customer_share": "reimbursementCustomerShare",
+        "local_start_date_time": "localStartDateTime",
+        "local_end_date_time": "localEndDateTime",
+    },
+    "ReimbursementCdrGeoLocationDto": {
+        "latitude": "latitude",
+        "longitude": "longitude",
+    },
+    "ReimbursementCdrLocationDto": {
+        "id": "id",
+        "evse_id": "evseId",
+        "power_type": "powerType",
+        "country_code": "country_code",
+        "party_id": "party_id",
+        "name": "name",
+        "house_number": "houseNumber",
+        "street": "street",
+        "city": "city",
+        "postal_code": "postal_code",
+        "state": "state",
+        "country": "country",
+        "hotline_phonenumber": "hotline_phonenumber",
+        "coordinates": "coordinates",
+        "time_zone": "time_zone",
+        "has_reimbursement": "hasReimbursement",
+    },
+    "ReimbursementCustomerShareDto": {
+        "customer_share": "customerShare",
+        "energy_compensation": "energyCompensation",
+        "tenant_fee": "tenantFee",
+    },
+    "ReimbursementPriceDto": {
+        "excl_vat": "excl_vat",
+        "incl_vat": "incl_vat",
+    },
+    "ReimbursementTariffDto": {
+        "id": "id",
+        "date_created": "dateCreated",
+        "valid_from": "validFrom",
+        "currency": "currency",
+        "price": "price",
+        "status": "status",
+    },
+    "RemoteStartTransactionRequest": {
+        "connector_id": "connectorId",
+        "charging_profile": "chargingProfile",
+        "id_tag": "idTag",
+    },
+    "RemoteStopTransactionRequest": {
+        "transaction_id": "transactionId",
+    },
+    "ReserveNowRequest": {
+        "parent_id_tag": "parentIdTag",
+        "connector_id": "connectorId",
+        "expiry_date": "expiryDate",
+        "id_tag": "idTag",
+        "reservation_id": "reservationId",
+    },
+    "ResetRequest": {
+        "type": "type",
+    },
+    "SendLocalListRequest": {
+        "local_authorization_list": "localAuthorizationList",
+        "list_version": "listVersion",
+        "update_type": "updateType",
+    },
+    "SessionDto": {
+        "id": "id",
+        "tenant_id": "tenantId",
+        "charge_point_id": "chargePointId",
+        "transaction_id": "transactionId",
+        "ocpp_transaction_id": "ocppTransactionId",
+        "connector_id": "connectorId",
+        "session_location": "sessionLocation",
+        "id_tag": "idTag",
+        "started_by_info": "startedByInfo",
+        "meter_start_in_wh": "meterStartInWh",
+        "session_start": "sessionStart",
+        "charging_periods": "chargingPeriods",
+        "charging_meter_values": "chargingMeterValues",
+        "meter_stop_in_wh": "meterStopInWh",
+        "session_stop": "sessionStop",
+        "status": "status",
+        "approval_status": "approvalStatus",
+        "review_scenario_type": "reviewScenarioType",
+        "total_energy_in_kwh": "totalEnergyInKwh",
+        "total_price": "totalPrice",
+        "created": "created",
+        "last_updated": "lastUpdated",
+        "ou": "ou",
+        "ou_id": "ouId",
+        "ou_name": "ouName",
+        "tariff_info": "tariffInfo",
+        "price_info": "priceInfo",
+        "tariff_id": "tariffId",
+        "tariff_name": "tariffName",
+        "start_tariff": "startTariff",
+        "tariff_price": "tariffPrice",
+        "parking_tariff": "parkingTariff",
+        "thresholds": "thresholds",
+        "parking_step_size": "parkingStepSize",
+        "delay_in_minutes": "delayInMinutes",
+        "parking_time_start": "parkingTimeStart",
+    },
+    "SessionGeoLocationDto": {
+        "latitude": "latitude",
+        "longitude": "longitude",
+    },
+    "SessionLocationDto": {
+        "id": "id",
+        "evse_id": "evseId",
+        "power_type": "powerType",
+        "country_code": "country_code",
+        "party_id": "party_id",
+        "name": "name",
+        "house_number": "houseNumber",
+        "street": "street",
+        "city": "city",
+        "postal_code": "postal_code",
+        "state": "state",
+        "country": "country",
+        "hotline_phonenumber": "hotline_phonenumber",
+        "coordinates": "coordinates",
+        "time_zone": "time_zone",
+        "has_reimbursement": "hasReimbursement",
+    },
+    "SessionThresholdCheckDto": {
+        "threshold_hit_outcome": "thresholdHitOutcome",
+        "status": "status",
+        "result": "result",
+        "is_enabled": "isEnabled",
+    },
+    "SessionThresholdValueDtoDecimal": {
+        "threshold_value": "thresholdValue",
+        "threshold_hit_outcome": "thresholdHitOutcome",
+        "status": "status",
+        "result": "result",
+        "is_enabled": "isEnabled",
+    },
+    "SessionThresholdValueDtoInt32": {
+        "threshold_value": "thresholdValue",
+        "threshold_hit_outcome": "thresholdHitOutcome",
+        "status": "status",
+        "result": "result",
+        "is_enabled": "isEnabled",
+    },
+    "SessionThresholdsDto": {
+        "thresholds_hit": "thresholdsHit",
+        "min_kwh_ac": "minKwhAc",
+        "max_kwh_ac": "maxKwhAc",
+        "min_kwh_dc": "minKwhDc",
+        "max_kwh_dc": "maxKwhDc",
+        "min_duration_in_minutes_ac": "minDurationInMinutesAc",
+        "min_duration_in_minutes_dc": "minDurationInMinutesDc",
+        "max_session_age_in_days": "maxSessionAgeInDays",
+        "check_charging_speed": "checkChargingSpeed",
+        "check_session_in_future": "checkSessionInFuture",
+    },
+    "SetChargingProfileRequest": {
+        "connector_id": "connectorId",
+        "cs_charging_profiles": "csChargingProfiles",
+    },
+    "StartedByInfoDto": {
+        "token_info": "tokenInfo",
+        "roaming_platform_type": "roamingPlatformType",
+        "authorization_state": "authorizationState",
+        "roaming_platform_connection_id": "roamingPlatformConnectionId",
+        "is_guest_usage": "isGuestUsage",
+    },
+    "StartedByTokenDto": {
+        "uid": "uid",
+        "auth_reference": "authReference",
+        "token_type": "tokenType",
+        "contract_id": "contractId",
+        "auth_method": "authMethod",
+        "provider_country_code": "providerCountryCode",
+        "provider_party_id": "providerPartyId",
+        "token_ou_id": "tokenOUId",
+        "token_ou_name": "tokenOUName",
+        "token_ou": "tokenOU",
+    },
+    "StatusScheduleDto": {
+        "period_begin": "period_begin",
+        "period_end": "period_end",
+        "status": "status",
+    },
+    "StringSegment": {
+        "buffer": "buffer",
+        "offset": "offset",
+        "length": "length",
+        "value": "value",
+        "has_value": "hasValue",
+    },
+    "TariffAssertionDto": {
+        "tariff_type": "tariffType",
+        "is_tariff_used": "isTariffUsed",
+        "tariff_result": "tariffResult",
+    },
+    "TariffDistributionGetDto": {
+        "name": "name",
+        "ou_code": "ouCode",
+        "energy_compensation": "energyCompensation",
+        "fixed_tenant_k_wh_fee": "fixedTenantKWhFee",
+        "percentage_fee_customer": "percentageFeeCustomer",
+        "percentage_fee_tenant": "percentageFeeTenant",
+        "price_history": "priceHistory",
+        "created": "created",
+        "deleted": "deleted",
+        "updated": "updated",
+        "id": "id",
+    },
+    "TariffDistributionHistoryDto": {
+        "valid_from": "validFrom",
+        "energy_compensation": "energyCompensation",
+        "fixed_tenant_k_wh_fee": "fixedTenantKWhFee",
+        "percentage_fee_customer": "percentageFeeCustomer",
+        "percentage_fee_tenant": "percentageFeeTenant",
+    },
+    "TariffDistributionPostDto": {
+        "name": "name",
+        "ou_code": "ouCode",
+        "energy_compensation": "energyCompensation",
+        "fixed_tenant_k_wh_fee": "fixedTenantKWhFee",
+        "percentage_fee_customer": "percentageFeeCustomer",
+        "percentage_fee_tenant": "percentageFeeTenant",
+    },
+    "TariffDistributionPutDto": {
+        "name": "name",
+        "ou_code": "ouCode",
+        "energy_compensation": "energyCompensation",
+        "fixed_tenant_k_wh_fee": "fixedTenantKWhFee",
+        "percentage_fee_customer": "percentageFeeCustomer",
+        "percentage_fee_tenant": "percentageFeeTenant",
+    },
+    "TariffDto": {
+        "id": "id",
+        "ocpi_id": "ocpiId",
+        "hubject_id": "hubjectId",
+        "name": "name",
+        "start_tariff": "startTariff",
+        "price": "price",
+        "price_incl_vat": "priceInclVat",
+        "currency": "currency",
+        "last_updated": "last_updated",
+        "usage_type": "usageType",
+        "tariff_type": "tariffType",
+        "vat": "vat",
+        "is_vat_relevant": "isVatRelevant",
+        "country_code": "country_code",
+        "party_id": "party_id",
+        "location_id": "locationId",
+        "is_private_emp_tariff": "isPrivateEmpTariff",
+        "private_emp_tariff": "privateEmpTariff",
+        "parking_tariff": "parkingTariff",
+        "parking_step_size_in_minutes": "parkingStepSizeInMinutes",
+        "parking_grace_period_in_minutes": "parkingGracePeriodInMinutes",
+        "parking_tariff_restrictions": "parkingTariffRestrictions",
+        "time_tariff": "timeTariff",
+        "time_step_size_in_minutes": "timeStepSizeInMinutes",
+        "time_grace_period_in_minutes": "timeGracePeriodInMinutes",
+        "price_history": "priceHistory",
+        "external_reference": "externalReference",
+        "deleted": "deleted",
+        "tenant_id": "tenantId",
+    },
+    "TariffInfoDto": {
+        "tariff_id": "tariffId",
+        "tariff_name": "tariffName",
+        "start_tariff": "startTariff",
+        "tariff_price": "tariffPrice",
+        "parking_tariff": "parkingTariff",
+        "parking_step_size_in_minutes": "parkingStepSizeInMinutes",
+        "parking_grace_period_in_minutes": "parkingGracePeriodInMinutes",
+        "time_tariff": "timeTariff",
+        "time_step_size_in_minutes": "timeStepSizeInMinutes",
+        "time_grace_period_in_minutes": "timeGracePeriodInMinutes",
+        "assertions": "assertions",
+    },
+    "TariffPostDto": {
+        "name": "name",
+        "currency": "currency",
+        "usage_type": "usageType",
+        "private_emp_tariff": "privateEmpTariff",
+        "start_tariff": "startTariff",
+        "price": "price",
+        "parking_tariff": "parkingTariff",
+        "parking_step_size_in_minutes": "parkingStepSizeInMinutes",
+        "parking_grace_period_in_minutes": "parkingGracePeriodInMinutes",
+        "parking_tariff_restrictions": "parkingTariffRestrictions",
+        "time_tariff": "timeTariff",
+        "time_step_size_in_minutes": "timeStepSizeInMinutes",
+        "time_grace_period_in_minutes": "timeGracePeriodInMinutes",
+        "external_reference": "externalReference",
+    },
+    "TariffPriceDto": {
+        "created_timestamp": "createdTimestamp",
+        "valid_from": "validFrom",
+        "start_tariff": "startTariff",
+        "price_per_kwh": "pricePerKwh",
+        "price_per_kwh_incl_vat": "pricePerKwhInclVat",
+        "is_vat_relevant": "isVatRelevant",
+        "parking_tariff": "parkingTariff",
+        "parking_step_size_in_minutes": "parkingStepSizeInMinutes",
+        "parking_grace_period_in_minutes": "parkingGracePeriodInMinutes",
+        "parking_tariff_restrictions": "parkingTariffRestrictions",
+        "time_tariff": "timeTariff",
+        "time_step_size_in_minutes": "timeStepSizeInMinutes",
+        "time_grace_period_in_minutes": "timeGracePeriodInMinutes",
+        "approval_status": "approvalStatus",
+    },
+    "TariffPutDto": {
+        "name": "name",
+        "hubject_id": "hubjectId",
+        "private_emp_tariff": "privateEmpTariff",
+        "start_tariff": "startTariff",
+        "price": "price",
+        "parking_tariff": "parkingTariff",
+        "parking_step_size_in_minutes": "parkingStepSizeInMinutes",
+        "parking_grace_period_in_minutes": "parkingGracePeriodInMinutes",
+        "parking_tariff_restrictions": "parkingTariffRestrictions",
+        "time_tariff": "timeTariff",
+        "time_step_size_in_minutes": "timeStepSizeInMinutes",
+        "time_grace_period_in_minutes": "timeGracePeriodInMinutes",
+        "external_reference": "externalReference",
+        "deleted": "deleted",
+    },
+    "TariffRestriction": {
+        "start_time": "startTime",
+        "end_time": "endTime",
+        "start_date": "startDate",
+        "end_date": "endDate",
+        "day_of_week": "dayOfWeek",
+    },
+    "TokenInfoDto": {
+        "id_tag": "idTag",
+        "contract_id": "contractId",
+        "token_type": "tokenType",
+    },
+    "TriggerMessageRequest": {
+        "connector_id": "connectorId",
+        "requested_message": "requestedMessage",
+    },
+    "UnlockConnectorRequest": {
+        "connector_id": "connectorId",
+    },
+    "UpdateFirmwareRequest": {
+        "retries": "retries",
+        "retry_interval": "retryInterval",
+        "location": "location",
+        "retrieve_date": "retrieveDate",
+    },
+    "WebhookGetDto": {
+        "id": "id",
+        "name": "name",
+        "ou_code": "ouCode",
+        "enabled": "enabled",
+        "event_types": "eventTypes",
+        "headers": "headers",
+        "url": "url",
+        "created": "created",
+        "updated": "updated",
+    },
+    "WebhookHeaderDto": {
+        "name": "name",
+        "value": "value",
+    },
+    "WebhookPostDto": {
+        "name": "name",
+        "ou_code": "ouCode",
+        "enabled": "enabled",
+        "event_types": "eventTypes",
+        "headers": "headers",
+        "url": "url",
+    },
+    "WebhookPutDto": {
+        "name": "name",
+        "ou_code": "ouCode",
+        "url": "url",
+        "enabled": "enabled",
+        "event_types": "eventTypes",
+        "headers": "headers",
+    },
+    "WebhookSummaryGetDto": {
+        "id": "id",
+        "name": "name",
+        "enabled": "enabled",
+        "event_types": "eventTypes",
+        "created": "created",
+        "updated": "updated",
+    },
+}
+
+
+def _keys_by_field(model: type) -> Dict[str, str]:
+    """The JSON key of every field, as written by the generated ``to_dict``"""
+    import ast
+    import inspect
+    import textwrap
+
+    source = textwrap.dedent(inspect.getsource(model.to_dict))  # type: ignore
+    keys: Dict[str, str] = {}
+    for node in ast.walk(ast.parse(source)):
+        # field_dict.update({"key": name, ...})
+        if isinstance(node, ast.Dict):
+            pairs = zip(node.keys, node.values)
+        # field_dict["key"] = name
+        elif isinstance(node, ast.Assign) and isinstance(node.targets[0], ast.Subscript):
+            pairs = zip([node.targets[0].slice], [node.value])  # type: ignore
+        else:
+            continue
+        for key, value in pairs:
+            if isinstance(key, ast.Constant) and isinstance(key.value, str) and isinstance(value, ast.Name):
+                keys[value.id] = key.value
+    return keys
+
+
+def _generate() -> Dict[str, Dict[str, str]]:
+    """The table of every model in ``longship_api_client.models``"""
+    import attrs
+
+    from . import models
+
+    table = {}
+    for name in sorted(models.__all__):
+        model = getattr(models, name)
+        if attrs.has(model) and hasattr(model, "to_dict"):
+            table[name] = _keys_by_field(model)
+    return table
+
+
+def _write(path: str) -> None:
+    with open(path) as file:
+        source = file.read()
+    start = source.index("JSON_KEYS: ")
+    end = source.index("\n\n\n", start)
+    lines = ["JSON_KEYS: Dict[str, Dict[str, str]] = {"]
+    for name, keys in _generate().items():
+        lines.append(f'    "{name}": {{')
+        lines.extend(f'        "{field}": "{key}",' for field, key in keys.items())
+        lines.append("    },")
+    lines.append("}")
+    with open(path, "w") as file:
+        file.write(source[:start] + "\n".join(lines) + source[end:])
+
+
+if __name__ == "__main__":
+    _write(__file__)
@@ -0,0 +1,159 @@
+"""Models whose nested objects and lists are decoded on first access
+
+``lazy_model(SessionDto).from_dict(data)`` decodes the scalar fields of a
+session right away, but keeps ``charging_periods``, ``session_location`` and
+every other optional nested model or list of them as the raw JSON until the
+attribute is read.
+Dashboards listing sessions by ``id`` and ``total_energy_in_kwh`` never pay for
+the meter values they don't show.
+
+Lazy models are subclasses of the model they wrap, so ``isinstance`` checks,
+``to_dict`` and comparisons with eagerly decoded models keep working. A field
+is decoded in full the first time it is read. Which JSON key belongs to which
+field is looked up in ``json_keys.JSON_KEYS``.
+"""
+
+import importlib
+import sys
+from functools import lru_cache
+from typing import Any, Callable, Dict, ForwardRef, List, Optional, Type, TypeVar, Union
+
+import attrs
+
+from .json_keys import JSON_KEYS
+
+T = TypeVar("T")
+
+
+def _resolve(model: type, annotation: Any) -> Any:
+    """A forward reference of a generated model, which are only imported for
+    type checking, looked up in its module or package
+    """
+    if isinstance(annotation, ForwardRef):
+        annotation = annotation.__forward_arg__
+    if not isinstance(annotation, str):
+        return annotation
+    module = sys.modules[model.__module__]
+    if hasattr(module, annotation):
+        return getattr(module, annotation)
+    package = importlib.import_module(model.__module__.rpartition(".")[0])
+    return getattr(package, annotation, None)
+
+
+def _is_model(value: Any) -> bool:
+    return isinstance(value, type) and attrs.has(value) and hasattr(value, "from_dict")
+
+
+def _decoder(model: type, annotation: Any) -> Optional[Callable[[Any], Any]]:
+    """A decoder for a field holding a nested model or a list of them"""
+    if getattr(annotation, "__origin__", None) is Union:
+        args = [
+            arg
+            for arg in annotation.__args__
+            if getattr(arg, "__name__", None) not in ("Unset", "NoneType")
+        ]
+        if len(args) != 1:
+            return None
+        annotation = args[0]
+    if getattr(annotation, "__origin__", None) in (list, List):
+        (item,) = annotation.__args__
+        item_class = _resolve(model, item)
+        if _is_model(item_class):
+            decode_item = item_class.from_dict  # type: ignore
+            return lambda raw: [decode_item(item) for item in raw]
+        return None
+    nested = _resolve(model, annotation)
+    if _is_model(nested):
+        return nested.from_dict  # type: ignore
+    return None
+
+
+def _lazy_field(name: str, decode: Callable[[Any], Any], slot: Any) -> property:
+    def get(self: Any) -> Any:
+        raw = self._raw
+        if raw is not None and name in raw:
+            slot.__set__(self, decode(raw.pop(name)))
+        return slot.__get__(self)
+
+    def set(self: Any, value: Any) -> None:
+        raw = self._raw
+        if raw:
+            raw.pop(name, None)
+        slot.__set__(self, value)
+
+    return property(get, set)
+
+
+def _from_dict(model: Type[T], src_dict: Dict[str, Any]) -> T:
+    # Lazy classes are created at runtime, so they are pickled by model
+    return lazy_model(model).from_dict(src_dict)  # type: ignore
+
+
+@lru_cache(maxsize=None)
+def lazy_model(model: Type[T]) -> Type[T]:
+    """The lazily decoding subclass of ``model``, an attrs model with ``from_dict``"""
+    eq_keys = [
+        (field.name, field.eq_key or (lambda value: value))
+        for field in attrs.fields(model)
+    ]
+    eager_from_dict = model.from_dict.__func__  # type: ignore
+    # Optional fields holding a nested model or a list of them, required ones
+    # are left to the generated from_dict that insists on their key
+    keys_by_field = JSON_KEYS.get(model.__name__, {})
+    fields_by_key: Dict[str, str] = {}
+    decoders: Dict[str, Callable[[Any], Any]] = {}
+    for field in attrs.fields(model):
+        decoder = _decoder(model, field.type)
+        if decoder is None or field.default is attrs.NOTHING:
+            continue
+        if field.name not in keys_by_field:
+            raise ValueError(
+                f"The JSON key of {model.__name__}.{field.name} is unknown, "
+                "regenerate longship_api_client.json_keys"
+            )
+        fields_by_key[keys_by_field[field.name]] = field.name
+        decoders[field.name] = decoder
+
+    def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
+        scalars = src_dict.copy()
+        nested = {}
+        for key, name in fields_by_key.items():
+            if scalars.get(key) is not None:
+                nested[name] = scalars.pop(key)
+        obj = eager_from_dict(cls, scalars)
+        if nested:
+            obj._raw = nested
+        return obj
+
+    def __init__(self: Any, *args: Any, **kwargs: Any) -> None:
+        self._raw = None
+        model.__init__(self, *args, **kwargs)  # type: ignore
+
+    def __eq__(self: Any, other: Any) -> Any:
+        if not isinstance(other, model):
+            return NotImplemented
+        return all(
+            key(getattr(self, name)) == key(getattr(other, name))
+            for name, key in eq_keys
+        )
+
+    def __reduce__(self: Any) -> Any:
+        return _from_dict, (model, self.to_dict())
+
+    namespace: Dict[str, Any] = {
+        "__slots__": ("_raw",),
+        "__doc__": model.__doc__,
+        "__module__": __name__,
+        "_eager": model,
+        "__init__": __init__,
+        "__eq__": __eq__,
+        "__hash__": None,
+        "__reduce__": __reduce__,
+        "from_dict": classmethod(from_dict),
+    }
+    for name, decoder in decoders.items():
+        namespace[name] = _lazy_field(name, decoder, model.__dict__[name])
+    return type(f"Lazy{model.__name__}", (model,), namespace)
+
+
+__all__ = ["lazy_model"]
@@ -1,279 +1,288 @@
-"""Contains all the data models used in inputs/outputs"""
+"""Contains all the data models used in inputs/outputs
 
-from .additional_geo_location_dto import AdditionalGeoLocationDto
-from .authorization_assertion_dto import AuthorizationAssertionDto
-from .authorization_assertion_dto_auth_scenario_type import (
-    AuthorizationAssertionDtoAuthScenarioType,
-)
-from .authorization_assertion_dto_status import AuthorizationAssertionDtoStatus
-from .authorization_charger_context_dto import AuthorizationChargerContextDto
-from .authorization_context_details_dto import AuthorizationContextDetailsDto
-from .authorization_data import AuthorizationData
-from .authorization_result_dto import AuthorizationResultDto
-from .authorization_result_dto_reason import AuthorizationResultDtoReason
-from .authorization_result_dto_status import AuthorizationResultDtoStatus
-from .authorization_tenant_context_dto import AuthorizationTenantContextDto
-from .business_details_dto import BusinessDetailsDto
-from .cancel_reservation_request import CancelReservationRequest
-from .cdr_dto import CdrDto
-from .cdr_dto_approval_status import CdrDtoApprovalStatus
-from .cdr_dto_financial_type import CdrDtoFinancialType
-from .cdr_geo_location_dto import CdrGeoLocationDto
-from .cdr_location_dto import CdrLocationDto
-from .cdr_location_dto_power_type import CdrLocationDtoPowerType
-from .cdr_patch_dto import CdrPatchDto
-from .cdr_patch_dto_approval_status import CdrPatchDtoApprovalStatus
-from .cdr_started_by_info_dto import CdrStartedByInfoDto
-from .cdr_started_by_info_dto_authorization_state import (
-    CdrStartedByInfoDtoAuthorizationState,
-)
-from .cdr_started_by_info_dto_roaming_platform_type import (
-    CdrStartedByInfoDtoRoamingPlatformType,
-)
-from .cdr_started_by_token_dto import CdrStartedByTokenDto
-from .cdr_started_by_token_dto_auth_method import CdrStartedByTokenDtoAuthMethod
-from .cdr_started_by_token_dto_token_type import CdrStartedByTokenDtoTokenType
-from .change_availability_request import ChangeAvailabilityRequest
-from .change_availability_request_type import ChangeAvailabilityRequestType
-from .change_configuration_request import ChangeConfigurationRequest
-from .charge_point_authorize_get_dto import ChargePointAuthorizeGetDto
-from .charge_point_authorize_get_dto_authorization_request_type import (
-    ChargePointAuthorizeGetDtoAuthorizationRequestType,
-)
-from .charge_point_authorize_post_dto import ChargePointAuthorizePostDto
-from .chargepoint_configuration_items_dto import ChargepointConfigurationItemsDto
-from .chargepoint_connector_dto import ChargepointConnectorDto
-from .chargepoint_connector_dto_format import ChargepointConnectorDtoFormat
-from .chargepoint_connector_dto_operational_status import (
-    ChargepointConnectorDtoOperationalStatus,
-)
-from .chargepoint_connector_dto_power_type import ChargepointConnectorDtoPowerType
-from .chargepoint_connector_dto_standard import ChargepointConnectorDtoStandard
-from .chargepoint_dto import ChargepointDto
-from .chargepoint_dto_connectivity_status import ChargepointDtoConnectivityStatus
-from .chargepoint_evse_dto import ChargepointEVSEDto
-from .chargepoint_put_dto import ChargepointPutDto
-from .chargepoint_status_dto import ChargepointStatusDto
-from .chargepoint_status_dto_connectivity_status import (
-    ChargepointStatusDtoConnectivityStatus,
-)
-from .charging_meter_value_dto import ChargingMeterValueDto
-from .charging_meter_value_dto_measurand import ChargingMeterValueDtoMeasurand
-from .charging_meter_value_dto_unit import ChargingMeterValueDtoUnit
-from .charging_period_dto import ChargingPeriodDto
-from .charging_profile import ChargingProfile
-from .charging_profile_charging_profile_kind import ChargingProfileChargingProfileKind
-from .charging_profile_charging_profile_purpose import (
-    ChargingProfileChargingProfilePurpose,
-)
-from .charging_profile_recurrency_kind import ChargingProfileRecurrencyKind
-from .charging_schedule import ChargingSchedule
-from .charging_schedule_charging_rate_unit import ChargingScheduleChargingRateUnit
-from .charging_schedule_period import ChargingSchedulePeriod
-from .clear_cache_request import ClearCacheRequest
-from .clear_charging_profile_request import ClearChargingProfileRequest
-from .clear_charging_profile_request_charging_profile_purpose import (
-    ClearChargingProfileRequestChargingProfilePurpose,
-)
-from .connector_dto import ConnectorDto
-from .connector_dto_format import ConnectorDtoFormat
-from .connector_dto_power_type import ConnectorDtoPowerType
-from .connector_dto_standard import ConnectorDtoStandard
-from .connector_operational_status_dto import ConnectorOperationalStatusDto
-from .connector_operational_status_dto_operational_status import (
-    ConnectorOperationalStatusDtoOperationalStatus,
-)
-from .cs_charging_profiles import CsChargingProfiles
-from .cs_charging_profiles_charging_profile_kind import (
-    CsChargingProfilesChargingProfileKind,
-)
-from .cs_charging_profiles_charging_profile_purpose import (
-    CsChargingProfilesChargingProfilePurpose,
-)
-from .cs_charging_profiles_recurrency_kind import CsChargingProfilesRecurrencyKind
-from .data_transfer_request import DataTransferRequest
-from .display_text_dto import DisplayTextDto
-from .energy_mix_dto import EnergyMixDto
-from .energy_source_dto import EnergySourceDto
-from .energy_source_dto_source import EnergySourceDtoSource
-from .entity_tag_header_value import EntityTagHeaderValue
-from .environmental_impact_dto import EnvironmentalImpactDto
-from .environmental_impact_dto_category import EnvironmentalImpactDtoCategory
-from .exceptional_period_dto import ExceptionalPeriodDto
-from .file_content_result import FileContentResult
-from .geo_location_dto import GeoLocationDto
-from .get_all_cdrs_order_by import GetAllCdrsOrderBy
-from .get_all_chargepoints_accesstype import GetAllChargepointsAccesstype
-from .get_all_chargepoints_chargerpowertype import GetAllChargepointsChargerpowertype
-from .get_all_chargepoints_operationalstatus import GetAllChargepointsOperationalstatus
-from .get_all_chargepoints_order_by import GetAllChargepointsOrderBy
-from .get_all_locations_accesstype import GetAllLocationsAccesstype
-from .get_all_locations_chargerpowertype import GetAllLocationsChargerpowertype
-from .get_all_locations_order_by import GetAllLocationsOrderBy
-from .get_all_reimbursementcdrs_order_by import GetAllReimbursementcdrsOrderBy
-from .get_all_sessions_order_by import GetAllSessionsOrderBy
-from .get_all_tariffdistributions_order_by import GetAllTariffdistributionsOrderBy
-from .get_all_tariffs_order_by import GetAllTariffsOrderBy
-from .get_all_webhooks_order_by import GetAllWebhooksOrderBy
-from .get_composite_schedule_request import GetCompositeScheduleRequest
-from .get_composite_schedule_request_charging_rate_unit import (
-    GetCompositeScheduleRequestChargingRateUnit,
-)
-from .get_configuration_request import GetConfigurationRequest
-from .get_diagnostics_request import GetDiagnosticsRequest
-from .get_local_list_version_request import GetLocalListVersionRequest
-from .hours_dto import HoursDto
-from .id_tag_info import IdTagInfo
-from .id_tag_info_status import IdTagInfoStatus
-from .image_dto import ImageDto
-from .image_dto_category import ImageDtoCategory
-from .interchange_format_cdr import InterchangeFormatCdr
-from .local_token_group_get_dto import LocalTokenGroupGetDto
-from .local_token_group_post_dto import LocalTokenGroupPostDto
-from .local_token_group_put_dto import LocalTokenGroupPutDto
-from .local_token_group_token_get_dto import LocalTokenGroupTokenGetDto
-from .local_token_group_token_post_dto import LocalTokenGroupTokenPostDto
-from .local_token_group_token_put_dto import LocalTokenGroupTokenPutDto
-from .location_charge_point_dto import LocationChargePointDto
-from .location_dto import LocationDto
-from .location_dto_facilities_item import LocationDtoFacilitiesItem
-from .location_dto_parking_type import LocationDtoParkingType
-from .location_evse_dto import LocationEVSEDto
-from .location_evse_dto_capabilities_item import LocationEVSEDtoCapabilitiesItem
-from .location_evse_dto_parking_restrictions_item import (
-    LocationEVSEDtoParkingRestrictionsItem,
-)
-from .location_evse_dto_status import LocationEVSEDtoStatus
-from .location_post_dto import LocationPostDto
-from .location_post_dto_facilities_item import LocationPostDtoFacilitiesItem
-from .location_post_dto_parking_type import LocationPostDtoParkingType
-from .location_put_dto import LocationPutDto
-from .location_put_dto_facilities_item import LocationPutDtoFacilitiesItem
-from .location_put_dto_parking_type import LocationPutDtoParkingType
-from .location_tariff_distribution_dto import LocationTariffDistributionDto
-from .longship_error import LongshipError
-from .longship_error_detail import LongshipErrorDetail
-from .message_log_dto import MessageLogDto
-from .message_log_dto_direction import MessageLogDtoDirection
-from .message_log_dto_ocpp_message_type import MessageLogDtoOcppMessageType
-from .message_log_dto_wamp_message_type import MessageLogDtoWampMessageType
-from .organization_unit_financial_details_dto import OrganizationUnitFinancialDetailsDto
-from .organization_unit_get_dto import OrganizationUnitGetDto
-from .organization_unit_post_dto import OrganizationUnitPostDto
-from .organization_unit_put_dto import OrganizationUnitPutDto
-from .price_info_dto import PriceInfoDto
-from .private_emp_tariff_dto import PrivateEmpTariffDto
-from .private_emp_tariff_dto_power_type import PrivateEmpTariffDtoPowerType
-from .publish_token_type_dto import PublishTokenTypeDto
-from .publish_token_type_dto_type import PublishTokenTypeDtoType
-from .regular_hours_dto import RegularHoursDto
-from .reimburse_info_dto import ReimburseInfoDto
-from .reimburse_info_dto_type import ReimburseInfoDtoType
-from .reimburse_started_by_info_dto import ReimburseStartedByInfoDto
-from .reimburse_started_by_info_dto_authorization_state import (
-    ReimburseStartedByInfoDtoAuthorizationState,
-)
-from .reimburse_started_by_token_dto import ReimburseStartedByTokenDto
-from .reimburse_started_by_token_dto_auth_method import (
-    ReimburseStartedByTokenDtoAuthMethod,
-)
-from .reimburse_started_by_token_dto_token_type import (
-    ReimburseStartedByTokenDtoTokenType,
-)
-from .reimbursement_bank_details_dto import ReimbursementBankDetailsDto
-from .reimbursement_cdr_dto import ReimbursementCdrDto
-from .reimbursement_cdr_geo_location_dto import ReimbursementCdrGeoLocationDto
-from .reimbursement_cdr_location_dto import ReimbursementCdrLocationDto
-from .reimbursement_cdr_location_dto_power_type import (
-    ReimbursementCdrLocationDtoPowerType,
-)
-from .reimbursement_customer_share_dto import ReimbursementCustomerShareDto
-from .reimbursement_price_dto import ReimbursementPriceDto
-from .reimbursement_tariff_dto import ReimbursementTariffDto
-from .reimbursement_tariff_dto_status import ReimbursementTariffDtoStatus
-from .remote_start_transaction_request import RemoteStartTransactionRequest
-from .remote_stop_transaction_request import RemoteStopTransactionRequest
-from .reserve_now_request import ReserveNowRequest
-from .reset_request import ResetRequest
-from .reset_request_type import ResetRequestType
-from .send_local_list_request import SendLocalListRequest
-from .send_local_list_request_update_type import SendLocalListRequestUpdateType
-from .session_dto import SessionDto
-from .session_dto_approval_status import SessionDtoApprovalStatus
-from .session_dto_review_scenario_type import SessionDtoReviewScenarioType
-from .session_dto_status import SessionDtoStatus
-from .session_geo_location_dto import SessionGeoLocationDto
-from .session_location_dto import SessionLocationDto
-from .session_location_dto_power_type import SessionLocationDtoPowerType
-from .session_threshold_check_dto import SessionThresholdCheckDto
-from .session_threshold_check_dto_status import SessionThresholdCheckDtoStatus
-from .session_threshold_check_dto_threshold_hit_outcome import (
-    SessionThresholdCheckDtoThresholdHitOutcome,
-)
-from .session_threshold_value_dto_decimal import SessionThresholdValueDtoDecimal
-from .session_threshold_value_dto_decimal_status import (
-    SessionThresholdValueDtoDecimalStatus,
-)
-from .session_threshold_value_dto_decimal_threshold_hit_outcome import (
-    SessionThresholdValueDtoDecimalThresholdHitOutcome,
-)
-from .session_threshold_value_dto_int_32 import SessionThresholdValueDtoInt32
-from .session_threshold_value_dto_int_32_status import (
-    SessionThresholdValueDtoInt32Status,
-)
-from .session_threshold_value_dto_int_32_threshold_hit_outcome import (
-    SessionThresholdValueDtoInt32ThresholdHitOutcome,
-)
-from .session_thresholds_dto import SessionThresholdsDto
-from .session_thresholds_dto_thresholds_hit_item import (
-    SessionThresholdsDtoThresholdsHitItem,
-)
-from .set_charging_profile_request import SetChargingProfileRequest
-from .started_by_info_dto import StartedByInfoDto
-from .started_by_info_dto_authorization_state import StartedByInfoDtoAuthorizationState
-from .started_by_info_dto_roaming_platform_type import (
-    StartedByInfoDtoRoamingPlatformType,
-)
-from .started_by_token_dto import StartedByTokenDto
-from .started_by_token_dto_auth_method import StartedByTokenDtoAuthMethod
-from .started_by_token_dto_token_type import StartedByTokenDtoTokenType
-from .status_schedule_dto import StatusScheduleDto
-from .status_schedule_dto_status import StatusScheduleDtoStatus
-from .string_segment import StringSegment
-from .tariff_assertion_dto import TariffAssertionDto
-from .tariff_assertion_dto_tariff_type import TariffAssertionDtoTariffType
-from .tariff_distribution_get_dto import TariffDistributionGetDto
-from .tariff_distribution_history_dto import TariffDistributionHistoryDto
-from .tariff_distribution_post_dto import TariffDistributionPostDto
-from .tariff_distribution_put_dto import TariffDistributionPutDto
-from .tariff_dto import TariffDto
-from .tariff_dto_tariff_type import TariffDtoTariffType
-from .tariff_dto_usage_type import TariffDtoUsageType
-from .tariff_info_dto import TariffInfoDto
-from .tariff_post_dto import TariffPostDto
-from .tariff_post_dto_usage_type import TariffPostDtoUsageType
-from .tariff_price_dto import TariffPriceDto
-from .tariff_price_dto_approval_status import TariffPriceDtoApprovalStatus
-from .tariff_put_dto import TariffPutDto
-from .tariff_restriction import TariffRestriction
-from .tariff_restriction_day_of_week import TariffRestrictionDayOfWeek
-from .token_info_dto import TokenInfoDto
-from .token_info_dto_token_type import TokenInfoDtoTokenType
-from .trigger_message_request import TriggerMessageRequest
-from .trigger_message_request_requested_message import (
-    TriggerMessageRequestRequestedMessage,
-)
-from .unlock_connector_request import UnlockConnectorRequest
-from .update_firmware_request import UpdateFirmwareRequest
-from .webhook_get_dto import WebhookGetDto
-from .webhook_get_dto_event_types_item import WebhookGetDtoEventTypesItem
-from .webhook_header_dto import WebhookHeaderDto
-from .webhook_post_dto import WebhookPostDto
-from .webhook_post_dto_event_types_item import WebhookPostDtoEventTypesItem
-from .webhook_put_dto import WebhookPutDto
-from .webhook_put_dto_event_types_item import WebhookPutDtoEventTypesItem
-from .webhook_summary_get_dto import WebhookSummaryGetDto
-from .webhook_summary_get_dto_event_types_item import WebhookSummaryGetDtoEventTypesItem
+Models are imported on first access, so using one of them doesn't import all of
+them.
+"""
+
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_module
+
+if TYPE_CHECKING:
+    from .additional_geo_location_dto import AdditionalGeoLocationDto
+    from .authorization_assertion_dto import AuthorizationAssertionDto
+    from .authorization_assertion_dto_auth_scenario_type import (
+        AuthorizationAssertionDtoAuthScenarioType,
+    )
+    from .authorization_assertion_dto_status import AuthorizationAssertionDtoStatus
+    from .authorization_charger_context_dto import AuthorizationChargerContextDto
+    from .authorization_context_details_dto import AuthorizationContextDetailsDto
+    from .authorization_data import AuthorizationData
+    from .authorization_result_dto import AuthorizationResultDto
+    from .authorization_result_dto_reason import AuthorizationResultDtoReason
+    from .authorization_result_dto_status import AuthorizationResultDtoStatus
+    from .authorization_tenant_context_dto import AuthorizationTenantContextDto
+    from .business_details_dto import BusinessDetailsDto
+    from .cancel_reservation_request import CancelReservationRequest
+    from .cdr_dto import CdrDto
+    from .cdr_dto_approval_status import CdrDtoApprovalStatus
+    from .cdr_dto_financial_type import CdrDtoFinancialType
+    from .cdr_geo_location_dto import CdrGeoLocationDto
+    from .cdr_location_dto import CdrLocationDto
+    from .cdr_location_dto_power_type import CdrLocationDtoPowerType
+    from .cdr_patch_dto import CdrPatchDto
+    from .cdr_patch_dto_approval_status import CdrPatchDtoApprovalStatus
+    from .cdr_started_by_info_dto import CdrStartedByInfoDto
+    from .cdr_started_by_info_dto_authorization_state import (
+        CdrStartedByInfoDtoAuthorizationState,
+    )
+    from .cdr_started_by_info_dto_roaming_platform_type import (
+        CdrStartedByInfoDtoRoamingPlatformType,
+    )
+    from .cdr_started_by_token_dto import CdrStartedByTokenDto
+    from .cdr_started_by_token_dto_auth_method import CdrStartedByTokenDtoAuthMethod
+    from .cdr_started_by_token_dto_token_type import CdrStartedByTokenDtoTokenType
+    from .change_availability_request import ChangeAvailabilityRequest
+    from .change_availability_request_type import ChangeAvailabilityRequestType
+    from .change_configuration_request import ChangeConfigurationRequest
+    from .charge_point_authorize_get_dto import ChargePointAuthorizeGetDto
+    from .charge_point_authorize_get_dto_authorization_request_type import (
+        ChargePointAuthorizeGetDtoAuthorizationRequestType,
+    )
+    from .charge_point_authorize_post_dto import ChargePointAuthorizePostDto
+    from .chargepoint_configuration_items_dto import ChargepointConfigurationItemsDto
+    from .chargepoint_connector_dto import ChargepointConnectorDto
+    from .chargepoint_connector_dto_format import ChargepointConnectorDtoFormat
+    from .chargepoint_connector_dto_operational_status import (
+        ChargepointConnectorDtoOperationalStatus,
+    )
+    from .chargepoint_connector_dto_power_type import ChargepointConnectorDtoPowerType
+    from .chargepoint_connector_dto_standard import ChargepointConnectorDtoStandard
+    from .chargepoint_dto import ChargepointDto
+    from .chargepoint_dto_connectivity_status import ChargepointDtoConnectivityStatus
+    from .chargepoint_evse_dto import ChargepointEVSEDto
+    from .chargepoint_put_dto import ChargepointPutDto
+    from .chargepoint_status_dto import ChargepointStatusDto
+    from .chargepoint_status_dto_connectivity_status import (
+        ChargepointStatusDtoConnectivityStatus,
+    )
+    from .charging_meter_value_dto import ChargingMeterValueDto
+    from .charging_meter_value_dto_measurand import ChargingMeterValueDtoMeasurand
+    from .charging_meter_value_dto_unit import ChargingMeterValueDtoUnit
+    from .charging_period_dto import ChargingPeriodDto
+    from .charging_profile import ChargingProfile
+    from .charging_profile_charging_profile_kind import ChargingProfileChargingProfileKind
+    from .charging_profile_charging_profile_purpose import (
+        ChargingProfileChargingProfilePurpose,
+    )
+    from .charging_profile_recurrency_kind import ChargingProfileRecurrencyKind
+    from .charging_schedule import ChargingSchedule
+    from .charging_schedule_charging_rate_unit import ChargingScheduleChargingRateUnit
+    from .charging_schedule_period import ChargingSchedulePeriod
+    from .clear_cache_request import ClearCacheRequest
+    from .clear_charging_profile_request import ClearChargingProfileRequest
+    from .clear_charging_profile_request_charging_profile_purpose import (
+        ClearChargingProfileRequestChargingProfilePurpose,
+    )
+    from .connector_dto import ConnectorDto
+    from .connector_dto_format import ConnectorDtoFormat
+    from .connector_dto_power_type import ConnectorDtoPowerType
+    from .connector_dto_standard import ConnectorDtoStandard
+    from .connector_operational_status_dto import ConnectorOperationalStatusDto
+    from .connector_operational_status_dto_operational_status import (
+        ConnectorOperationalStatusDtoOperationalStatus,
+    )
+    from .cs_charging_profiles import CsChargingProfiles
+    from .cs_charging_profiles_charging_profile_kind import (
+        CsChargingProfilesChargingProfileKind,
+    )
+    from .cs_charging_profiles_charging_profile_purpose import (
+        CsChargingProfilesChargingProfilePurpose,
+    )
+    from .cs_charging_profiles_recurrency_kind import CsChargingProfilesRecurrencyKind
+    from .data_transfer_request import DataTransferRequest
+    from .display_text_dto import DisplayTextDto
+    from .energy_mix_dto import EnergyMixDto
+    from .energy_source_dto import EnergySourceDto
+    from .energy_source_dto_source import EnergySourceDtoSource
+    from .entity_tag_header_value import EntityTagHeaderValue
+    from .environmental_impact_dto import EnvironmentalImpactDto
+    from .environmental_impact_dto_category import EnvironmentalImpactDtoCategory
+    from .exceptional_period_dto import ExceptionalPeriodDto
+    from .file_content_result import FileContentResult
+    from .geo_location_dto import GeoLocationDto
+    from .get_all_cdrs_order_by import GetAllCdrsOrderBy
+    from .get_all_chargepoints_accesstype import GetAllChargepointsAccesstype
+    from .get_all_chargepoints_chargerpowertype import GetAllChargepointsChargerpowertype
+    from .get_all_chargepoints_operationalstatus import GetAllChargepointsOperationalstatus
+    from .get_all_chargepoints_order_by import GetAllChargepointsOrderBy
+    from .get_all_locations_accesstype import GetAllLocationsAccesstype
+    from .get_all_locations_chargerpowertype import GetAllLocationsChargerpowertype
+    from .get_all_locations_order_by import GetAllLocationsOrderBy
+    from .get_all_reimbursementcdrs_order_by import GetAllReimbursementcdrsOrderBy
+    from .get_all_sessions_order_by import GetAllSessionsOrderBy
+    from .get_all_tariffdistributions_order_by import GetAllTariffdistributionsOrderBy
+    from .get_all_tariffs_order_by import GetAllTariffsOrderBy
+    from .get_all_webhooks_order_by import GetAllWebhooksOrderBy
+    from .get_composite_schedule_request import GetCompositeScheduleRequest
+    from .get_composite_schedule_request_charging_rate_unit import (
+        GetCompositeScheduleRequestChargingRateUnit,
+    )
+    from .get_configuration_request import GetConfigurationRequest
+    from .get_diagnostics_request import GetDiagnosticsRequest
+    from .get_local_list_version_request import GetLocalListVersionRequest
+    from .hours_dto import HoursDto
+    from .id_tag_info import IdTagInfo
+    from .id_tag_info_status import IdTagInfoStatus
+    from .image_dto import ImageDto
+    from .image_dto_category import ImageDtoCategory
+    from .interchange_format_cdr import InterchangeFormatCdr
+    from .local_token_group_get_dto import LocalTokenGroupGetDto
+    from .local_token_group_post_dto import LocalTokenGroupPostDto
+    from .local_token_group_put_dto import LocalTokenGroupPutDto
+    from .local_token_group_token_get_dto import LocalTokenGroupTokenGetDto
+    from .local_token_group_token_post_dto import LocalTokenGroupTokenPostDto
+    from .local_token_group_token_put_dto import LocalTokenGroupTokenPutDto
+    from .location_charge_point_dto import LocationChargePointDto
+    from .location_dto import LocationDto
+    from .location_dto_facilities_item import LocationDtoFacilitiesItem
+    from .location_dto_parking_type import LocationDtoParkingType
+    from .location_evse_dto import LocationEVSEDto
+    from .location_evse_dto_capabilities_item import LocationEVSEDtoCapabilitiesItem
+    from .location_evse_dto_parking_restrictions_item import (
+        LocationEVSEDtoParkingRestrictionsItem,
+    )
+    from .location_evse_dto_status import LocationEVSEDtoStatus
+    from .location_post_dto import LocationPostDto
+    from .location_post_dto_facilities_item import LocationPostDtoFacilitiesItem
+    from .location_post_dto_parking_type import LocationPostDtoParkingType
+    from .location_put_dto import LocationPutDto
+    from .location_put_dto_facilities_item import LocationPutDtoFacilitiesItem
+    from .location_put_dto_parking_type import LocationPutDtoParkingType
+    from .location_tariff_distribution_dto import LocationTariffDistributionDto
+    from .longship_error import LongshipError
+    from .longship_error_detail import LongshipErrorDetail
+    from .message_log_dto import MessageLogDto
+    from .message_log_dto_direction import MessageLogDtoDirection
+    from .message_log_dto_ocpp_message_type import MessageLogDtoOcppMessageType
+    from .message_log_dto_wamp_message_type import MessageLogDtoWampMessageType
+    from .organization_unit_financial_details_dto import OrganizationUnitFinancialDetailsDto
+    from .organization_unit_get_dto import OrganizationUnitGetDto
+    from .organization_unit_post_dto import OrganizationUnitPostDto
+    from .organization_unit_put_dto import OrganizationUnitPutDto
+    from .price_info_dto import PriceInfoDto
+    from .private_emp_tariff_dto import PrivateEmpTariffDto
+    from .private_emp_tariff_dto_power_type import PrivateEmpTariffDtoPowerType
+    from .publish_token_type_dto import PublishTokenTypeDto
+    from .publish_token_type_dto_type import PublishTokenTypeDtoType
+    from .regular_hours_dto import RegularHoursDto
+    from .reimburse_info_dto import ReimburseInfoDto
+    from .reimburse_info_dto_type import ReimburseInfoDtoType
+    from .reimburse_started_by_info_dto import ReimburseStartedByInfoDto
+    from .reimburse_started_by_info_dto_authorization_state import (
+        ReimburseStartedByInfoDtoAuthorizationState,
+    )
+    from .reimburse_started_by_token_dto import ReimburseStartedByTokenDto
+    from .reimburse_started_by_token_dto_auth_method import (
+        ReimburseStartedByTokenDtoAuthMethod,
+    )
+    from .reimburse_started_by_token_dto_token_type import (
+        ReimburseStartedByTokenDtoTokenType,
+    )
+    from .reimbursement_bank_details_dto import ReimbursementBankDetailsDto
+    from .reimbursement_cdr_dto import ReimbursementCdrDto
+    from .reimbursement_cdr_geo_location_dto import ReimbursementCdrGeoLocationDto
+    from .reimbursement_cdr_location_dto import ReimbursementCdrLocationDto
+    from .reimbursement_cdr_location_dto_power_type import (
+        ReimbursementCdrLocationDtoPowerType,
+    )
+    from .reimbursement_customer_share_dto import ReimbursementCustomerShareDto
+    from .reimbursement_price_dto import ReimbursementPriceDto
+    from .reimbursement_tariff_dto import ReimbursementTariffDto
+    from .reimbursement_tariff_dto_status import ReimbursementTariffDtoStatus
+    from .remote_start_transaction_request import RemoteStartTransactionRequest
+    from .remote_stop_transaction_request import RemoteStopTransactionRequest
+    from .reserve_now_request import ReserveNowRequest
+    from .reset_request import ResetRequest
+    from .reset_request_type import ResetRequestType
+    from .send_local_list_request import SendLocalListRequest
+    from .send_local_list_request_update_type import SendLocalListRequestUpdateType
+    from .session_dto import SessionDto
+    from .session_dto_approval_status import SessionDtoApprovalStatus
+    from .session_dto_review_scenario_type import SessionDtoReviewScenarioType
+    from .session_dto_status import SessionDtoStatus
+    from .session_geo_location_dto import SessionGeoLocationDto
+    from .session_location_dto import SessionLocationDto
+    from .session_location_dto_power_type import SessionLocationDtoPowerType
+    from .session_threshold_check_dto import SessionThresholdCheckDto
+    from .session_threshold_check_dto_status import SessionThresholdCheckDtoStatus
+    from .session_threshold_check_dto_threshold_hit_outcome import (
+        SessionThresholdCheckDtoThresholdHitOutcome,
+    )
+    from .session_threshold_value_dto_decimal import SessionThresholdValueDtoDecimal
+    from .session_threshold_value_dto_decimal_status import (
+        SessionThresholdValueDtoDecimalStatus,
+    )
+    from .session_threshold_value_dto_decimal_threshold_hit_outcome import (
+        SessionThresholdValueDtoDecimalThresholdHitOutcome,
+    )
+    from .session_threshold_value_dto_int_32 import SessionThresholdValueDtoInt32
+    from .session_threshold_value_dto_int_32_status import (
+        SessionThresholdValueDtoInt32Status,
+    )
+    from .session_threshold_value_dto_int_32_threshold_hit_outcome import (
+        SessionThresholdValueDtoInt32ThresholdHitOutcome,
+    )
+    from .session_thresholds_dto import SessionThresholdsDto
+    from .session_thresholds_dto_thresholds_hit_item import (
+        SessionThresholdsDtoThresholdsHitItem,
+    )
+    from .set_charging_profile_request import SetChargingProfileRequest
+    from .started_by_info_dto import StartedByInfoDto
+    from .started_by_info_dto_authorization_state import StartedByInfoDtoAuthorizationState
+    from .started_by_info_dto_roaming_platform_type import (
+        StartedByInfoDtoRoamingPlatformType,
+    )
+    from .started_by_token_dto import StartedByTokenDto
+    from .started_by_token_dto_auth_method import StartedByTokenDtoAuthMethod
+    from .started_by_token_dto_token_type import StartedByTokenDtoTokenType
+    from .status_schedule_dto import StatusScheduleDto
+    from .status_schedule_dto_status import StatusScheduleDtoStatus
+    from .string_segment import StringSegment
+    from .tariff_assertion_dto import TariffAssertionDto
+    from .tariff_assertion_dto_tariff_type import TariffAssertionDtoTariffType
+    from .tariff_distribution_get_dto import TariffDistributionGetDto
+    from .tariff_distribution_history_dto import TariffDistributionHistoryDto
+    from .tariff_distribution_post_dto import TariffDistributionPostDto
+    from .tariff_distribution_put_dto import TariffDistributionPutDto
+    from .tariff_dto import TariffDto
+    from .tariff_dto_tariff_type import TariffDtoTariffType
+    from .tariff_dto_usage_type import TariffDtoUsageType
+    from .tariff_info_dto import TariffInfoDto
+    from .tariff_post_dto import TariffPostDto
+    from .tariff_post_dto_usage_type import TariffPostDtoUsageType
+    from .tariff_price_dto import TariffPriceDto
+    from .tariff_price_dto_approval_status import TariffPriceDtoApprovalStatus
+    from .tariff_put_dto import TariffPutDto
+    from .tariff_restriction import TariffRestriction
+    from .tariff_restriction_day_of_week import TariffRestrictionDayOfWeek
+    from .token_info_dto import TokenInfoDto
+    from .token_info_dto_token_type import TokenInfoDtoTokenType
+    from .trigger_message_request import TriggerMessageRequest
+    from .trigger_message_request_requested_message import (
+        TriggerMessageRequestRequestedMessage,
+    )
+    from .unlock_connector_request import UnlockConnectorRequest
+    from .update_firmware_request import UpdateFirmwareRequest
+    from .webhook_get_dto import WebhookGetDto
+    from .webhook_get_dto_event_types_item import WebhookGetDtoEventTypesItem
+    from .webhook_header_dto import WebhookHeaderDto
+    from .webhook_post_dto import WebhookPostDto
+    from .webhook_post_dto_event_types_item import WebhookPostDtoEventTypesItem
+    from .webhook_put_dto import WebhookPutDto
+    from .webhook_put_dto_event_types_item import WebhookPutDtoEventTypesItem
+    from .webhook_summary_get_dto import WebhookSummaryGetDto
+    from .webhook_summary_get_dto_event_types_item import WebhookSummaryGetDtoEventTypesItem
 
 __all__ = (
     "AdditionalGeoLocationDto",
@@ -501,3 +510,233 @@ __all__ = (
     "WebhookSummaryGetDto",
     "WebhookSummaryGetDtoEventTypesItem",
 )
+
+__getattr__, __dir__ = lazy_module(
+    __name__,
+    {
+        "AdditionalGeoLocationDto": "additional_geo_location_dto",
+        "AuthorizationAssertionDto": "authorization_assertion_dto",
+        "AuthorizationAssertionDtoAuthScenarioType": "authorization_assertion_dto_auth_scenario_type",
+        "AuthorizationAssertionDtoStatus": "authorization_assertion_dto_status",
+        "AuthorizationChargerContextDto": "authorization_charger_context_dto",
+        "AuthorizationContextDetailsDto": "authorization_context_details_dto",
+        "AuthorizationData": "authorization_data",
+        "AuthorizationResultDto": "authorization_result_dto",
+        "AuthorizationResultDtoReason": "authorization_result_dto_reason",
+        "AuthorizationResultDtoStatus": "authorization_result_dto_status",
+        "AuthorizationTenantContextDto": "authorization_tenant_context_dto",
+        "BusinessDetailsDto": "business_details_dto",
+        "CancelReservationRequest": "cancel_reservation_request",
+        "CdrDto": "cdr_dto",
+        "CdrDtoApprovalStatus": "cdr_dto_approval_status",
+        "CdrDtoFinancialType": "cdr_dto_financial_type",
+        "CdrGeoLocationDto": "cdr_geo_location_dto",
+        "CdrLocationDto": "cdr_location_dto",
+        "CdrLocationDtoPowerType": "cdr_location_dto_power_type",
+        "CdrPatchDto": "cdr_patch_dto",
+        "CdrPatchDtoApprovalStatus": "cdr_patch_dto_approval_status",
+        "CdrStartedByInfoDto": "cdr_started_by_info_dto",
+        "CdrStartedByInfoDtoAuthorizationState": "cdr_started_by_info_dto_authorization_state",
+        "CdrStartedByInfoDtoRoamingPlatformType": "cdr_started_by_info_dto_roaming_platform_type",
+        "CdrStartedByTokenDto": "cdr_started_by_token_dto",
+        "CdrStartedByTokenDtoAuthMethod": "cdr_started_by_token_dto_auth_method",
+        "CdrStartedByTokenDtoTokenType": "cdr_started_by_token_dto_token_type",
+        "ChangeAvailabilityRequest": "change_availability_request",
+        "ChangeAvailabilityRequestType": "change_availability_request_type",
+        "ChangeConfigurationRequest": "change_configuration_request",
+        "ChargePointAuthorizeGetDto": "charge_point_authorize_get_dto",
+        "ChargePointAuthorizeGetDtoAuthorizationRequestType": "charge_point_authorize_get_dto_authorization_request_type",
+        "ChargePointAuthorizePostDto": "charge_point_authorize_post_dto",
+        "ChargepointConfigurationItemsDto": "chargepoint_configuration_items_dto",
+        "ChargepointConnectorDto": "chargepoint_connector_dto",
+        "ChargepointConnectorDtoFormat": "chargepoint_connector_dto_format",
+        "ChargepointConnectorDtoOperationalStatus": "chargepoint_connector_dto_operational_status",
+        "ChargepointConnectorDtoPowerType": "chargepoint_connector_dto_power_type",
+        "ChargepointConnectorDtoStandard": "chargepoint_connector_dto_standard",
+        "ChargepointDto": "chargepoint_dto",
+        "ChargepointDtoConnectivityStatus": "chargepoint_dto_connectivity_status",
+        "ChargepointEVSEDto": "chargepoint_evse_dto",
+        "ChargepointPutDto": "chargepoint_put_dto",
+        "ChargepointStatusDto": "chargepoint_status_dto",
+        "ChargepointStatusDtoConnectivityStatus": "chargepoint_status_dto_connectivity_status",
+        "ChargingMeterValueDto": "charging_meter_value_dto",
+        "ChargingMeterValueDtoMeasurand": "charging_meter_value_dto_measurand",
+        "ChargingMeterValueDtoUnit": "charging_meter_value_dto_unit",
+        "ChargingPeriodDto": "charging_period_dto",
+        "ChargingProfile": "charging_profile",
+        "ChargingProfileChargingProfileKind": "charging_profile_charging_profile_kind",
+        "ChargingProfileChargingProfilePurpose": "charging_profile_charging_profile_purpose",
+        "ChargingProfileRecurrencyKind": "charging_profile_recurrency_kind",
+        "ChargingSchedule": "charging_schedule",
+        "ChargingScheduleChargingRateUnit": "charging_schedule_charging_rate_unit",
+        "ChargingSchedulePeriod": "charging_schedule_period",
+        "ClearCacheRequest": "clear_cache_request",
+        "ClearChargingProfileRequest": "clear_charging_profile_request",
+        "ClearChargingProfileRequestChargingProfilePurpose": "clear_charging_profile_request_charging_profile_purpose",
+        "ConnectorDto": "connector_dto",
+        "ConnectorDtoFormat": "connector_dto_format",
+        "ConnectorDtoPowerType": "connector_dto_power_type",
+        "ConnectorDtoStandard": "connector_dto_standard",
+        "ConnectorOperationalStatusDto": "connector_operational_status_dto",
+        "ConnectorOperationalStatusDtoOperationalStatus": "connector_operational_status_dto_operational_status",
+        "CsChargingProfiles": "cs_charging_profiles",
+        "CsChargingProfilesChargingProfileKind": "cs_charging_profiles_charging_profile_kind",
+        "CsChargingProfilesChargingProfilePurpose": "cs_charging_profiles_charging_profile_purpose",
+        "CsChargingProfilesRecurrencyKind": "cs_charging_profiles_recurrency_kind",
+        "DataTransferRequest": "data_transfer_request",
+        "DisplayTextDto": "display_text_dto",
+        "EnergyMixDto": "energy_mix_dto",
+        "EnergySourceDto": "energy_source_dto",
+        "EnergySourceDtoSource": "energy_source_dto_source",
+        "EntityTagHeaderValue": "entity_tag_header_value",
+        "EnvironmentalImpactDto": "environmental_impact_dto",
+        "EnvironmentalImpactDtoCategory": "environmental_impact_dto_category",
+        "ExceptionalPeriodDto": "exceptional_period_dto",
+        "FileContentResult": "file_content_result",
+        "GeoLocationDto": "geo_location_dto",
+        "GetAllCdrsOrderBy": "get_all_cdrs_order_by",
+        "GetAllChargepointsAccesstype": "get_all_chargepoints_accesstype",
+        "GetAllChargepointsChargerpowertype": "get_all_chargepoints_chargerpowertype",
+        "GetAllChargepointsOperationalstatus": "get_all_chargepoints_operationalstatus",
+        "GetAllChargepointsOrderBy": "get_all_chargepoints_order_by",
+        "GetAllLocationsAccesstype": "get_all_locations_accesstype",
+        "GetAllLocationsChargerpowertype": "get_all_locations_chargerpowertype",
+        "GetAllLocationsOrderBy": "get_all_locations_order_by",
+        "GetAllReimbursementcdrsOrderBy": "get_all_reimbursementcdrs_order_by",
+        "GetAllSessionsOrderBy": "get_all_sessions_order_by",
+        "GetAllTariffdistributionsOrderBy": "get_all_tariffdistributions_order_by",
+        "GetAllTariffsOrderBy": "get_all_tariffs_order_by",
+        "GetAllWebhooksOrderBy": "get_all_webhooks_order_by",
+        "GetCompositeScheduleRequest": "get_composite_schedule_request",
+        "GetCompositeScheduleRequestChargingRateUnit": "get_composite_schedule_request_charging_rate_unit",
+        "GetConfigurationRequest": "get_configuration_request",
+        "GetDiagnosticsRequest": "get_diagnostics_request",
+        "GetLocalListVersionRequest": "get_local_list_version_request",
+        "HoursDto": "hours_dto",
+        "IdTagInfo": "id_tag_info",
+        "IdTagInfoStatus": "id_tag_info_status",
+        "ImageDto": "image_dto",
+        "ImageDtoCategory": "image_dto_category",
+        "InterchangeFormatCdr": "interchange_format_cdr",
+        "LocalTokenGroupGetDto": "local_token_group_get_dto",
+        "LocalTokenGroupPostDto": "local_token_group_post_dto",
+        "LocalTokenGroupPutDto": "local_token_group_put_dto",
+        "LocalTokenGroupTokenGetDto": "local_token_group_token_get_dto",
+        "LocalTokenGroupTokenPostDto": "local_token_group_token_post_dto",
+        "LocalTokenGroupTokenPutDto": "local_token_group_token_put_dto",
+        "LocationChargePointDto": "location_charge_point_dto",
+        "LocationDto": "location_dto",
+        "LocationDtoFacilitiesItem": "location_dto_facilities_item",
+        "LocationDtoParkingType": "location_dto_parking_type",
+        "LocationEVSEDto": "location_evse_dto",
+        "LocationEVSEDtoCapabilitiesItem": "location_evse_dto_capabilities_item",
+        "LocationEVSEDtoParkingRestrictionsItem": "location_evse_dto_parking_restrictions_item",
+        "LocationEVSEDtoStatus": "location_evse_dto_status",
+        "LocationPostDto": "location_post_dto",
+        "LocationPostDtoFacilitiesItem": "location_post_dto_facilities_item",
+        "LocationPostDtoParkingType": "location_post_dto_parking_type",
+        "LocationPutDto": "location_put_dto",
+        "LocationPutDtoFacilitiesItem": "location_put_dto_facilities_item",
+        "LocationPutDtoParkingType": "location_put_dto_parking_type",
+        "LocationTariffDistributionDto": "location_tariff_distribution_dto",
+        "LongshipError": "longship_error",
+        "LongshipErrorDetail": "longship_error_detail",
+        "MessageLogDto": "message_log_dto",
+        "MessageLogDtoDirection": "message_log_dto_direction",
+        "MessageLogDtoOcppMessageType": "message_log_dto_ocpp_message_type",
+        "MessageLogDtoWampMessageType": "message_log_dto_wamp_message_type",
+        "OrganizationUnitFinancialDetailsDto": "organization_unit_financial_details_dto",
+        "OrganizationUnitGetDto": "organization_unit_get_dto",
+        "OrganizationUnitPostDto": "organization_unit_post_dto",
+        "OrganizationUnitPutDto": "organization_unit_put_dto",
+        "PriceInfoDto": "price_info_dto",
+        "PrivateEmpTariffDto": "private_emp_tariff_dto",
+        "PrivateEmpTariffDtoPowerType": "private_emp_tariff_dto_power_type",
+        "PublishTokenTypeDto": "publish_token_type_dto",
+        "PublishTokenTypeDtoType": "publish_token_type_dto_type",
+        "RegularHoursDto": "regular_hours_dto",
+        "ReimburseInfoDto": "reimburse_info_dto",
+        "ReimburseInfoDtoType": "reimburse_info_dto_type",
+        "ReimburseStartedByInfoDto": "reimburse_started_by_info_dto",
+        "ReimburseStartedByInfoDtoAuthorizationState": "reimburse_started_by_info_dto_authorization_state",
+        "ReimburseStartedByTokenDto": "reimburse_started_by_token_dto",
+        "ReimburseStartedByTokenDtoAuthMethod": "reimburse_started_by_token_dto_auth_method",
+        "ReimburseStartedByTokenDtoTokenType": "reimburse_started_by_token_dto_token_type",
+        "ReimbursementBankDetailsDto": "reimbursement_bank_details_dto",
+        "ReimbursementCdrDto": "reimbursement_cdr_dto",
+        "ReimbursementCdrGeoLocationDto": "reimbursement_cdr_geo_location_dto",
+        "ReimbursementCdrLocationDto": "reimbursement_cdr_location_dto",
+        "ReimbursementCdrLocationDtoPowerType": "reimbursement_cdr_location_dto_power_type",
+        "ReimbursementCustomerShareDto": "reimbursement_customer_share_dto",
+        "ReimbursementPriceDto": "reimbursement_price_dto",
+        "ReimbursementTariffDto": "reimbursement_tariff_dto",
+        "ReimbursementTariffDtoStatus": "reimbursement_tariff_dto_status",
+        "RemoteStartTransactionRequest": "remote_start_transaction_request",
+        "RemoteStopTransactionRequest": "remote_stop_transaction_request",
+        "ReserveNowRequest": "reserve_now_request",
+        "ResetRequest": "reset_request",
+        "ResetRequestType": "reset_request_type",
+        "SendLocalListRequest": "send_local_list_request",
+        "SendLocalListRequestUpdateType": "send_local_list_request_update_type",
+        "SessionDto": "session_dto",
+        "SessionDtoApprovalStatus": "session_dto_approval_status",
+        "SessionDtoReviewScenarioType": "session_dto_review_scenario_type",
+        "SessionDtoStatus": "session_dto_status",
+        "SessionGeoLocationDto": "session_geo_location_dto",
+        "SessionLocationDto": "session_location_dto",
+        "SessionLocationDtoPowerType": "session_location_dto_power_type",
+        "SessionThresholdCheckDto": "session_threshold_check_dto",
+        "SessionThresholdCheckDtoStatus": "session_threshold_check_dto_status",
+        "SessionThresholdCheckDtoThresholdHitOutcome": "session_threshold_check_dto_threshold_hit_outcome",
+        "SessionThresholdValueDtoDecimal": "session_threshold_value_dto_decimal",
+        "SessionThresholdValueDtoDecimalStatus": "session_threshold_value_dto_decimal_status",
+        "SessionThresholdValueDtoDecimalThresholdHitOutcome": "session_threshold_value_dto_decimal_threshold_hit_outcome",
+        "SessionThresholdValueDtoInt32": "session_threshold_value_dto_int_32",
+        "SessionThresholdValueDtoInt32Status": "session_threshold_value_dto_int_32_status",
+        "SessionThresholdValueDtoInt32ThresholdHitOutcome": "session_threshold_value_dto_int_32_threshold_hit_outcome",
+        "SessionThresholdsDto": "session_thresholds_dto",
+        "SessionThresholdsDtoThresholdsHitItem": "session_thresholds_dto_thresholds_hit_item",
+        "SetChargingProfileRequest": "set_charging_profile_request",
+        "StartedByInfoDto": "started_by_info_dto",
+        "StartedByInfoDtoAuthorizationState": "started_by_info_dto_authorization_state",
+        "StartedByInfoDtoRoamingPlatformType": "started_by_info_dto_roaming_platform_type",
+        "StartedByTokenDto": "started_by_token_dto",
+        "StartedByTokenDtoAuthMethod": "started_by_token_dto_auth_method",
+        "StartedByTokenDtoTokenType": "started_by_token_dto_token_type",
+        "StatusScheduleDto": "status_schedule_dto",
+        "StatusScheduleDtoStatus": "status_schedule_dto_status",
+        "StringSegment": "string_segment",
+        "TariffAssertionDto": "tariff_assertion_dto",
+        "TariffAssertionDtoTariffType": "tariff_assertion_dto_tariff_type",
+        "TariffDistributionGetDto": "tariff_distribution_get_dto",
+        "TariffDistributionHistoryDto": "tariff_distribution_history_dto",
+        "TariffDistributionPostDto": "tariff_distribution_post_dto",
+        "TariffDistributionPutDto": "tariff_distribution_put_dto",
+        "TariffDto": "tariff_dto",
+        "TariffDtoTariffType": "tariff_dto_tariff_type",
+        "TariffDtoUsageType": "tariff_dto_usage_type",
+        "TariffInfoDto": "tariff_info_dto",
+        "TariffPostDto": "tariff_post_dto",
+        "TariffPostDtoUsageType": "tariff_post_dto_usage_type",
+        "TariffPriceDto": "tariff_price_dto",
+        "TariffPriceDtoApprovalStatus": "tariff_price_dto_approval_status",
+        "TariffPutDto": "tariff_put_dto",
+        "TariffRestriction": "tariff_restriction",
+        "TariffRestrictionDayOfWeek": "tariff_restriction_day_of_week",
+        "TokenInfoDto": "token_info_dto",
+        "TokenInfoDtoTokenType": "token_info_dto_token_type",
+        "TriggerMessageRequest": "trigger_message_request",
+        "TriggerMessageRequestRequestedMessage": "trigger_message_request_requested_message",
+        "UnlockConnectorRequest": "unlock_connector_request",
+        "UpdateFirmwareRequest": "update_firmware_request",
+        "WebhookGetDto": "webhook_get_dto",
+        "WebhookGetDtoEventTypesItem": "webhook_get_dto_event_types_item",
+        "WebhookHeaderDto": "webhook_header_dto",
+        "WebhookPostDto": "webhook_post_dto",
+        "WebhookPostDtoEventTypesItem": "webhook_post_dto_event_types_item",
+        "WebhookPutDto": "webhook_put_dto",
+        "WebhookPutDtoEventTypesItem": "webhook_put_dto_event_types_item",
+        "WebhookSummaryGetDto": "webhook_summary_get_dto",
+        "WebhookSummaryGetDtoEventTypesItem": "webhook_summary_get_dto_event_types_item",
+    },
+)
@@ -1,11 +1,15 @@
 from typing import Any, Dict, Type, TypeVar
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
 from typing import Union
@@ -35,7 +39,9 @@ class AuthorizationAssertionDto:
     status: Union[Unset, AuthorizationAssertionDtoStatus] = (
         AuthorizationAssertionDtoStatus.PENDING
     )
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         auth_scenario_type: Union[Unset, str] = UNSET
@@ -49,7 +55,7 @@ class AuthorizationAssertionDto:
             status = self.status.value
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update({})
         if auth_scenario_type is not UNSET:
             field_dict["authScenarioType"] = auth_scenario_type
@@ -87,12 +93,23 @@ class AuthorizationAssertionDto:
             status=status,
         )
 
-        authorization_assertion_dto.additional_properties = d
+        if d:
+            authorization_assertion_dto.additional_properties = d
         return authorization_assertion_dto
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -104,4 +121,4 @@ class AuthorizationAssertionDto:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
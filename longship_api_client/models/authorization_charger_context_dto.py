@@ -1,11 +1,15 @@
 from typing import Any, Dict, Type, TypeVar
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
 from typing import Union
@@ -32,7 +36,9 @@ class AuthorizationChargerContextDto:
     reimburse_uid: Union[Unset, str] = UNSET
     reimburse_ou: Union[Unset, str] = UNSET
     has_reimbursement: Union[Unset, bool] = UNSET
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         allow_any_token = self.allow_any_token
@@ -48,7 +54,7 @@ class AuthorizationChargerContextDto:
         has_reimbursement = self.has_reimbursement
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update({})
         if allow_any_token is not UNSET:
             field_dict["allowAnyToken"] = allow_any_token
@@ -89,12 +95,23 @@ class AuthorizationChargerContextDto:
             has_reimbursement=has_reimbursement,
         )
 
-        authorization_charger_context_dto.additional_properties = d
+        if d:
+            authorization_charger_context_dto.additional_properties = d
         return authorization_charger_context_dto
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -106,4 +123,4 @@ class AuthorizationChargerContextDto:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
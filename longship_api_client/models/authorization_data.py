@@ -1,11 +1,15 @@
 from typing import Any, Dict, Type, TypeVar, TYPE_CHECKING
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
 from typing import Union
@@ -27,7 +31,9 @@ class AuthorizationData:
 
     id_tag: str
     id_tag_info: Union[Unset, "IdTagInfo"] = UNSET
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         id_tag = self.id_tag
@@ -37,7 +43,7 @@ class AuthorizationData:
             id_tag_info = self.id_tag_info.to_dict()
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update(
             {
                 "idTag": id_tag,
@@ -67,12 +73,23 @@ class AuthorizationData:
             id_tag_info=id_tag_info,
         )
 
-        authorization_data.additional_properties = d
+        if d:
+            authorization_data.additional_properties = d
         return authorization_data
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -84,4 +101,4 @@ class AuthorizationData:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -1,11 +1,15 @@
 from typing import Any, Dict, Type, TypeVar, TYPE_CHECKING
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
 from ..models.authorization_result_dto_status import AuthorizationResultDtoStatus
@@ -37,7 +41,9 @@ class AuthorizationResultDto:
         AuthorizationResultDtoReason.APPROVEDBYREMOTE
     )
     description: Union[Unset, str] = UNSET
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         assertion: Union[Unset, List[Dict[str, Any]]] = UNSET
@@ -58,7 +64,7 @@ class AuthorizationResultDto:
         description = self.description
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update({})
         if assertion is not UNSET:
             field_dict["assertion"] = assertion
@@ -106,12 +112,23 @@ class AuthorizationResultDto:
             description=description,
         )
 
-        authorization_result_dto.additional_properties = d
+        if d:
+            authorization_result_dto.additional_properties = d
         return authorization_result_dto
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -123,4 +140,4 @@ class AuthorizationResultDto:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
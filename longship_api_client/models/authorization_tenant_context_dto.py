@@ -1,11 +1,15 @@
 from typing import Any, Dict, Type, TypeVar
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
 from typing import Union
@@ -26,7 +30,9 @@ class AuthorizationTenantContextDto:
     hubject_priority: Union[Unset, int] = UNSET
     hubject_enabled: Union[Unset, bool] = UNSET
     hubject_fast_approval: Union[Unset, bool] = UNSET
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         hubject_priority = self.hubject_priority
@@ -36,7 +42,7 @@ class AuthorizationTenantContextDto:
         hubject_fast_approval = self.hubject_fast_approval
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update({})
         if hubject_priority is not UNSET:
             field_dict["hubjectPriority"] = hubject_priority
@@ -62,12 +68,23 @@ class AuthorizationTenantContextDto:
             hubject_fast_approval=hubject_fast_approval,
         )
 
-        authorization_tenant_context_dto.additional_properties = d
+        if d:
+            authorization_tenant_context_dto.additional_properties = d
         return authorization_tenant_context_dto
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -79,4 +96,4 @@ class AuthorizationTenantContextDto:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -1,11 +1,15 @@
 from typing import Any, Dict, Type, TypeVar
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 
 T = TypeVar("T", bound="CancelReservationRequest")
 
@@ -18,13 +22,15 @@ class CancelReservationRequest:
     """
 
     reservation_id: int
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         reservation_id = self.reservation_id
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update(
             {
                 "reservationId": reservation_id,
@@ -42,12 +48,23 @@ class CancelReservationRequest:
             reservation_id=reservation_id,
         )
 
-        cancel_reservation_request.additional_properties = d
+        if d:
+            cancel_reservation_request.additional_properties = d
         return cancel_reservation_request
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -59,4 +76,4 @@ class CancelReservationRequest:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
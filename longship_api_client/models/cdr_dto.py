@@ -1,15 +1,19 @@
 from typing import Any, Dict, Type, TypeVar, TYPE_CHECKING
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
 from ..models.cdr_dto_approval_status import CdrDtoApprovalStatus
-from dateutil.parser import isoparse
+from ..timestamps import parse_timestamp
 from ..models.cdr_dto_financial_type import CdrDtoFinancialType
 import datetime
 from typing import Union
@@ -92,7 +96,9 @@ class CdrDto:
     approval_status: Union[Unset, CdrDtoApprovalStatus] = CdrDtoApprovalStatus.APPROVED
     financial_type: Union[Unset, CdrDtoFinancialType] = CdrDtoFinancialType.DEBIT
     debit_cdr_id: Union[Unset, str] = UNSET
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         id = self.id
@@ -185,7 +191,7 @@ class CdrDto:
         debit_cdr_id = self.debit_cdr_id
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update({})
         if id is not UNSET:
             field_dict["id"] = id
@@ -280,14 +286,14 @@ class CdrDto:
         if isinstance(_start_datetime, Unset) or _start_datetime is None:
             start_datetime = UNSET
         else:
-            start_datetime = isoparse(_start_datetime)
+            start_datetime = parse_timestamp(_start_datetime)
 
         _end_date_time = d.pop("endDateTime", UNSET)
         end_date_time: Union[Unset, datetime.datetime]
         if isinstance(_end_date_time, Unset) or _end_date_time is None:
             end_date_time = UNSET
         else:
-            end_date_time = isoparse(_end_date_time)
+            end_date_time = parse_timestamp(_end_date_time)
 
         session_id = d.pop("sessionId", UNSET)
 
@@ -320,14 +326,14 @@ class CdrDto:
         if isinstance(_created, Unset) or _created is None:
             created = UNSET
         else:
-            created = isoparse(_created)
+            created = parse_timestamp(_created)
 
         _last_updated = d.pop("lastUpdated", UNSET)
         last_updated: Union[Unset, datetime.datetime]
         if isinstance(_last_updated, Unset) or _last_updated is None:
             last_updated = UNSET
         else:
-            last_updated = isoparse(_last_updated)
+            last_updated = parse_timestamp(_last_updated)
 
         ou = d.pop("ou", UNSET)
 
@@ -359,14 +365,14 @@ class CdrDto:
         if isinstance(_local_start_date_time, Unset) or _local_start_date_time is None:
             local_start_date_time = UNSET
         else:
-            local_start_date_time = isoparse(_local_start_date_time)
+            local_start_date_time = parse_timestamp(_local_start_date_time)
 
         _local_end_date_time = d.pop("localEndDateTime", UNSET)
         local_end_date_time: Union[Unset, datetime.datetime]
         if isinstance(_local_end_date_time, Unset) or _local_end_date_time is None:
             local_end_date_time = UNSET
         else:
-            local_end_date_time = isoparse(_local_end_date_time)
+            local_end_date_time = parse_timestamp(_local_end_date_time)
 
         _approval_status = d.pop("approvalStatus", UNSET)
         approval_status: Union[Unset, CdrDtoApprovalStatus]
@@ -418,12 +424,23 @@ class CdrDto:
             debit_cdr_id=debit_cdr_id,
         )
 
-        cdr_dto.additional_properties = d
+        if d:
+            cdr_dto.additional_properties = d
         return cdr_dto
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -435,4 +452,4 @@ class CdrDto:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -1,11 +1,15 @@
 from typing import Any, Dict, Type, TypeVar, TYPE_CHECKING
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
 from ..models.cdr_location_dto_power_type import CdrLocationDtoPowerType
@@ -58,7 +62,9 @@ class CdrLocationDto:
     coordinates: Union[Unset, "CdrGeoLocationDto"] = UNSET
     time_zone: Union[Unset, str] = UNSET
     has_reimbursement: Union[Unset, bool] = UNSET
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         id = self.id
@@ -98,7 +104,7 @@ class CdrLocationDto:
         has_reimbursement = self.has_reimbursement
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update({})
         if id is not UNSET:
             field_dict["id"] = id
@@ -201,12 +207,23 @@ class CdrLocationDto:
             has_reimbursement=has_reimbursement,
         )
 
-        cdr_location_dto.additional_properties = d
+        if d:
+            cdr_location_dto.additional_properties = d
         return cdr_location_dto
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -218,4 +235,4 @@ class CdrLocationDto:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -1,11 +1,15 @@
 from typing import Any, Dict, Type, TypeVar
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
 from typing import Union
@@ -25,7 +29,9 @@ class CdrPatchDto:
     approval_status: Union[Unset, CdrPatchDtoApprovalStatus] = (
         CdrPatchDtoApprovalStatus.APPROVED
     )
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         approval_status: Union[Unset, str] = UNSET
@@ -33,7 +39,7 @@ class CdrPatchDto:
             approval_status = self.approval_status.value
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update({})
         if approval_status is not UNSET:
             field_dict["approvalStatus"] = approval_status
@@ -54,12 +60,23 @@ class CdrPatchDto:
             approval_status=approval_status,
         )
 
-        cdr_patch_dto.additional_properties = d
+        if d:
+            cdr_patch_dto.additional_properties = d
         return cdr_patch_dto
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -71,4 +88,4 @@ class CdrPatchDto:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
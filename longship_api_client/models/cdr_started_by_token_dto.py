@@ -1,11 +1,15 @@
 from typing import Any, Dict, Type, TypeVar
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
 from ..models.cdr_started_by_token_dto_auth_method import CdrStartedByTokenDtoAuthMethod
@@ -47,7 +51,9 @@ class CdrStartedByTokenDto:
     token_ou_id: Union[Unset, str] = UNSET
     token_ou_name: Union[Unset, str] = UNSET
     token_ou: Union[Unset, str] = UNSET
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         uid = self.uid
@@ -75,7 +81,7 @@ class CdrStartedByTokenDto:
         token_ou = self.token_ou
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update({})
         if uid is not UNSET:
             field_dict["uid"] = uid
@@ -146,12 +152,23 @@ class CdrStartedByTokenDto:
             token_ou=token_ou,
         )
 
-        cdr_started_by_token_dto.additional_properties = d
+        if d:
+            cdr_started_by_token_dto.additional_properties = d
         return cdr_started_by_token_dto
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -163,4 +180,4 @@ class CdrStartedByTokenDto:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -1,14 +1,18 @@
 from typing import Any, Dict, Type, TypeVar, TYPE_CHECKING
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
-from dateutil.parser import isoparse
+from ..timestamps import parse_timestamp
 import datetime
 from typing import Union
 from ..models.charge_point_authorize_get_dto_authorization_request_type import (
@@ -49,7 +53,9 @@ class ChargePointAuthorizeGetDto:
     ] = ChargePointAuthorizeGetDtoAuthorizationRequestType.AUTHORIZE
     authorization_result: Union[Unset, "AuthorizationResultDto"] = UNSET
     context: Union[Unset, "AuthorizationContextDetailsDto"] = UNSET
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         id = self.id
@@ -77,7 +83,7 @@ class ChargePointAuthorizeGetDto:
             context = self.context.to_dict()
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update({})
         if id is not UNSET:
             field_dict["id"] = id
@@ -114,7 +120,7 @@ class ChargePointAuthorizeGetDto:
         if isinstance(_created, Unset) or _created is None:
             created = UNSET
         else:
-            created = isoparse(_created)
+            created = parse_timestamp(_created)
 
         _token_info = d.pop("tokenInfo", UNSET)
         token_info: Union[Unset, TokenInfoDto]
@@ -162,12 +168,23 @@ class ChargePointAuthorizeGetDto:
             context=context,
         )
 
-        charge_point_authorize_get_dto.additional_properties = d
+        if d:
+            charge_point_authorize_get_dto.additional_properties = d
         return charge_point_authorize_get_dto
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -179,4 +196,4 @@ class ChargePointAuthorizeGetDto:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
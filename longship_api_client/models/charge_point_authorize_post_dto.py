@@ -1,11 +1,15 @@
 from typing import Any, Dict, Type, TypeVar
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
 from typing import Union
@@ -24,7 +28,9 @@ class ChargePointAuthorizePostDto:
 
     contract_id: Union[Unset, str] = UNSET
     id_tag: Union[Unset, str] = UNSET
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         contract_id = self.contract_id
@@ -32,7 +38,7 @@ class ChargePointAuthorizePostDto:
         id_tag = self.id_tag
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update({})
         if contract_id is not UNSET:
             field_dict["contractId"] = contract_id
@@ -53,12 +59,23 @@ class ChargePointAuthorizePostDto:
             id_tag=id_tag,
         )
 
-        charge_point_authorize_post_dto.additional_properties = d
+        if d:
+            charge_point_authorize_post_dto.additional_properties = d
         return charge_point_authorize_post_dto
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -70,4 +87,4 @@ class ChargePointAuthorizePostDto:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
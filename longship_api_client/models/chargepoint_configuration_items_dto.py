@@ -1,14 +1,18 @@
 from typing import Any, Dict, Type, TypeVar
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
-from dateutil.parser import isoparse
+from ..timestamps import parse_timestamp
 import datetime
 from typing import Union
 
@@ -34,7 +38,9 @@ class ChargepointConfigurationItemsDto:
     created: Union[Unset, datetime.datetime] = UNSET
     modified: Union[Unset, datetime.datetime] = UNSET
     deleted: Union[Unset, datetime.datetime] = UNSET
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         id = self.id
@@ -56,7 +62,7 @@ class ChargepointConfigurationItemsDto:
             deleted = self.deleted.isoformat()
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update({})
         if id is not UNSET:
             field_dict["id"] = id
@@ -87,21 +93,21 @@ class ChargepointConfigurationItemsDto:
         if isinstance(_created, Unset) or _created is None:
             created = UNSET
         else:
-            created = isoparse(_created)
+            created = parse_timestamp(_created)
 
         _modified = d.pop("modified", UNSET)
         modified: Union[Unset, datetime.datetime]
         if isinstance(_modified, Unset) or _modified is None:
             modified = UNSET
         else:
-            modified = isoparse(_modified)
+            modified = parse_timestamp(_modified)
 
         _deleted = d.pop("deleted", UNSET)
         deleted: Union[Unset, datetime.datetime]
         if isinstance(_deleted, Unset) or _deleted is None:
             deleted = UNSET
         else:
-            deleted = isoparse(_deleted)
+            deleted = parse_timestamp(_deleted)
 
         chargepoint_configuration_items_dto = cls(
             id=id,
@@ -112,12 +118,23 @@ class ChargepointConfigurationItemsDto:
             deleted=deleted,
         )
 
-        chargepoint_configuration_items_dto.additional_properties = d
+        if d:
+            chargepoint_configuration_items_dto.additional_properties = d
         return chargepoint_configuration_items_dto
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -129,4 +146,4 @@ class ChargepointConfigurationItemsDto:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
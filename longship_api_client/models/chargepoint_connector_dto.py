@@ -1,11 +1,15 @@
 from typing import Any, Dict, Type, TypeVar
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
 from ..models.chargepoint_connector_dto_format import ChargepointConnectorDtoFormat
@@ -56,7 +60,9 @@ class ChargepointConnectorDto:
     max_amperage: Union[Unset, int] = UNSET
     max_electric_power: Union[Unset, int] = UNSET
     tariff_id: Union[Unset, str] = UNSET
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         id = self.id
@@ -86,7 +92,7 @@ class ChargepointConnectorDto:
         tariff_id = self.tariff_id
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update({})
         if id is not UNSET:
             field_dict["id"] = id
@@ -164,12 +170,23 @@ class ChargepointConnectorDto:
             tariff_id=tariff_id,
         )
 
-        chargepoint_connector_dto.additional_properties = d
+        if d:
+            chargepoint_connector_dto.additional_properties = d
         return chargepoint_connector_dto
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -181,4 +198,4 @@ class ChargepointConnectorDto:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -1,17 +1,21 @@
 from typing import Any, Dict, Type, TypeVar, TYPE_CHECKING
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
 from ..models.chargepoint_dto_connectivity_status import (
     ChargepointDtoConnectivityStatus,
 )
-from dateutil.parser import isoparse
+from ..timestamps import parse_timestamp
 from typing import cast
 import datetime
 from typing import Union
@@ -116,7 +120,9 @@ class ChargepointDto:
     reimburse_ou: Union[Unset, str] = UNSET
     use_tenant_fee: Union[Unset, bool] = UNSET
     max_capacity_in_kw: Union[Unset, float] = UNSET
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         id = self.id
@@ -219,7 +225,7 @@ class ChargepointDto:
         max_capacity_in_kw = self.max_capacity_in_kw
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update({})
         if id is not UNSET:
             field_dict["id"] = id
@@ -322,7 +328,7 @@ class ChargepointDto:
         if isinstance(_date_deleted, Unset) or _date_deleted is None:
             date_deleted = UNSET
         else:
-            date_deleted = isoparse(_date_deleted)
+            date_deleted = parse_timestamp(_date_deleted)
 
         display_name = d.pop("displayName", UNSET)
 
@@ -375,14 +381,14 @@ class ChargepointDto:
         if isinstance(_date_created, Unset) or _date_created is None:
             date_created = UNSET
         else:
-            date_created = isoparse(_date_created)
+            date_created = parse_timestamp(_date_created)
 
         _updated = d.pop("updated", UNSET)
         updated: Union[Unset, datetime.datetime]
         if isinstance(_updated, Unset) or _updated is None:
             updated = UNSET
         else:
-            updated = isoparse(_updated)
+            updated = parse_timestamp(_updated)
 
         ou = d.pop("ou", UNSET)
 
@@ -467,12 +473,23 @@ class ChargepointDto:
             max_capacity_in_kw=max_capacity_in_kw,
         )
 
-        chargepoint_dto.additional_properties = d
+        if d:
+            chargepoint_dto.additional_properties = d
         return chargepoint_dto
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -484,4 +501,4 @@ class ChargepointDto:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -1,11 +1,15 @@
 from typing import Any, Dict, Type, TypeVar
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
 from typing import Union
@@ -36,7 +40,9 @@ class ChargepointPutDto:
     sim_card_number: Union[Unset, str] = UNSET
     is_new: Union[Unset, bool] = UNSET
     max_capacity_in_kw: Union[Unset, float] = UNSET
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         display_name = self.display_name
@@ -56,7 +62,7 @@ class ChargepointPutDto:
         max_capacity_in_kw = self.max_capacity_in_kw
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update({})
         if display_name is not UNSET:
             field_dict["displayName"] = display_name
@@ -107,12 +113,23 @@ class ChargepointPutDto:
             max_capacity_in_kw=max_capacity_in_kw,
         )
 
-        chargepoint_put_dto.additional_properties = d
+        if d:
+            chargepoint_put_dto.additional_properties = d
         return chargepoint_put_dto
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -124,4 +141,4 @@ class ChargepointPutDto:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -1,14 +1,18 @@
 from typing import Any, Dict, Type, TypeVar, TYPE_CHECKING
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
-from dateutil.parser import isoparse
+from ..timestamps import parse_timestamp
 import datetime
 from ..models.chargepoint_status_dto_connectivity_status import (
     ChargepointStatusDtoConnectivityStatus,
@@ -53,7 +57,9 @@ class ChargepointStatusDto:
     connectors: Union[Unset, List["ConnectorOperationalStatusDto"]] = UNSET
     websocket_connected: Union[Unset, datetime.datetime] = UNSET
     websocket_disconnected: Union[Unset, datetime.datetime] = UNSET
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         id = self.id
@@ -92,7 +98,7 @@ class ChargepointStatusDto:
             websocket_disconnected = self.websocket_disconnected.isoformat()
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update({})
         if id is not UNSET:
             field_dict["id"] = id
@@ -143,7 +149,7 @@ class ChargepointStatusDto:
         if isinstance(_timestamp, Unset) or _timestamp is None:
             timestamp = UNSET
         else:
-            timestamp = isoparse(_timestamp)
+            timestamp = parse_timestamp(_timestamp)
 
         _connectivity_status = d.pop("connectivityStatus", UNSET)
         connectivity_status: Union[Unset, ChargepointStatusDtoConnectivityStatus]
@@ -168,14 +174,14 @@ class ChargepointStatusDto:
         if isinstance(_websocket_connected, Unset) or _websocket_connected is None:
             websocket_connected = UNSET
         else:
-            websocket_connected = isoparse(_websocket_connected)
+            websocket_connected = parse_timestamp(_websocket_connected)
 
         _websocket_disconnected = d.pop("websocketDisconnected", UNSET)
         websocket_disconnected: Union[Unset, datetime.datetime]
         if isinstance(_websocket_disconnected, Unset) or _websocket_disconnected is None:
             websocket_disconnected = UNSET
         else:
-            websocket_disconnected = isoparse(_websocket_disconnected)
+            websocket_disconnected = parse_timestamp(_websocket_disconnected)
 
         chargepoint_status_dto = cls(
             id=id,
@@ -191,12 +197,23 @@ class ChargepointStatusDto:
             websocket_disconnected=websocket_disconnected,
         )
 
-        chargepoint_status_dto.additional_properties = d
+        if d:
+            chargepoint_status_dto.additional_properties = d
         return chargepoint_status_dto
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -208,4 +225,4 @@ class ChargepointStatusDto:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -1,14 +1,18 @@
 from typing import Any, Dict, Type, TypeVar
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
-from dateutil.parser import isoparse
+from ..timestamps import parse_timestamp
 from ..models.charging_meter_value_dto_measurand import ChargingMeterValueDtoMeasurand
 import datetime
 from ..models.charging_meter_value_dto_unit import ChargingMeterValueDtoUnit
@@ -35,7 +39,9 @@ class ChargingMeterValueDto:
         ChargingMeterValueDtoMeasurand.ENERGY_ACTIVE_EXPORT_REGISTER
     )
     unit: Union[Unset, ChargingMeterValueDtoUnit] = ChargingMeterValueDtoUnit.WH
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         timestamp: Union[Unset, str] = UNSET
@@ -53,7 +59,7 @@ class ChargingMeterValueDto:
             unit = self.unit.value
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update({})
         if timestamp is not UNSET:
             field_dict["timestamp"] = timestamp
@@ -74,7 +80,7 @@ class ChargingMeterValueDto:
         if isinstance(_timestamp, Unset) or _timestamp is None:
             timestamp = UNSET
         else:
-            timestamp = isoparse(_timestamp)
+            timestamp = parse_timestamp(_timestamp)
 
         value = d.pop("value", UNSET)
 
@@ -99,12 +105,23 @@ class ChargingMeterValueDto:
             unit=unit,
         )
 
-        charging_meter_value_dto.additional_properties = d
+        if d:
+            charging_meter_value_dto.additional_properties = d
         return charging_meter_value_dto
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -116,4 +133,4 @@ class ChargingMeterValueDto:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -1,14 +1,18 @@
 from typing import Any, Dict, Type, TypeVar
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
-from dateutil.parser import isoparse
+from ..timestamps import parse_timestamp
 import datetime
 from typing import Union
 
@@ -32,7 +36,9 @@ class ChargingPeriodDto:
     absolute_kwh: Union[Unset, float] = UNSET
     price: Union[Unset, float] = UNSET
     parking_time_minutes: Union[Unset, float] = UNSET
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         timestamp: Union[Unset, str] = UNSET
@@ -48,7 +54,7 @@ class ChargingPeriodDto:
         parking_time_minutes = self.parking_time_minutes
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update({})
         if timestamp is not UNSET:
             field_dict["timestamp"] = timestamp
@@ -71,7 +77,7 @@ class ChargingPeriodDto:
         if isinstance(_timestamp, Unset) or _timestamp is None:
             timestamp = UNSET
         else:
-            timestamp = isoparse(_timestamp)
+            timestamp = parse_timestamp(_timestamp)
 
         delta_kwh = d.pop("deltaKwh", UNSET)
 
@@ -89,12 +95,23 @@ class ChargingPeriodDto:
             parking_time_minutes=parking_time_minutes,
         )
 
-        charging_period_dto.additional_properties = d
+        if d:
+            charging_period_dto.additional_properties = d
         return charging_period_dto
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -106,4 +123,4 @@ class ChargingPeriodDto:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
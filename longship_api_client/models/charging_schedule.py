@@ -1,14 +1,18 @@
 from typing import Any, Dict, Type, TypeVar, TYPE_CHECKING
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
-from dateutil.parser import isoparse
+from ..timestamps import parse_timestamp
 import datetime
 from typing import Union
 from ..models.charging_schedule_charging_rate_unit import (
@@ -40,7 +44,9 @@ class ChargingSchedule:
     duration: Union[Unset, int] = UNSET
     start_schedule: Union[Unset, datetime.datetime] = UNSET
     min_charging_rate: Union[Unset, float] = UNSET
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         charging_rate_unit = self.charging_rate_unit.value
@@ -59,7 +65,7 @@ class ChargingSchedule:
         min_charging_rate = self.min_charging_rate
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update(
             {
                 "chargingRateUnit": charging_rate_unit,
@@ -98,7 +104,7 @@ class ChargingSchedule:
         if isinstance(_start_schedule, Unset) or _start_schedule is None:
             start_schedule = UNSET
         else:
-            start_schedule = isoparse(_start_schedule)
+            start_schedule = parse_timestamp(_start_schedule)
 
         min_charging_rate = d.pop("minChargingRate", UNSET)
 
@@ -110,12 +116,23 @@ class ChargingSchedule:
             min_charging_rate=min_charging_rate,
         )
 
-        charging_schedule.additional_properties = d
+        if d:
+            charging_schedule.additional_properties = d
         return charging_schedule
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -127,4 +144,4 @@ class ChargingSchedule:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
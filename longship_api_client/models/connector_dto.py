@@ -1,14 +1,18 @@
 from typing import Any, Dict, Type, TypeVar
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
-from dateutil.parser import isoparse
+from ..timestamps import parse_timestamp
 import datetime
 from ..models.connector_dto_format import ConnectorDtoFormat
 from ..models.connector_dto_power_type import ConnectorDtoPowerType
@@ -43,7 +47,9 @@ class ConnectorDto:
     max_electric_power: Union[Unset, int] = UNSET
     calc_max_electric_power: Union[Unset, bool] = UNSET
     last_updated: Union[Unset, datetime.datetime] = UNSET
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         id = self.id
@@ -73,7 +79,7 @@ class ConnectorDto:
             last_updated = self.last_updated.isoformat()
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update({})
         if id is not UNSET:
             field_dict["id"] = id
@@ -135,7 +141,7 @@ class ConnectorDto:
         if isinstance(_last_updated, Unset) or _last_updated is None:
             last_updated = UNSET
         else:
-            last_updated = isoparse(_last_updated)
+            last_updated = parse_timestamp(_last_updated)
 
         connector_dto = cls(
             id=id,
@@ -149,12 +155,23 @@ class ConnectorDto:
             last_updated=last_updated,
         )
 
-        connector_dto.additional_properties = d
+        if d:
+            connector_dto.additional_properties = d
         return connector_dto
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -166,4 +183,4 @@ class ConnectorDto:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -1,14 +1,18 @@
 from typing import Any, Dict, Type, TypeVar
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
-from dateutil.parser import isoparse
+from ..timestamps import parse_timestamp
 import datetime
 from typing import Union
 from ..models.connector_operational_status_dto_operational_status import (
@@ -34,7 +38,9 @@ class ConnectorOperationalStatusDto:
         ConnectorOperationalStatusDtoOperationalStatus.AVAILABLE
     )
     timestamp: Union[Unset, datetime.datetime] = UNSET
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         connector_number = self.connector_number
@@ -48,7 +54,7 @@ class ConnectorOperationalStatusDto:
             timestamp = self.timestamp.isoformat()
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update({})
         if connector_number is not UNSET:
             field_dict["connectorNumber"] = connector_number
@@ -78,7 +84,7 @@ class ConnectorOperationalStatusDto:
         if isinstance(_timestamp, Unset) or _timestamp is None:
             timestamp = UNSET
         else:
-            timestamp = isoparse(_timestamp)
+            timestamp = parse_timestamp(_timestamp)
 
         connector_operational_status_dto = cls(
             connector_number=connector_number,
@@ -86,12 +92,23 @@ class ConnectorOperationalStatusDto:
             timestamp=timestamp,
         )
 
-        connector_operational_status_dto.additional_properties = d
+        if d:
+            connector_operational_status_dto.additional_properties = d
         return connector_operational_status_dto
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -103,4 +120,4 @@ class ConnectorOperationalStatusDto:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
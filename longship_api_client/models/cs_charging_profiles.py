@@ -1,17 +1,21 @@
 from typing import Any, Dict, Type, TypeVar, TYPE_CHECKING
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
 from ..models.cs_charging_profiles_charging_profile_kind import (
     CsChargingProfilesChargingProfileKind,
 )
-from dateutil.parser import isoparse
+from ..timestamps import parse_timestamp
 from ..models.cs_charging_profiles_recurrency_kind import (
     CsChargingProfilesRecurrencyKind,
 )
@@ -61,7 +65,9 @@ class CsChargingProfiles:
     )
     valid_from: Union[Unset, datetime.datetime] = UNSET
     valid_to: Union[Unset, datetime.datetime] = UNSET
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         charging_profile_id = self.charging_profile_id
@@ -89,7 +95,7 @@ class CsChargingProfiles:
             valid_to = self.valid_to.isoformat()
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update(
             {
                 "chargingProfileId": charging_profile_id,
@@ -143,14 +149,14 @@ class CsChargingProfiles:
         if isinstance(_valid_from, Unset) or _valid_from is None:
             valid_from = UNSET
         else:
-            valid_from = isoparse(_valid_from)
+            valid_from = parse_timestamp(_valid_from)
 
         _valid_to = d.pop("validTo", UNSET)
         valid_to: Union[Unset, datetime.datetime]
         if isinstance(_valid_to, Unset) or _valid_to is None:
             valid_to = UNSET
         else:
-            valid_to = isoparse(_valid_to)
+            valid_to = parse_timestamp(_valid_to)
 
         cs_charging_profiles = cls(
             charging_profile_id=charging_profile_id,
@@ -164,12 +170,23 @@ class CsChargingProfiles:
             valid_to=valid_to,
         )
 
-        cs_charging_profiles.additional_properties = d
+        if d:
+            cs_charging_profiles.additional_properties = d
         return cs_charging_profiles
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -181,4 +198,4 @@ class CsChargingProfiles:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
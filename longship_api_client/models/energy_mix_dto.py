@@ -1,11 +1,15 @@
 from typing import Any, Dict, Type, TypeVar, TYPE_CHECKING
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
 from typing import Union
@@ -30,7 +34,9 @@ class EnergyMixDto:
     is_green_energy: Union[Unset, bool] = UNSET
     energy_sources: Union[Unset, List["EnergySourceDto"]] = UNSET
     environ_impact: Union[Unset, List["EnvironmentalImpactDto"]] = UNSET
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         is_green_energy = self.is_green_energy
@@ -50,7 +56,7 @@ class EnergyMixDto:
                 environ_impact.append(environ_impact_item)
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update({})
         if is_green_energy is not UNSET:
             field_dict["is_green_energy"] = is_green_energy
@@ -91,12 +97,23 @@ class EnergyMixDto:
             environ_impact=environ_impact,
         )
 
-        energy_mix_dto.additional_properties = d
+        if d:
+            energy_mix_dto.additional_properties = d
         return energy_mix_dto
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -108,4 +125,4 @@ class EnergyMixDto:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -1,14 +1,18 @@
 from typing import Any, Dict, Type, TypeVar, TYPE_CHECKING
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
-from dateutil.parser import isoparse
+from ..timestamps import parse_timestamp
 import datetime
 from typing import Union
 from ..types import File, FileJsonType
@@ -39,7 +43,9 @@ class FileContentResult:
     last_modified: Union[Unset, datetime.datetime] = UNSET
     entity_tag: Union[Unset, "EntityTagHeaderValue"] = UNSET
     enable_range_processing: Union[Unset, bool] = UNSET
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         file_contents: Union[Unset, FileJsonType] = UNSET
@@ -61,7 +67,7 @@ class FileContentResult:
         enable_range_processing = self.enable_range_processing
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update({})
         if file_contents is not UNSET:
             field_dict["fileContents"] = file_contents
@@ -99,7 +105,7 @@ class FileContentResult:
         if isinstance(_last_modified, Unset) or _last_modified is None:
             last_modified = UNSET
         else:
-            last_modified = isoparse(_last_modified)
+            last_modified = parse_timestamp(_last_modified)
 
         _entity_tag = d.pop("entityTag", UNSET)
         entity_tag: Union[Unset, EntityTagHeaderValue]
@@ -119,12 +125,23 @@ class FileContentResult:
             enable_range_processing=enable_range_processing,
         )
 
-        file_content_result.additional_properties = d
+        if d:
+            file_content_result.additional_properties = d
         return file_content_result
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -136,4 +153,4 @@ class FileContentResult:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -1,11 +1,15 @@
 from typing import Any, Dict, Type, TypeVar
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
 from ..models.get_composite_schedule_request_charging_rate_unit import (
@@ -32,7 +36,9 @@ class GetCompositeScheduleRequest:
     charging_rate_unit: Union[Unset, GetCompositeScheduleRequestChargingRateUnit] = (
         GetCompositeScheduleRequestChargingRateUnit.A
     )
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         connector_id = self.connector_id
@@ -44,7 +50,7 @@ class GetCompositeScheduleRequest:
             charging_rate_unit = self.charging_rate_unit.value
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update(
             {
                 "connectorId": connector_id,
@@ -78,12 +84,23 @@ class GetCompositeScheduleRequest:
             charging_rate_unit=charging_rate_unit,
         )
 
-        get_composite_schedule_request.additional_properties = d
+        if d:
+            get_composite_schedule_request.additional_properties = d
         return get_composite_schedule_request
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -95,4 +112,4 @@ class GetCompositeScheduleRequest:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -1,14 +1,18 @@
 from typing import Any, Dict, Type, TypeVar
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
-from dateutil.parser import isoparse
+from ..timestamps import parse_timestamp
 import datetime
 from typing import Union
 
@@ -32,7 +36,9 @@ class GetDiagnosticsRequest:
     retry_interval: Union[Unset, int] = UNSET
     start_time: Union[Unset, datetime.datetime] = UNSET
     stop_time: Union[Unset, datetime.datetime] = UNSET
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         location = self.location
@@ -50,7 +56,7 @@ class GetDiagnosticsRequest:
             stop_time = self.stop_time.isoformat()
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update(
             {
                 "location": location,
@@ -81,14 +87,14 @@ class GetDiagnosticsRequest:
         if isinstance(_start_time, Unset) or _start_time is None:
             start_time = UNSET
         else:
-            start_time = isoparse(_start_time)
+            start_time = parse_timestamp(_start_time)
 
         _stop_time = d.pop("stopTime", UNSET)
         stop_time: Union[Unset, datetime.datetime]
         if isinstance(_stop_time, Unset) or _stop_time is None:
             stop_time = UNSET
         else:
-            stop_time = isoparse(_stop_time)
+            stop_time = parse_timestamp(_stop_time)
 
         get_diagnostics_request = cls(
             location=location,
@@ -98,12 +104,23 @@ class GetDiagnosticsRequest:
             stop_time=stop_time,
         )
 
-        get_diagnostics_request.additional_properties = d
+        if d:
+            get_diagnostics_request.additional_properties = d
         return get_diagnostics_request
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -115,4 +132,4 @@ class GetDiagnosticsRequest:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
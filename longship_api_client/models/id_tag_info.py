@@ -1,14 +1,18 @@
 from typing import Any, Dict, Type, TypeVar
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
-from dateutil.parser import isoparse
+from ..timestamps import parse_timestamp
 import datetime
 from ..models.id_tag_info_status import IdTagInfoStatus
 from typing import Union
@@ -29,7 +33,9 @@ class IdTagInfo:
     status: IdTagInfoStatus = IdTagInfoStatus.ACCEPTED
     expiry_date: Union[Unset, datetime.datetime] = UNSET
     parent_id_tag: Union[Unset, str] = UNSET
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         status = self.status.value
@@ -41,7 +47,7 @@ class IdTagInfo:
         parent_id_tag = self.parent_id_tag
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update(
             {
                 "status": status,
@@ -64,7 +70,7 @@ class IdTagInfo:
         if isinstance(_expiry_date, Unset) or _expiry_date is None:
             expiry_date = UNSET
         else:
-            expiry_date = isoparse(_expiry_date)
+            expiry_date = parse_timestamp(_expiry_date)
 
         parent_id_tag = d.pop("parentIdTag", UNSET)
 
@@ -74,12 +80,23 @@ class IdTagInfo:
             parent_id_tag=parent_id_tag,
         )
 
-        id_tag_info.additional_properties = d
+        if d:
+            id_tag_info.additional_properties = d
         return id_tag_info
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -91,4 +108,4 @@ class IdTagInfo:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -1,14 +1,18 @@
 from typing import Any, Dict, Type, TypeVar
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
-from dateutil.parser import isoparse
+from ..timestamps import parse_timestamp
 import datetime
 from typing import Union
 
@@ -62,7 +66,9 @@ class InterchangeFormatCdr:
     service_provider_id: Union[Unset, str] = UNSET
     infra_provider_id: Union[Unset, str] = UNSET
     calculated_cost: Union[Unset, float] = UNSET
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         cdr_id = self.cdr_id
@@ -110,7 +116,7 @@ class InterchangeFormatCdr:
         calculated_cost = self.calculated_cost
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update({})
         if cdr_id is not UNSET:
             field_dict["cdrId"] = cdr_id
@@ -165,14 +171,14 @@ class InterchangeFormatCdr:
         if isinstance(_start_date_time, Unset) or _start_date_time is None:
             start_date_time = UNSET
         else:
-            start_date_time = isoparse(_start_date_time)
+            start_date_time = parse_timestamp(_start_date_time)
 
         _end_date_time = d.pop("endDateTime", UNSET)
         end_date_time: Union[Unset, datetime.datetime]
         if isinstance(_end_date_time, Unset) or _end_date_time is None:
             end_date_time = UNSET
         else:
-            end_date_time = isoparse(_end_date_time)
+            end_date_time = parse_timestamp(_end_date_time)
 
         duration = d.pop("duration", UNSET)
 
@@ -231,12 +237,23 @@ class InterchangeFormatCdr:
             calculated_cost=calculated_cost,
         )
 
-        interchange_format_cdr.additional_properties = d
+        if d:
+            interchange_format_cdr.additional_properties = d
         return interchange_format_cdr
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -248,4 +265,4 @@ class InterchangeFormatCdr:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
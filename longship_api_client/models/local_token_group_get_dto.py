@@ -1,14 +1,18 @@
 from typing import Any, Dict, Type, TypeVar, TYPE_CHECKING
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
-from dateutil.parser import isoparse
+from ..timestamps import parse_timestamp
 from typing import cast
 import datetime
 from typing import Union
@@ -44,7 +48,9 @@ class LocalTokenGroupGetDto:
     override_tariff_id: Union[Unset, str] = UNSET
     created: Union[Unset, datetime.datetime] = UNSET
     updated: Union[Unset, datetime.datetime] = UNSET
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         id = self.id
@@ -79,7 +85,7 @@ class LocalTokenGroupGetDto:
             updated = self.updated.isoformat()
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update({})
         if id is not UNSET:
             field_dict["id"] = id
@@ -131,14 +137,14 @@ class LocalTokenGroupGetDto:
         if isinstance(_created, Unset) or _created is None:
             created = UNSET
         else:
-            created = isoparse(_created)
+            created = parse_timestamp(_created)
 
         _updated = d.pop("updated", UNSET)
         updated: Union[Unset, datetime.datetime]
         if isinstance(_updated, Unset) or _updated is None:
             updated = UNSET
         else:
-            updated = isoparse(_updated)
+            updated = parse_timestamp(_updated)
 
         local_token_group_get_dto = cls(
             id=id,
@@ -152,12 +158,23 @@ class LocalTokenGroupGetDto:
             updated=updated,
         )
 
-        local_token_group_get_dto.additional_properties = d
+        if d:
+            local_token_group_get_dto.additional_properties = d
         return local_token_group_get_dto
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -169,4 +186,4 @@ class LocalTokenGroupGetDto:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -1,11 +1,15 @@
 from typing import Any, Dict, Type, TypeVar, TYPE_CHECKING
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
 from typing import cast
@@ -36,7 +40,9 @@ class LocalTokenGroupPostDto:
     override_tariff_id: Union[Unset, str] = UNSET
     tokens: Union[Unset, List["LocalTokenGroupTokenPostDto"]] = UNSET
     target_chargepoint_ids: Union[Unset, List[str]] = UNSET
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         oucode = self.oucode
@@ -61,7 +67,7 @@ class LocalTokenGroupPostDto:
             target_chargepoint_ids = self.target_chargepoint_ids
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update({})
         if oucode is not UNSET:
             field_dict["oucode"] = oucode
@@ -111,12 +117,23 @@ class LocalTokenGroupPostDto:
             target_chargepoint_ids=target_chargepoint_ids,
         )
 
-        local_token_group_post_dto.additional_properties = d
+        if d:
+            local_token_group_post_dto.additional_properties = d
         return local_token_group_post_dto
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -128,4 +145,4 @@ class LocalTokenGroupPostDto:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -1,11 +1,15 @@
 from typing import Any, Dict, Type, TypeVar
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
 from typing import Union
@@ -30,7 +34,9 @@ class LocalTokenGroupTokenGetDto:
     uid: Union[Unset, str] = UNSET
     contract_id: Union[Unset, str] = UNSET
     normalized_contract_id: Union[Unset, str] = UNSET
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         is_valid = self.is_valid
@@ -44,7 +50,7 @@ class LocalTokenGroupTokenGetDto:
         normalized_contract_id = self.normalized_contract_id
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update({})
         if is_valid is not UNSET:
             field_dict["isValid"] = is_valid
@@ -80,12 +86,23 @@ class LocalTokenGroupTokenGetDto:
             normalized_contract_id=normalized_contract_id,
         )
 
-        local_token_group_token_get_dto.additional_properties = d
+        if d:
+            local_token_group_token_get_dto.additional_properties = d
         return local_token_group_token_get_dto
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -97,4 +114,4 @@ class LocalTokenGroupTokenGetDto:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -1,14 +1,18 @@
 from typing import Any, Dict, Type, TypeVar, TYPE_CHECKING
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
-from dateutil.parser import isoparse
+from ..timestamps import parse_timestamp
 from ..models.location_evse_dto_parking_restrictions_item import (
     LocationEVSEDtoParkingRestrictionsItem,
 )
@@ -70,7 +74,9 @@ class LocationEVSEDto:
     )
     images: Union[Unset, List["ImageDto"]] = UNSET
     last_updated: Union[Unset, datetime.datetime] = UNSET
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         id = self.id
@@ -144,7 +150,7 @@ class LocationEVSEDto:
             last_updated = self.last_updated.isoformat()
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update({})
         if id is not UNSET:
             field_dict["id"] = id
@@ -273,7 +279,7 @@ class LocationEVSEDto:
         if isinstance(_last_updated, Unset) or _last_updated is None:
             last_updated = UNSET
         else:
-            last_updated = isoparse(_last_updated)
+            last_updated = parse_timestamp(_last_updated)
 
         location_evse_dto = cls(
             id=id,
@@ -295,12 +301,23 @@ class LocationEVSEDto:
             last_updated=last_updated,
         )
 
-        location_evse_dto.additional_properties = d
+        if d:
+            location_evse_dto.additional_properties = d
         return location_evse_dto
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -312,4 +329,4 @@ class LocationEVSEDto:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -1,14 +1,18 @@
 from typing import Any, Dict, Type, TypeVar, TYPE_CHECKING
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
-from dateutil.parser import isoparse
+from ..timestamps import parse_timestamp
 from ..models.location_put_dto_parking_type import LocationPutDtoParkingType
 from ..models.location_put_dto_facilities_item import LocationPutDtoFacilitiesItem
 import datetime
@@ -112,7 +116,9 @@ class LocationPutDto:
     external_reference_1: Union[Unset, str] = UNSET
     external_reference_2: Union[Unset, str] = UNSET
     external_reference_3: Union[Unset, str] = UNSET
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         id = self.id
@@ -236,7 +242,7 @@ class LocationPutDto:
         external_reference_3 = self.external_reference_3
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update(
             {
                 "id": id,
@@ -340,7 +346,7 @@ class LocationPutDto:
 
         time_zone = d.pop("time_zone")
 
-        last_updated = isoparse(d.pop("last_updated"))
+        last_updated = parse_timestamp(d.pop("last_updated"))
 
         publish_allowed_to = []
         _publish_allowed_to = d.pop("publish_allowed_to", UNSET)
@@ -447,7 +453,7 @@ class LocationPutDto:
         if isinstance(_deleted_on, Unset) or _deleted_on is None:
             deleted_on = UNSET
         else:
-            deleted_on = isoparse(_deleted_on)
+            deleted_on = parse_timestamp(_deleted_on)
 
         has_reimbursement = d.pop("hasReimbursement", UNSET)
 
@@ -510,12 +516,23 @@ class LocationPutDto:
             external_reference_3=external_reference_3,
         )
 
-        location_put_dto.additional_properties = d
+        if d:
+            location_put_dto.additional_properties = d
         return location_put_dto
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -527,4 +544,4 @@ class LocationPutDto:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
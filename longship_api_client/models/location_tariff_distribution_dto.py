@@ -1,14 +1,18 @@
 from typing import Any, Dict, Type, TypeVar
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
-from dateutil.parser import isoparse
+from ..timestamps import parse_timestamp
 import datetime
 from typing import Union
 
@@ -26,7 +30,9 @@ class LocationTariffDistributionDto:
 
     valid_from: datetime.datetime
     id: Union[Unset, str] = UNSET
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         valid_from = self.valid_from.isoformat()
@@ -34,7 +40,7 @@ class LocationTariffDistributionDto:
         id = self.id
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update(
             {
                 "validFrom": valid_from,
@@ -48,7 +54,7 @@ class LocationTariffDistributionDto:
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
         d = src_dict.copy()
-        valid_from = isoparse(d.pop("validFrom"))
+        valid_from = parse_timestamp(d.pop("validFrom"))
 
         id = d.pop("id", UNSET)
 
@@ -57,12 +63,23 @@ class LocationTariffDistributionDto:
             id=id,
         )
 
-        location_tariff_distribution_dto.additional_properties = d
+        if d:
+            location_tariff_distribution_dto.additional_properties = d
         return location_tariff_distribution_dto
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -74,4 +91,4 @@ class LocationTariffDistributionDto:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
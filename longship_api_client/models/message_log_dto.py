@@ -1,14 +1,18 @@
 from typing import Any, Dict, Type, TypeVar
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
-from dateutil.parser import isoparse
+from ..timestamps import parse_timestamp
 from ..models.message_log_dto_ocpp_message_type import MessageLogDtoOcppMessageType
 import datetime
 from typing import Union
@@ -48,7 +52,9 @@ class MessageLogDto:
     tenant_id: Union[Unset, str] = UNSET
     payload: Union[Unset, str] = UNSET
     timestamp: Union[Unset, datetime.datetime] = UNSET
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         id = self.id
@@ -78,7 +84,7 @@ class MessageLogDto:
             timestamp = self.timestamp.isoformat()
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update({})
         if id is not UNSET:
             field_dict["id"] = id
@@ -140,7 +146,7 @@ class MessageLogDto:
         if isinstance(_timestamp, Unset) or _timestamp is None:
             timestamp = UNSET
         else:
-            timestamp = isoparse(_timestamp)
+            timestamp = parse_timestamp(_timestamp)
 
         message_log_dto = cls(
             id=id,
@@ -154,12 +160,23 @@ class MessageLogDto:
             timestamp=timestamp,
         )
 
-        message_log_dto.additional_properties = d
+        if d:
+            message_log_dto.additional_properties = d
         return message_log_dto
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -171,4 +188,4 @@ class MessageLogDto:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
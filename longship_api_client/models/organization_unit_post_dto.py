@@ -1,11 +1,15 @@
 from typing import Any, Dict, Type, TypeVar, TYPE_CHECKING
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
 from typing import Union
@@ -67,7 +71,9 @@ class OrganizationUnitPostDto:
     msp_ou_code: Union[Unset, str] = UNSET
     msp_external_id: Union[Unset, str] = UNSET
     financial_details: Union[Unset, "OrganizationUnitFinancialDetailsDto"] = UNSET
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         parent_id = self.parent_id
@@ -115,7 +121,7 @@ class OrganizationUnitPostDto:
             financial_details = self.financial_details.to_dict()
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update(
             {
                 "parentId": parent_id,
@@ -244,12 +250,23 @@ class OrganizationUnitPostDto:
             financial_details=financial_details,
         )
 
-        organization_unit_post_dto.additional_properties = d
+        if d:
+            organization_unit_post_dto.additional_properties = d
         return organization_unit_post_dto
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -261,4 +278,4 @@ class OrganizationUnitPostDto:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -1,11 +1,15 @@
 from typing import Any, Dict, Type, TypeVar
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
 from typing import Union
@@ -31,7 +35,9 @@ class PrivateEmpTariffDto:
         PrivateEmpTariffDtoPowerType.AC
     )
     use_public_tariff_when_kwh_is_cheaper: Union[Unset, bool] = UNSET
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         country_code = self.country_code
@@ -47,7 +53,7 @@ class PrivateEmpTariffDto:
         )
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update({})
         if country_code is not UNSET:
             field_dict["country_code"] = country_code
@@ -87,12 +93,23 @@ class PrivateEmpTariffDto:
             use_public_tariff_when_kwh_is_cheaper=use_public_tariff_when_kwh_is_cheaper,
         )
 
-        private_emp_tariff_dto.additional_properties = d
+        if d:
+            private_emp_tariff_dto.additional_properties = d
         return private_emp_tariff_dto
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -104,4 +121,4 @@ class PrivateEmpTariffDto:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -1,11 +1,15 @@
 from typing import Any, Dict, Type, TypeVar, TYPE_CHECKING
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
 from ..models.reimburse_started_by_info_dto_authorization_state import (
@@ -37,7 +41,9 @@ class ReimburseStartedByInfoDto:
         ReimburseStartedByInfoDtoAuthorizationState.APPROVEDBYREMOTE
     )
     is_guest_usage: Union[Unset, bool] = UNSET
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         id_tag = self.id_tag
@@ -53,7 +59,7 @@ class ReimburseStartedByInfoDto:
         is_guest_usage = self.is_guest_usage
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update({})
         if id_tag is not UNSET:
             field_dict["idTag"] = id_tag
@@ -98,12 +104,23 @@ class ReimburseStartedByInfoDto:
             is_guest_usage=is_guest_usage,
         )
 
-        reimburse_started_by_info_dto.additional_properties = d
+        if d:
+            reimburse_started_by_info_dto.additional_properties = d
         return reimburse_started_by_info_dto
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -115,4 +132,4 @@ class ReimburseStartedByInfoDto:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
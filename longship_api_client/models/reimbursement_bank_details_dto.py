@@ -1,14 +1,18 @@
 from typing import Any, Dict, Type, TypeVar
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
-from dateutil.parser import isoparse
+from ..timestamps import parse_timestamp
 import datetime
 from typing import Union
 
@@ -28,7 +32,9 @@ class ReimbursementBankDetailsDto:
     bankaccount: Union[Unset, str] = UNSET
     date_created: Union[Unset, datetime.datetime] = UNSET
     valid_from: Union[Unset, datetime.datetime] = UNSET
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         bankaccount = self.bankaccount
@@ -42,7 +48,7 @@ class ReimbursementBankDetailsDto:
             valid_from = self.valid_from.isoformat()
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update({})
         if bankaccount is not UNSET:
             field_dict["bankaccount"] = bankaccount
@@ -63,14 +69,14 @@ class ReimbursementBankDetailsDto:
         if isinstance(_date_created, Unset) or _date_created is None:
             date_created = UNSET
         else:
-            date_created = isoparse(_date_created)
+            date_created = parse_timestamp(_date_created)
 
         _valid_from = d.pop("validFrom", UNSET)
         valid_from: Union[Unset, datetime.datetime]
         if isinstance(_valid_from, Unset) or _valid_from is None:
             valid_from = UNSET
         else:
-            valid_from = isoparse(_valid_from)
+            valid_from = parse_timestamp(_valid_from)
 
         reimbursement_bank_details_dto = cls(
             bankaccount=bankaccount,
@@ -78,12 +84,23 @@ class ReimbursementBankDetailsDto:
             valid_from=valid_from,
         )
 
-        reimbursement_bank_details_dto.additional_properties = d
+        if d:
+            reimbursement_bank_details_dto.additional_properties = d
         return reimbursement_bank_details_dto
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -95,4 +112,4 @@ class ReimbursementBankDetailsDto:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
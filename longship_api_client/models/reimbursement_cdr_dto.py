@@ -1,14 +1,18 @@
 from typing import Any, Dict, Type, TypeVar, TYPE_CHECKING
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
-from dateutil.parser import isoparse
+from ..timestamps import parse_timestamp
 import datetime
 from typing import Union
 
@@ -108,7 +112,9 @@ class ReimbursementCdrDto:
     reimbursement_customer_share: Union[Unset, "ReimbursementCustomerShareDto"] = UNSET
     local_start_date_time: Union[Unset, datetime.datetime] = UNSET
     local_end_date_time: Union[Unset, datetime.datetime] = UNSET
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         id = self.id
@@ -220,7 +226,7 @@ class ReimbursementCdrDto:
             local_end_date_time = self.local_end_date_time.isoformat()
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update({})
         if id is not UNSET:
             field_dict["id"] = id
@@ -341,14 +347,14 @@ class ReimbursementCdrDto:
         if isinstance(_start_datetime, Unset) or _start_datetime is None:
             start_datetime = UNSET
         else:
-            start_datetime = isoparse(_start_datetime)
+            start_datetime = parse_timestamp(_start_datetime)
 
         _end_date_time = d.pop("endDateTime", UNSET)
         end_date_time: Union[Unset, datetime.datetime]
         if isinstance(_end_date_time, Unset) or _end_date_time is None:
             end_date_time = UNSET
         else:
-            end_date_time = isoparse(_end_date_time)
+            end_date_time = parse_timestamp(_end_date_time)
 
         session_id = d.pop("sessionId", UNSET)
 
@@ -374,14 +380,14 @@ class ReimbursementCdrDto:
         if isinstance(_created, Unset) or _created is None:
             created = UNSET
         else:
-            created = isoparse(_created)
+            created = parse_timestamp(_created)
 
         _last_updated = d.pop("lastUpdated", UNSET)
         last_updated: Union[Unset, datetime.datetime]
         if isinstance(_last_updated, Unset) or _last_updated is None:
             last_updated = UNSET
         else:
-            last_updated = isoparse(_last_updated)
+            last_updated = parse_timestamp(_last_updated)
 
         ou = d.pop("ou", UNSET)
 
@@ -402,7 +408,7 @@ class ReimbursementCdrDto:
         if isinstance(_reimburse_price_calculated_on, Unset) or _reimburse_price_calculated_on is None:
             reimburse_price_calculated_on = UNSET
         else:
-            reimburse_price_calculated_on = isoparse(_reimburse_price_calculated_on)
+            reimburse_price_calculated_on = parse_timestamp(_reimburse_price_calculated_on)
 
         bank_account = d.pop("bankAccount", UNSET)
 
@@ -411,14 +417,14 @@ class ReimbursementCdrDto:
         if isinstance(_bank_account_created_on, Unset) or _bank_account_created_on is None:
             bank_account_created_on = UNSET
         else:
-            bank_account_created_on = isoparse(_bank_account_created_on)
+            bank_account_created_on = parse_timestamp(_bank_account_created_on)
 
         _bank_account_valid_from = d.pop("bankAccountValidFrom", UNSET)
         bank_account_valid_from: Union[Unset, datetime.datetime]
         if isinstance(_bank_account_valid_from, Unset) or _bank_account_valid_from is None:
             bank_account_valid_from = UNSET
         else:
-            bank_account_valid_from = isoparse(_bank_account_valid_from)
+            bank_account_valid_from = parse_timestamp(_bank_account_valid_from)
 
         reimburse_tariff_original_price = d.pop("reimburseTariffOriginalPrice", UNSET)
 
@@ -457,14 +463,14 @@ class ReimbursementCdrDto:
         if isinstance(_local_start_date_time, Unset) or _local_start_date_time is None:
             local_start_date_time = UNSET
         else:
-            local_start_date_time = isoparse(_local_start_date_time)
+            local_start_date_time = parse_timestamp(_local_start_date_time)
 
         _local_end_date_time = d.pop("localEndDateTime", UNSET)
         local_end_date_time: Union[Unset, datetime.datetime]
         if isinstance(_local_end_date_time, Unset) or _local_end_date_time is None:
             local_end_date_time = UNSET
         else:
-            local_end_date_time = isoparse(_local_end_date_time)
+            local_end_date_time = parse_timestamp(_local_end_date_time)
 
         reimbursement_cdr_dto = cls(
             id=id,
@@ -509,12 +515,23 @@ class ReimbursementCdrDto:
             local_end_date_time=local_end_date_time,
         )
 
-        reimbursement_cdr_dto.additional_properties = d
+        if d:
+            reimbursement_cdr_dto.additional_properties = d
         return reimbursement_cdr_dto
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -526,4 +543,4 @@ class ReimbursementCdrDto:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -1,11 +1,15 @@
 from typing import Any, Dict, Type, TypeVar
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
 from typing import Union
@@ -26,7 +30,9 @@ class ReimbursementCustomerShareDto:
     customer_share: Union[Unset, float] = UNSET
     energy_compensation: Union[Unset, float] = UNSET
     tenant_fee: Union[Unset, float] = UNSET
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         customer_share = self.customer_share
@@ -36,7 +42,7 @@ class ReimbursementCustomerShareDto:
         tenant_fee = self.tenant_fee
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update({})
         if customer_share is not UNSET:
             field_dict["customerShare"] = customer_share
@@ -62,12 +68,23 @@ class ReimbursementCustomerShareDto:
             tenant_fee=tenant_fee,
         )
 
-        reimbursement_customer_share_dto.additional_properties = d
+        if d:
+            reimbursement_customer_share_dto.additional_properties = d
         return reimbursement_customer_share_dto
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -79,4 +96,4 @@ class ReimbursementCustomerShareDto:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
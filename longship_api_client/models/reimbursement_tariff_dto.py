@@ -1,14 +1,18 @@
 from typing import Any, Dict, Type, TypeVar, TYPE_CHECKING
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
-from dateutil.parser import isoparse
+from ..timestamps import parse_timestamp
 import datetime
 from ..models.reimbursement_tariff_dto_status import ReimbursementTariffDtoStatus
 from typing import Union
@@ -40,7 +44,9 @@ class ReimbursementTariffDto:
     status: Union[Unset, ReimbursementTariffDtoStatus] = (
         ReimbursementTariffDtoStatus.PENDING
     )
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         id = self.id
@@ -64,7 +70,7 @@ class ReimbursementTariffDto:
             status = self.status.value
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update({})
         if id is not UNSET:
             field_dict["id"] = id
@@ -93,14 +99,14 @@ class ReimbursementTariffDto:
         if isinstance(_date_created, Unset) or _date_created is None:
             date_created = UNSET
         else:
-            date_created = isoparse(_date_created)
+            date_created = parse_timestamp(_date_created)
 
         _valid_from = d.pop("validFrom", UNSET)
         valid_from: Union[Unset, datetime.datetime]
         if isinstance(_valid_from, Unset) or _valid_from is None:
             valid_from = UNSET
         else:
-            valid_from = isoparse(_valid_from)
+            valid_from = parse_timestamp(_valid_from)
 
         currency = d.pop("currency", UNSET)
 
@@ -127,12 +133,23 @@ class ReimbursementTariffDto:
             status=status,
         )
 
-        reimbursement_tariff_dto.additional_properties = d
+        if d:
+            reimbursement_tariff_dto.additional_properties = d
         return reimbursement_tariff_dto
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -144,4 +161,4 @@ class ReimbursementTariffDto:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
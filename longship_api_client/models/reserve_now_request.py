@@ -1,14 +1,18 @@
 from typing import Any, Dict, Type, TypeVar
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
-from dateutil.parser import isoparse
+from ..timestamps import parse_timestamp
 import datetime
 from typing import Union
 
@@ -32,7 +36,9 @@ class ReserveNowRequest:
     id_tag: str
     reservation_id: int
     parent_id_tag: Union[Unset, str] = UNSET
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         connector_id = self.connector_id
@@ -46,7 +52,7 @@ class ReserveNowRequest:
         parent_id_tag = self.parent_id_tag
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update(
             {
                 "connectorId": connector_id,
@@ -65,7 +71,7 @@ class ReserveNowRequest:
         d = src_dict.copy()
         connector_id = d.pop("connectorId")
 
-        expiry_date = isoparse(d.pop("expiryDate"))
+        expiry_date = parse_timestamp(d.pop("expiryDate"))
 
         id_tag = d.pop("idTag")
 
@@ -81,12 +87,23 @@ class ReserveNowRequest:
             parent_id_tag=parent_id_tag,
         )
 
-        reserve_now_request.additional_properties = d
+        if d:
+            reserve_now_request.additional_properties = d
         return reserve_now_request
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -98,4 +115,4 @@ class ReserveNowRequest:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -1,11 +1,15 @@
 from typing import Any, Dict, Type, TypeVar, TYPE_CHECKING
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
 from ..models.send_local_list_request_update_type import SendLocalListRequestUpdateType
@@ -32,7 +36,9 @@ class SendLocalListRequest:
         SendLocalListRequestUpdateType.DIFFERENTIAL
     )
     local_authorization_list: Union[Unset, List["AuthorizationData"]] = UNSET
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         list_version = self.list_version
@@ -49,7 +55,7 @@ class SendLocalListRequest:
                 local_authorization_list.append(local_authorization_list_item)
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update(
             {
                 "listVersion": list_version,
@@ -85,12 +91,23 @@ class SendLocalListRequest:
             local_authorization_list=local_authorization_list,
         )
 
-        send_local_list_request.additional_properties = d
+        if d:
+            send_local_list_request.additional_properties = d
         return send_local_list_request
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -102,4 +119,4 @@ class SendLocalListRequest:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -1,15 +1,19 @@
 from typing import Any, Dict, Type, TypeVar, TYPE_CHECKING
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
 from ..models.session_dto_approval_status import SessionDtoApprovalStatus
-from dateutil.parser import isoparse
+from ..timestamps import parse_timestamp
 from ..models.session_dto_status import SessionDtoStatus
 import datetime
 from typing import Union
@@ -111,7 +115,9 @@ class SessionDto:
     parking_step_size: Union[Unset, int] = UNSET
     delay_in_minutes: Union[Unset, int] = UNSET
     parking_time_start: Union[Unset, datetime.datetime] = UNSET
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         id = self.id
@@ -223,7 +229,7 @@ class SessionDto:
             parking_time_start = self.parking_time_start.isoformat()
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update({})
         if id is not UNSET:
             field_dict["id"] = id
@@ -346,7 +352,7 @@ class SessionDto:
         if isinstance(_session_start, Unset) or _session_start is None:
             session_start = UNSET
         else:
-            session_start = isoparse(_session_start)
+            session_start = parse_timestamp(_session_start)
 
         charging_periods = []
         _charging_periods = d.pop("chargingPeriods", UNSET)
@@ -373,7 +379,7 @@ class SessionDto:
         if isinstance(_session_stop, Unset) or _session_stop is None:
             session_stop = UNSET
         else:
-            session_stop = isoparse(_session_stop)
+            session_stop = parse_timestamp(_session_stop)
 
         _status = d.pop("status", UNSET)
         status: Union[Unset, SessionDtoStatus]
@@ -405,14 +411,14 @@ class SessionDto:
         if isinstance(_created, Unset) or _created is None:
             created = UNSET
         else:
-            created = isoparse(_created)
+            created = parse_timestamp(_created)
 
         _last_updated = d.pop("lastUpdated", UNSET)
         last_updated: Union[Unset, datetime.datetime]
         if isinstance(_last_updated, Unset) or _last_updated is None:
             last_updated = UNSET
         else:
-            last_updated = isoparse(_last_updated)
+            last_updated = parse_timestamp(_last_updated)
 
         ou = d.pop("ou", UNSET)
 
@@ -460,7 +466,7 @@ class SessionDto:
         if isinstance(_parking_time_start, Unset) or _parking_time_start is None:
             parking_time_start = UNSET
         else:
-            parking_time_start = isoparse(_parking_time_start)
+            parking_time_start = parse_timestamp(_parking_time_start)
 
         session_dto = cls(
             id=id,
@@ -501,12 +507,23 @@ class SessionDto:
             parking_time_start=parking_time_start,
         )
 
-        session_dto.additional_properties = d
+        if d:
+            session_dto.additional_properties = d
         return session_dto
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -518,4 +535,4 @@ class SessionDto:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -1,11 +1,15 @@
 from typing import Any, Dict, Type, TypeVar
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
 from ..models.session_threshold_value_dto_int_32_threshold_hit_outcome import (
@@ -42,7 +46,9 @@ class SessionThresholdValueDtoInt32:
     )
     result: Union[Unset, str] = UNSET
     is_enabled: Union[Unset, bool] = UNSET
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         threshold_value = self.threshold_value
@@ -60,7 +66,7 @@ class SessionThresholdValueDtoInt32:
         is_enabled = self.is_enabled
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update({})
         if threshold_value is not UNSET:
             field_dict["thresholdValue"] = threshold_value
@@ -110,12 +116,23 @@ class SessionThresholdValueDtoInt32:
             is_enabled=is_enabled,
         )
 
-        session_threshold_value_dto_int_32.additional_properties = d
+        if d:
+            session_threshold_value_dto_int_32.additional_properties = d
         return session_threshold_value_dto_int_32
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -127,4 +144,4 @@ class SessionThresholdValueDtoInt32:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -1,11 +1,15 @@
 from typing import Any, Dict, Type, TypeVar, TYPE_CHECKING
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
 from typing import Union
@@ -52,7 +56,9 @@ class SessionThresholdsDto:
     max_session_age_in_days: Union[Unset, "SessionThresholdValueDtoInt32"] = UNSET
     check_charging_speed: Union[Unset, "SessionThresholdCheckDto"] = UNSET
     check_session_in_future: Union[Unset, "SessionThresholdCheckDto"] = UNSET
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         thresholds_hit: Union[Unset, List[str]] = UNSET
@@ -99,7 +105,7 @@ class SessionThresholdsDto:
             check_session_in_future = self.check_session_in_future.to_dict()
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update({})
         if thresholds_hit is not UNSET:
             field_dict["thresholdsHit"] = thresholds_hit
@@ -230,12 +236,23 @@ class SessionThresholdsDto:
             check_session_in_future=check_session_in_future,
         )
 
-        session_thresholds_dto.additional_properties = d
+        if d:
+            session_thresholds_dto.additional_properties = d
         return session_thresholds_dto
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -247,4 +264,4 @@ class SessionThresholdsDto:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
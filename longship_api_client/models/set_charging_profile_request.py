@@ -1,11 +1,15 @@
 from typing import Any, Dict, Type, TypeVar, TYPE_CHECKING
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 
 if TYPE_CHECKING:
     from ..models.cs_charging_profiles import CsChargingProfiles
@@ -24,7 +28,9 @@ class SetChargingProfileRequest:
 
     connector_id: int
     cs_charging_profiles: "CsChargingProfiles"
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         connector_id = self.connector_id
@@ -32,7 +38,7 @@ class SetChargingProfileRequest:
         cs_charging_profiles = self.cs_charging_profiles.to_dict()
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update(
             {
                 "connectorId": connector_id,
@@ -56,12 +62,23 @@ class SetChargingProfileRequest:
             cs_charging_profiles=cs_charging_profiles,
         )
 
-        set_charging_profile_request.additional_properties = d
+        if d:
+            set_charging_profile_request.additional_properties = d
         return set_charging_profile_request
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -73,4 +90,4 @@ class SetChargingProfileRequest:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
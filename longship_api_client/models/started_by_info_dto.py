@@ -1,11 +1,15 @@
 from typing import Any, Dict, Type, TypeVar, TYPE_CHECKING
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
 from ..models.started_by_info_dto_roaming_platform_type import (
@@ -45,7 +49,9 @@ class StartedByInfoDto:
     )
     roaming_platform_connection_id: Union[Unset, str] = UNSET
     is_guest_usage: Union[Unset, bool] = UNSET
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         token_info: Union[Unset, Dict[str, Any]] = UNSET
@@ -65,7 +71,7 @@ class StartedByInfoDto:
         is_guest_usage = self.is_guest_usage
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update({})
         if token_info is not UNSET:
             field_dict["tokenInfo"] = token_info
@@ -122,12 +128,23 @@ class StartedByInfoDto:
             is_guest_usage=is_guest_usage,
         )
 
-        started_by_info_dto.additional_properties = d
+        if d:
+            started_by_info_dto.additional_properties = d
         return started_by_info_dto
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -139,4 +156,4 @@ class StartedByInfoDto:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
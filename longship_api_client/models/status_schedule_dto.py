@@ -1,14 +1,18 @@
 from typing import Any, Dict, Type, TypeVar
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
-from dateutil.parser import isoparse
+from ..timestamps import parse_timestamp
 from ..models.status_schedule_dto_status import StatusScheduleDtoStatus
 import datetime
 from typing import Union
@@ -29,7 +33,9 @@ class StatusScheduleDto:
     period_begin: Union[Unset, datetime.datetime] = UNSET
     period_end: Union[Unset, datetime.datetime] = UNSET
     status: Union[Unset, StatusScheduleDtoStatus] = StatusScheduleDtoStatus.AVAILABLE
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         period_begin: Union[Unset, str] = UNSET
@@ -45,7 +51,7 @@ class StatusScheduleDto:
             status = self.status.value
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update({})
         if period_begin is not UNSET:
             field_dict["period_begin"] = period_begin
@@ -64,14 +70,14 @@ class StatusScheduleDto:
         if isinstance(_period_begin, Unset) or _period_begin is None:
             period_begin = UNSET
         else:
-            period_begin = isoparse(_period_begin)
+            period_begin = parse_timestamp(_period_begin)
 
         _period_end = d.pop("period_end", UNSET)
         period_end: Union[Unset, datetime.datetime]
         if isinstance(_period_end, Unset) or _period_end is None:
             period_end = UNSET
         else:
-            period_end = isoparse(_period_end)
+            period_end = parse_timestamp(_period_end)
 
         _status = d.pop("status", UNSET)
         status: Union[Unset, StatusScheduleDtoStatus]
@@ -86,12 +92,23 @@ class StatusScheduleDto:
             status=status,
         )
 
-        status_schedule_dto.additional_properties = d
+        if d:
+            status_schedule_dto.additional_properties = d
         return status_schedule_dto
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -103,4 +120,4 @@ class StatusScheduleDto:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -1,14 +1,18 @@
 from typing import Any, Dict, Type, TypeVar, TYPE_CHECKING
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
-from dateutil.parser import isoparse
+from ..timestamps import parse_timestamp
 import datetime
 from typing import Union
 
@@ -47,7 +51,9 @@ class TariffDistributionGetDto:
     created: Union[Unset, datetime.datetime] = UNSET
     deleted: Union[Unset, datetime.datetime] = UNSET
     updated: Union[Unset, datetime.datetime] = UNSET
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         id = self.id
@@ -84,7 +90,7 @@ class TariffDistributionGetDto:
             updated = self.updated.isoformat()
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update(
             {
                 "id": id,
@@ -148,21 +154,21 @@ class TariffDistributionGetDto:
         if isinstance(_created, Unset) or _created is None:
             created = UNSET
         else:
-            created = isoparse(_created)
+            created = parse_timestamp(_created)
 
         _deleted = d.pop("deleted", UNSET)
         deleted: Union[Unset, datetime.datetime]
         if isinstance(_deleted, Unset) or _deleted is None:
             deleted = UNSET
         else:
-            deleted = isoparse(_deleted)
+            deleted = parse_timestamp(_deleted)
 
         _updated = d.pop("updated", UNSET)
         updated: Union[Unset, datetime.datetime]
         if isinstance(_updated, Unset) or _updated is None:
             updated = UNSET
         else:
-            updated = isoparse(_updated)
+            updated = parse_timestamp(_updated)
 
         tariff_distribution_get_dto = cls(
             id=id,
@@ -178,12 +184,23 @@ class TariffDistributionGetDto:
             updated=updated,
         )
 
-        tariff_distribution_get_dto.additional_properties = d
+        if d:
+            tariff_distribution_get_dto.additional_properties = d
         return tariff_distribution_get_dto
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -195,4 +212,4 @@ class TariffDistributionGetDto:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
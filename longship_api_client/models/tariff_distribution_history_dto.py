@@ -1,14 +1,18 @@
 from typing import Any, Dict, Type, TypeVar
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
-from dateutil.parser import isoparse
+from ..timestamps import parse_timestamp
 import datetime
 from typing import Union
 
@@ -32,7 +36,9 @@ class TariffDistributionHistoryDto:
     fixed_tenant_k_wh_fee: Union[Unset, float] = UNSET
     percentage_fee_customer: Union[Unset, float] = UNSET
     percentage_fee_tenant: Union[Unset, float] = UNSET
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         valid_from: Union[Unset, str] = UNSET
@@ -48,7 +54,7 @@ class TariffDistributionHistoryDto:
         percentage_fee_tenant = self.percentage_fee_tenant
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update({})
         if valid_from is not UNSET:
             field_dict["validFrom"] = valid_from
@@ -71,7 +77,7 @@ class TariffDistributionHistoryDto:
         if isinstance(_valid_from, Unset) or _valid_from is None:
             valid_from = UNSET
         else:
-            valid_from = isoparse(_valid_from)
+            valid_from = parse_timestamp(_valid_from)
 
         energy_compensation = d.pop("energyCompensation", UNSET)
 
@@ -89,12 +95,23 @@ class TariffDistributionHistoryDto:
             percentage_fee_tenant=percentage_fee_tenant,
         )
 
-        tariff_distribution_history_dto.additional_properties = d
+        if d:
+            tariff_distribution_history_dto.additional_properties = d
         return tariff_distribution_history_dto
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -106,4 +123,4 @@ class TariffDistributionHistoryDto:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -1,15 +1,19 @@
 from typing import Any, Dict, Type, TypeVar, TYPE_CHECKING
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
 from ..models.tariff_dto_tariff_type import TariffDtoTariffType
-from dateutil.parser import isoparse
+from ..timestamps import parse_timestamp
 import datetime
 from typing import Union
 from ..models.tariff_dto_usage_type import TariffDtoUsageType
@@ -87,7 +91,9 @@ class TariffDto:
     price_history: Union[Unset, List["TariffPriceDto"]] = UNSET
     external_reference: Union[Unset, str] = UNSET
     deleted: Union[Unset, datetime.datetime] = UNSET
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         tenant_id = self.tenant_id
@@ -173,7 +179,7 @@ class TariffDto:
             deleted = self.deleted.isoformat()
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update(
             {
                 "tenantId": tenant_id,
@@ -268,7 +274,7 @@ class TariffDto:
         if isinstance(_last_updated, Unset) or _last_updated is None:
             last_updated = UNSET
         else:
-            last_updated = isoparse(_last_updated)
+            last_updated = parse_timestamp(_last_updated)
 
         _usage_type = d.pop("usageType", UNSET)
         usage_type: Union[Unset, TariffDtoUsageType]
@@ -338,7 +344,7 @@ class TariffDto:
         if isinstance(_deleted, Unset) or _deleted is None:
             deleted = UNSET
         else:
-            deleted = isoparse(_deleted)
+            deleted = parse_timestamp(_deleted)
 
         tariff_dto = cls(
             tenant_id=tenant_id,
@@ -372,12 +378,23 @@ class TariffDto:
             deleted=deleted,
         )
 
-        tariff_dto.additional_properties = d
+        if d:
+            tariff_dto.additional_properties = d
         return tariff_dto
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -389,4 +406,4 @@ class TariffDto:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
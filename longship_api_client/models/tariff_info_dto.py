@@ -1,11 +1,15 @@
 from typing import Any, Dict, Type, TypeVar, TYPE_CHECKING
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
 from typing import Union
@@ -45,7 +49,9 @@ class TariffInfoDto:
     time_step_size_in_minutes: Union[Unset, int] = UNSET
     time_grace_period_in_minutes: Union[Unset, int] = UNSET
     assertions: Union[Unset, List["TariffAssertionDto"]] = UNSET
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         tariff_id = self.tariff_id
@@ -76,7 +82,7 @@ class TariffInfoDto:
                 assertions.append(assertions_item)
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update({})
         if tariff_id is not UNSET:
             field_dict["tariffId"] = tariff_id
@@ -149,12 +155,23 @@ class TariffInfoDto:
             assertions=assertions,
         )
 
-        tariff_info_dto.additional_properties = d
+        if d:
+            tariff_info_dto.additional_properties = d
         return tariff_info_dto
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -166,4 +183,4 @@ class TariffInfoDto:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
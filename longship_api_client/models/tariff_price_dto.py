@@ -1,14 +1,18 @@
 from typing import Any, Dict, Type, TypeVar, TYPE_CHECKING
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
-from dateutil.parser import isoparse
+from ..timestamps import parse_timestamp
 from ..models.tariff_price_dto_approval_status import TariffPriceDtoApprovalStatus
 import datetime
 from typing import Union
@@ -56,7 +60,9 @@ class TariffPriceDto:
     approval_status: Union[Unset, TariffPriceDtoApprovalStatus] = (
         TariffPriceDtoApprovalStatus.PENDING
     )
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         created_timestamp: Union[Unset, str] = UNSET
@@ -103,7 +109,7 @@ class TariffPriceDto:
             approval_status = self.approval_status.value
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update({})
         if created_timestamp is not UNSET:
             field_dict["createdTimestamp"] = created_timestamp
@@ -146,14 +152,14 @@ class TariffPriceDto:
         if isinstance(_created_timestamp, Unset) or _created_timestamp is None:
             created_timestamp = UNSET
         else:
-            created_timestamp = isoparse(_created_timestamp)
+            created_timestamp = parse_timestamp(_created_timestamp)
 
         _valid_from = d.pop("validFrom", UNSET)
         valid_from: Union[Unset, datetime.datetime]
         if isinstance(_valid_from, Unset) or _valid_from is None:
             valid_from = UNSET
         else:
-            valid_from = isoparse(_valid_from)
+            valid_from = parse_timestamp(_valid_from)
 
         start_tariff = d.pop("startTariff", UNSET)
 
@@ -208,12 +214,23 @@ class TariffPriceDto:
             approval_status=approval_status,
         )
 
-        tariff_price_dto.additional_properties = d
+        if d:
+            tariff_price_dto.additional_properties = d
         return tariff_price_dto
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -225,4 +242,4 @@ class TariffPriceDto:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -1,14 +1,18 @@
 from typing import Any, Dict, Type, TypeVar, TYPE_CHECKING
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
-from dateutil.parser import isoparse
+from ..timestamps import parse_timestamp
 import datetime
 from typing import Union
 
@@ -54,7 +58,9 @@ class TariffPutDto:
     time_grace_period_in_minutes: Union[Unset, int] = UNSET
     external_reference: Union[Unset, str] = UNSET
     deleted: Union[Unset, datetime.datetime] = UNSET
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         name = self.name
@@ -99,7 +105,7 @@ class TariffPutDto:
             deleted = self.deleted.isoformat()
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update({})
         if name is not UNSET:
             field_dict["name"] = name
@@ -181,7 +187,7 @@ class TariffPutDto:
         if isinstance(_deleted, Unset) or _deleted is None:
             deleted = UNSET
         else:
-            deleted = isoparse(_deleted)
+            deleted = parse_timestamp(_deleted)
 
         tariff_put_dto = cls(
             name=name,
@@ -200,12 +206,23 @@ class TariffPutDto:
             deleted=deleted,
         )
 
-        tariff_put_dto.additional_properties = d
+        if d:
+            tariff_put_dto.additional_properties = d
         return tariff_put_dto
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -217,4 +234,4 @@ class TariffPutDto:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
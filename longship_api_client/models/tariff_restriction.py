@@ -1,14 +1,18 @@
 from typing import Any, Dict, Type, TypeVar
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
-from dateutil.parser import isoparse
+from ..timestamps import parse_timestamp
 import datetime
 from typing import Union
 from ..models.tariff_restriction_day_of_week import TariffRestrictionDayOfWeek
@@ -35,7 +39,9 @@ class TariffRestriction:
     day_of_week: Union[Unset, TariffRestrictionDayOfWeek] = (
         TariffRestrictionDayOfWeek.VALUE_0
     )
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         start_time = self.start_time
@@ -55,7 +61,7 @@ class TariffRestriction:
             day_of_week = self.day_of_week.value
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update({})
         if start_time is not UNSET:
             field_dict["startTime"] = start_time
@@ -82,14 +88,14 @@ class TariffRestriction:
         if isinstance(_start_date, Unset) or _start_date is None:
             start_date = UNSET
         else:
-            start_date = isoparse(_start_date)
+            start_date = parse_timestamp(_start_date)
 
         _end_date = d.pop("endDate", UNSET)
         end_date: Union[Unset, datetime.datetime]
         if isinstance(_end_date, Unset) or _end_date is None:
             end_date = UNSET
         else:
-            end_date = isoparse(_end_date)
+            end_date = parse_timestamp(_end_date)
 
         _day_of_week = d.pop("dayOfWeek", UNSET)
         day_of_week: Union[Unset, TariffRestrictionDayOfWeek]
@@ -106,12 +112,23 @@ class TariffRestriction:
             day_of_week=day_of_week,
         )
 
-        tariff_restriction.additional_properties = d
+        if d:
+            tariff_restriction.additional_properties = d
         return tariff_restriction
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -123,4 +140,4 @@ class TariffRestriction:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -1,14 +1,18 @@
 from typing import Any, Dict, Type, TypeVar
 
+from typing import Optional
+
 from typing import List
 
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import additional_properties_eq
+
 from ..types import UNSET, Unset
 
-from dateutil.parser import isoparse
+from ..timestamps import parse_timestamp
 import datetime
 from typing import Union
 
@@ -30,7 +34,9 @@ class UpdateFirmwareRequest:
     retrieve_date: datetime.datetime
     retries: Union[Unset, int] = UNSET
     retry_interval: Union[Unset, int] = UNSET
-    additional_properties: Dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[Dict[str, Any]] = _attrs_field(
+        init=False, default=None, eq=additional_properties_eq
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         location = self.location
@@ -42,7 +48,7 @@ class UpdateFirmwareRequest:
         retry_interval = self.retry_interval
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties or {})
         field_dict.update(
             {
                 "location": location,
@@ -61,7 +67,7 @@ class UpdateFirmwareRequest:
         d = src_dict.copy()
         location = d.pop("location")
 
-        retrieve_date = isoparse(d.pop("retrieveDate"))
+        retrieve_date = parse_timestamp(d.pop("retrieveDate"))
 
         retries = d.pop("retries", UNSET)
 
@@ -74,12 +80,23 @@ class UpdateFirmwareRequest:
             retry_interval=retry_interval,
         )
 
-        update_firmware_request.additional_properties = d
+        if d:
+            update_firmware_request.additional_properties = d
         return update_firmware_request
 
+    @property
+    def additional_properties(self) -> Dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: Dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> List[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -91,4 +108,4 @@ class UpdateFirmwareRequest:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
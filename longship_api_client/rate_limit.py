@@ -0,0 +1,277 @@
+"""Client-side rate limiting shared by the sync and async httpx clients"""
+
+import asyncio
+import ipaddress
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Optional
+from urllib.request import getproxies
+
+import httpx
+
+
+def endpoint_group(request: httpx.Request) -> str:
+    """Group requests by the resource after the API version, e.g. ``/v1/sessions/...`` -> ``sessions``"""
+    segments = [segment for segment in request.url.path.split("/") if segment]
+    if segments and segments[0].startswith("v") and segments[0][1:].isdigit():
+        segments = segments[1:]
+    return segments[0] if segments else ""
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header holding either seconds or an HTTP date"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucket:
+    """A thread-safe token bucket refilled at ``rate`` tokens per second.
+
+    ``reserve`` always hands out a token and returns how long the caller has to
+    wait before using it, so waiting happens outside of the lock and works the
+    same for ``time.sleep`` and ``asyncio.sleep``.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._paused_until - now)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every request of the bucket, e.g. after a 429"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+class RateLimiter:
+    """Throttles requests per endpoint group and retries rate-limited ones.
+
+    Every endpoint group (see ``endpoint_group``) gets its own token bucket,
+    refilled at ``group_rates[group]`` or ``rate`` requests per second and holding
+    up to ``burst`` tokens. A 429 response pauses the group's bucket for the
+    ``Retry-After`` the API asked for (or an exponential backoff when it didn't)
+    and the request is retried up to ``max_retries`` times, with random
+    ``jitter`` added so that waiting requests don't retry in lockstep.
+
+    One limiter can be shared between clients, threads and event loops.
+    """
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        burst: Optional[float] = None,
+        group_rates: Optional[Dict[str, float]] = None,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        jitter: float = 0.5,
+        group_for: Callable[[httpx.Request], str] = endpoint_group,
+    ) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.group_rates = group_rates or {}
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.group_for = group_for
+        self.retries = 0
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, group: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(group)
+            if bucket is None:
+                rate = self.group_rates.get(group, self.rate)
+                bucket = TokenBucket(rate, self.burst if self.burst else rate)
+                self._buckets[group] = bucket
+            return bucket
+
+    def acquire(self, request: httpx.Request) -> float:
+        """Take a token for ``request`` and return how long to wait before sending it"""
+        return self.bucket(self.group_for(request)).reserve()
+
+    def retry_delay(
+        self, request: httpx.Request, response: httpx.Response, attempt: int
+    ) -> Optional[float]:
+        """Return how long to wait before retrying, or ``None`` to return ``response``"""
+        if response.status_code != 429 or attempt >= self.max_retries:
+            return None
+        delay = parse_retry_after(response.headers.get("Retry-After"))
+        if delay is None:
+            delay = min(self.backoff * 2**attempt, self.max_backoff)
+        self.bucket(self.group_for(request)).pause(delay)
+        self.retries += 1
+        return delay + random.uniform(0, self.jitter)
+
+
+class RateLimitedTransport(httpx.BaseTransport):
+    def __init__(self, transport: httpx.BaseTransport, limiter: RateLimiter) -> None:
+        self._transport = transport
+        self._limiter = limiter
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        attempt = 0
+        while True:
+            time.sleep(self._limiter.acquire(request))
+            response = self._transport.handle_request(request)
+            delay = self._limiter.retry_delay(request, response, attempt)
+            if delay is None:
+                return response
+            response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncRateLimitedTransport(httpx.AsyncBaseTransport):
+    def __init__(
+        self, transport: httpx.AsyncBaseTransport, limiter: RateLimiter
+    ) -> None:
+        self._transport = transport
+        self._limiter = limiter
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        attempt = 0
+        while True:
+            await asyncio.sleep(self._limiter.acquire(request))
+            response = await self._transport.handle_async_request(request)
+            delay = self._limiter.retry_delay(request, response, attempt)
+            if delay is None:
+                return response
+            await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+# Arguments of httpx.Client that configure its default transport
+_TRANSPORT_ARGS = ("cert", "http1", "http2", "limits", "trust_env")
+
+
+def _is_ip_address(hostname: str) -> bool:
+    try:
+        ipaddress.ip_network(hostname, strict=False)
+    except ValueError:
+        return False
+    return True
+
+
+def _environment_proxies() -> Dict[str, Optional[str]]:
+    """The proxies of ``HTTP(S)_PROXY``, ``ALL_PROXY`` and ``NO_PROXY``, mapped
+    to URL patterns the way ``httpx.Client`` does for ``trust_env``
+    """
+    proxy_info = getproxies()
+    proxies: Dict[str, Optional[str]] = {}
+    for scheme in ("http", "https", "all"):
+        url = proxy_info.get(scheme)
+        if url:
+            proxies[f"{scheme}://"] = url if "://" in url else f"http://{url}"
+    for hostname in (host.strip() for host in proxy_info.get("no", "").split(",")):
+        if hostname == "*":
+            return {}
+        if not hostname:
+            continue
+        if "://" in hostname:
+            proxies[hostname] = None
+        elif ":" in hostname and _is_ip_address(hostname):
+            proxies[f"all://[{hostname}]"] = None
+        elif _is_ip_address(hostname) or hostname.lower() == "localhost":
+            proxies[f"all://{hostname}"] = None
+        else:
+            proxies[f"all://*{hostname}"] = None
+    return proxies
+
+
+def _proxy_map(proxies: Any, trust_env: bool) -> Dict[str, Optional[httpx.Proxy]]:
+    """The proxy of every URL pattern, like ``httpx.Client`` maps them"""
+    if proxies is None:
+        if not trust_env:
+            return {}
+        # httpx skips the environment when given a transport, so read it here
+        proxies = _environment_proxies()
+    elif not isinstance(proxies, dict):
+        proxies = {"all://": proxies}
+    return {
+        str(pattern): proxy
+        if proxy is None or isinstance(proxy, httpx.Proxy)
+        else httpx.Proxy(url=proxy)
+        for pattern, proxy in proxies.items()
+    }
+
+
+def rate_limited_httpx_args(
+    httpx_args: Dict[str, Any],
+    verify: Any,
+    limiter: Optional[RateLimiter],
+    is_async: bool,
+) -> Dict[str, Any]:
+    """Return ``httpx_args`` with the transport and every mount, proxies
+    included, wrapped in ``limiter``
+    """
+    if limiter is None:
+        return httpx_args
+    args = dict(httpx_args)
+    transport = args.pop("transport", None)
+    proxies = args.pop("proxies", None)
+    mounts = dict(args.pop("mounts", None) or {})
+    options = {key: args.pop(key) for key in _TRANSPORT_ARGS if key in args}
+    if "trust_env" in options:
+        # Also read by the client, for .netrc authentication
+        args["trust_env"] = options["trust_env"]
+    transport_class = httpx.AsyncHTTPTransport if is_async else httpx.HTTPTransport
+    if transport is None:
+        transport = transport_class(verify=verify, **options)
+    trust_env = options.get("trust_env", True) and "transport" not in httpx_args
+    for pattern, proxy in _proxy_map(proxies, trust_env).items():
+        if pattern in mounts:
+            continue
+        # A None proxy sends the pattern's requests directly, through transport
+        mounts[pattern] = (
+            None
+            if proxy is None
+            else transport_class(verify=verify, proxy=proxy, **options)
+        )
+    wrap = AsyncRateLimitedTransport if is_async else RateLimitedTransport
+    args["transport"] = wrap(transport, limiter)  # type: ignore
+    if mounts:
+        args["mounts"] = {
+            pattern: None if mounted is None else wrap(mounted, limiter)  # type: ignore
+            for pattern, mounted in mounts.items()
+        }
+    return args
@@ -0,0 +1,115 @@
+"""Parsing of the ISO-8601 timestamps in API responses"""
+
+import datetime
+import sys
+from functools import lru_cache
+from typing import Callable, Dict, Optional
+
+from dateutil.parser import isoparse
+
+_OFFSETS: Dict[str, Optional[datetime.timezone]] = {
+    "": None,
+    "Z": datetime.timezone.utc,
+}
+
+
+def _offset(value: str) -> Optional[datetime.timezone]:
+    tz = _OFFSETS.get(value)
+    if tz is None and value:
+        if len(value) != 6 or value[0] not in "+-" or value[3] != ":":
+            raise ValueError(value)
+        minutes = int(value[1:3]) * 60 + int(value[4:6])
+        if value[0] == "-":
+            minutes = -minutes
+        tz = datetime.timezone(datetime.timedelta(minutes=minutes))
+        _OFFSETS[value] = tz
+    return tz
+
+
+def _parse_slices(value: str) -> Optional[datetime.datetime]:
+    if (
+        len(value) < 19
+        or value[4] != "-"
+        or value[7] != "-"
+        or value[10] != "T"
+        or value[13] != ":"
+        or value[16] != ":"
+    ):
+        return None
+    microsecond = 0
+    end = 19
+    if value[19:20] == ".":
+        end = 20
+        while end < len(value) and value[end].isdigit():
+            end += 1
+        fraction = value[20:end]
+        if not fraction:
+            return None
+        microsecond = int(fraction[:6].ljust(6, "0"))
+    try:
+        return datetime.datetime(
+            int(value[0:4]),
+            int(value[5:7]),
+            int(value[8:10]),
+            int(value[11:13]),
+            int(value[14:16]),
+            int(value[17:19]),
+            microsecond,
+            _offset(value[end:]),
+        )
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=8192)
+def _parse_cached(value: str) -> datetime.datetime:
+    parsed = _parse_slices(value)
+    if parsed is None:
+        return isoparse(value)
+    return parsed
+
+
+if sys.version_info >= (3, 11):
+
+    def parse_isoformat(value: str) -> datetime.datetime:
+        """Parse the timestamps Longship emits, e.g. ``2023-06-25T13:03:50.0223808Z``
+
+        ``datetime.fromisoformat`` handles these since Python 3.11, other formats
+        are handed to ``dateutil.parser.isoparse``. Only those are memoized, a
+        cache lookup costs more than ``fromisoformat`` itself.
+        """
+        try:
+            return datetime.datetime.fromisoformat(value)
+        except ValueError:
+            return _parse_cached(value)
+
+else:
+
+    def parse_isoformat(value: str) -> datetime.datetime:
+        """Parse the timestamps Longship emits, e.g. ``2023-06-25T13:03:50.0223808Z``
+
+        Handles ``YYYY-MM-DDTHH:MM:SS`` with optional fractional seconds (truncated
+        to microseconds, like ``isoparse``) and an optional ``Z`` or ``+HH:MM``
+        offset, other formats are handed to ``dateutil.parser.isoparse``. Parsed
+        strings are memoized, as timestamps often repeat between polls.
+        """
+        return _parse_cached(value)
+
+
+_parser: Callable[[str], datetime.datetime] = parse_isoformat
+
+
+def parse_timestamp(value: str) -> datetime.datetime:
+    """Parse a timestamp of an API response with the configured parser"""
+    return _parser(value)
+
+
+def set_timestamp_parser(parser: Optional[Callable[[str], datetime.datetime]]) -> None:
+    """Parse the timestamps of all models with ``parser``, e.g. ``isoparse``.
+    ``None`` restores the default ``parse_isoformat``.
+    """
+    global _parser
+    _parser = parse_isoformat if parser is None else parser
+
+
+__all__ = ["parse_isoformat", "parse_timestamp", "set_timestamp_parser"]
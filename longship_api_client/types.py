@@ -1,7 +1,7 @@
 """Contains some shared types for properties"""
 
 from http import HTTPStatus
-from typing import BinaryIO, Generic, MutableMapping, Optional, Tuple, TypeVar, Literal
+from typing import Any, BinaryIO, Dict, Generic, MutableMapping, Optional, Tuple, TypeVar, Literal
 
 from attrs import define
 
@@ -13,6 +13,18 @@ class Unset:
 
 UNSET: Unset = Unset()
 
+
+def additional_properties_eq(value: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Compare models without extra keys equal whether or not their
+    ``additional_properties`` dict was created yet
+
+    Models only get a dict of their own once ``additional_properties`` is
+    accessed, so that parsing large responses doesn't allocate an empty dict per
+    object.
+    """
+    return {} if value is None else value
+
+
 FileJsonType = Tuple[Optional[str], BinaryIO, Optional[str]]
 
 
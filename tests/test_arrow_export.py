@@ -0,0 +1,138 @@
+import asyncio
+import datetime
+import io
+
+import httpx
+import pytest
+from longship_api_client import Client
+from longship_api_client.api.cdrs import get_all_cdrs, get_all_interchangeformat
+from longship_api_client.models.cdr_dto import CdrDto
+from longship_api_client.models.interchange_format_cdr import InterchangeFormatCdr
+
+from longship.arrow_export import aexport_arrow, arrow_schema, export_arrow
+from longship.errors import PageLoadError
+
+pyarrow = pytest.importorskip("pyarrow")
+pyarrow_parquet = pytest.importorskip("pyarrow.parquet")
+
+
+def cdr(index):
+    return {
+        "id": f"cdr-{index}",
+        "connectorId": 1,
+        "cdrLocation": {"id": "location-1", "powerType": "AC_3_PHASE"},
+        "startDatetime": "2024-01-01T00:00:00Z",
+        "chargingPeriods": [{"timestamp": "2024-01-01T00:15:00Z", "deltaKwh": 2.5}],
+        "totalEnergyInKwh": 10.0,
+        "approvalStatus": "Approved",
+    }
+
+
+def make_client(items):
+    def handler(request):
+        skip = int(request.url.params.get("skip", 0))
+        take = int(request.url.params.get("take", 100))
+        return httpx.Response(200, json=items[skip : skip + take])
+
+    return Client(
+        base_url="https://api.example.com",
+        httpx_args={"transport": httpx.MockTransport(handler)},
+    )
+
+
+class TestArrowSchema:
+    def test_cdr_schema(self):
+        """Test that the schema mirrors the model, nested models included."""
+        schema = arrow_schema(CdrDto)
+        assert schema.field("id").type == pyarrow.string()
+        assert schema.field("connector_id").type == pyarrow.int64()
+        assert schema.field("start_datetime").type == pyarrow.timestamp("us", tz="UTC")
+        assert schema.field("approval_status").type == pyarrow.string()
+        assert schema.field("cdr_location").type.field("power_type").type == pyarrow.string()
+        period = schema.field("charging_periods").type.value_type
+        assert period.field("delta_kwh").type == pyarrow.float64()
+        assert "additional_properties" not in schema.names
+
+    def test_interchange_format_schema(self):
+        """Test the schema of interchange format CDRs."""
+        schema = arrow_schema(InterchangeFormatCdr)
+        assert schema.field("cdr_id").type == pyarrow.string()
+        assert schema.field("volume").type == pyarrow.float64()
+        assert schema.field("calculated_cost").type == pyarrow.float64()
+
+
+class TestExportArrow:
+    def test_parquet(self, tmp_path):
+        """Test that all pages end up in the Parquet file, in row groups of batch_size."""
+        client = make_client([cdr(i) for i in range(25)])
+        path = tmp_path / "cdrs.parquet"
+        rows = export_arrow(
+            get_all_cdrs, CdrDto, client, str(path), batch_size=10, page_size=7
+        )
+        assert rows == 25
+        parquet = pyarrow_parquet.ParquetFile(path)
+        assert parquet.metadata.num_row_groups == 3
+        table = parquet.read()
+        assert table.schema == arrow_schema(CdrDto)
+        assert table.column("id").to_pylist() == [f"cdr-{i}" for i in range(25)]
+        first = table.slice(0, 1).to_pylist()[0]
+        assert first["start_datetime"] == datetime.datetime(
+            2024, 1, 1, tzinfo=datetime.timezone.utc
+        )
+        assert first["cdr_location"]["power_type"] == "AC_3_PHASE"
+        assert first["charging_periods"][0]["delta_kwh"] == 2.5
+        assert first["total_price"] is None
+
+    def test_ipc(self, tmp_path):
+        """Test that interchange format CDRs are exported to an Arrow IPC file."""
+        items = [{"cdrId": f"cdr-{i}", "volume": 1.5 * i} for i in range(5)]
+        path = tmp_path / "cdrs.arrow"
+        rows = asyncio.run(
+            aexport_arrow(
+                get_all_interchangeformat,
+                InterchangeFormatCdr,
+                make_client(items),
+                str(path),
+                format="ipc",
+            )
+        )
+        assert rows == 5
+        table = pyarrow.ipc.open_file(str(path)).read_all()
+        assert table.column("volume").to_pylist() == [1.5 * i for i in range(5)]
+
+    def test_unknown_format(self, tmp_path):
+        """Test that unknown formats are rejected before paging starts."""
+        with pytest.raises(ValueError):
+            export_arrow(get_all_cdrs, CdrDto, make_client([]), str(tmp_path / "x"), format="csv")
+        assert list(tmp_path.iterdir()) == []
+
+    def test_failed_export_leaves_sink_alone(self, tmp_path):
+        """Test that an export failing halfway writes neither a path nor a file object."""
+        items = [cdr(i) for i in range(25)]
+
+        def handler(request):
+            skip = int(request.url.params.get("skip", 0))
+            if skip >= 10:
+                return httpx.Response(503)
+            return httpx.Response(200, json=items[skip : skip + 10])
+
+        client = Client(
+            base_url="https://api.example.com",
+            httpx_args={"transport": httpx.MockTransport(handler)},
+        )
+        path = tmp_path / "cdrs.parquet"
+        path.write_bytes(b"previous export")
+        with pytest.raises(PageLoadError):
+            export_arrow(get_all_cdrs, CdrDto, client, path, batch_size=5, page_size=10)
+        assert path.read_bytes() == b"previous export"
+        assert list(tmp_path.iterdir()) == [path]
+        sink = io.BytesIO()
+        with pytest.raises(PageLoadError):
+            export_arrow(get_all_cdrs, CdrDto, client, sink, batch_size=5, page_size=10)
+        assert sink.getvalue() == b""
+
+    def test_file_object_sink(self):
+        """Test that a complete export is copied to a file object."""
+        sink = io.BytesIO()
+        assert export_arrow(get_all_cdrs, CdrDto, make_client([cdr(0)]), sink) == 1
+        assert pyarrow_parquet.read_table(io.BytesIO(sink.getvalue())).num_rows == 1
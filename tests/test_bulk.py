@@ -0,0 +1,114 @@
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+
+from longship.bulk import RateLimitedScheduler, run_bulk
+from longship.client import Longship
+
+
+class TestRateLimitedScheduler:
+    def test_concurrency_is_bounded(self):
+        """Test that no more than `concurrency` calls run at once."""
+        in_flight = 0
+        max_seen = 0
+
+        async def call():
+            nonlocal in_flight, max_seen
+            in_flight += 1
+            max_seen = max(max_seen, in_flight)
+            await asyncio.sleep(0.005)
+            in_flight -= 1
+
+        async def run():
+            scheduler = RateLimitedScheduler(concurrency=3)
+            await asyncio.gather(*(scheduler.run(call) for _ in range(20)))
+
+        asyncio.run(run())
+        assert max_seen == 3
+
+    def test_rate_spaces_out_starts(self):
+        """Test that calls start no faster than `rate` per second."""
+        starts = []
+
+        async def call():
+            starts.append(time.monotonic())
+
+        async def run():
+            scheduler = RateLimitedScheduler(concurrency=10, rate=100)
+            await asyncio.gather(*(scheduler.run(call) for _ in range(10)))
+
+        asyncio.run(run())
+        # Ten starts at 100/s span at least nine intervals of 10 ms
+        assert starts[-1] - starts[0] >= 0.085
+
+    def test_invalid_arguments(self):
+        """Test that concurrency and rate are validated."""
+        with pytest.raises(ValueError):
+            RateLimitedScheduler(concurrency=0)
+        with pytest.raises(ValueError):
+            RateLimitedScheduler(rate=0)
+
+
+class TestRunBulk:
+    def test_results_and_timings(self):
+        """Test that every key gets its result, error and timings."""
+
+        async def ok():
+            await asyncio.sleep(0.01)
+            return "done"
+
+        async def fail():
+            raise RuntimeError("boom")
+
+        async def run():
+            return await run_bulk(
+                {"a": ok, "b": fail, "c": ok}, RateLimitedScheduler(concurrency=1)
+            )
+
+        report = asyncio.run(run())
+        assert report.results["a"].response == "done"
+        assert report.results["a"].ok
+        assert isinstance(report.results["b"].error, RuntimeError)
+        assert set(report.failed) == {"b"}
+        # The event loop may wake a sleep up to its clock resolution early
+        assert report.results["a"].duration >= 0.009
+        # With a single slot the last call waits for the ones before it
+        assert report.results["c"].queued >= 0.009
+        assert report.max_queued == report.results["c"].queued
+        assert report.total >= 0.018
+
+
+class TestBulkMaxPower:
+    def test_set_charge_points_max_power(self):
+        """Test that a profile is sent to every chargepoint with its own limit."""
+        received = {}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            chargepoint_id = request.url.path.split("/")[3]
+            if chargepoint_id == "CP3":
+                return httpx.Response(500, json={"message": "error"})
+            body = json.loads(request.content)
+            profile = body["csChargingProfiles"]
+            received[chargepoint_id] = profile["chargingSchedule"][
+                "chargingSchedulePeriod"
+            ][0]["limit"]
+            return httpx.Response(202)
+
+        longship = Longship("https://api.example.com", "apiKey", "ocpKey")
+        longship._client.set_async_httpx_client(
+            httpx.AsyncClient(
+                base_url="https://api.example.com",
+                transport=httpx.MockTransport(handler),
+            )
+        )
+        limits = {"CP1": 11000, "CP2": 7400, "CP3": 3700}
+        report = asyncio.run(
+            longship.set_charge_points_max_power(limits, concurrency=2, rate=None)
+        )
+        assert received == {"CP1": 11000, "CP2": 7400}
+        assert set(report.results) == set(limits)
+        assert set(report.failed) == {"CP3"}
+        assert report.results["CP1"].response.status_code == 202
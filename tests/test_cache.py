@@ -0,0 +1,268 @@
+import asyncio
+
+import httpx
+import pytest
+from longship_api_client import Client
+from longship_api_client.api.chargepoints import chargepoint_get
+from longship_api_client.api.locations import location_get
+from longship_api_client.api.sessions import session_get
+from longship_api_client.api.tariffs import tariff_get
+
+from longship.cache import EntityCache, TTLCache, tenant_namespace
+from longship.client import Longship
+from longship.registry import LongshipRegistry
+from longship.single_flight import SingleFlight
+from longship.types import WebhookPayload, WebhookPayloadType
+
+# Valid as a location, tariff and chargepoint alike
+ENTITY = {
+    "country_code": "NL",
+    "party_id": "ABC",
+    "publish": True,
+    "street": "Stationsplein 1",
+    "city": "Amsterdam",
+    "country": "NLD",
+    "coordinates": {"latitude": "52.37", "longitude": "4.90"},
+    "time_zone": "Europe/Amsterdam",
+    "last_updated": "2024-01-01T00:00:00Z",
+    "tenantId": "tenant-1",
+}
+
+OPERATIONAL_STATUS = {
+    "status": "Available",
+    "errorcode": "NoError",
+    "connectornumber": 1,
+    "statussource": "Chargepoint",
+}
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class Server:
+    def __init__(self, status_code=200):
+        self.status_code = status_code
+        self.requests = []
+
+    def __call__(self, request):
+        self.requests.append(request)
+        entity_id = request.url.path.split("/")[3]
+        return httpx.Response(self.status_code, json={**ENTITY, "id": entity_id})
+
+
+def make_client(server):
+    return Client(
+        base_url="https://api.example.com",
+        httpx_args={"transport": httpx.MockTransport(server)},
+    )
+
+
+def webhook(payload_type, subject, data=None):
+    return WebhookPayload(
+        specversion="1.0",
+        id="event-1",
+        type=payload_type,
+        subject=subject,
+        time="2024-01-01T00:00:00Z",
+        source="/locations",
+        datacontenttype="application/json",
+        data={} if data is None else data,
+    )
+
+
+class TestTTLCache:
+    def test_expiry(self):
+        """Test that entries expire ttl seconds after being set."""
+        clock = Clock()
+        cache = TTLCache(ttl=10, clock=clock)
+        cache.set("a", 1)
+        cache.set("b", 2, ttl=20)
+        clock.now = 15
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert len(cache) == 1
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted at maxsize."""
+        cache = TTLCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert (cache.get("a"), cache.get("c")) == (1, 3)
+        assert cache.evictions == 1
+
+    def test_delete(self):
+        """Test that delete reports whether the key was cached."""
+        cache = TTLCache()
+        cache.set("a", 1)
+        assert cache.delete("a")
+        assert not cache.delete("a")
+
+
+class TestEntityCache:
+    def test_hits_and_misses(self):
+        """Test that repeated lookups are served from the cache and counted."""
+        server = Server()
+        client = make_client(server)
+        cache = EntityCache()
+        for _ in range(3):
+            response = cache.call(location_get, client, id="L1")
+        cache.call(tariff_get, client, id="T1")
+        assert response.parsed.id == "L1"
+        assert len(server.requests) == 2
+        assert cache.hits == {"location_get": 2}
+        assert cache.misses == {"location_get": 1, "tariff_get": 1}
+        assert cache.hit_ratio == 0.5
+
+    def test_errors_are_not_cached(self):
+        """Test that unsuccessful responses are fetched again."""
+        server = Server(status_code=404)
+        client = make_client(server)
+        cache = EntityCache()
+        cache.call(location_get, client, id="L1")
+        cache.call(location_get, client, id="L1")
+        assert len(server.requests) == 2
+
+    def test_other_endpoints_are_not_cached(self):
+        """Test that endpoints of fast-changing entities are passed through."""
+        server = Server()
+        client = make_client(server)
+        cache = EntityCache()
+        cache.call(session_get, client, id="S1")
+        cache.call(session_get, client, id="S1")
+        assert len(server.requests) == 2
+        assert not cache.misses
+
+    @pytest.mark.parametrize(
+        "payload_type, endpoint, data",
+        [
+            (WebhookPayloadType.LocationUpdated, location_get, None),
+            (WebhookPayloadType.LocationCreated, location_get, None),
+            (WebhookPayloadType.ChargePointBooted, chargepoint_get, {"registrationstatus": "Accepted"}),
+            (WebhookPayloadType.OperationalStatusChanged, chargepoint_get, OPERATIONAL_STATUS),
+        ],
+    )
+    def test_webhook_invalidation(self, payload_type, endpoint, data):
+        """Test that webhooks drop the entity in their subject."""
+        server = Server()
+        client = make_client(server)
+        cache = EntityCache()
+        cache.call(endpoint, client, id="X1")
+        cache.call(endpoint, client, id="X2")
+        assert cache.handle_webhook(webhook(payload_type, "X1", data)) == 1
+        cache.call(endpoint, client, id="X1")
+        cache.call(endpoint, client, id="X2")
+        assert [request.url.path[-2:] for request in server.requests] == ["X1", "X2", "X1"]
+        assert sum(cache.invalidations.values()) == 1
+
+    def test_unrelated_webhook(self):
+        """Test that other webhooks leave the cache alone."""
+        cache = EntityCache()
+        cache.call(location_get, make_client(Server()), id="L1")
+        assert cache.handle_webhook(webhook(WebhookPayloadType.Ping, "L1")) == 0
+        assert len(cache.backend) == 1
+
+    def test_shared_backend(self):
+        """Test that caches sharing a backend see each other's entries and invalidations."""
+        server = Server()
+        backend = TTLCache()
+        first, second = EntityCache(backend), EntityCache(backend)
+        first.call(location_get, make_client(server), id="L1")
+        second.call(location_get, make_client(server), id="L1")
+        assert len(server.requests) == 1
+        second.handle_webhook(webhook(WebhookPayloadType.LocationUpdated, "L1"))
+        first.call(location_get, make_client(server), id="L1")
+        assert len(server.requests) == 2
+
+    def test_namespaces(self):
+        """Test that caches of different tenants sharing a backend keep their entries apart."""
+        server = Server()
+        backend = TTLCache()
+        first = EntityCache(backend, namespace=tenant_namespace("https://api.example.com", "key-1"))
+        second = EntityCache(backend, namespace=tenant_namespace("https://api.example.com", "key-2"))
+        first.call(location_get, make_client(server), id="L1")
+        second.call(location_get, make_client(server), id="L1")
+        assert len(server.requests) == 2
+        assert len(backend) == 2
+        assert all("key-" not in key for key in backend._entries)
+        first.handle_webhook(webhook(WebhookPayloadType.LocationUpdated, "L1"))
+        assert len(backend) == 1
+
+    def test_concurrent_misses_are_coalesced(self):
+        """Test that misses go through the single flight."""
+        server = Server()
+        client = make_client(server)
+        cache = EntityCache(single_flight=SingleFlight())
+
+        async def main():
+            await asyncio.gather(*(cache.acall(location_get, client, id="L1") for _ in range(3)))
+
+        asyncio.run(main())
+        assert len(server.requests) == 1
+        assert cache.single_flight.coalesced == 2
+
+    def test_invalidation_during_fetch(self):
+        """Test that a response fetched while its entity was invalidated isn't cached."""
+        cache = EntityCache()
+
+        def server(request):
+            # The entity changes while its old version is on the way
+            cache.handle_webhook(webhook(WebhookPayloadType.LocationUpdated, "L1"))
+            return httpx.Response(200, json={**ENTITY, "id": "L1"})
+
+        async def main():
+            client = make_client(server)
+            await cache.acall(location_get, client, id="L1")
+            cache.call(location_get, client, id="L1")
+
+        asyncio.run(main())
+        assert len(cache.backend) == 0
+        assert cache.misses == {"location_get": 2}
+
+
+class TestLongshipCache:
+    def test_get_location(self):
+        """Test that the facade caches lookups and invalidates them on webhooks."""
+        server = Server()
+        longship = Longship("https://api.example.com", "apiKey", "ocpKey", cache=TTLCache())
+        longship._client.set_async_httpx_client(
+            httpx.AsyncClient(
+                base_url="https://api.example.com", transport=httpx.MockTransport(server)
+            )
+        )
+
+        async def main():
+            await longship.get_location("L1")
+            await longship.get_location("L1")
+            longship.handle_webhook(webhook(WebhookPayloadType.LocationUpdated, "L1"))
+            return await longship.get_location("L1")
+
+        location = asyncio.run(main())
+        assert location.id == "L1"
+        assert len(server.requests) == 2
+        assert longship.cache.hits == {"location_get": 1}
+
+    def test_tenants_sharing_a_backend(self):
+        """Test that registry tenants sharing a cache backend never see each other's entities."""
+
+        def server(request):
+            tenant = request.headers["x-api-key"]
+            return httpx.Response(200, json={**ENTITY, "id": "L1", "name": tenant})
+
+        async def main():
+            async with LongshipRegistry(cache=TTLCache()) as registry:
+                names = []
+                for tenant in ("tenant-1", "tenant-2", "tenant-1"):
+                    longship = registry.get("https://api.example.com", tenant, "ocpKey")
+                    longship._client.get_async_httpx_client()._transport = httpx.MockTransport(server)
+                    names.append((await longship.get_location("L1")).name)
+                return names
+
+        assert asyncio.run(main()) == ["tenant-1", "tenant-2", "tenant-1"]
@@ -0,0 +1,158 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+from dateutil.parser import isoparse
+from longship_api_client import Client
+from longship_api_client.models.get_all_cdrs_order_by import GetAllCdrsOrderBy
+
+from longship.cdr_export import CdrExporter, split_windows
+from longship.errors import PageLoadError
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def make_cdrs(count, step=timedelta(hours=5)):
+    return [
+        {"id": f"cdr-{i}", "startDatetime": (START + step * i).isoformat()}
+        for i in range(count)
+    ]
+
+
+def make_client(cdrs, status_code=200, stats=None):
+    """Create a client backed by a mock CDR endpoint with inclusive from/to filters."""
+    in_flight = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight
+        in_flight += 1
+        if stats is not None:
+            stats["max_in_flight"] = max(stats.get("max_in_flight", 0), in_flight)
+            stats["requests"] = stats.get("requests", 0) + 1
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        if status_code != 200:
+            return httpx.Response(status_code, json={"message": "error"})
+        params = request.url.params
+        from_ = isoparse(params["from"])
+        to = isoparse(params["to"])
+        matching = [
+            cdr for cdr in cdrs if from_ <= isoparse(cdr["startDatetime"]) <= to
+        ]
+        matching.sort(
+            key=lambda cdr: cdr["startDatetime"],
+            reverse=params.get("descending") == "true",
+        )
+        skip = int(params["skip"])
+        take = int(params["take"])
+        return httpx.Response(200, json=matching[skip : skip + take])
+
+    return Client(base_url="https://api.example.com").set_async_httpx_client(
+        httpx.AsyncClient(
+            base_url="https://api.example.com", transport=httpx.MockTransport(handler)
+        )
+    )
+
+
+async def collect(exporter):
+    return [cdr async for cdr in exporter]
+
+
+class TestSplitWindows:
+    def test_split_windows(self):
+        """Test that the range is covered by consecutive windows."""
+        windows = split_windows(START, START + timedelta(hours=50), timedelta(days=1))
+        assert windows == [
+            (START, START + timedelta(days=1)),
+            (START + timedelta(days=1), START + timedelta(days=2)),
+            (START + timedelta(days=2), START + timedelta(hours=50)),
+        ]
+
+    def test_split_windows_empty_range(self):
+        """Test that an empty range yields no windows."""
+        assert split_windows(START, START, timedelta(days=1)) == []
+
+    def test_split_windows_invalid_window(self):
+        """Test that a non-positive window is rejected."""
+        with pytest.raises(ValueError):
+            split_windows(START, START + timedelta(days=1), timedelta(0))
+
+
+class TestCdrExporter:
+    def test_export_is_ordered_and_deduplicated(self):
+        """Test that windows are merged in order without boundary duplicates."""
+        cdrs = make_cdrs(150)
+        client = make_client(cdrs)
+        exporter = CdrExporter(
+            client,
+            START,
+            START + timedelta(days=40),
+            window=timedelta(days=1),
+            page_size=3,
+        )
+        result = asyncio.run(collect(exporter))
+        # CDRs starting exactly on a window boundary are returned by both windows
+        assert [cdr.id for cdr in result] == [cdr["id"] for cdr in cdrs]
+
+    def test_export_descending(self):
+        """Test that descending exports are merged from newest to oldest."""
+        cdrs = make_cdrs(60)
+        client = make_client(cdrs)
+        exporter = CdrExporter(
+            client,
+            START,
+            START + timedelta(days=20),
+            window=timedelta(days=2),
+            page_size=4,
+            descending=True,
+        )
+        result = asyncio.run(collect(exporter))
+        assert [cdr.id for cdr in result] == [cdr["id"] for cdr in reversed(cdrs)]
+
+    def test_concurrency_is_bounded(self):
+        """Test that no more than `concurrency` requests are in flight."""
+        stats = {}
+        client = make_client(make_cdrs(100), stats=stats)
+        exporter = CdrExporter(
+            client,
+            START,
+            START + timedelta(days=30),
+            window=timedelta(days=1),
+            concurrency=3,
+            page_size=2,
+        )
+        result = asyncio.run(collect(exporter))
+        assert len(result) == 100
+        assert 1 < stats["max_in_flight"] <= 3
+
+    def test_order_by_end_datetime(self):
+        """Test that the merge follows the requested ordering field."""
+        cdrs = [
+            {
+                "id": "a",
+                "startDatetime": "2024-01-01T00:00:00+00:00",
+                "endDateTime": "2024-01-03T00:00:00+00:00",
+            },
+            {
+                "id": "b",
+                "startDatetime": "2024-01-02T01:00:00+00:00",
+                "endDateTime": "2024-01-02T02:00:00+00:00",
+            },
+        ]
+        client = make_client(cdrs)
+        exporter = CdrExporter(
+            client,
+            START,
+            START + timedelta(days=3),
+            order_by=GetAllCdrsOrderBy.ENDDATETIME,
+        )
+        result = asyncio.run(collect(exporter))
+        assert [cdr.id for cdr in result] == ["b", "a"]
+
+    def test_error_response_raises(self):
+        """Test that a failing window raises PageLoadError."""
+        client = make_client([], status_code=500)
+        exporter = CdrExporter(client, START, START + timedelta(days=3))
+        with pytest.raises(PageLoadError):
+            asyncio.run(collect(exporter))
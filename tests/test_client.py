@@ -0,0 +1,111 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+from longship_api_client.models.charging_schedule import ChargingSchedule
+
+from longship.client import Longship
+from longship.errors import ChargerResponseTimeoutError
+
+SCHEDULE = {
+    "chargingRateUnit": "W",
+    "chargingSchedulePeriod": [{"startPeriod": 0, "limit": 11000.0}],
+}
+
+
+def make_longship(handler):
+    longship = Longship("https://api.example.com", "apiKey", "ocpKey")
+    longship._client.set_async_httpx_client(
+        httpx.AsyncClient(
+            base_url="https://api.example.com", transport=httpx.MockTransport(handler)
+        )
+    )
+    return longship
+
+
+def composite_schedule_handler(answer_after):
+    """Mock the command endpoint and a message log that answers on the nth poll."""
+    polls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            return httpx.Response(
+                202,
+                headers={
+                    "location": "https://api.example.com/v1/chargepoints/CP1/messages"
+                    "?messageId=message-1"
+                },
+            )
+        polls.append(request.url.params["responseOnly"])
+        if len(polls) < answer_after:
+            return httpx.Response(200, json=[])
+        payload = [3, "message-1", {"status": "Accepted", "chargingSchedule": SCHEDULE}]
+        return httpx.Response(
+            200, json=[{"messageId": "message-1", "payload": json.dumps(payload)}]
+        )
+
+    return handler, polls
+
+
+class TestLongship:
+    def test_connection_pool_limits(self):
+        """Test that the pool configuration is passed to the HTTP client."""
+        longship = Longship(
+            "https://api.example.com",
+            "apiKey",
+            "ocpKey",
+            max_connections=10,
+            max_keepalive_connections=5,
+            keepalive_expiry=12.0,
+        )
+        limits = longship._client._httpx_args["limits"]
+        assert limits.max_connections == 10
+        assert limits.max_keepalive_connections == 5
+        assert limits.keepalive_expiry == 12.0
+        assert longship._client._httpx_args["http2"] is False
+
+    def test_async_context_manager_closes_client(self):
+        """Test that leaving `async with` closes the pooled connections."""
+
+        async def run():
+            async with Longship("https://api.example.com", "apiKey", "ocpKey") as longship:
+                http_client = longship._client.get_async_httpx_client()
+                assert not http_client.is_closed
+            return http_client
+
+        http_client = asyncio.run(run())
+        assert isinstance(http_client, httpx.AsyncClient)
+        assert http_client.is_closed
+
+    def test_aclose_only_closes_created_clients(self):
+        """Test that aclose closes the sync client and creates no async one."""
+        longship = Longship("https://api.example.com", "apiKey", "ocpKey")
+        http_client = longship._client.get_httpx_client()
+        asyncio.run(longship.aclose())
+        assert http_client.is_closed
+        assert longship._client._async_client is None
+
+    def test_headers(self):
+        """Test that the API keys are sent with every request."""
+        longship = Longship("https://api.example.com", "apiKey", "ocpKey")
+        headers = longship._client.get_async_httpx_client().headers
+        assert headers["x-api-key"] == "apiKey"
+        assert headers["Ocp-Apim-Subscription-Key"] == "ocpKey"
+
+    def test_get_composite_schedule_polls_until_reply(self):
+        """Test that the schedule is returned once the reply shows up."""
+        handler, polls = composite_schedule_handler(answer_after=2)
+        longship = make_longship(handler)
+        schedule = asyncio.run(longship.get_composite_schedule("CP1"))
+        assert isinstance(schedule, ChargingSchedule)
+        assert schedule.charging_schedule_period[0].limit == 11000.0
+        assert polls == ["true", "true"]
+        assert longship.response_latency["GetCompositeSchedule"].count == 1
+
+    def test_get_composite_schedule_timeout(self):
+        """Test that a charger that never answers raises after the deadline."""
+        handler, _ = composite_schedule_handler(answer_after=1000)
+        longship = make_longship(handler)
+        with pytest.raises(ChargerResponseTimeoutError):
+            asyncio.run(longship.get_composite_schedule("CP1", timeout=0.2))
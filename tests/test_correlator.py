@@ -0,0 +1,172 @@
+import asyncio
+import itertools
+import json
+
+import httpx
+import pytest
+from longship_api_client import Client
+from longship_api_client.api.commands import send_reset_request
+from longship_api_client.models.reset_request import ResetRequest
+
+from longship.correlator import CommandCorrelator
+from longship.errors import (
+    ChargepointNotFoundError,
+    ChargerResponseTimeoutError,
+    CommandFailedError,
+)
+
+
+class MockApi:
+    """Mock command and message log endpoints of a set of chargers."""
+
+    def __init__(self, reply=True, error=False, command_status=202):
+        self.reply = reply
+        self.error = error
+        self.command_status = command_status
+        self.message_ids = itertools.count()
+        self.sent = {}
+        self.message_log_calls = 0
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        chargepoint_id = request.url.path.split("/")[3]
+        if request.method == "POST":
+            if self.command_status != 202:
+                return httpx.Response(self.command_status, json={"message": "error"})
+            message_id = f"message-{next(self.message_ids)}"
+            self.sent.setdefault(chargepoint_id, []).append(message_id)
+            return httpx.Response(
+                202,
+                headers={
+                    "location": f"https://api.example.com/v1/chargepoints/"
+                    f"{chargepoint_id}/messages?messageId={message_id}"
+                },
+            )
+        self.message_log_calls += 1
+        assert request.url.params["responseOnly"] == "true"
+        assert "from" in request.url.params
+        messages = []
+        if self.reply:
+            for message_id in self.sent.get(chargepoint_id, []):
+                if self.error:
+                    frame = [4, message_id, "NotSupported", "Reset not supported", {}]
+                else:
+                    frame = [3, message_id, {"status": "Accepted", "id": message_id}]
+                messages.append({"messageId": message_id, "payload": json.dumps(frame)})
+        skip = int(request.url.params["skip"])
+        take = int(request.url.params["take"])
+        return httpx.Response(200, json=messages[skip : skip + take])
+
+    def client(self) -> Client:
+        return Client(
+            base_url="https://api.example.com",
+            httpx_args={"transport": httpx.MockTransport(self.handler)},
+        )
+
+
+def make_correlator(api, **kwargs):
+    options = dict(initial_delay=0.01, max_delay=0.02, page_size=20)
+    options.update(kwargs)
+    return CommandCorrelator(api.client(), **options)
+
+
+class TestCommandCorrelator:
+    def test_commands_are_batched_per_chargepoint(self):
+        """Test that concurrent commands share message log lookups."""
+        api = MockApi()
+        correlator = make_correlator(api)
+
+        async def run():
+            return await asyncio.gather(
+                *(
+                    correlator.send(send_reset_request, f"CP{i % 3}", ResetRequest())
+                    for i in range(150)
+                )
+            )
+
+        payloads = asyncio.run(run())
+        assert len(payloads) == 150
+        assert all(payload["status"] == "Accepted" for payload in payloads)
+        assert len({payload["id"] for payload in payloads}) == 150
+        # A handful of polls per chargepoint rather than one per command
+        assert correlator.message_log_calls < 20
+        assert correlator.latency["Reset"].count == 150
+
+    def test_call_error_raises(self):
+        """Test that a CALLERROR reply fails the command."""
+        correlator = make_correlator(MockApi(error=True))
+        with pytest.raises(CommandFailedError):
+            asyncio.run(correlator.send(send_reset_request, "CP1", ResetRequest()))
+
+    def test_timeout(self):
+        """Test that a charger that never answers times out."""
+        correlator = make_correlator(MockApi(reply=False), timeout=0.05)
+        with pytest.raises(ChargerResponseTimeoutError):
+            asyncio.run(correlator.send(send_reset_request, "CP1", ResetRequest()))
+        assert correlator._pending == {}
+        assert correlator._pollers == {}
+
+    def test_unknown_chargepoint(self):
+        """Test that a 404 on the command raises ChargepointNotFoundError."""
+        correlator = make_correlator(MockApi(command_status=404))
+        with pytest.raises(ChargepointNotFoundError):
+            asyncio.run(correlator.send(send_reset_request, "CP1", ResetRequest()))
+
+    def test_rejected_command(self):
+        """Test that an error status on the command raises CommandFailedError."""
+        correlator = make_correlator(MockApi(command_status=500))
+        with pytest.raises(CommandFailedError):
+            asyncio.run(correlator.send(send_reset_request, "CP1", ResetRequest()))
+
+    def test_missing_message_id(self):
+        """Test that a command accepted without a messageId raises CommandFailedError."""
+
+        def handler(request):
+            return httpx.Response(202, headers={"location": "https://api.example.com/v1/x"})
+
+        client = Client(
+            base_url="https://api.example.com",
+            httpx_args={"transport": httpx.MockTransport(handler)},
+        )
+        correlator = CommandCorrelator(client)
+        with pytest.raises(CommandFailedError):
+            asyncio.run(correlator.send(send_reset_request, "CP1", ResetRequest()))
+
+    def test_message_log_failures_are_retried(self):
+        """Test that failed message log lookups are retried at the next poll."""
+        api = MockApi()
+        handler = api.handler
+        failures = [httpx.Response(500, json={"message": "error"}), httpx.Response(429)]
+
+        def failing_handler(request: httpx.Request) -> httpx.Response:
+            if request.method == "GET" and failures:
+                return failures.pop()
+            return handler(request)
+
+        api.handler = failing_handler
+        correlator = make_correlator(api)
+        payload = asyncio.run(correlator.send(send_reset_request, "CP1", ResetRequest()))
+        assert payload["status"] == "Accepted"
+        assert correlator.message_log_errors == 2
+
+    def test_message_log_failures_until_the_deadline(self):
+        """Test that a message log failing for good times out on time."""
+        api = MockApi()
+        handler = api.handler
+
+        def failing_handler(request: httpx.Request) -> httpx.Response:
+            if request.method == "GET":
+                return httpx.Response(500, json={"message": "error"})
+            return handler(request)
+
+        api.handler = failing_handler
+        # Polls are far apart, the deadline must not wait for the next one
+        correlator = make_correlator(api, timeout=0.05, initial_delay=0.5, max_delay=5.0)
+
+        async def run():
+            started = asyncio.get_running_loop().time()
+            with pytest.raises(ChargerResponseTimeoutError):
+                await correlator.send(send_reset_request, "CP1", ResetRequest())
+            return asyncio.get_running_loop().time() - started
+
+        assert asyncio.run(run()) < 0.3
+        assert correlator.message_log_errors >= 1
@@ -0,0 +1,190 @@
+import asyncio
+import base64
+import json
+
+import httpx
+import pytest
+from longship_api_client import Client
+from longship_api_client.api.cdrs import get_file_full_download_cdrs
+
+from longship.download import FileContentsDecoder, adownload_file, download_file
+from longship.errors import DownloadError
+
+FILE = b"".join(b"cdr-%d;2024-01-01;10.5\n" % index for index in range(2000))
+
+
+def envelope(contents, escape=False):
+    encoded = base64.b64encode(contents).decode()
+    if escape:
+        # Like System.Text.Json, which escapes + and /
+        encoded = encoded.replace("+", "\\u002B").replace("/", "\\/")
+    return (
+        '{"fileContents":"%s","contentType":"text/csv",'
+        '"fileDownloadName":"cdrs.csv","enableRangeProcessing":true}' % encoded
+    ).encode()
+
+
+class InterruptedStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """A response body that breaks off with a network error after `limit` bytes."""
+
+    def __init__(self, body, limit):
+        self.body = body
+        self.limit = limit
+
+    def __iter__(self):
+        yield self.body[: self.limit]
+        if self.limit < len(self.body):
+            raise httpx.ReadError("connection reset")
+
+    async def __aiter__(self):
+        for chunk in self:
+            yield chunk
+
+
+class FileServer:
+    """Serves `body` with Range support, dropping the connection after `limit` bytes."""
+
+    def __init__(self, body, etag='"v1"', limit=None):
+        self.body = body
+        self.etag = etag
+        self.limit = limit
+        self.requests = []
+
+    def __call__(self, request):
+        self.requests.append(request)
+        start = 0
+        range_header = request.headers.get("range")
+        if range_header and request.headers.get("if-range") == self.etag:
+            start = int(range_header[len("bytes=") : -1])
+            if start >= len(self.body):
+                return httpx.Response(
+                    416, headers={"Content-Range": f"bytes */{len(self.body)}"}
+                )
+        body = self.body[start:]
+        headers = {
+            "Content-Type": "application/json; charset=utf-8",
+            "Content-Length": str(len(body)),
+            "ETag": self.etag,
+        }
+        status_code = 200
+        if start:
+            status_code = 206
+            headers["Content-Range"] = f"bytes {start}-{len(self.body) - 1}/{len(self.body)}"
+        limit = len(body) if self.limit is None else self.limit
+        return httpx.Response(
+            status_code, headers=headers, stream=InterruptedStream(body, limit)
+        )
+
+
+def make_client(server):
+    return Client(
+        base_url="https://api.example.com",
+        httpx_args={"transport": httpx.MockTransport(server)},
+    )
+
+
+class TestFileContentsDecoder:
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 4096])
+    @pytest.mark.parametrize("escape", [False, True])
+    def test_decodes_in_chunks(self, chunk_size, escape):
+        """Test that the contents are decoded whatever the chunk boundaries."""
+        contents = bytes(range(256)) * 4
+        body = envelope(contents, escape=escape)
+        decoder = FileContentsDecoder()
+        decoded = b"".join(
+            decoder.feed(body[i : i + chunk_size]) for i in range(0, len(body), chunk_size)
+        )
+        assert decoded == contents
+        assert decoder.close() == {
+            "fileContents": None,
+            "contentType": "text/csv",
+            "fileDownloadName": "cdrs.csv",
+            "enableRangeProcessing": True,
+        }
+
+    @pytest.mark.parametrize("chunk_size", [1, 5, 4096])
+    def test_whitespace_escapes(self, chunk_size):
+        """Test that escaped line breaks in wrapped base64 are skipped."""
+        contents = bytes(range(256)) * 4
+        encoded = base64.encodebytes(contents).decode().replace("\n", "\r\n")
+        body = json.dumps({"fileContents": encoded, "contentType": "text/csv"})
+        assert "\\r\\n" in body
+        decoder = FileContentsDecoder()
+        body = body.encode()
+        decoded = b"".join(
+            decoder.feed(body[i : i + chunk_size]) for i in range(0, len(body), chunk_size)
+        )
+        assert decoded == contents
+        assert decoder.close() == {"fileContents": None, "contentType": "text/csv"}
+
+    def test_incomplete(self):
+        """Test that a body ending within the contents is rejected."""
+        decoder = FileContentsDecoder()
+        decoder.feed(envelope(FILE)[:100])
+        with pytest.raises(ValueError):
+            decoder.close()
+
+
+class TestDownloadFile:
+    def test_download(self, tmp_path):
+        """Test that the decoded file is written and the temporary files removed."""
+        server = FileServer(envelope(FILE))
+        path = tmp_path / "cdrs.csv"
+        download = download_file(
+            get_file_full_download_cdrs, make_client(server), path, chunk_size=1000
+        )
+        assert path.read_bytes() == FILE
+        assert download.size == len(FILE)
+        assert download.resumes == 0
+        assert download.result.file_download_name == "cdrs.csv"
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["cdrs.csv"]
+        assert server.requests[0].headers["accept-encoding"] == "identity"
+
+    def test_resumes_interrupted_transfer(self, tmp_path):
+        """Test that a dropped connection is resumed with Range and If-Range."""
+        body = envelope(FILE)
+        server = FileServer(body, limit=len(body) // 3)
+        path = tmp_path / "cdrs.csv"
+        download = download_file(get_file_full_download_cdrs, make_client(server), path)
+        assert path.read_bytes() == FILE
+        assert download.resumes == 3
+        assert "range" not in server.requests[0].headers
+        assert server.requests[1].headers["range"] == f"bytes={len(body) // 3}-"
+        assert server.requests[1].headers["if-range"] == '"v1"'
+
+    def test_resumes_after_restart(self, tmp_path):
+        """Test that a partial download left by an earlier call is resumed."""
+        body = envelope(FILE)
+        path = tmp_path / "cdrs.csv"
+        server = FileServer(body, limit=1000)
+        with pytest.raises(httpx.ReadError):
+            download_file(
+                get_file_full_download_cdrs, make_client(server), path, max_resumes=0
+            )
+        assert (tmp_path / "cdrs.csv.part").stat().st_size == 1000
+        server.limit = None
+        download = asyncio.run(
+            adownload_file(get_file_full_download_cdrs, make_client(server), path)
+        )
+        assert path.read_bytes() == FILE
+        assert server.requests[-1].headers["range"] == "bytes=1000-"
+        assert download.resumes == 0
+
+    def test_changed_file_restarts(self, tmp_path):
+        """Test that the whole file is downloaded again if its ETag changed."""
+        path = tmp_path / "cdrs.csv"
+        server = FileServer(envelope(b"old contents"), limit=10)
+        with pytest.raises(httpx.ReadError):
+            download_file(
+                get_file_full_download_cdrs, make_client(server), path, max_resumes=0
+            )
+        server = FileServer(envelope(FILE), etag='"v2"')
+        download_file(get_file_full_download_cdrs, make_client(server), path)
+        assert path.read_bytes() == FILE
+        assert server.requests[0].headers["if-range"] == '"v1"'
+
+    def test_error_status(self, tmp_path):
+        """Test that error responses raise DownloadError."""
+        client = make_client(lambda request: httpx.Response(403, json={}))
+        with pytest.raises(DownloadError):
+            download_file(get_file_full_download_cdrs, client, tmp_path / "cdrs.csv")
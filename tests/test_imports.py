@@ -0,0 +1,53 @@
+import subprocess
+import sys
+
+import longship_api_client.api as api
+import longship_api_client.models as models
+
+# longship.client needs about 30 of the 225 model modules
+MAX_MODEL_MODULES = 50
+
+
+def imported_modules(statement):
+    """Return the modules ``python -X importtime`` reports for ``statement``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return [
+        line.rsplit("|", 1)[1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and "|" in line
+    ]
+
+
+class TestLazyImports:
+    def test_client_imports_few_models(self):
+        """Test that importing longship.client doesn't import every model."""
+        modules = imported_modules("import longship.client")
+        model_modules = [m for m in modules if m.startswith("longship_api_client.models.")]
+        assert "longship.client" in modules
+        assert 0 < len(model_modules) <= MAX_MODEL_MODULES
+
+    def test_models_package_imports_nothing(self):
+        """Test that importing the models package alone imports no model."""
+        modules = imported_modules("import longship_api_client.models")
+        assert not [m for m in modules if m.startswith("longship_api_client.models.")]
+
+    def test_all_models_resolve(self):
+        """Test that every name in models.__all__ resolves to its class."""
+        for name in models.__all__:
+            assert getattr(models, name).__name__ == name
+        assert set(models.__all__) <= set(dir(models))
+
+    def test_api_submodules_resolve(self):
+        """Test that endpoint modules resolve through attribute access."""
+        assert callable(api.sessions.get_all_sessions.sync_detailed)
+        assert "get_all_sessions" in dir(api.sessions)
+
+    def test_unknown_attribute(self):
+        """Test that unknown names still raise AttributeError."""
+        assert not hasattr(models, "NoSuchModel")
+        assert not hasattr(api, "no_such_tag")
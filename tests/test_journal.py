@@ -0,0 +1,159 @@
+import asyncio
+import datetime
+import json
+import threading
+from pathlib import Path
+
+import httpx
+
+from longship.journal import WebhookJournal
+from longship.types import OperationalStatusChangedData, WebhookPayloadType
+from longship.webhook_receiver import WebhookReceiver
+
+FIXTURES = Path(__file__).parent.parent / "fixtures"
+
+
+def body(event_id, payload_type="OperationalStatusChanged", subject="CP1", minute=0):
+    payload = json.loads((FIXTURES / "OperationalStatusChanged.json").read_text())
+    payload.update(
+        id=event_id,
+        type=payload_type,
+        subject=subject,
+        time=f"2024-01-01T00:{minute:02d}:00.1234567Z",
+    )
+    return json.dumps(payload).encode()
+
+
+def at(minute):
+    return datetime.datetime(2024, 1, 1, 0, minute, tzinfo=datetime.timezone.utc)
+
+
+class TestWebhookJournal:
+    def test_append_and_replay(self, tmp_path):
+        """Test that webhooks are replayed in order with their index fields."""
+        with WebhookJournal(tmp_path) as journal:
+            bodies = [body(f"e{i}", minute=i) for i in range(3)]
+            assert [journal.append(b) for b in bodies] == [0, 1, 2]
+            entries = list(journal.replay())
+        assert [entry.body for entry in entries] == bodies
+        assert entries[1].id == "e1"
+        assert entries[1].subject == "CP1"
+        assert entries[1].type == "OperationalStatusChanged"
+        assert entries[1].time == at(1).replace(microsecond=123456)
+        assert isinstance(entries[1].payload.data, OperationalStatusChangedData)
+
+    def test_filters(self, tmp_path):
+        """Test replay by sequence number, type, subject and time range."""
+        with WebhookJournal(tmp_path) as journal:
+            journal.append(body("a", minute=1))
+            journal.append(body("b", "ConnectivityStatusChanged", minute=2))
+            journal.append(body("c", subject="CP2", minute=3))
+            journal.append(body("d", minute=4))
+
+            def ids(**filters):
+                return [entry.id for entry in journal.replay(**filters)]
+
+            assert ids(start=2) == ["c", "d"]
+            assert ids(types=[WebhookPayloadType.ConnectivityStatusChanged]) == ["b"]
+            assert ids(subject="CP2") == ["c"]
+            assert ids(since=at(2), until=at(4)) == ["b", "c"]
+            assert ids(since=at(5)) == []
+
+    def test_reopen(self, tmp_path):
+        """Test that a reopened journal continues the sequence of the old one."""
+        with WebhookJournal(tmp_path, segment_size=1) as journal:
+            for i in range(3):
+                journal.append(body(f"e{i}"))
+        with WebhookJournal(tmp_path, segment_size=1) as journal:
+            assert journal.append(body("e3")) == 3
+            assert [entry.seq for entry in journal.replay(start=1)] == [1, 2, 3]
+            assert len(journal) == 4
+
+    def test_recovers_torn_append(self, tmp_path):
+        """Test that an append cut off by a crash is dropped on open."""
+        with WebhookJournal(tmp_path) as journal:
+            journal.append(body("e0"))
+            journal.append(body("e1"))
+        (index,) = tmp_path.glob("*.idx")
+        (log,) = tmp_path.glob("*.log")
+        index.write_bytes(index.read_bytes()[:-3])
+        with open(log, "ab") as file:
+            file.write(b'{"partial')
+        with WebhookJournal(tmp_path) as journal:
+            assert [entry.id for entry in journal.replay()] == ["e0"]
+            assert journal.append(body("e2")) == 1
+            assert [entry.id for entry in journal.replay()] == ["e0", "e2"]
+
+    def test_rotation_and_size_retention(self, tmp_path):
+        """Test that segments rotate and the oldest are dropped beyond max_bytes."""
+        size = len(body("e0"))
+        with WebhookJournal(tmp_path, segment_size=2 * size, max_bytes=5 * size) as journal:
+            for i in range(10):
+                journal.append(body(f"e{i}"))
+            assert journal.size <= 5 * size + journal.segment_size
+            seqs = [entry.seq for entry in journal.replay()]
+        assert seqs[-1] == 9
+        assert seqs[0] > 0
+        assert len(list(tmp_path.glob("*.log"))) == len(list(tmp_path.glob("*.idx")))
+
+    def test_age_retention(self, tmp_path):
+        """Test that segments whose newest webhook is older than max_age are dropped."""
+        now = [at(0)]
+        journal = WebhookJournal(
+            tmp_path, segment_size=1, max_age=datetime.timedelta(minutes=10), clock=lambda: now[0]
+        )
+        with journal:
+            for minute in (1, 15, 25, 29):
+                journal.append(body(f"m{minute}", minute=minute))
+            now[0] = at(30)
+            assert journal.apply_retention() == 2
+            assert [entry.id for entry in journal.replay()] == ["m25", "m29"]
+            # The segment appended to is kept, however old
+            now[0] = at(59)
+            journal.apply_retention()
+            assert [entry.id for entry in journal.replay()] == ["m29"]
+
+
+    def test_retention_on_open_and_append(self, tmp_path):
+        """Test that expired segments are dropped without waiting for a rotation."""
+        now = [at(0)]
+        options = dict(segment_size=1, max_age=datetime.timedelta(minutes=10), clock=lambda: now[0])
+        with WebhookJournal(tmp_path, **options) as journal:
+            for minute in (1, 2, 3):
+                journal.append(body(f"m{minute}", minute=minute))
+        now[0] = at(12)
+        with WebhookJournal(tmp_path, **options) as journal:
+            assert [entry.id for entry in journal.replay()] == ["m2", "m3"]
+            journal.segment_size = 1 << 20
+            journal.append(body("m4", minute=4))
+            now[0] = at(14)
+            journal.append(body("m5", minute=5))
+            assert [entry.id for entry in journal.replay()] == ["m3", "m4", "m5"]
+
+
+class TestReceiverJournal:
+    def test_accepted_webhooks_are_journaled(self, tmp_path):
+        """Test that the receiver journals what it acknowledges."""
+        journal = WebhookJournal(tmp_path)
+        receiver = WebhookReceiver(journal=journal)
+        append = journal.append
+        threads = []
+
+        def recording_append(*args):
+            threads.append(threading.current_thread())
+            return append(*args)
+
+        journal.append = recording_append
+
+        async def main():
+            transport = httpx.ASGITransport(app=receiver)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                await client.post("/", content=body("e0"))
+                await client.post("/", content=b"not json")
+            await receiver.stop()
+
+        asyncio.run(main())
+        assert [entry.id for entry in journal.replay()] == ["e0"]
+        # Appended off the event loop
+        assert threads and threading.main_thread() not in threads
+        journal.close()
@@ -0,0 +1,103 @@
+import json
+
+import httpx
+import pytest
+from longship_api_client import Client
+from longship_api_client.api.commands import send_reset_request
+from longship_api_client.api.sessions import get_all_sessions
+from longship_api_client.json_codec import (
+    JsonCodec,
+    MsgspecCodec,
+    OrjsonCodec,
+    default_json_codec,
+)
+from longship_api_client.models.reset_request import ResetRequest
+from longship_api_client.models.reset_request_type import ResetRequestType
+
+
+class RecordingCodec(JsonCodec):
+    """Standard library codec that counts its calls."""
+
+    def __init__(self):
+        self.loads_calls = 0
+        self.dumps_calls = 0
+
+    def loads(self, content):
+        self.loads_calls += 1
+        return super().loads(content)
+
+    def dumps(self, obj):
+        self.dumps_calls += 1
+        return super().dumps(obj)
+
+
+class TestJsonCodec:
+    def test_round_trip(self):
+        """Test that the standard library codec encodes compact UTF-8."""
+        codec = JsonCodec()
+        encoded = codec.dumps({"city": "Zürich", "kwh": [1.5, 2]})
+        assert encoded == '{"city":"Zürich","kwh":[1.5,2]}'.encode()
+        assert codec.loads(encoded) == {"city": "Zürich", "kwh": [1.5, 2]}
+
+    def test_encode_body(self):
+        """Test that the json request argument is replaced by its content."""
+        kwargs = JsonCodec().encode_body({"method": "post", "json": {"type": "Soft"}})
+        assert kwargs == {"method": "post", "content": b'{"type":"Soft"}'}
+        assert JsonCodec().encode_body({"method": "get"}) == {"method": "get"}
+
+    def test_orjson(self):
+        """Test that orjson is preferred when it is installed."""
+        pytest.importorskip("orjson")
+        codec = OrjsonCodec()
+        assert codec.loads(codec.dumps({"a": [1, 2]})) == {"a": [1, 2]}
+        assert isinstance(default_json_codec(), OrjsonCodec)
+
+
+    @pytest.mark.parametrize("codec_class", [JsonCodec, OrjsonCodec, MsgspecCodec])
+    def test_invalid_json(self, codec_class):
+        """Test that every codec raises ValueError for malformed JSON."""
+        try:
+            codec = codec_class()
+        except ImportError:
+            pytest.skip(f"{codec_class.name} is not installed")
+        for content in (b'{"type": ', b"not json", '{"a": 1,}'):
+            with pytest.raises(ValueError):
+                codec.loads(content)
+
+class TestClientCodec:
+    def test_responses_decoded_with_codec(self):
+        """Test that endpoints decode responses with the client's codec."""
+        codec = RecordingCodec()
+        client = Client(
+            base_url="https://api.example.com",
+            json_codec=codec,
+            httpx_args={
+                "transport": httpx.MockTransport(
+                    lambda request: httpx.Response(200, json=[{"id": "session-1"}])
+                )
+            },
+        )
+        sessions = get_all_sessions.sync(client=client)
+        assert [session.id for session in sessions] == ["session-1"]
+        assert codec.loads_calls == 1
+
+    def test_bodies_encoded_with_codec(self):
+        """Test that request bodies are encoded with the client's codec."""
+        codec = RecordingCodec()
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(202)
+
+        client = Client(
+            base_url="https://api.example.com",
+            json_codec=codec,
+            httpx_args={"transport": httpx.MockTransport(handler)},
+        )
+        send_reset_request.sync_detailed(
+            "CP1", client=client, body=ResetRequest(type=ResetRequestType.SOFT)
+        )
+        assert codec.dumps_calls == 1
+        assert json.loads(requests[0].content) == {"type": "Soft"}
+        assert requests[0].headers["Content-Type"] == "application/json"
@@ -0,0 +1,153 @@
+import json
+import pickle
+
+import attrs
+import httpx
+import pytest
+from longship_api_client import Client, json_keys
+from longship_api_client.api.locations import get_all_locations
+from longship_api_client.api.sessions import get_all_sessions
+from longship_api_client.lazy_models import lazy_model
+from longship_api_client.models.charging_meter_value_dto import ChargingMeterValueDto
+from longship_api_client.models.location_dto import LocationDto
+from longship_api_client.models.session_dto import SessionDto
+
+SESSION = {
+    "id": "session-1",
+    "chargePointId": "CP1",
+    "totalEnergyInKwh": 12.5,
+    "sessionStart": "2024-01-01T00:00:00Z",
+    "sessionLocation": {"id": "location-1", "city": "Utrecht"},
+    "chargingMeterValues": [
+        {"timestamp": "2024-01-01T00:00:00Z", "value": "0", "unit": "Wh"},
+        {"timestamp": "2024-01-01T01:00:00Z", "value": "12500", "unit": "Wh"},
+    ],
+}
+
+LOCATION = {
+    "id": "location-1",
+    "country_code": "NL",
+    "party_id": "ABC",
+    "publish": True,
+    "street": "Stationsplein 1",
+    "city": "Amsterdam",
+    "country": "NLD",
+    "coordinates": {"latitude": "52.37", "longitude": "4.90"},
+    "time_zone": "Europe/Amsterdam",
+    "last_updated": "2024-01-01T00:00:00Z",
+    "evses": [{"uid": "evse-1", "status": "AVAILABLE"}],
+}
+
+
+class TestLazyModel:
+    def test_nested_fields_decoded_on_access(self):
+        """Test that nested objects and lists stay raw until they are read."""
+        session = lazy_model(SessionDto).from_dict(SESSION)
+        assert isinstance(session, SessionDto)
+        assert session.id == "session-1"
+        assert session.total_energy_in_kwh == 12.5
+        assert set(session._raw) == {"session_location", "charging_meter_values"}
+        meter_values = session.charging_meter_values
+        assert isinstance(meter_values[1], ChargingMeterValueDto)
+        assert meter_values[1].value == "12500"
+        assert session.charging_meter_values is meter_values
+        assert set(session._raw) == {"session_location"}
+
+    def test_matches_eager_decoding(self):
+        """Test that a lazy model equals and serializes like the eager one."""
+        eager = SessionDto.from_dict(SESSION)
+        assert lazy_model(SessionDto).from_dict(SESSION) == eager
+        assert eager == lazy_model(SessionDto).from_dict(SESSION)
+        assert lazy_model(SessionDto).from_dict(SESSION).to_dict() == eager.to_dict()
+        restored = pickle.loads(pickle.dumps(lazy_model(SessionDto).from_dict(SESSION)))
+        assert type(restored) is lazy_model(SessionDto)
+        assert restored == eager
+
+    def test_assignment_replaces_raw_value(self):
+        """Test that setting a nested field discards its undecoded value."""
+        session = lazy_model(SessionDto).from_dict(SESSION)
+        session.charging_meter_values = []
+        assert session.charging_meter_values == []
+        assert "charging_meter_values" not in session._raw
+
+    def test_unknown_keys(self):
+        """Test that nested values of unknown keys end up in additional_properties."""
+        session = lazy_model(SessionDto).from_dict({**SESSION, "tags": ["fleet"]})
+        assert session["tags"] == ["fleet"]
+        assert session.to_dict()["tags"] == ["fleet"]
+
+    def test_null_nested_value(self):
+        """Test that null nested values decode like the eager model does."""
+        without_location = lazy_model(SessionDto).from_dict(
+            {**SESSION, "sessionLocation": None}
+        )
+        assert without_location == SessionDto.from_dict({**SESSION, "sessionLocation": None})
+        session = lazy_model(SessionDto).from_dict(SESSION)
+        assert session.session_location.city == "Utrecht"
+
+    def test_empty_nested_value(self):
+        """Test that an empty list doesn't keep later values of its key from being lazy."""
+        empty = lazy_model(SessionDto).from_dict({**SESSION, "chargingPeriods": []})
+        assert empty.charging_periods == []
+        periods = [{"startDateTime": "2024-01-01T00:00:00Z", "dimensions": []}]
+        session = lazy_model(SessionDto).from_dict({**SESSION, "chargingPeriods": periods})
+        assert "charging_periods" in session._raw
+        assert session == SessionDto.from_dict({**SESSION, "chargingPeriods": periods})
+
+    def test_required_keys(self):
+        """Test models with required keys, whose required nested fields stay eager."""
+        location = lazy_model(LocationDto).from_dict(LOCATION)
+        assert set(location._raw) == {"evses"}
+        assert location.coordinates.latitude == "52.37"
+        assert location == LocationDto.from_dict(LOCATION)
+        assert location.to_dict() == LocationDto.from_dict(LOCATION).to_dict()
+
+
+    def test_unknown_json_keys(self):
+        """Test that a model missing from the key table is rejected, not decoded eagerly."""
+
+        @attrs.define
+        class UnknownDto:
+            location: LocationDto = attrs.field(default=None)
+
+            @classmethod
+            def from_dict(cls, src_dict):
+                return cls()
+
+        with pytest.raises(ValueError, match="UnknownDto.location"):
+            lazy_model(UnknownDto)
+
+    def test_json_keys_are_up_to_date(self):
+        """Test that the key table matches the to_dict of the generated models."""
+        assert json_keys._generate() == json_keys.JSON_KEYS
+
+
+class TestClientLazyModels:
+    def test_list_endpoint(self):
+        """Test that list endpoints return lazy models when enabled."""
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, content=json.dumps([SESSION]))
+        )
+        for lazy in (False, True):
+            client = Client(
+                base_url="https://api.example.com",
+                lazy_models=lazy,
+                httpx_args={"transport": transport},
+            )
+            (session,) = get_all_sessions.sync(client=client)
+            assert (type(session) is lazy_model(SessionDto)) is lazy
+            assert session == SessionDto.from_dict(SESSION)
+
+    def test_list_endpoint_with_required_keys(self):
+        """Test that lazy list endpoints decode models with required keys."""
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, content=json.dumps([LOCATION]))
+        )
+        client = Client(
+            base_url="https://api.example.com",
+            lazy_models=True,
+            httpx_args={"transport": transport},
+        )
+        (location,) = get_all_locations.sync(client=client)
+        assert type(location) is lazy_model(LocationDto)
+        assert location.evses[0].uid == "evse-1"
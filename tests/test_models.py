@@ -0,0 +1,62 @@
+import pytest
+from longship_api_client.models.charging_meter_value_dto import ChargingMeterValueDto
+
+METER_VALUE = {
+    "timestamp": "2024-01-01T00:00:00+00:00",
+    "value": "1000",
+    "measurand": "Energy.Active.Import.Register",
+    "unit": "Wh",
+}
+
+
+class TestAdditionalProperties:
+    def test_no_extra_keys_no_dict(self):
+        """Test that models without extra keys don't get a dict until accessed."""
+        meter_value = ChargingMeterValueDto.from_dict(METER_VALUE)
+        assert meter_value._additional_properties is None
+        assert meter_value.additional_keys == []
+        assert "phase" not in meter_value
+        assert meter_value.to_dict() == METER_VALUE
+        assert meter_value._additional_properties is None
+
+    def test_extra_keys_are_kept(self):
+        """Test that unknown keys still end up in additional_properties."""
+        meter_value = ChargingMeterValueDto.from_dict({**METER_VALUE, "phase": "L1"})
+        assert meter_value.additional_properties == {"phase": "L1"}
+        assert meter_value["phase"] == "L1"
+        assert meter_value.to_dict() == {**METER_VALUE, "phase": "L1"}
+
+    def test_setitem_gives_model_own_dict(self):
+        """Test that setting a key doesn't leak into other models."""
+        first = ChargingMeterValueDto.from_dict(METER_VALUE)
+        second = ChargingMeterValueDto.from_dict(METER_VALUE)
+        first["phase"] = "L1"
+        assert first.additional_properties == {"phase": "L1"}
+        assert second.additional_properties == {}
+        del first["phase"]
+        assert "phase" not in first
+
+    def test_additional_properties_is_writable(self):
+        """Test that the dict of a model can be written to directly."""
+        first = ChargingMeterValueDto.from_dict(METER_VALUE)
+        second = ChargingMeterValueDto.from_dict(METER_VALUE)
+        first.additional_properties["phase"] = "L1"
+        second.additional_properties.update(phase="L2")
+        assert first["phase"] == "L1"
+        assert second["phase"] == "L2"
+        assert first.to_dict() == {**METER_VALUE, "phase": "L1"}
+        with pytest.raises(KeyError):
+            del first["location"]
+
+    def test_equality(self):
+        """Test that parsed and constructed models still compare equal."""
+        parsed = ChargingMeterValueDto.from_dict(METER_VALUE)
+        constructed = ChargingMeterValueDto(
+            timestamp=parsed.timestamp,
+            value=parsed.value,
+            measurand=parsed.measurand,
+            unit=parsed.unit,
+        )
+        assert parsed == constructed
+        constructed.additional_properties = {}
+        assert parsed == constructed
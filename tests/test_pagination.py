@@ -0,0 +1,158 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+from longship_api_client import Client
+from longship_api_client.api.sessions import get_all_sessions
+from longship_api_client.models.session_dto import SessionDto
+
+from longship.errors import PageLoadError
+from longship.pagination import Paginator
+
+
+def make_client(total, status_code=200, requests=None):
+    """Create a client backed by a mock sessions endpoint holding `total` items."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        skip = int(request.url.params.get("skip", 0))
+        take = int(request.url.params.get("take", 100))
+        if requests is not None:
+            requests.append((skip, take))
+        if status_code != 200:
+            return httpx.Response(status_code, json={"message": "error"})
+        items = [{"id": f"session-{i}"} for i in range(skip, min(skip + take, total))]
+        return httpx.Response(200, json=items)
+
+    return Client(
+        base_url="https://api.example.com",
+        httpx_args={"transport": httpx.MockTransport(handler)},
+    )
+
+
+async def collect(paginator):
+    return [item async for item in paginator]
+
+
+class TestPaginator:
+    def test_async_iterates_all_pages(self):
+        """Test that async iteration yields every item in order."""
+        client = make_client(25)
+        items = asyncio.run(collect(Paginator(get_all_sessions, client, page_size=10)))
+        assert [item.id for item in items] == [f"session-{i}" for i in range(25)]
+        assert all(isinstance(item, SessionDto) for item in items)
+
+    def test_sync_iterates_all_pages(self):
+        """Test that sync iteration yields every item in order."""
+        client = make_client(25)
+        items = list(Paginator(get_all_sessions, client, page_size=10))
+        assert [item.id for item in items] == [f"session-{i}" for i in range(25)]
+
+    def test_exact_multiple_of_page_size(self):
+        """Test that a trailing empty page ends iteration."""
+        client = make_client(20)
+        items = asyncio.run(collect(Paginator(get_all_sessions, client, page_size=10)))
+        assert len(items) == 20
+
+    def test_empty_result(self):
+        """Test that an empty endpoint yields nothing."""
+        client = make_client(0)
+        assert list(Paginator(get_all_sessions, client, page_size=10)) == []
+
+    def test_prefetch_is_bounded(self):
+        """Test that no more than max_in_flight pages are requested past the end."""
+        requests = []
+        client = make_client(5, requests=requests)
+        paginator = Paginator(get_all_sessions, client, page_size=10, max_in_flight=3)
+        items = asyncio.run(collect(paginator))
+        assert len(items) == 5
+        assert requests[0] == (0, 10)
+        assert len(requests) <= 3
+
+    def test_pages_are_fetched_concurrently(self):
+        """Test that the next pages are in flight while the current one is handled."""
+        in_flight = 0
+        max_seen = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, max_seen
+            in_flight += 1
+            max_seen = max(max_seen, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            skip = int(request.url.params["skip"])
+            take = int(request.url.params["take"])
+            items = [{"id": str(i)} for i in range(skip, min(skip + take, 100))]
+            return httpx.Response(200, json=items)
+
+        async def run():
+            client = Client(base_url="https://api.example.com").set_async_httpx_client(
+                httpx.AsyncClient(
+                    base_url="https://api.example.com",
+                    transport=httpx.MockTransport(handler),
+                )
+            )
+            paginator = Paginator(
+                get_all_sessions, client, page_size=10, max_in_flight=4
+            )
+            return await collect(paginator)
+
+        items = asyncio.run(run())
+        assert len(items) == 100
+        assert 1 < max_seen <= 4
+
+    def test_one_sync_client_for_concurrent_pages(self, monkeypatch):
+        """Test that threads iterating pages at once share one sync HTTP client."""
+        created = []
+
+        class SlowClient(httpx.Client):
+            def __init__(self, *args, **kwargs):
+                time.sleep(0.05)
+                super().__init__(*args, **kwargs)
+                created.append(self)
+
+        monkeypatch.setattr(httpx, "Client", SlowClient)
+        paginator = Paginator(get_all_sessions, make_client(25), page_size=10)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(len(list(paginator))))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert results == [25] * 4
+        assert len(created) == 1
+
+    def test_filters_are_forwarded(self):
+        """Test that extra keyword arguments are sent as query parameters."""
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.url.params.get("chargepointId"))
+            return httpx.Response(200, json=[])
+
+        client = Client(
+            base_url="https://api.example.com",
+            httpx_args={"transport": httpx.MockTransport(handler)},
+        )
+        list(Paginator(get_all_sessions, client, chargepoint_id="CP1"))
+        assert seen and all(value == "CP1" for value in seen)
+
+    def test_error_response_raises(self):
+        """Test that a non-list response raises PageLoadError."""
+        client = make_client(10, status_code=500)
+        with pytest.raises(PageLoadError):
+            asyncio.run(collect(Paginator(get_all_sessions, client)))
+        with pytest.raises(PageLoadError):
+            list(Paginator(get_all_sessions, client))
+
+    def test_invalid_arguments(self):
+        """Test that page_size and max_in_flight are validated."""
+        client = make_client(0)
+        with pytest.raises(ValueError):
+            Paginator(get_all_sessions, client, page_size=0)
+        with pytest.raises(ValueError):
+            Paginator(get_all_sessions, client, max_in_flight=0)
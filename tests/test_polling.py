@@ -0,0 +1,43 @@
+import pytest
+
+from longship.polling import Backoff, LatencyHistogram
+
+
+class TestBackoff:
+    def test_backoff_grows_to_max_delay(self):
+        """Test that delays grow exponentially and are capped."""
+        backoff = Backoff(initial_delay=0.1, max_delay=1.0, multiplier=2.0, jitter=0)
+        delays = [backoff.next_delay() for _ in range(6)]
+        assert delays == pytest.approx([0.1, 0.2, 0.4, 0.8, 1.0, 1.0])
+        backoff.reset()
+        assert backoff.next_delay() == pytest.approx(0.1)
+
+    def test_jitter_stays_within_bounds(self):
+        """Test that jitter randomises delays within the configured fraction."""
+        backoff = Backoff(initial_delay=1.0, max_delay=1.0, jitter=0.2)
+        delays = [backoff.next_delay() for _ in range(50)]
+        assert all(0.8 <= delay <= 1.2 for delay in delays)
+        assert len(set(delays)) > 1
+
+
+class TestLatencyHistogram:
+    def test_observe(self):
+        """Test that observations are counted in cumulative buckets."""
+        histogram = LatencyHistogram(buckets=(0.5, 1.0, 5.0))
+        for seconds in (0.1, 0.5, 0.7, 3.0, 10.0):
+            histogram.observe(seconds)
+        assert histogram.snapshot() == {0.5: 2, 1.0: 3, 5.0: 4}
+        assert histogram.count == 5
+        assert histogram.sum == pytest.approx(14.3)
+
+    def test_quantile(self):
+        """Test that quantiles resolve to bucket upper bounds."""
+        histogram = LatencyHistogram(buckets=(0.5, 1.0, 5.0))
+        assert histogram.quantile(0.5) is None
+        for seconds in (0.1, 0.2, 0.7, 3.0):
+            histogram.observe(seconds)
+        assert histogram.quantile(0.5) == 0.5
+        assert histogram.quantile(0.75) == 1.0
+        assert histogram.quantile(1.0) == 5.0
+        histogram.observe(10.0)
+        assert histogram.quantile(1.0) == float("inf")
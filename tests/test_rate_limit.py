@@ -0,0 +1,205 @@
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpx
+import pytest
+from longship_api_client import AuthenticatedClient, Client
+from longship_api_client.api.sessions import get_all_sessions
+from longship_api_client.rate_limit import (
+    RateLimitedTransport,
+    RateLimiter,
+    TokenBucket,
+    _environment_proxies,
+    endpoint_group,
+    parse_retry_after,
+)
+
+
+class Throttling:
+    """Mock API answering the first ``rejections`` requests with a 429."""
+
+    def __init__(self, rejections=0, retry_after="0"):
+        self.rejections = rejections
+        self.retry_after = retry_after
+        self.requests = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append((time.monotonic(), request))
+        if len(self.requests) <= self.rejections:
+            headers = {"Retry-After": self.retry_after} if self.retry_after else {}
+            return httpx.Response(429, headers=headers)
+        return httpx.Response(200, json=[])
+
+
+def make_client(api, limiter, client_class=Client, **kwargs):
+    return client_class(
+        base_url="https://api.example.com",
+        httpx_args={"transport": httpx.MockTransport(api.handler)},
+        rate_limiter=limiter,
+        **kwargs,
+    )
+
+
+class TestTokenBucket:
+    def test_burst_then_rate(self):
+        """Test that a full bucket serves a burst and then paces requests."""
+        bucket = TokenBucket(rate=10, capacity=2)
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+        assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+    def test_pause(self):
+        """Test that a paused bucket holds back requests even with tokens left."""
+        bucket = TokenBucket(rate=10, capacity=10)
+        bucket.pause(1.0)
+        assert bucket.reserve() == pytest.approx(1.0, abs=0.01)
+
+
+class TestHelpers:
+    def test_endpoint_group(self):
+        """Test that requests are grouped by the resource after the version."""
+        request = httpx.Request("GET", "https://api.example.com/v1/chargepoints/CP1")
+        assert endpoint_group(request) == "chargepoints"
+        request = httpx.Request("GET", "https://api.example.com/sessions")
+        assert endpoint_group(request) == "sessions"
+
+    def test_parse_retry_after(self):
+        """Test that Retry-After is parsed as seconds or an HTTP date."""
+        assert parse_retry_after("3") == 3.0
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+        later = datetime.now(timezone.utc) + timedelta(seconds=60)
+        assert parse_retry_after(format_datetime(later, usegmt=True)) == pytest.approx(
+            60, abs=2
+        )
+
+
+class TestRateLimiter:
+    def test_retries_after_429(self):
+        """Test that a 429 is retried after its Retry-After."""
+        api = Throttling(rejections=2, retry_after="0.05")
+        limiter = RateLimiter(rate=1000, jitter=0)
+        response = get_all_sessions.sync_detailed(client=make_client(api, limiter))
+        assert response.status_code == 200
+        assert response.parsed == []
+        assert len(api.requests) == 3
+        assert api.requests[1][0] - api.requests[0][0] >= 0.05
+        assert limiter.retries == 2
+
+    def test_gives_up_after_max_retries(self):
+        """Test that the 429 is returned once the retries are used up."""
+        api = Throttling(rejections=10, retry_after=None)
+        limiter = RateLimiter(rate=1000, max_retries=2, backoff=0.01, jitter=0)
+        response = get_all_sessions.sync_detailed(client=make_client(api, limiter))
+        assert response.status_code == 429
+        assert len(api.requests) == 3
+
+    def test_async_client_retries(self):
+        """Test that the async client goes through the same limiter."""
+        api = Throttling(rejections=1)
+        limiter = RateLimiter(rate=1000, jitter=0)
+        client = make_client(api, limiter)
+        response = asyncio.run(get_all_sessions.asyncio_detailed(client=client))
+        assert response.status_code == 200
+        assert limiter.retries == 1
+
+    def test_requests_are_paced(self):
+        """Test that requests beyond the burst are spread out at the rate."""
+        api = Throttling()
+        limiter = RateLimiter(rate=50, burst=1)
+        client = make_client(api, limiter)
+
+        async def run():
+            await asyncio.gather(
+                *(get_all_sessions.asyncio_detailed(client=client) for _ in range(6))
+            )
+
+        asyncio.run(run())
+        times = [sent for sent, _ in api.requests]
+        assert times[-1] - times[0] >= 0.09
+
+    def test_groups_have_own_buckets(self):
+        """Test that a slow endpoint group doesn't hold back the others."""
+        limiter = RateLimiter(rate=1000, group_rates={"sessions": 1})
+        sessions = httpx.Request("GET", "https://api.example.com/v1/sessions")
+        cdrs = httpx.Request("GET", "https://api.example.com/v1/cdrs")
+        assert limiter.acquire(sessions) == 0
+        assert limiter.acquire(sessions) > 0.5
+        assert limiter.acquire(cdrs) == 0
+
+    def test_authenticated_client(self):
+        """Test that AuthenticatedClient wraps its transport too."""
+        api = Throttling(rejections=1)
+        limiter = RateLimiter(rate=1000, jitter=0)
+        client = make_client(api, limiter, AuthenticatedClient, token="secret")
+        assert isinstance(client.get_httpx_client()._transport, RateLimitedTransport)
+        response = get_all_sessions.sync_detailed(client=client)
+        assert response.status_code == 200
+        assert api.requests[-1][1].headers["Authorization"] == "Bearer secret"
+
+    def test_default_transport_keeps_pool_limits(self):
+        """Test that the wrapped default transport keeps the configured limits."""
+        limits = httpx.Limits(max_connections=7, max_keepalive_connections=3)
+        client = Client(
+            base_url="https://api.example.com",
+            httpx_args={"limits": limits},
+            rate_limiter=RateLimiter(),
+        )
+        transport = client.get_httpx_client()._transport
+        assert isinstance(transport, RateLimitedTransport)
+        assert transport._transport._pool._max_connections == 7
+
+    def test_mounts_are_rate_limited(self):
+        """Test that requests through a mounted transport go through the limiter."""
+        api = Throttling(rejections=1)
+        limiter = RateLimiter(rate=1000, jitter=0)
+        client = Client(
+            base_url="https://api.example.com",
+            httpx_args={"mounts": {"https://api.example.com": httpx.MockTransport(api.handler)}},
+            rate_limiter=limiter,
+        )
+        response = get_all_sessions.sync_detailed(client=client)
+        assert response.status_code == 200
+        assert limiter.retries == 1
+
+    def test_proxies_are_kept(self):
+        """Test that configured proxies are mounted behind the limiter."""
+        client = Client(
+            base_url="https://api.example.com",
+            httpx_args={"proxies": "http://proxy.example.com:3128"},
+            rate_limiter=RateLimiter(),
+        )
+        mounts = list(client.get_httpx_client()._mounts.values())
+        assert len(mounts) == 1
+        assert isinstance(mounts[0], RateLimitedTransport)
+        assert mounts[0]._transport._pool._proxy_url.host == b"proxy.example.com"
+
+    def test_environment_proxies_are_kept(self, monkeypatch):
+        """Test that proxies from the environment are mounted behind the limiter."""
+        monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example.com:3128")
+        client = Client(base_url="https://api.example.com", rate_limiter=RateLimiter())
+        mounts = list(client.get_httpx_client()._mounts.values())
+        assert [type(mount) for mount in mounts] == [RateLimitedTransport]
+        untrusted = Client(
+            base_url="https://api.example.com",
+            httpx_args={"trust_env": False},
+            rate_limiter=RateLimiter(),
+        )
+        assert untrusted.get_httpx_client()._mounts == {}
+
+    def test_no_proxy_hosts_are_sent_directly(self, monkeypatch):
+        """Test that NO_PROXY hosts are mounted without a proxy."""
+        monkeypatch.setenv("HTTPS_PROXY", "proxy.example.com:3128")
+        monkeypatch.setenv("NO_PROXY", "localhost, 10.0.0.1, ::1, .internal")
+        assert _environment_proxies() == {
+            "https://": "http://proxy.example.com:3128",
+            "all://localhost": None,
+            "all://10.0.0.1": None,
+            "all://[::1]": None,
+            "all://*.internal": None,
+        }
+        monkeypatch.setenv("NO_PROXY", "*")
+        assert _environment_proxies() == {}
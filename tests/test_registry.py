@@ -0,0 +1,105 @@
+import asyncio
+
+import pytest
+
+from longship.client import Longship
+from longship.registry import LongshipRegistry
+
+URL = "https://api.example.com"
+
+
+class TestLongshipRegistry:
+    def test_clients_are_independent(self):
+        """Test that each tenant gets its own client and connection pool."""
+
+        async def run():
+            async with LongshipRegistry() as registry:
+                first = registry.get(URL, "tenant-1", "ocp")
+                second = registry.get(URL, "tenant-2", "ocp")
+                assert first is not second
+                assert first._client is not second._client
+                assert registry.get(URL, "tenant-1", "ocp") is first
+                assert len(registry) == 2
+
+        asyncio.run(run())
+
+    def test_longship_is_not_a_singleton(self):
+        """Test that creating a second client keeps the first one intact."""
+        first = Longship(URL, "tenant-1", "ocp")
+        second = Longship(URL, "tenant-2", "ocp")
+        assert first is not second
+        assert first._client.get_async_httpx_client().headers["x-api-key"] == "tenant-1"
+
+    def test_lru_eviction_closes_client(self):
+        """Test that the least recently used tenant is evicted and closed."""
+
+        async def run():
+            async with LongshipRegistry(max_size=2) as registry:
+                first = registry.get(URL, "tenant-1", "ocp")
+                http_client = first._client.get_async_httpx_client()
+                registry.get(URL, "tenant-2", "ocp")
+                registry.get(URL, "tenant-1", "ocp")
+                registry.get(URL, "tenant-3", "ocp")
+                assert (URL, "tenant-1") in registry
+                assert (URL, "tenant-2") not in registry
+                assert len(registry) == 2
+                registry.get(URL, "tenant-4", "ocp")
+                assert (URL, "tenant-1") not in registry
+                await asyncio.sleep(0)
+                assert http_client.is_closed
+            return http_client
+
+        assert asyncio.run(run()).is_closed
+
+    def test_leased_client_is_closed_on_release(self):
+        """Test that an evicted client is kept open until its lease is released."""
+
+        async def run():
+            async with LongshipRegistry(max_size=1) as registry:
+                async with registry.lease(URL, "tenant-1", "ocp") as first:
+                    http_client = first._client.get_async_httpx_client()
+                    registry.get(URL, "tenant-2", "ocp")
+                    assert (URL, "tenant-1") not in registry
+                    await asyncio.sleep(0)
+                    assert not http_client.is_closed
+                assert http_client.is_closed
+
+        asyncio.run(run())
+
+    def test_eviction_outside_loop_is_closed_by_aclose(self):
+        """Test that clients evicted without a running loop are closed by aclose."""
+        registry = LongshipRegistry(max_size=1)
+        http_client = registry.get(URL, "tenant-1", "ocp")._client
+        http_client = http_client.get_async_httpx_client()
+        registry.get(URL, "tenant-2", "ocp")
+        assert not http_client.is_closed
+        asyncio.run(registry.aclose())
+        assert http_client.is_closed
+
+    def test_aclose_closes_all_clients(self):
+        """Test that shutting down the registry closes every pool."""
+
+        async def run():
+            registry = LongshipRegistry(max_size=4)
+            clients = [
+                registry.get(URL, f"tenant-{i}", "ocp")._client.get_async_httpx_client()
+                for i in range(3)
+            ]
+            registry.evict(URL, "tenant-0")
+            await registry.aclose()
+            return registry, clients
+
+        registry, clients = asyncio.run(run())
+        assert len(registry) == 0
+        assert all(client.is_closed for client in clients)
+
+    def test_client_options(self):
+        """Test that pool options are applied to created clients."""
+        registry = LongshipRegistry(max_connections=7)
+        longship = registry.get(URL, "tenant-1", "ocp")
+        assert longship._client._httpx_args["limits"].max_connections == 7
+
+    def test_invalid_max_size(self):
+        """Test that max_size must be positive."""
+        with pytest.raises(ValueError):
+            LongshipRegistry(max_size=0)
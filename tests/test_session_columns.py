@@ -0,0 +1,109 @@
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+from longship.session_columns import (
+    MISSING_CODE,
+    MISSING_TIMESTAMP,
+    SessionColumnsBuilder,
+)
+from longship_api_client.models.session_dto import SessionDto
+
+numpy = pytest.importorskip("numpy")
+
+SESSIONS = [
+    {
+        "id": "session-1",
+        "chargingMeterValues": [
+            {
+                "timestamp": "2024-01-01T00:00:00.5Z",
+                "value": "1000",
+                "measurand": "Energy.Active.Import.Register",
+                "unit": "Wh",
+            },
+            {
+                "timestamp": "2024-01-01T01:00:00+01:00",
+                "value": "11",
+                "measurand": "Power.Active.Import",
+                "unit": "kW",
+            },
+        ],
+        "chargingPeriods": [
+            {
+                "timestamp": "2024-01-01T00:00:00Z",
+                "deltaKwh": 2.5,
+                "absoluteKwh": 2.5,
+                "price": 0.87,
+            }
+        ],
+    },
+    {"id": "session-2"},
+    {
+        "id": "session-3",
+        "chargingMeterValues": [{"value": "not a number"}],
+    },
+]
+
+
+def epoch_ms(*args):
+    return int(datetime(*args, tzinfo=timezone.utc).timestamp() * 1000)
+
+
+class TestSessionColumnsBuilder:
+    def test_columns(self):
+        """Test that meter values and charging periods end up in flat columns."""
+        columns = (
+            SessionColumnsBuilder()
+            .extend(SessionDto.from_dict(session) for session in SESSIONS)
+            .build()
+        )
+        assert len(columns) == 3
+        assert list(columns.session_ids) == ["session-1", "session-2", "session-3"]
+        assert columns.meter_value_offsets.tolist() == [0, 2, 2, 3]
+        assert columns.meter_timestamps.tolist() == [
+            epoch_ms(2024, 1, 1) + 500,
+            epoch_ms(2024, 1, 1),
+            MISSING_TIMESTAMP,
+        ]
+        assert columns.meter_values[:2].tolist() == [1000.0, 11.0]
+        assert numpy.isnan(columns.meter_values[2])
+        assert columns.measurands == ["Energy.Active.Import.Register", "Power.Active.Import"]
+        assert columns.meter_measurands.tolist() == [0, 1, MISSING_CODE]
+        assert columns.units == ["Wh", "kW"]
+        assert columns.meter_units.tolist() == [0, 1, MISSING_CODE]
+        assert columns.meter_value_sessions().tolist() == [0, 0, 2]
+        assert columns.charging_period_offsets.tolist() == [0, 1, 1, 1]
+        assert columns.period_delta_kwh.tolist() == [2.5]
+        assert columns.charging_period_sessions().tolist() == [0]
+        assert numpy.isnat(columns.meter_timestamps.view("datetime64[ms]")[2])
+
+    def test_add_dict_matches_models(self):
+        """Test that raw sessions give the same columns as decoded ones."""
+        from_models = SessionColumnsBuilder()
+        from_dicts = SessionColumnsBuilder()
+        for session in SESSIONS:
+            from_models.add(SessionDto.from_dict(session))
+            from_dicts.add_dict(session)
+        models, dicts = from_models.build(), from_dicts.build()
+        for name in ("meter_value_offsets", "meter_timestamps", "meter_measurands"):
+            assert getattr(models, name).tolist() == getattr(dicts, name).tolist()
+        assert numpy.array_equal(models.meter_values, dicts.meter_values, equal_nan=True)
+
+    def test_aextend(self):
+        """Test that sessions can be streamed from an async iterator."""
+
+        async def sessions():
+            for session in SESSIONS:
+                yield SessionDto.from_dict(session)
+
+        builder = asyncio.run(SessionColumnsBuilder().aextend(sessions()))
+        assert len(builder.build()) == 3
+
+    def test_build_is_a_snapshot(self):
+        """Test that adding sessions after build leaves built columns unchanged."""
+        builder = SessionColumnsBuilder()
+        builder.add_dict(SESSIONS[0])
+        columns = builder.build()
+        builder.add_dict(SESSIONS[2])
+        assert columns.meter_value_offsets.tolist() == [0, 2]
+        assert len(builder.build().meter_values) == 3
@@ -0,0 +1,230 @@
+import asyncio
+
+import httpx
+from longship_api_client import Client
+
+from longship.client import Longship
+from longship.session_tracker import SessionChange, SessionTracker
+from longship.types import WebhookPayload, WebhookPayloadType
+
+
+def session_event(payload_type, session_id, time, chargepoint_id="CP1", connector=1, **data):
+    if payload_type != WebhookPayloadType.SessionStart:
+        data = {"totalenergyinkwh": 1.5, "totalduration": "00:10:00", "totalcosts": 0.5, **data}
+    return WebhookPayload(
+        specversion="1.0",
+        id=f"{payload_type}-{session_id}-{time}",
+        type=payload_type,
+        subject=session_id,
+        time=f"2024-01-01T00:{time:02d}:00Z",
+        source="https://api.longship.io/v1/sessions",
+        datacontenttype="application/json",
+        data={
+            "chargepointid": chargepoint_id,
+            "connectornumber": connector,
+            "transactionid": f"tx-{session_id}",
+            **data,
+        },
+    )
+
+
+def start(session_id, time=0, **kwargs):
+    return session_event(WebhookPayloadType.SessionStart, session_id, time, **kwargs)
+
+
+def update(session_id, time, **kwargs):
+    return session_event(WebhookPayloadType.SessionUpdate, session_id, time, **kwargs)
+
+
+def stop(session_id, time, **kwargs):
+    return session_event(WebhookPayloadType.SessionStop, session_id, time, **kwargs)
+
+
+class SessionsServer:
+    def __init__(self, sessions=()):
+        self.sessions = list(sessions)
+        self.requests = []
+
+    def __call__(self, request):
+        self.requests.append(request)
+        assert request.url.params["runningOnly"] == "true"
+        skip = int(request.url.params.get("skip", 0))
+        take = int(request.url.params.get("take", 100))
+        return httpx.Response(200, json=self.sessions[skip : skip + take])
+
+
+def running_session(session_id, chargepoint_id="CP1", connector=1):
+    return {
+        "id": session_id,
+        "chargePointId": chargepoint_id,
+        "connectorId": connector,
+        "ocppTransactionId": f"tx-{session_id}",
+        "sessionStart": "2024-01-01T00:00:00Z",
+        "totalEnergyInKwh": 3.0,
+    }
+
+
+def make_tracker(server):
+    client = Client(
+        base_url="https://api.example.com",
+        httpx_args={"transport": httpx.MockTransport(server)},
+    )
+    return SessionTracker(client, backfill_delay=0)
+
+
+class TestSessionTracker:
+    def test_lifecycle(self):
+        """Test that a session is tracked from start to stop and listeners told."""
+        tracker = make_tracker(SessionsServer())
+        changes = []
+        tracker.subscribe(lambda change, session: changes.append((change, session.session_id)))
+        tracker.apply(start("S1", locationid="L1"))
+        session = tracker.apply(update("S1", 5, totalenergyinkwh=4.2))
+        assert tracker.by_connector("CP1", 1) is session
+        assert tracker.by_transaction("tx-S1") is session
+        assert tracker.by_chargepoint("CP1") == [session]
+        assert session.total_energy_in_kwh == 4.2
+        assert session.location_id == "L1"
+        tracker.apply(stop("S1", 10))
+        assert len(tracker) == 0
+        assert tracker.by_connector("CP1", 1) is None
+        assert tracker.by_transaction("tx-S1") is None
+        assert changes == [
+            (SessionChange.Started, "S1"),
+            (SessionChange.Updated, "S1"),
+            (SessionChange.Stopped, "S1"),
+        ]
+        assert tracker.gaps == 0
+
+    def test_late_events_are_ignored(self):
+        """Test that updates after the stop or older than the last one are dropped."""
+        tracker = make_tracker(SessionsServer())
+        tracker.apply(start("S1"))
+        tracker.apply(update("S1", 5, totalenergyinkwh=2.0))
+        assert tracker.apply(update("S1", 3, totalenergyinkwh=1.0)) is None
+        assert tracker.get("S1").total_energy_in_kwh == 2.0
+        tracker.apply(stop("S1", 10))
+        assert tracker.apply(update("S1", 8)) is None
+        assert len(tracker) == 0
+
+    def test_missed_start_is_a_gap(self):
+        """Test that an update of an unknown session is left to a backfill."""
+        tracker = make_tracker(SessionsServer())
+        assert tracker.apply(update("S1", 5)) is None
+        assert tracker.get("S1") is None
+        assert tracker.gaps == 1
+
+    def test_unknown_sessions_keep_the_running_one(self):
+        """Test that events of unknown sessions don't displace the session on the connector."""
+        tracker = make_tracker(SessionsServer())
+        changes = []
+        tracker.subscribe(lambda change, session: changes.append((change, session.session_id)))
+        tracker.apply(start("A"))
+        assert tracker.apply(stop("B", 5)) is None
+        assert tracker.apply(update("C", 6)) is None
+        assert tracker.apply(update("A", 7, totalenergyinkwh=3.0)).total_energy_in_kwh == 3.0
+        # B stopped already, a late start doesn't bring it back
+        assert tracker.apply(start("B", 4)) is None
+        assert tracker.by_connector("CP1", 1).session_id == "A"
+        assert changes == [(SessionChange.Started, "A"), (SessionChange.Updated, "A")]
+        assert tracker.gaps == 1
+
+    def test_missed_stop_is_a_gap(self):
+        """Test that a start on an occupied connector ends the session before."""
+        tracker = make_tracker(SessionsServer())
+        changes = []
+        tracker.subscribe(lambda change, session: changes.append((change, session.session_id)))
+        tracker.apply(start("S1"))
+        tracker.apply(start("S2", 20))
+        assert tracker.by_connector("CP1", 1).session_id == "S2"
+        assert tracker.get("S1") is None
+        assert (SessionChange.Displaced, "S1") in changes
+        assert (SessionChange.Stopped, "S1") not in changes
+        assert tracker.gaps == 1
+
+    def test_displaced_session_is_backfilled(self):
+        """Test that a session displaced by a start comes back if it still runs."""
+        server = SessionsServer([running_session("S1"), running_session("S2", connector=2)])
+        tracker = make_tracker(server)
+        asyncio.run(tracker.backfill())
+        tracker.apply(start("S3", 20, connector=2))
+        assert tracker.get("S2") is None
+        server.sessions = [running_session("S1"), running_session("S2", connector=2)]
+        asyncio.run(tracker.backfill())
+        assert tracker.by_connector("CP1", 2).session_id == "S2"
+
+    def test_displaced_session_is_stopped_by_backfill(self):
+        """Test that a displaced session that stopped meanwhile is not brought back."""
+        server = SessionsServer([running_session("S1")])
+        tracker = make_tracker(server)
+        asyncio.run(tracker.backfill())
+        changes = []
+        tracker.subscribe(lambda change, session: changes.append((change, session.session_id)))
+        tracker.apply(start("S2", 20))
+        server.sessions = [running_session("S2")]
+        asyncio.run(tracker.backfill())
+        assert tracker.by_connector("CP1", 1).session_id == "S2"
+        assert changes == [(SessionChange.Displaced, "S1"), (SessionChange.Started, "S2")]
+
+    def test_backfill(self):
+        """Test that a backfill adds running sessions and drops stopped ones."""
+        server = SessionsServer([running_session("S1"), running_session("S2", connector=2)])
+        tracker = make_tracker(server)
+        tracker.page_size = 1
+        asyncio.run(tracker.backfill())
+        assert tracker.ready.is_set()
+        assert {session.session_id for session in tracker} == {"S1", "S2"}
+        assert tracker.by_transaction("tx-S2").connector_number == 2
+        server.sessions = [running_session("S2", connector=2)]
+        asyncio.run(tracker.backfill())
+        assert tracker.get("S1") is None
+        assert tracker.get("S2").total_energy_in_kwh == 3.0
+
+    def test_run_backfills_after_gap(self):
+        """Test that run backfills on startup and again after a gap only."""
+        server = SessionsServer([running_session("S1")])
+        tracker = make_tracker(server)
+
+        async def main():
+            task = asyncio.create_task(tracker.run())
+            await tracker.ready.wait()
+            tracker.apply(update("S1", 5))
+            tracker.apply(update("S1", 6))
+            assert tracker.backfills == 1
+            tracker.apply(update("S9", 5, connector=2))
+            for _ in range(10):
+                await asyncio.sleep(0)
+            task.cancel()
+
+        asyncio.run(main())
+        assert tracker.backfills == 2
+        # Not running according to the API, so the backfill dropped it
+        assert tracker.get("S9") is None
+
+    def test_run_survives_failed_backfills(self):
+        """Test that run retries a backfill that failed."""
+        server = SessionsServer([running_session("S1")])
+        failures = [httpx.Response(503)]
+
+        def handler(request):
+            return failures.pop() if failures else server(request)
+
+        tracker = make_tracker(handler)
+        tracker.retry_interval = 0
+
+        async def main():
+            task = asyncio.create_task(tracker.run())
+            await asyncio.wait_for(tracker.ready.wait(), 5)
+            task.cancel()
+
+        asyncio.run(main())
+        assert tracker.failures == 1
+        assert tracker.get("S1") is not None
+
+    def test_longship_handle_webhook(self):
+        """Test that the facade feeds webhooks to its session tracker."""
+        longship = Longship("https://api.example.com", "apiKey", "ocpKey")
+        tracker = longship.session_tracker()
+        assert longship.session_tracker() is tracker
+        longship.handle_webhook(start("S1"))
+        assert tracker.by_connector("CP1", 1).session_id == "S1"
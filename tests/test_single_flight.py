@@ -0,0 +1,190 @@
+import asyncio
+import threading
+
+import httpx
+import pytest
+from longship_api_client import Client
+from longship_api_client.api.chargepoint_status import chargepoint_status_get
+from longship_api_client.api.chargepoints import chargepoint_get
+from longship_api_client.api.commands import send_reset_request
+from longship_api_client.models.reset_request import ResetRequest
+
+from longship.client import Longship
+from longship.single_flight import SingleFlight
+
+
+class SlowServer:
+    """Answers GETs after a delay, so that concurrent calls overlap."""
+
+    def __init__(self, delay=0.05, status_code=200):
+        self.delay = delay
+        self.status_code = status_code
+        self.requests = []
+
+    async def __call__(self, request):
+        self.requests.append(request)
+        await asyncio.sleep(self.delay)
+        return self.response(request)
+
+    def sync(self, request):
+        self.requests.append(request)
+        threading.Event().wait(self.delay)
+        return self.response(request)
+
+    def response(self, request):
+        chargepoint_id = request.url.path.split("/")[3]
+        return httpx.Response(self.status_code, json={"id": chargepoint_id})
+
+
+def make_client(handler):
+    return Client(
+        base_url="https://api.example.com",
+        httpx_args={"transport": httpx.MockTransport(handler)},
+    )
+
+
+class TestSingleFlight:
+    def test_coalesces_identical_calls(self):
+        """Test that concurrent identical calls share one request and its result."""
+        server = SlowServer()
+        client = make_client(server)
+        single_flight = SingleFlight()
+
+        async def main():
+            return await asyncio.gather(
+                *(single_flight.acall(chargepoint_get, client, id="CP1") for _ in range(5)),
+                single_flight.acall(chargepoint_get, client, id="CP2"),
+                single_flight.acall(chargepoint_status_get, client, id="CP1"),
+            )
+
+        responses = asyncio.run(main())
+        assert len(server.requests) == 3
+        assert all(response is responses[0] for response in responses[:5])
+        assert responses[0].parsed.id == "CP1"
+        assert responses[5].parsed.id == "CP2"
+        assert (single_flight.calls, single_flight.flights, single_flight.coalesced) == (7, 3, 4)
+        assert single_flight.coalesced_by_endpoint == {"chargepoint_get": 4}
+        assert single_flight.in_flight == 0
+
+    def test_sequential_calls_are_sent(self):
+        """Test that a completed call isn't reused."""
+        server = SlowServer(delay=0)
+        client = make_client(server)
+        single_flight = SingleFlight()
+
+        async def main():
+            await single_flight.acall(chargepoint_get, client, id="CP1")
+            await single_flight.acall(chargepoint_get, client, id="CP1")
+
+        asyncio.run(main())
+        assert len(server.requests) == 2
+        assert single_flight.coalesced == 0
+
+    def test_other_methods_are_not_coalesced(self):
+        """Test that non-GET requests are always sent."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(202)
+
+        client = make_client(handler)
+        single_flight = SingleFlight()
+
+        async def main():
+            await asyncio.gather(
+                *(
+                    single_flight.acall(
+                        send_reset_request, client, id="CP1", body=ResetRequest()
+                    )
+                    for _ in range(3)
+                )
+            )
+
+        asyncio.run(main())
+        assert len(requests) == 3
+        assert single_flight.coalesced == 0
+
+    def test_cancelled_caller(self):
+        """Test that cancelling one caller leaves the shared call to the others."""
+        server = SlowServer()
+        client = make_client(server)
+        single_flight = SingleFlight()
+
+        async def main():
+            first = asyncio.ensure_future(single_flight.acall(chargepoint_get, client, id="CP1"))
+            second = asyncio.ensure_future(single_flight.acall(chargepoint_get, client, id="CP1"))
+            await asyncio.sleep(0.01)
+            first.cancel()
+            return await second
+
+        response = asyncio.run(main())
+        assert response.parsed.id == "CP1"
+        assert len(server.requests) == 1
+
+    def test_errors_are_shared(self):
+        """Test that every caller of a failed call gets its exception."""
+
+        async def handler(request):
+            await asyncio.sleep(0.01)
+            raise httpx.ConnectError("unreachable")
+
+        client = make_client(handler)
+        single_flight = SingleFlight()
+
+        async def main():
+            return await asyncio.gather(
+                *(single_flight.acall(chargepoint_get, client, id="CP1") for _ in range(3)),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(main())
+        assert all(isinstance(result, httpx.ConnectError) for result in results)
+        assert single_flight.flights == 1
+
+    def test_threads(self):
+        """Test that sync calls are coalesced between threads."""
+        server = SlowServer(delay=0.1)
+        client = make_client(server.sync)
+        single_flight = SingleFlight()
+        barrier = threading.Barrier(4)
+        responses = []
+
+        def call():
+            barrier.wait()
+            responses.append(single_flight.call(chargepoint_get, client, id="CP1"))
+
+        threads = [threading.Thread(target=call) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(server.requests) == 1
+        assert len({id(response) for response in responses}) == 1
+        assert single_flight.coalesced == 3
+
+
+class TestLongshipSingleFlight:
+    @pytest.mark.parametrize("single_flight, requests", [(True, 1), (False, 4)])
+    def test_get_chargepoint_status(self, single_flight, requests):
+        """Test that the facade coalesces get_* calls if enabled."""
+        server = SlowServer()
+        longship = Longship(
+            "https://api.example.com", "apiKey", "ocpKey", single_flight=single_flight
+        )
+        longship._client.set_async_httpx_client(
+            httpx.AsyncClient(
+                base_url="https://api.example.com", transport=httpx.MockTransport(server)
+            )
+        )
+
+        async def main():
+            return await asyncio.gather(
+                *(longship.get_chargepoint_status("CP1") for _ in range(4))
+            )
+
+        statuses = asyncio.run(main())
+        assert len(server.requests) == requests
+        assert all(status.id == "CP1" for status in statuses)
+        if single_flight:
+            assert longship.single_flight.coalesced == 3
@@ -0,0 +1,192 @@
+import asyncio
+import json
+from pathlib import Path
+
+import httpx
+from longship_api_client import Client
+from longship_api_client.models.chargepoint_status_dto_connectivity_status import (
+    ChargepointStatusDtoConnectivityStatus,
+)
+from longship_api_client.models.connector_operational_status_dto_operational_status import (
+    ConnectorOperationalStatusDtoOperationalStatus as Status,
+)
+
+from longship.client import Longship
+from longship.status_mirror import StatusMirror
+from longship.types import WebhookPayload
+
+FIXTURES = Path(__file__).parent.parent / "fixtures"
+
+
+def chargepoint_status(chargepoint_id, ou_id, *statuses, timestamp="2024-01-01T00:00:00Z"):
+    return {
+        "id": chargepoint_id,
+        "ouId": ou_id,
+        "connectivityStatus": "ONLINE",
+        "timestamp": timestamp,
+        "connectors": [
+            {"connectorNumber": number, "operationalStatus": status, "timestamp": timestamp}
+            for number, status in enumerate(statuses, start=1)
+        ],
+    }
+
+
+def make_client(statuses):
+    def handler(request):
+        skip = int(request.url.params.get("skip", 0))
+        take = int(request.url.params.get("take", 100))
+        return httpx.Response(200, json=statuses[skip : skip + take])
+
+    return Client(
+        base_url="https://api.example.com",
+        httpx_args={"transport": httpx.MockTransport(handler)},
+    )
+
+
+def operational_status(chargepoint_id, connector_number, status, time="2024-01-01T00:05:00Z"):
+    payload = json.loads((FIXTURES / "OperationalStatusChanged.json").read_text())
+    payload.update(subject=chargepoint_id, time=time)
+    payload["data"].update(connectornumber=connector_number, status=status)
+    return WebhookPayload.from_dict(payload)
+
+
+def seeded_mirror(statuses):
+    mirror = StatusMirror(make_client(statuses), page_size=2)
+    asyncio.run(mirror.reconcile())
+    return mirror
+
+
+STATUSES = [
+    chargepoint_status("CP1", "OU1", "Available", "Charging"),
+    chargepoint_status("CP2", "OU1", "Available"),
+    chargepoint_status("CP3", "OU2", "Available", "Faulted"),
+]
+
+
+class TestStatusMirror:
+    def test_seed(self):
+        """Test that the mirror is seeded from all pages and indexed."""
+        mirror = seeded_mirror(STATUSES)
+        assert mirror.ready.is_set()
+        assert len(mirror) == 3
+        assert mirror.connector("CP1", 2).status == Status.CHARGING
+        assert mirror.chargepoint("CP3").connectivity_status == (
+            ChargepointStatusDtoConnectivityStatus.ONLINE
+        )
+        assert mirror.chargepoints_in_ou("OU1") == {"CP1", "CP2"}
+        assert mirror.connectors_with_status(Status.AVAILABLE) == {
+            ("CP1", 1),
+            ("CP2", 1),
+            ("CP3", 1),
+        }
+        assert mirror.connectors_with_status(Status.AVAILABLE, ou_id="OU2") == {("CP3", 1)}
+        assert mirror.repairs == 0
+
+    def test_operational_status_webhook(self):
+        """Test that connector status webhooks move connectors between indexes."""
+        mirror = seeded_mirror(STATUSES)
+        assert mirror.apply(operational_status("CP1", 1, "Preparing"))
+        assert mirror.connector("CP1", 1).status == Status.PREPARING
+        assert mirror.connector("CP1", 1).error_code == "NoError"
+        assert ("CP1", 1) not in mirror.connectors_with_status(Status.AVAILABLE)
+        assert mirror.connectors_with_status(Status.PREPARING) == {("CP1", 1)}
+
+    def test_index_views(self):
+        """Test that queries return live read-only views of the index, not copies."""
+        mirror = seeded_mirror(STATUSES)
+        preparing = mirror.connectors_with_status(Status.PREPARING)
+        assert mirror.connectors_with_status(Status.PREPARING) == preparing == set()
+        mirror.apply(operational_status("CP1", 1, "Preparing"))
+        assert preparing == {("CP1", 1)}
+        assert not hasattr(preparing, "add")
+        assert not hasattr(mirror.chargepoints_in_ou("OU1"), "discard")
+
+    def test_stale_webhook_is_ignored(self):
+        """Test that a webhook older than the known status doesn't overwrite it."""
+        mirror = seeded_mirror(STATUSES)
+        mirror.apply(operational_status("CP1", 1, "Charging", time="2024-01-01T00:10:00Z"))
+        assert not mirror.apply(
+            operational_status("CP1", 1, "Preparing", time="2024-01-01T00:05:00Z")
+        )
+        assert mirror.connector("CP1", 1).status == Status.CHARGING
+
+    def test_connectivity_webhook(self):
+        """Test the ConnectivityStatusChanged fixture."""
+        mirror = seeded_mirror([chargepoint_status("ESTG_00669", "OU1", "Available")])
+        payload = WebhookPayload.from_json((FIXTURES / "ConnectivityStatusChanged.json").read_bytes())
+        # The fixture is older than the seeded status
+        assert not mirror.apply(payload)
+        payload.time = "2024-02-01T00:00:00Z"
+        assert mirror.apply(payload)
+        assert mirror.chargepoint("ESTG_00669").connectivity_status == (
+            ChargepointStatusDtoConnectivityStatus.OFFLINE
+        )
+
+    def test_unknown_chargepoint(self):
+        """Test that webhooks of chargepoints not seeded yet are kept."""
+        mirror = StatusMirror(make_client([]))
+        mirror.apply(operational_status("CP9", 1, "Available"))
+        assert mirror.connectors_with_status(Status.AVAILABLE) == {("CP9", 1)}
+        assert mirror.chargepoints_in_ou(None) == {"CP9"}
+
+    def test_reconcile_repairs_missed_events(self):
+        """Test that a sweep corrects missed changes and drops deleted chargepoints."""
+        statuses = list(STATUSES)
+        mirror = StatusMirror(make_client(statuses), page_size=2)
+        asyncio.run(mirror.reconcile())
+        statuses[0] = chargepoint_status(
+            "CP1", "OU2", "Faulted", "Charging", timestamp="2024-01-02T00:00:00Z"
+        )
+        del statuses[1]
+        assert asyncio.run(mirror.reconcile()) == 2
+        assert mirror.repairs == 2
+        assert mirror.connector("CP1", 1).status == Status.FAULTED
+        assert mirror.chargepoints_in_ou("OU2") == {"CP1", "CP3"}
+        assert mirror.chargepoint("CP2") is None
+        assert ("CP2", 1) not in mirror.connectors_with_status(Status.AVAILABLE)
+
+    def test_snapshot_keeps_error_code(self):
+        """Test that a sweep keeps the error code of the webhook unless the status changed."""
+        statuses = list(STATUSES)
+        mirror = seeded_mirror(statuses)
+        webhook = operational_status("CP3", 2, "Faulted")
+        webhook.data.errorcode = "GroundFailure"
+        mirror.apply(webhook)
+        statuses[2] = chargepoint_status(
+            "CP3", "OU2", "Charging", "Faulted", timestamp="2024-01-01T00:10:00Z"
+        )
+        asyncio.run(mirror.reconcile())
+        assert mirror.connector("CP3", 2).error_code == "GroundFailure"
+        assert mirror.connector("CP3", 1).error_code is None
+
+    def test_run_survives_failed_sweeps(self):
+        """Test that run keeps reconciling after a sweep failed."""
+        responses = [httpx.Response(500), httpx.Response(200, json=STATUSES)]
+
+        def handler(request):
+            if len(responses) > 1:
+                return responses.pop(0)
+            return responses[0]
+
+        client = Client(
+            base_url="https://api.example.com",
+            httpx_args={"transport": httpx.MockTransport(handler)},
+        )
+        mirror = StatusMirror(client, reconcile_interval=0)
+
+        async def main():
+            task = asyncio.create_task(mirror.run())
+            await asyncio.wait_for(mirror.ready.wait(), 5)
+            task.cancel()
+
+        asyncio.run(main())
+        assert mirror.failures == 1
+        assert len(mirror) == 3
+
+    def test_longship_handle_webhook(self):
+        """Test that the facade feeds webhooks to its status mirror."""
+        longship = Longship("https://api.example.com", "apiKey", "ocpKey")
+        mirror = longship.status_mirror()
+        assert longship.status_mirror() is mirror
+        longship.handle_webhook(operational_status("CP1", 1, "Faulted"))
+        assert mirror.connector("CP1", 1).status == Status.FAULTED
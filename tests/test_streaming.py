@@ -0,0 +1,115 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+from longship_api_client import Client
+from longship_api_client.api.sessions import get_all_sessions
+from longship_api_client.models.session_dto import SessionDto
+
+from longship.errors import PageLoadError
+from longship.streaming import JsonArrayDecoder, aiter_list, iter_list
+
+ITEMS = [
+    {"id": "a", "nested": {"list": [1, 2, {"x": "]"}]}, "text": 'quote " and \\ ['},
+    {"id": "b", "text": "comma, brace } and unicode é"},
+    [],
+    "plain",
+    12.5,
+    None,
+    True,
+]
+
+
+def decode(body: bytes, chunk_size: int):
+    decoder = JsonArrayDecoder()
+    items = []
+    for i in range(0, len(body), chunk_size):
+        items.extend(decoder.feed(body[i : i + chunk_size]))
+    decoder.close()
+    return items
+
+
+class TestJsonArrayDecoder:
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 100000])
+    def test_decodes_any_chunking(self, chunk_size):
+        """Test that items decode identically regardless of chunk boundaries."""
+        body = json.dumps(ITEMS, indent=2).encode()
+        assert decode(body, chunk_size) == ITEMS
+
+    def test_empty_array(self):
+        """Test that an empty array yields nothing."""
+        assert decode(b"  [ ]  ", 1) == []
+
+    def test_items_are_returned_as_soon_as_complete(self):
+        """Test that an item is emitted before the array is closed."""
+        decoder = JsonArrayDecoder()
+        assert decoder.feed(b'[{"id": "a"}') == []
+        assert decoder.feed(b',') == [{"id": "a"}]
+        assert decoder.feed(b'{"id": "b"}]') == [{"id": "b"}]
+
+    def test_buffer_holds_a_single_item(self):
+        """Test that memory is bounded by the largest item, not the array."""
+        item = {"id": "x" * 100}
+        body = json.dumps([item] * 1000).encode()
+        decoder = JsonArrayDecoder()
+        largest = 0
+        for i in range(0, len(body), 50):
+            decoder.feed(body[i : i + 50])
+            largest = max(largest, len(decoder._buffer))
+        assert largest <= len(json.dumps(item)) + 50
+
+    def test_not_an_array(self):
+        """Test that a non-array body is rejected."""
+        with pytest.raises(ValueError):
+            JsonArrayDecoder().feed(b'{"message": "error"}')
+
+    def test_incomplete_array(self):
+        """Test that a truncated body is detected on close."""
+        decoder = JsonArrayDecoder()
+        decoder.feed(b'[{"id": "a"},')
+        with pytest.raises(ValueError):
+            decoder.close()
+
+    def test_trailing_data(self):
+        """Test that data after the closing bracket is rejected."""
+        with pytest.raises(ValueError):
+            JsonArrayDecoder().feed(b"[1] 2")
+
+
+def make_client(status_code=200, count=50):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if status_code != 200:
+            return httpx.Response(status_code, json={"message": "error"})
+        body = json.dumps([{"id": f"session-{i}"} for i in range(count)]).encode()
+        return httpx.Response(200, content=body)
+
+    return Client(
+        base_url="https://api.example.com",
+        httpx_args={"transport": httpx.MockTransport(handler)},
+    )
+
+
+class TestListStreaming:
+    def test_aiter_list(self):
+        """Test that the async stream yields decoded models."""
+
+        async def run():
+            client = make_client()
+            return [
+                item async for item in aiter_list(get_all_sessions, SessionDto, client)
+            ]
+
+        items = asyncio.run(run())
+        assert [item.id for item in items] == [f"session-{i}" for i in range(50)]
+        assert all(isinstance(item, SessionDto) for item in items)
+
+    def test_iter_list(self):
+        """Test that the sync stream yields decoded models."""
+        items = list(iter_list(get_all_sessions, SessionDto, make_client(), take=50))
+        assert [item.id for item in items] == [f"session-{i}" for i in range(50)]
+
+    def test_error_status_raises(self):
+        """Test that a non-200 response raises PageLoadError."""
+        with pytest.raises(PageLoadError):
+            list(iter_list(get_all_sessions, SessionDto, make_client(status_code=401)))
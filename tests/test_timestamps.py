@@ -0,0 +1,72 @@
+import datetime
+
+import pytest
+from dateutil.parser import isoparse
+from longship_api_client import timestamps
+from longship_api_client.models.charging_meter_value_dto import ChargingMeterValueDto
+from longship_api_client.timestamps import parse_isoformat, set_timestamp_parser
+
+TIMESTAMPS = [
+    "2023-06-25T13:03:50.0223808Z",
+    "2023-06-25T13:03:50Z",
+    "2023-06-25T13:03:50",
+    "2023-06-25T13:03:50.5+02:00",
+    "2023-06-25T13:03:50.123456-05:30",
+    "2023-06-25",
+    "2023-06-25T13:03",
+    "2023-06-25 13:03:50Z",
+]
+
+
+class TestParseIsoformat:
+    @pytest.mark.parametrize("value", TIMESTAMPS)
+    def test_matches_isoparse(self, value):
+        """Test that the fast path agrees with isoparse."""
+        assert parse_isoformat(value) == isoparse(value)
+        assert parse_isoformat(value).utcoffset() == isoparse(value).utcoffset()
+
+    @pytest.mark.parametrize("value", TIMESTAMPS)
+    def test_pure_python_path_matches_isoparse(self, value):
+        """Test that the path used before Python 3.11 agrees with isoparse."""
+        assert timestamps._parse_cached(value) == isoparse(value)
+        assert timestamps._parse_cached(value).utcoffset() == isoparse(value).utcoffset()
+
+    def test_truncates_to_microseconds(self):
+        """Test that 7 fractional digits are truncated like isoparse does."""
+        parsed = parse_isoformat("2023-06-25T13:03:50.0223808Z")
+        assert parsed == datetime.datetime(
+            2023, 6, 25, 13, 3, 50, 22380, tzinfo=datetime.timezone.utc
+        )
+
+    def test_invalid(self):
+        """Test that invalid timestamps raise ValueError."""
+        with pytest.raises(ValueError):
+            parse_isoformat("yesterday")
+        with pytest.raises(ValueError):
+            timestamps._parse_cached("2023-06-25T13:03:50.Z")
+
+    def test_memoized(self):
+        """Test that the pure Python path memoizes repeated strings."""
+        timestamps._parse_cached.cache_clear()
+        first = timestamps._parse_cached("2023-06-25T13:03:50Z")
+        assert timestamps._parse_cached("2023-06-25T13:03:50Z") is first
+        assert timestamps._parse_cached.cache_info().hits == 1
+
+
+class TestSetTimestampParser:
+    def test_models_use_configured_parser(self):
+        """Test that models parse timestamps with the configured parser."""
+        calls = []
+
+        def parser(value):
+            calls.append(value)
+            return isoparse(value)
+
+        set_timestamp_parser(parser)
+        try:
+            meter_value = ChargingMeterValueDto.from_dict({"timestamp": "2024-01-01T00:00:00Z"})
+        finally:
+            set_timestamp_parser(None)
+        assert calls == ["2024-01-01T00:00:00Z"]
+        assert meter_value.timestamp == datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+        assert timestamps._parser is parse_isoformat
@@ -1,3 +1,6 @@
+import json
+from pathlib import Path
+
 import pytest
 from longship_api_client.models.chargepoint_dto_connectivity_status import (
     ChargepointDtoConnectivityStatus,
@@ -155,6 +158,18 @@ class TestDataClasses:
         assert data.evseid == "evse123"
         assert data.stateofcharge == 90.0
 
+    def test_session_data_positional_arguments(self):
+        """Test that session data can still be created with positional arguments."""
+        start = SessionStartData("cp123", 1, "tx123", "loc123")
+        assert start.transactionid == "tx123"
+        assert start.locationid == "loc123"
+        update = SessionUpdateData("cp123", 1, None, 25.5, "PT1H30M", 15.75)
+        assert update.transactionid is None
+        assert update.totalenergyinkwh == 25.5
+        stop = SessionStopData("cp123", 1, "tx123", 30.0, "PT2H", 20.0, "loc123")
+        assert stop.totalcosts == 20.0
+        assert stop.locationid == "loc123"
+
     def test_cdr_created_data(self):
         """Test CDRCreatedData creation and attributes."""
         data = CDRCreatedData(
@@ -580,4 +595,79 @@ class TestEdgeCases:
             assert payload.data is not None
             # Extra fields should not be present
             assert not hasattr(payload.data, 'extra_field_1')
-            assert not hasattr(payload.data, 'extra_field_2') 
\ No newline at end of file
+            assert not hasattr(payload.data, 'extra_field_2') 
+
+
+class TestFromJson:
+    def test_fixture(self):
+        """Test that a webhook sample decodes from its raw body."""
+        with open(Path(__file__).parent.parent / "fixtures" / "CdrCreated.json", "rb") as f:
+            payload = WebhookPayload.from_json(f.read())
+
+        assert payload.type is WebhookPayloadType.CDRCreated
+        assert isinstance(payload.data, CDRCreatedData)
+
+    def test_fixture_without_data(self):
+        """Test that location webhooks, which come without data, decode."""
+        with open(Path(__file__).parent.parent / "fixtures" / "LocationUpdated.json", "rb") as f:
+            payload = WebhookPayload.from_json(f.read())
+
+        assert payload.type is WebhookPayloadType.LocationUpdated
+        assert isinstance(payload.data, LocationUpdatedData)
+
+    def test_fixture_without_transaction(self):
+        """Test that session webhooks sent before the transaction started decode."""
+        for name, data_class in [
+            ("SessionStart", SessionStartData),
+            ("SessionUpdate", SessionUpdateData),
+            ("SessionStop", SessionStopData),
+        ]:
+            with open(Path(__file__).parent.parent / "fixtures" / f"{name}.json", "rb") as f:
+                payload = WebhookPayload.from_json(f.read())
+
+            assert isinstance(payload.data, data_class)
+            assert payload.data.chargepointid == "ESTG_00669"
+            assert payload.data.transactionid is None
+
+    def test_string_type_dispatch(self):
+        """Test that a plain string type dispatches like the enum member."""
+        payload = WebhookPayload(
+            specversion="1.0",
+            id="test-id",
+            type="CdrCreated",
+            subject="test-subject",
+            time="2024-01-01T00:00:00Z",
+            source="test-source",
+            datacontenttype="application/json",
+            data={
+                "chargepointid": "cp123",
+                "connectornumber": 1,
+                "totalenergyinkwh": 25.5,
+                "totalduration": "PT1H30M",
+                "totalcosts": 15.75,
+                "transactionid": "tx123",
+            },
+        )
+
+        assert isinstance(payload.data, CDRCreatedData)
+
+    def test_unknown_type(self):
+        """Test that an unknown webhook type keeps its data as is."""
+        payload = WebhookPayload.from_json(
+            json.dumps(
+                {
+                    "specversion": "1.0",
+                    "id": "test-id",
+                    "type": "SomethingNew",
+                    "subject": "test-subject",
+                    "time": "2024-01-01T00:00:00Z",
+                    "source": "test-source",
+                    "datacontenttype": "application/json",
+                    "data": {"key": "value"},
+                    "extension": "ignored",
+                }
+            )
+        )
+
+        assert payload.type == "SomethingNew"
+        assert payload.data == {"key": "value"}
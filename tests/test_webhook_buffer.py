@@ -0,0 +1,120 @@
+from longship.types import WebhookPayload, WebhookPayloadType
+from longship.webhook_buffer import (
+    WebhookBuffer,
+    WebhookDeduplicator,
+    WebhookReorderBuffer,
+)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def ping(event_id, subject="CP1", second=0):
+    return WebhookPayload(
+        specversion="1.0",
+        id=event_id,
+        type=WebhookPayloadType.Ping,
+        subject=subject,
+        time=f"2024-01-01T00:00:{second:02d}Z",
+        source="https://api.longship.io",
+        datacontenttype="application/json",
+        data={},
+    )
+
+
+def ids(payloads):
+    return [payload.id for payload in payloads]
+
+
+class TestWebhookDeduplicator:
+    def test_duplicates(self):
+        """Test that redelivered ids are recognized and counted."""
+        deduplicator = WebhookDeduplicator()
+        assert not deduplicator.is_duplicate(ping("a"))
+        assert not deduplicator.is_duplicate(ping("b"))
+        assert deduplicator.is_duplicate(ping("a"))
+        assert deduplicator.duplicates == 1
+
+    def test_window(self):
+        """Test that ids are forgotten after the window."""
+        clock = Clock()
+        deduplicator = WebhookDeduplicator(window=60, clock=clock)
+        deduplicator.is_duplicate(ping("a"))
+        clock.now = 61
+        assert not deduplicator.is_duplicate(ping("a"))
+        assert len(deduplicator) == 1
+
+    def test_maxsize(self):
+        """Test that the oldest ids are forgotten beyond maxsize."""
+        deduplicator = WebhookDeduplicator(maxsize=2)
+        for event_id in "abc":
+            deduplicator.is_duplicate(ping(event_id))
+        assert len(deduplicator) == 2
+        assert not deduplicator.is_duplicate(ping("a"))
+        assert deduplicator.is_duplicate(ping("c"))
+
+
+class TestWebhookReorderBuffer:
+    def test_reorders_per_subject(self):
+        """Test that events are released by time once held long enough."""
+        clock = Clock()
+        buffer = WebhookReorderBuffer(hold_back=2, clock=clock)
+        buffer.push(ping("stop", second=10))
+        buffer.push(ping("other", subject="CP2", second=5))
+        clock.now = 1
+        buffer.push(ping("update", second=8))
+        assert buffer.pop_ready() == []
+        assert buffer.next_deadline() == 2
+        clock.now = 2
+        # The update arrived later but happened before the stop
+        assert ids(buffer.pop_ready()) == ["update", "stop", "other"]
+        assert len(buffer) == 0
+        assert buffer.next_deadline() is None
+
+    def test_held_until_own_deadline(self):
+        """Test that later events of a subject aren't released with earlier ones."""
+        clock = Clock()
+        buffer = WebhookReorderBuffer(hold_back=2, clock=clock)
+        buffer.push(ping("first", second=1))
+        clock.now = 1
+        buffer.push(ping("second", second=2))
+        clock.now = 2
+        assert ids(buffer.pop_ready()) == ["first"]
+        clock.now = 3
+        assert ids(buffer.pop_ready()) == ["second"]
+
+    def test_late_events(self):
+        """Test that events older than a released one of their subject are dropped."""
+        clock = Clock()
+        buffer = WebhookReorderBuffer(hold_back=1, clock=clock)
+        buffer.push(ping("stop", second=10))
+        clock.now = 1
+        buffer.pop_ready()
+        assert not buffer.push(ping("update", second=8))
+        assert buffer.push(ping("other", subject="CP2", second=8))
+        assert buffer.late == 1
+
+    def test_max_held(self):
+        """Test that the longest held events are released early beyond max_held."""
+        buffer = WebhookReorderBuffer(hold_back=60, max_held=2)
+        for second in range(3):
+            buffer.push(ping(f"e{second}", subject=f"CP{second}", second=second))
+        assert ids(buffer.pop_ready()) == ["e0"]
+        assert ids(buffer.flush()) == ["e1", "e2"]
+
+
+class TestWebhookBuffer:
+    def test_dedupes_and_reorders(self):
+        """Test the combined stage."""
+        clock = Clock()
+        buffer = WebhookBuffer(hold_back=1, clock=clock)
+        assert buffer.push(ping("b", second=2))
+        assert buffer.push(ping("a", second=1))
+        assert not buffer.push(ping("b", second=2))
+        clock.now = 1
+        assert ids(buffer.pop_ready()) == ["a", "b"]
@@ -0,0 +1,153 @@
+import asyncio
+from pathlib import Path
+
+import httpx
+import pytest
+
+from longship.types import WebhookPayloadType
+from longship.webhook_receiver import WebhookReceiver
+
+FIXTURES = Path(__file__).parent.parent / "fixtures"
+
+
+def fixture(name):
+    return (FIXTURES / f"{name}.json").read_bytes()
+
+
+def run(receiver, requests):
+    """Post `requests` (path, body) to the receiver, stop it and return the responses."""
+
+    async def main():
+        transport = httpx.ASGITransport(app=receiver)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            responses = [await client.post(path, content=body) for path, body in requests]
+        await receiver.stop()
+        return responses
+
+    return asyncio.run(main())
+
+
+class TestWebhookReceiver:
+    def test_batches(self):
+        """Test that webhooks are acknowledged and handed to handlers in batches."""
+        receiver = WebhookReceiver(batch_size=3, batch_timeout=0.01)
+        batches = []
+
+        @receiver.handler(WebhookPayloadType.OperationalStatusChanged)
+        async def statuses(payloads):
+            batches.append([payload.subject for payload in payloads])
+
+        responses = run(receiver, [("/", fixture("OperationalStatusChanged"))] * 5)
+        assert [response.status_code for response in responses] == [202] * 5
+        assert sum(len(batch) for batch in batches) == 5
+        assert max(len(batch) for batch in batches) <= 3
+        assert batches[0][0] == "ESTG_00669"
+        assert receiver.received == {"OperationalStatusChanged": 5}
+        assert receiver.handled == {"OperationalStatusChanged": 5}
+
+    def test_types_are_routed(self):
+        """Test that handlers only get the types they registered for."""
+        receiver = WebhookReceiver(batch_timeout=0)
+        seen = {"status": [], "all": []}
+
+        @receiver.handler(WebhookPayloadType.ConnectivityStatusChanged)
+        async def connectivity(payloads):
+            seen["status"].extend(str(payload.type) for payload in payloads)
+
+        @receiver.handler()
+        async def everything(payloads):
+            seen["all"].extend(str(payload.type) for payload in payloads)
+
+        run(
+            receiver,
+            [("/", fixture("ConnectivityStatusChanged")), ("/", fixture("LocationCreated"))],
+        )
+        assert seen["status"] == ["ConnectivityStatusChanged"]
+        assert sorted(seen["all"]) == ["ConnectivityStatusChanged", "LocationCreated"]
+
+    def test_backpressure(self):
+        """Test that a full queue is answered with 503 and Retry-After."""
+        receiver = WebhookReceiver(max_queue=2, batch_size=1, retry_after=7)
+        release = None
+
+        @receiver.handler(WebhookPayloadType.LocationUpdated)
+        async def blocked(payloads):
+            await release.wait()
+
+        async def main():
+            nonlocal release
+            release = asyncio.Event()
+            transport = httpx.ASGITransport(app=receiver)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                responses = []
+                for _ in range(4):
+                    responses.append(await client.post("/", content=fixture("LocationUpdated")))
+                    await asyncio.sleep(0)
+            release.set()
+            await receiver.stop()
+            return responses
+
+        responses = asyncio.run(main())
+        # One in the handler, two queued
+        assert [response.status_code for response in responses] == [202, 202, 202, 503]
+        assert responses[3].headers["retry-after"] == "7"
+        assert receiver.rejected == {"LocationUpdated": 1}
+        assert receiver.handled == {"LocationUpdated": 3}
+
+    def test_failing_handler(self):
+        """Test that a failing handler is counted and doesn't stop the worker."""
+        receiver = WebhookReceiver(batch_size=1)
+
+        @receiver.handler(WebhookPayloadType.LocationCreated)
+        async def failing(payloads):
+            raise RuntimeError("database down")
+
+        run(receiver, [("/", fixture("LocationCreated"))] * 2)
+        assert receiver.failed == {"LocationCreated": 2}
+
+    @pytest.mark.parametrize(
+        "path, body, status_code",
+        [
+            ("/", b"not json", 400),
+            ("/", b'{"type": "Ping"}', 400),
+            ("/other", fixture("LocationCreated"), 404),
+            ("/", b"x" * 2048, 413),
+            # No handler for the type
+            ("/", fixture("CdrCreated"), 202),
+            # Sent before the transaction started, without a transaction id
+            ("/", fixture("SessionStart"), 202),
+        ],
+    )
+    def test_rejected_requests(self, path, body, status_code):
+        """Test the responses to requests that aren't queued."""
+        receiver = WebhookReceiver(max_body_size=1024)
+        receiver.add_handler(lambda payloads: asyncio.sleep(0), WebhookPayloadType.Ping)
+        (response,) = run(receiver, [(path, body)])
+        assert response.status_code == status_code
+        assert receiver.queued == 0
+
+    def test_lifespan(self):
+        """Test that the workers are started and stopped by the lifespan protocol."""
+        receiver = WebhookReceiver()
+        receiver.add_handler(lambda payloads: asyncio.sleep(0), WebhookPayloadType.Ping)
+        # Queues belong to the loop the receiver runs in, not the one it was built in
+        assert receiver._dispatches["Ping"].queue is None
+        sent = []
+
+        async def main():
+            messages = iter([{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}])
+
+            async def receive():
+                return next(messages)
+
+            async def send(message):
+                sent.append(message["type"])
+                if message["type"] == "lifespan.startup.complete":
+                    assert len(receiver._workers) == 1
+                    assert receiver._dispatches["Ping"].queue is not None
+
+            await receiver({"type": "lifespan"}, receive, send)
+
+        asyncio.run(main())
+        assert sent == ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+        assert receiver._workers == []